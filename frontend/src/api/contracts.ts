@@ -220,6 +220,7 @@ export type AuthorJobStatusResponse = {
   progress_snapshot?: AuthorJobProgressSnapshot | null
   cache_metrics?: AuthorCacheMetrics | null
   error?: { code: string; message: string } | null
+  queue_position?: number | null
 }
 
 export type AuthorStorySummary = {
@@ -433,6 +434,7 @@ export type PlaySessionHistoryResponse = {
   session_id: string
   story_id: string
   entries: PlaySessionHistoryEntry[]
+  has_more?: boolean
 }
 
 export type PlaySessionProgress = {
@@ -510,7 +512,9 @@ export type PlaySessionSnapshot = {
 
 export type AuthorJobEventName =
   | "job_created"
+  | "queue_position"
   | "job_started"
+  | "job_resumed"
   | "stage_changed"
   | "job_completed"
   | "job_failed"
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections import Counter
+import hashlib
 import json
 import random
 import sqlite3
 from functools import lru_cache
 from typing import Any
+import zlib
 
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
@@ -61,17 +64,35 @@ AUTHOR_CHECKPOINT_ALLOWLIST = (
     RulePack,
 )
 
+_BLOB_COMPRESSION_LEVEL = 6
+# Stay well under SQLite's default host-parameter limit when batching IN (...) lookups.
+_SQLITE_MAX_PARAMS = 500
+
 
 class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """SQLite checkpointer for the author graphs.
+
+    Channel values and pending writes are stored by content: each distinct
+    serialized value lives once in ``author_checkpoint_blob_store`` (zlib
+    compressed, keyed by its SHA-256) with a reference count, and the per
+    checkpoint rows only point at it. Large channels that do not change between
+    steps (bundles, playbooks, plans) therefore cost one copy per thread
+    instead of one per version. Rows written before the store existed keep
+    their value inline and stay readable.
+    """
+
     def __init__(self, db_path: str, *, serde: SerializerProtocol | None = None) -> None:
         super().__init__(
             serde=serde or JsonPlusSerializer(allowed_msgpack_modules=AUTHOR_CHECKPOINT_ALLOWLIST)
         )
         self._db_path = db_path
+        self._schema_ready = False
 
     def _connect(self) -> sqlite3.Connection:
         connection = connect_sqlite(self._db_path)
-        self._ensure_schema(connection)
+        if not self._schema_ready:
+            self._ensure_schema(connection)
+            self._schema_ready = True
         return connection
 
     def _ensure_schema(self, connection: sqlite3.Connection) -> None:
@@ -102,6 +123,7 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
                 value_type TEXT NOT NULL,
                 value_blob BLOB NOT NULL,
                 task_path TEXT NOT NULL DEFAULT '',
+                content_hash TEXT,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx)
             )
             """
@@ -115,10 +137,25 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
                 version_key TEXT NOT NULL,
                 value_type TEXT NOT NULL,
                 value_blob BLOB NOT NULL,
+                content_hash TEXT,
                 PRIMARY KEY (thread_id, checkpoint_ns, channel, version_key)
             )
             """
         )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS author_checkpoint_blob_store (
+                content_hash TEXT PRIMARY KEY,
+                value_type TEXT NOT NULL,
+                value_blob BLOB NOT NULL,
+                ref_count INTEGER NOT NULL
+            )
+            """
+        )
+        for table_name in ("author_checkpoint_writes", "author_checkpoint_blobs"):
+            columns = {str(row["name"]) for row in connection.execute(f"PRAGMA table_info({table_name})").fetchall()}
+            if "content_hash" not in columns:
+                connection.execute(f"ALTER TABLE {table_name} ADD COLUMN content_hash TEXT")
         connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_author_checkpoints_thread ON author_checkpoints (thread_id, checkpoint_ns, checkpoint_id DESC)"
         )
@@ -128,6 +165,93 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
     def _version_key(version: str | int | float) -> str:
         return json.dumps(version, ensure_ascii=True, separators=(",", ":"))
 
+    @staticmethod
+    def _content_hash(value_type: str, value_blob: bytes) -> str:
+        digest = hashlib.sha256(value_type.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(value_blob)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _stored_value(row: sqlite3.Row) -> tuple[str, bytes]:
+        if row["content_hash"] is None:
+            return str(row["value_type"]), bytes(row["value_blob"])
+        return str(row["value_type"]), zlib.decompress(bytes(row["stored_blob"]))
+
+    def _acquire_blobs(self, connection: sqlite3.Connection, typed_values: list[tuple[str, bytes]]) -> list[str]:
+        """Store each serialized value once and take one reference per entry."""
+        hashes = [self._content_hash(value_type, value_blob) for value_type, value_blob in typed_values]
+        if not hashes:
+            return hashes
+        reference_counts = Counter(hashes)
+        known: set[str] = set()
+        distinct = list(reference_counts)
+        for start in range(0, len(distinct), _SQLITE_MAX_PARAMS):
+            chunk = distinct[start : start + _SQLITE_MAX_PARAMS]
+            known.update(
+                str(row["content_hash"])
+                for row in connection.execute(
+                    f"SELECT content_hash FROM author_checkpoint_blob_store WHERE content_hash IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+            )
+        # The lookup only saves compressing values that are already stored. A concurrent
+        # release can delete one of them before this transaction writes, so each known
+        # value is re-checked by its own increment and stored again if it is gone.
+        missing = [content_hash for content_hash in distinct if content_hash not in known]
+        for content_hash in known:
+            updated = connection.execute(
+                "UPDATE author_checkpoint_blob_store SET ref_count = ref_count + ? WHERE content_hash = ?",
+                (reference_counts[content_hash], content_hash),
+            )
+            if updated.rowcount == 0:
+                missing.append(content_hash)
+        values_by_hash = dict(zip(hashes, typed_values))
+        connection.executemany(
+            """
+            INSERT INTO author_checkpoint_blob_store (content_hash, value_type, value_blob, ref_count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(content_hash) DO UPDATE SET ref_count = ref_count + excluded.ref_count
+            """,
+            [
+                (
+                    content_hash,
+                    values_by_hash[content_hash][0],
+                    zlib.compress(values_by_hash[content_hash][1], _BLOB_COMPRESSION_LEVEL),
+                    reference_counts[content_hash],
+                )
+                for content_hash in missing
+            ],
+        )
+        return hashes
+
+    @staticmethod
+    def _release_blobs(connection: sqlite3.Connection, reference_counts: Counter[str]) -> None:
+        """Drop references and delete the stored values nothing points at any more."""
+        if not reference_counts:
+            return
+        connection.executemany(
+            "UPDATE author_checkpoint_blob_store SET ref_count = ref_count - ? WHERE content_hash = ?",
+            [(count, content_hash) for content_hash, count in reference_counts.items()],
+        )
+        connection.executemany(
+            "DELETE FROM author_checkpoint_blob_store WHERE content_hash = ? AND ref_count <= 0",
+            [(content_hash,) for content_hash in reference_counts],
+        )
+
+    def _release_rows(self, connection: sqlite3.Connection, table_name: str, where: str, params: tuple[Any, ...]) -> None:
+        rows = connection.execute(
+            f"""
+            SELECT content_hash, COUNT(*) AS reference_count
+            FROM {table_name}
+            WHERE {where}
+              AND content_hash IS NOT NULL
+            GROUP BY content_hash
+            """,
+            params,
+        ).fetchall()
+        self._release_blobs(connection, Counter({str(row["content_hash"]): int(row["reference_count"]) for row in rows}))
+
     def _load_blobs(
         self,
         connection: sqlite3.Connection,
@@ -139,18 +263,19 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
         for channel, version in versions.items():
             row = connection.execute(
                 """
-                SELECT value_type, value_blob
-                FROM author_checkpoint_blobs
-                WHERE thread_id = ?
-                  AND checkpoint_ns = ?
-                  AND channel = ?
-                  AND version_key = ?
+                SELECT b.value_type, b.value_blob, b.content_hash, s.value_blob AS stored_blob
+                FROM author_checkpoint_blobs b
+                LEFT JOIN author_checkpoint_blob_store s ON s.content_hash = b.content_hash
+                WHERE b.thread_id = ?
+                  AND b.checkpoint_ns = ?
+                  AND b.channel = ?
+                  AND b.version_key = ?
                 """,
                 (thread_id, checkpoint_ns, channel, self._version_key(version)),
             ).fetchone()
             if row is None:
                 continue
-            typed_value = (str(row["value_type"]), bytes(row["value_blob"]))
+            typed_value = self._stored_value(row)
             if typed_value[0] != "empty":
                 channel_values[channel] = self.serde.loads_typed(typed_value)
         return channel_values
@@ -165,12 +290,13 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
     ) -> list[tuple[str, str, Any]]:
         rows = connection.execute(
             """
-            SELECT task_id, channel, value_type, value_blob
-            FROM author_checkpoint_writes
-            WHERE thread_id = ?
-              AND checkpoint_ns = ?
-              AND checkpoint_id = ?
-            ORDER BY write_idx ASC, task_id ASC
+            SELECT w.task_id, w.channel, w.value_type, w.value_blob, w.content_hash, s.value_blob AS stored_blob
+            FROM author_checkpoint_writes w
+            LEFT JOIN author_checkpoint_blob_store s ON s.content_hash = w.content_hash
+            WHERE w.thread_id = ?
+              AND w.checkpoint_ns = ?
+              AND w.checkpoint_id = ?
+            ORDER BY w.write_idx ASC, w.task_id ASC
             """,
             (thread_id, checkpoint_ns, checkpoint_id),
         ).fetchall()
@@ -178,7 +304,7 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
             (
                 str(row["task_id"]),
                 str(row["channel"]),
-                self.serde.loads_typed((str(row["value_type"]), bytes(row["value_blob"]))),
+                self.serde.loads_typed(self._stored_value(row)),
             )
             for row in rows
         ]
@@ -316,29 +442,50 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
         checkpoint_id = str(checkpoint["id"])
         values: dict[str, Any] = checkpoint_copy.pop("channel_values")  # type: ignore[misc]
         with self._connect() as connection:
-            for channel, version in new_versions.items():
-                if channel in values:
-                    value_type, value_blob = self.serde.dumps_typed(values[channel])
-                else:
-                    value_type, value_blob = ("empty", b"")
-                connection.execute(
-                    """
-                    INSERT INTO author_checkpoint_blobs (
-                        thread_id, checkpoint_ns, channel, version_key, value_type, value_blob
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(thread_id, checkpoint_ns, channel, version_key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_blob = excluded.value_blob
-                    """,
-                    (
-                        thread_id,
-                        checkpoint_ns,
-                        channel,
-                        self._version_key(version),
-                        value_type,
-                        value_blob,
-                    ),
+            version_keys = {channel: self._version_key(version) for channel, version in new_versions.items()}
+            # A channel version always names the same value, so versions already stored are kept as they are.
+            stored_keys: set[tuple[str, str]] = set()
+            pending_keys = list(version_keys.items())
+            for start in range(0, len(pending_keys), _SQLITE_MAX_PARAMS // 2):
+                chunk = pending_keys[start : start + _SQLITE_MAX_PARAMS // 2]
+                stored_keys.update(
+                    (str(row["channel"]), str(row["version_key"]))
+                    for row in connection.execute(
+                        f"""
+                        SELECT channel, version_key
+                        FROM author_checkpoint_blobs
+                        WHERE thread_id = ?
+                          AND checkpoint_ns = ?
+                          AND (channel, version_key) IN ({','.join(['(?, ?)'] * len(chunk))})
+                        """,
+                        (thread_id, checkpoint_ns, *[item for pair in chunk for item in pair]),
+                    ).fetchall()
                 )
+            blob_rows: list[tuple[str, str, str, str, str, bytes, str | None]] = []
+            stored_channels: list[str] = []
+            typed_values: list[tuple[str, bytes]] = []
+            for channel, version_key in version_keys.items():
+                if (channel, version_key) in stored_keys:
+                    continue
+                if channel not in values:
+                    blob_rows.append((thread_id, checkpoint_ns, channel, version_key, "empty", b"", None))
+                    continue
+                stored_channels.append(channel)
+                typed_values.append(self.serde.dumps_typed(values[channel]))
+            for channel, (value_type, _), content_hash in zip(
+                stored_channels,
+                typed_values,
+                self._acquire_blobs(connection, typed_values),
+            ):
+                blob_rows.append((thread_id, checkpoint_ns, channel, version_keys[channel], value_type, b"", content_hash))
+            connection.executemany(
+                """
+                INSERT INTO author_checkpoint_blobs (
+                    thread_id, checkpoint_ns, channel, version_key, value_type, value_blob, content_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                blob_rows,
+            )
             checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint_copy)
             metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
             connection.execute(
@@ -391,40 +538,43 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
         checkpoint_id = config["configurable"]["checkpoint_id"]
         with self._connect() as connection:
+            # Regular writes keep the first value recorded for their slot; special
+            # channels (errors, interrupts) are small, stored inline and overwritten.
+            recorded_indexes = {
+                int(row["write_idx"])
+                for row in connection.execute(
+                    """
+                    SELECT write_idx
+                    FROM author_checkpoint_writes
+                    WHERE thread_id = ?
+                      AND checkpoint_ns = ?
+                      AND checkpoint_id = ?
+                      AND task_id = ?
+                    """,
+                    (thread_id, checkpoint_ns, checkpoint_id, task_id),
+                ).fetchall()
+            }
+            regular_writes: list[tuple[int, str, tuple[str, bytes]]] = []
+            special_rows: list[tuple[str, str, str, str, int, str, str, bytes, str]] = []
             for index, (channel, value) in enumerate(writes):
                 write_idx = WRITES_IDX_MAP.get(channel, index)
-                value_type, value_blob = self.serde.dumps_typed(value)
                 if write_idx >= 0:
-                    connection.execute(
-                        """
-                        INSERT OR IGNORE INTO author_checkpoint_writes (
-                            thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, channel, value_type, value_blob, task_path
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            thread_id,
-                            checkpoint_ns,
-                            checkpoint_id,
-                            task_id,
-                            write_idx,
-                            channel,
-                            value_type,
-                            value_blob,
-                            task_path,
-                        ),
-                    )
+                    if write_idx not in recorded_indexes:
+                        recorded_indexes.add(write_idx)
+                        regular_writes.append((write_idx, channel, self.serde.dumps_typed(value)))
                     continue
-                connection.execute(
-                    """
-                    INSERT INTO author_checkpoint_writes (
-                        thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, channel, value_type, value_blob, task_path
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx) DO UPDATE SET
-                        channel = excluded.channel,
-                        value_type = excluded.value_type,
-                        value_blob = excluded.value_blob,
-                        task_path = excluded.task_path
-                    """,
+                value_type, value_blob = self.serde.dumps_typed(value)
+                special_rows.append(
+                    (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, channel, value_type, value_blob, task_path)
+                )
+            content_hashes = self._acquire_blobs(connection, [typed_value for _, _, typed_value in regular_writes])
+            connection.executemany(
+                """
+                INSERT INTO author_checkpoint_writes (
+                    thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, channel, value_type, value_blob, task_path, content_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         thread_id,
                         checkpoint_ns,
@@ -433,14 +583,40 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
                         write_idx,
                         channel,
                         value_type,
-                        value_blob,
+                        b"",
                         task_path,
-                    ),
+                        content_hash,
+                    )
+                    for (write_idx, channel, (value_type, _)), content_hash in zip(regular_writes, content_hashes)
+                ],
+            )
+            if special_rows:
+                self._release_rows(
+                    connection,
+                    "author_checkpoint_writes",
+                    f"thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? AND task_id = ? AND write_idx IN ({','.join('?' * len(special_rows))})",
+                    (thread_id, checkpoint_ns, checkpoint_id, task_id, *[row[4] for row in special_rows]),
+                )
+                connection.executemany(
+                    """
+                    INSERT INTO author_checkpoint_writes (
+                        thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, channel, value_type, value_blob, task_path, content_hash
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+                    ON CONFLICT(thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx) DO UPDATE SET
+                        channel = excluded.channel,
+                        value_type = excluded.value_type,
+                        value_blob = excluded.value_blob,
+                        task_path = excluded.task_path,
+                        content_hash = NULL
+                    """,
+                    special_rows,
                 )
             connection.commit()
 
     def delete_thread(self, thread_id: str) -> None:
         with self._connect() as connection:
+            self._release_rows(connection, "author_checkpoint_blobs", "thread_id = ?", (thread_id,))
+            self._release_rows(connection, "author_checkpoint_writes", "thread_id = ?", (thread_id,))
             connection.execute("DELETE FROM author_checkpoints WHERE thread_id = ?", (thread_id,))
             connection.execute("DELETE FROM author_checkpoint_writes WHERE thread_id = ?", (thread_id,))
             connection.execute("DELETE FROM author_checkpoint_blobs WHERE thread_id = ?", (thread_id,))
@@ -452,23 +628,27 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
 
     def copy_thread(self, source_thread_id: str, target_thread_id: str) -> None:
         with self._connect() as connection:
+            # The copy shares stored values with the source: it takes a reference to each
+            # one and gives up whatever the overwritten target rows pointed at.
+            acquired: Counter[str] = Counter()
+            released: Counter[str] = Counter()
             checkpoint_rows = connection.execute(
                 "SELECT * FROM author_checkpoints WHERE thread_id = ?",
                 (source_thread_id,),
             ).fetchall()
-            for row in checkpoint_rows:
-                connection.execute(
-                    """
-                    INSERT INTO author_checkpoints (
-                        thread_id, checkpoint_ns, checkpoint_id, checkpoint_type, checkpoint_blob, metadata_type, metadata_blob, parent_checkpoint_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(thread_id, checkpoint_ns, checkpoint_id) DO UPDATE SET
-                        checkpoint_type = excluded.checkpoint_type,
-                        checkpoint_blob = excluded.checkpoint_blob,
-                        metadata_type = excluded.metadata_type,
-                        metadata_blob = excluded.metadata_blob,
-                        parent_checkpoint_id = excluded.parent_checkpoint_id
-                    """,
+            connection.executemany(
+                """
+                INSERT INTO author_checkpoints (
+                    thread_id, checkpoint_ns, checkpoint_id, checkpoint_type, checkpoint_blob, metadata_type, metadata_blob, parent_checkpoint_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(thread_id, checkpoint_ns, checkpoint_id) DO UPDATE SET
+                    checkpoint_type = excluded.checkpoint_type,
+                    checkpoint_blob = excluded.checkpoint_blob,
+                    metadata_type = excluded.metadata_type,
+                    metadata_blob = excluded.metadata_blob,
+                    parent_checkpoint_id = excluded.parent_checkpoint_id
+                """,
+                [
                     (
                         target_thread_id,
                         row["checkpoint_ns"],
@@ -478,24 +658,42 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
                         row["metadata_type"],
                         row["metadata_blob"],
                         row["parent_checkpoint_id"],
-                    ),
-                )
+                    )
+                    for row in checkpoint_rows
+                ],
+            )
+            target_write_hashes = {
+                (str(row["checkpoint_ns"]), str(row["checkpoint_id"]), str(row["task_id"]), int(row["write_idx"])): row["content_hash"]
+                for row in connection.execute(
+                    "SELECT checkpoint_ns, checkpoint_id, task_id, write_idx, content_hash FROM author_checkpoint_writes WHERE thread_id = ?",
+                    (target_thread_id,),
+                ).fetchall()
+            }
             write_rows = connection.execute(
                 "SELECT * FROM author_checkpoint_writes WHERE thread_id = ?",
                 (source_thread_id,),
             ).fetchall()
             for row in write_rows:
-                connection.execute(
-                    """
-                    INSERT INTO author_checkpoint_writes (
-                        thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, channel, value_type, value_blob, task_path
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx) DO UPDATE SET
-                        channel = excluded.channel,
-                        value_type = excluded.value_type,
-                        value_blob = excluded.value_blob,
-                        task_path = excluded.task_path
-                    """,
+                replaced_hash = target_write_hashes.get(
+                    (str(row["checkpoint_ns"]), str(row["checkpoint_id"]), str(row["task_id"]), int(row["write_idx"]))
+                )
+                if replaced_hash is not None:
+                    released[str(replaced_hash)] += 1
+                if row["content_hash"] is not None:
+                    acquired[str(row["content_hash"])] += 1
+            connection.executemany(
+                """
+                INSERT INTO author_checkpoint_writes (
+                    thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, channel, value_type, value_blob, task_path, content_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx) DO UPDATE SET
+                    channel = excluded.channel,
+                    value_type = excluded.value_type,
+                    value_blob = excluded.value_blob,
+                    task_path = excluded.task_path,
+                    content_hash = excluded.content_hash
+                """,
+                [
                     (
                         target_thread_id,
                         row["checkpoint_ns"],
@@ -506,22 +704,39 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
                         row["value_type"],
                         row["value_blob"],
                         row["task_path"],
-                    ),
-                )
+                        row["content_hash"],
+                    )
+                    for row in write_rows
+                ],
+            )
+            target_blob_hashes = {
+                (str(row["checkpoint_ns"]), str(row["channel"]), str(row["version_key"])): row["content_hash"]
+                for row in connection.execute(
+                    "SELECT checkpoint_ns, channel, version_key, content_hash FROM author_checkpoint_blobs WHERE thread_id = ?",
+                    (target_thread_id,),
+                ).fetchall()
+            }
             blob_rows = connection.execute(
                 "SELECT * FROM author_checkpoint_blobs WHERE thread_id = ?",
                 (source_thread_id,),
             ).fetchall()
             for row in blob_rows:
-                connection.execute(
-                    """
-                    INSERT INTO author_checkpoint_blobs (
-                        thread_id, checkpoint_ns, channel, version_key, value_type, value_blob
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(thread_id, checkpoint_ns, channel, version_key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_blob = excluded.value_blob
-                    """,
+                replaced_hash = target_blob_hashes.get((str(row["checkpoint_ns"]), str(row["channel"]), str(row["version_key"])))
+                if replaced_hash is not None:
+                    released[str(replaced_hash)] += 1
+                if row["content_hash"] is not None:
+                    acquired[str(row["content_hash"])] += 1
+            connection.executemany(
+                """
+                INSERT INTO author_checkpoint_blobs (
+                    thread_id, checkpoint_ns, channel, version_key, value_type, value_blob, content_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(thread_id, checkpoint_ns, channel, version_key) DO UPDATE SET
+                    value_type = excluded.value_type,
+                    value_blob = excluded.value_blob,
+                    content_hash = excluded.content_hash
+                """,
+                [
                     (
                         target_thread_id,
                         row["checkpoint_ns"],
@@ -529,71 +744,105 @@ class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
                         row["version_key"],
                         row["value_type"],
                         row["value_blob"],
-                    ),
-                )
+                        row["content_hash"],
+                    )
+                    for row in blob_rows
+                ],
+            )
+            connection.executemany(
+                "UPDATE author_checkpoint_blob_store SET ref_count = ref_count + ? WHERE content_hash = ?",
+                [(count, content_hash) for content_hash, count in acquired.items()],
+            )
+            self._release_blobs(connection, released)
             connection.commit()
 
     def prune(self, thread_ids, *, strategy: str = "keep_latest") -> None:
-        with self._connect() as connection:
-            for thread_id in thread_ids:
-                if strategy == "delete":
-                    connection.execute("DELETE FROM author_checkpoints WHERE thread_id = ?", (thread_id,))
-                    connection.execute("DELETE FROM author_checkpoint_writes WHERE thread_id = ?", (thread_id,))
-                    connection.execute("DELETE FROM author_checkpoint_blobs WHERE thread_id = ?", (thread_id,))
-                    continue
+        # Each thread is pruned in its own short transaction, and only the stored values
+        # that thread gave up are checked for garbage, so pruning never scans the store.
+        for thread_id in thread_ids:
+            if strategy == "delete":
+                self.delete_thread(thread_id)
+                continue
+            with self._connect() as connection:
                 namespaces = connection.execute(
                     "SELECT DISTINCT checkpoint_ns FROM author_checkpoints WHERE thread_id = ?",
                     (thread_id,),
                 ).fetchall()
                 for namespace_row in namespaces:
-                    checkpoint_ns = str(namespace_row["checkpoint_ns"])
-                    latest = connection.execute(
-                        """
-                        SELECT checkpoint_id
-                        FROM author_checkpoints
-                        WHERE thread_id = ?
-                          AND checkpoint_ns = ?
-                        ORDER BY checkpoint_id DESC
-                        LIMIT 1
-                        """,
-                        (thread_id, checkpoint_ns),
-                    ).fetchone()
-                    if latest is None:
-                        continue
-                    latest_id = str(latest["checkpoint_id"])
-                    connection.execute(
-                        """
-                        DELETE FROM author_checkpoints
-                        WHERE thread_id = ?
-                          AND checkpoint_ns = ?
-                          AND checkpoint_id != ?
-                        """,
-                        (thread_id, checkpoint_ns, latest_id),
-                    )
-                    connection.execute(
-                        """
-                        DELETE FROM author_checkpoint_writes
-                        WHERE thread_id = ?
-                          AND checkpoint_ns = ?
-                          AND checkpoint_id != ?
-                        """,
-                        (thread_id, checkpoint_ns, latest_id),
-                    )
-                    connection.execute(
-                        """
-                        DELETE FROM author_checkpoint_blobs
-                        WHERE thread_id = ?
-                          AND checkpoint_ns = ?
-                          AND NOT EXISTS (
-                              SELECT 1
-                              FROM author_checkpoints c
-                              WHERE c.thread_id = author_checkpoint_blobs.thread_id
-                                AND c.checkpoint_ns = author_checkpoint_blobs.checkpoint_ns
-                          )
-                        """,
-                        (thread_id, checkpoint_ns),
-                    )
-            connection.commit()
+                    self._prune_namespace(connection, thread_id, str(namespace_row["checkpoint_ns"]))
+                connection.commit()
+
+    def _prune_namespace(self, connection: sqlite3.Connection, thread_id: str, checkpoint_ns: str) -> None:
+        latest = connection.execute(
+            """
+            SELECT checkpoint_id, checkpoint_type, checkpoint_blob
+            FROM author_checkpoints
+            WHERE thread_id = ?
+              AND checkpoint_ns = ?
+            ORDER BY checkpoint_id DESC
+            LIMIT 1
+            """,
+            (thread_id, checkpoint_ns),
+        ).fetchone()
+        if latest is None:
+            return
+        latest_id = str(latest["checkpoint_id"])
+        latest_checkpoint = self.serde.loads_typed((str(latest["checkpoint_type"]), bytes(latest["checkpoint_blob"])))
+        live_versions = {
+            (str(channel), self._version_key(version))
+            for channel, version in dict(latest_checkpoint.get("channel_versions") or {}).items()
+        }
+        stale_blob_rows = [
+            row
+            for row in connection.execute(
+                """
+                SELECT channel, version_key, content_hash
+                FROM author_checkpoint_blobs
+                WHERE thread_id = ?
+                  AND checkpoint_ns = ?
+                """,
+                (thread_id, checkpoint_ns),
+            ).fetchall()
+            if (str(row["channel"]), str(row["version_key"])) not in live_versions
+        ]
+        self._release_rows(
+            connection,
+            "author_checkpoint_writes",
+            "thread_id = ? AND checkpoint_ns = ? AND checkpoint_id != ?",
+            (thread_id, checkpoint_ns, latest_id),
+        )
+        self._release_blobs(
+            connection,
+            Counter(str(row["content_hash"]) for row in stale_blob_rows if row["content_hash"] is not None),
+        )
+        connection.execute(
+            """
+            DELETE FROM author_checkpoints
+            WHERE thread_id = ?
+              AND checkpoint_ns = ?
+              AND checkpoint_id != ?
+            """,
+            (thread_id, checkpoint_ns, latest_id),
+        )
+        connection.execute(
+            """
+            DELETE FROM author_checkpoint_writes
+            WHERE thread_id = ?
+              AND checkpoint_ns = ?
+              AND checkpoint_id != ?
+            """,
+            (thread_id, checkpoint_ns, latest_id),
+        )
+        connection.executemany(
+            """
+            DELETE FROM author_checkpoint_blobs
+            WHERE thread_id = ?
+              AND checkpoint_ns = ?
+              AND channel = ?
+              AND version_key = ?
+            """,
+            [(thread_id, checkpoint_ns, row["channel"], row["version_key"]) for row in stale_blob_rows],
+        )
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         return self.get_tuple(config)
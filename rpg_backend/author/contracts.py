@@ -673,6 +673,7 @@ class AuthorJobStatusResponse(BaseModel):
     progress_snapshot: AuthorJobProgressSnapshot | None = None
     cache_metrics: AuthorCacheMetrics | None = None
     error: dict[str, str] | None = None
+    queue_position: int | None = Field(default=None, ge=1)
 
 
 class AuthorStorySummary(BaseModel):
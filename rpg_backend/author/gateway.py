@@ -124,6 +124,7 @@ def get_author_llm_gateway(settings: Settings | None = None) -> AuthorLLMGateway
         ),
         chat_json_stream_mode=resolved.responses_chat_json_stream_mode,
         chat_json_stream_hosts=resolved.responses_chat_json_stream_host_list(),
+        default_priority="background",
     )
     return AuthorLLMGateway(
         client=client,
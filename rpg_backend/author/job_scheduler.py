@@ -0,0 +1,205 @@
+"""Bounded admission for author jobs.
+
+`AuthorJobScheduler` runs at most ``max_concurrent`` author jobs at a time and
+keeps the rest waiting in per-user FIFO queues that are served round-robin, so
+one user submitting a burst cannot starve everyone else. Once the backlog is
+more than ``max_queue_depth`` jobs beyond the free run slots, new submissions
+are refused with `AuthorJobQueueFullError`, which carries a retry-after hint
+derived from recent job durations.
+
+The queue itself is not stored here: services persist each waiting job as a
+``queued`` job record and resubmit those records, oldest first, when they
+start up.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import math
+import threading
+from time import monotonic
+
+from rpg_backend.author.gateway import AuthorGatewayError
+
+# Retry-after estimates before any job has finished in this process.
+_DEFAULT_JOB_SECONDS = 60.0
+_JOB_SECONDS_SMOOTHING = 0.2
+_REPORT_EVERY_POSITION_UP_TO = 10
+
+
+class AuthorJobQueueFullError(AuthorGatewayError):
+    def __init__(self, *, queued_jobs: int, retry_after_seconds: int) -> None:
+        super().__init__(
+            code="author_job_queue_full",
+            message=f"author job queue is full ({queued_jobs} waiting); retry in about {retry_after_seconds}s",
+            status_code=429,
+        )
+        self.retry_after_seconds = retry_after_seconds
+
+
+def should_report_queue_position(previous: int | None, position: int) -> bool:
+    """Report the first position, then forward moves: each one near the front, every tenth place further back.
+
+    A new user's first job is served ahead of other users' backlogs, so places
+    can also slip back by one; those moves are not worth an event each.
+    """
+    if previous is None:
+        return True
+    if position >= previous:
+        return False
+    return position <= _REPORT_EVERY_POSITION_UP_TO or position // 10 != previous // 10
+
+
+@dataclass(frozen=True)
+class _QueuedJob:
+    job_id: str
+    owner_user_id: str
+    run: Callable[[], None]
+
+
+class AuthorJobScheduler:
+    def __init__(
+        self,
+        *,
+        max_concurrent: int,
+        max_queue_depth: int,
+        on_queue_changed: Callable[[dict[str, int]], None] | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._max_queue_depth = max(0, int(max_queue_depth))
+        self._on_queue_changed = on_queue_changed
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Users in service order; each holds that user's waiting jobs in submission order.
+        self._queues: OrderedDict[str, deque[_QueuedJob]] = OrderedDict()
+        self._queued = 0
+        self._reserved = 0
+        self._running: set[str] = set()
+        self._average_job_seconds = _DEFAULT_JOB_SECONDS
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    def running_count(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def queued_count(self) -> int:
+        with self._lock:
+            return self._queued
+
+    def ensure_capacity(self) -> None:
+        """Raise `AuthorJobQueueFullError` if a submission made now would be refused."""
+        with self._lock:
+            self._check_capacity_locked()
+
+    @contextmanager
+    def admission(self) -> Iterator[None]:
+        """Hold a backlog slot while the caller prepares and submits a job.
+
+        The slot is taken on entry, raising `AuthorJobQueueFullError` when there
+        is none, so concurrent submitters cannot all pass the depth check before
+        any of them has submitted. The slot is released on exit.
+        """
+        with self._lock:
+            self._check_capacity_locked()
+            self._reserved += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved -= 1
+
+    def submit(self, job_id: str, owner_user_id: str, run: Callable[[], None]) -> int | None:
+        """Queue ``run`` behind the owner's earlier jobs; returns the queue position, or ``None`` if it started."""
+        with self._lock:
+            queue = self._queues.get(owner_user_id)
+            if queue is None:
+                queue = self._queues[owner_user_id] = deque()
+            queue.append(_QueuedJob(job_id, owner_user_id, run))
+            self._queued += 1
+            started = self._dispatch_locked()
+            positions = self._positions_locked()
+        for job in started:
+            self._start(job)
+        self._notify(positions)
+        return positions.get(job_id)
+
+    def position(self, job_id: str) -> int | None:
+        """1-based place in line for a waiting job; ``None`` once it runs or if unknown."""
+        with self._lock:
+            return self._positions_locked().get(job_id)
+
+    def retry_after_seconds(self) -> int:
+        with self._lock:
+            return self._retry_after_locked()
+
+    def _check_capacity_locked(self) -> None:
+        if self._backlog_locked() >= self._max_concurrent + self._max_queue_depth:
+            raise AuthorJobQueueFullError(
+                queued_jobs=self._queued + self._reserved,
+                retry_after_seconds=self._retry_after_locked(),
+            )
+
+    def _backlog_locked(self) -> int:
+        return len(self._running) + self._queued + self._reserved
+
+    def _retry_after_locked(self) -> int:
+        # Jobs finish roughly every average/max_concurrent seconds; each one frees a backlog slot.
+        over_capacity = self._backlog_locked() - self._max_concurrent - self._max_queue_depth + 1
+        return max(1, math.ceil(max(over_capacity, 1) * self._average_job_seconds / self._max_concurrent))
+
+    def _dispatch_locked(self) -> list[_QueuedJob]:
+        started: list[_QueuedJob] = []
+        while self._queues and len(self._running) < self._max_concurrent:
+            owner_user_id, queue = next(iter(self._queues.items()))
+            job = queue.popleft()
+            # The served user goes to the back of the rotation.
+            del self._queues[owner_user_id]
+            if queue:
+                self._queues[owner_user_id] = queue
+            self._queued -= 1
+            self._running.add(job.job_id)
+            started.append(job)
+        return started
+
+    def _positions_locked(self) -> dict[str, int]:
+        # Mirrors _dispatch_locked: one job per user per round, users in rotation order.
+        positions: dict[str, int] = {}
+        queues = list(self._queues.values())
+        depth = 0
+        while queues:
+            for queue in queues:
+                positions[queue[depth].job_id] = len(positions) + 1
+            depth += 1
+            queues = [queue for queue in queues if len(queue) > depth]
+        return positions
+
+    def _start(self, job: _QueuedJob) -> None:
+        thread = threading.Thread(target=self._run, args=(job,), daemon=True, name=f"author-job-{job.job_id[:8]}")
+        thread.start()
+
+    def _run(self, job: _QueuedJob) -> None:
+        started_at = self._clock()
+        try:
+            job.run()
+        finally:
+            elapsed = self._clock() - started_at
+            with self._lock:
+                self._running.discard(job.job_id)
+                self._average_job_seconds += _JOB_SECONDS_SMOOTHING * (elapsed - self._average_job_seconds)
+                started = self._dispatch_locked()
+                positions = self._positions_locked()
+            for item in started:
+                self._start(item)
+            if started:
+                self._notify(positions)
+
+    def _notify(self, positions: dict[str, int]) -> None:
+        if self._on_queue_changed is not None:
+            self._on_queue_changed(positions)
@@ -25,6 +25,7 @@ from rpg_backend.author.display import (
     build_progress_snapshot,
 )
 from rpg_backend.author.gateway import AuthorGatewayError, AuthorLLMGateway, get_author_llm_gateway
+from rpg_backend.author.job_scheduler import AuthorJobScheduler, should_report_queue_position
 from rpg_backend.author.storage import SQLiteAuthorJobStorage
 from rpg_backend.author.metrics import (
     estimate_token_cost,
@@ -95,6 +96,12 @@ class AuthorJobService:
         self._lock = threading.Lock()
         self._jobs: dict[str, _AuthorJobRecord] = {}
         self._conditions: dict[str, threading.Condition] = {}
+        self._queue_positions: dict[str, int] = {}
+        self._scheduler = AuthorJobScheduler(
+            max_concurrent=self._settings.author_job_max_concurrent,
+            max_queue_depth=self._settings.author_job_max_queue_depth,
+            on_queue_changed=self._report_queue_positions,
+        )
         self._reconcile_interrupted_jobs()
 
     @staticmethod
@@ -219,8 +226,22 @@ class AuthorJobService:
         self._storage.save_job(self._serialize_job_record(record))
 
     def _start_background_job(self, job_id: str, *, resume_from_checkpoint: bool) -> None:
-        thread = threading.Thread(target=self._run_job, args=(job_id, resume_from_checkpoint), daemon=True)
-        thread.start()
+        with self._lock:
+            owner_user_id = self._get_record(job_id).owner_user_id
+        self._scheduler.submit(job_id, owner_user_id, lambda: self._run_job(job_id, resume_from_checkpoint))
+
+    def _report_queue_positions(self, positions: dict[str, int]) -> None:
+        for job_id, position in positions.items():
+            with self._lock:
+                if not should_report_queue_position(self._queue_positions.get(job_id), position):
+                    continue
+                self._queue_positions[job_id] = position
+            self._emit_event(
+                job_id,
+                "queue_position",
+                {**self._build_status_event_payload(job_id), "queue_position": position},
+                only_if_status="queued",
+            )
 
     def _run_preview_workflow(self, prompt_seed: str, *, actor_user_id: str) -> AuthorPreviewResponse:
         preview_id = str(uuid4())
@@ -276,24 +297,29 @@ class AuthorJobService:
             existing_preview=record.preview,
         )
 
+    def ensure_job_capacity(self) -> None:
+        """Refuse up front, before any quota is spent, when a new job could not be queued."""
+        self._scheduler.ensure_capacity()
+
     def create_job(self, request: AuthorJobCreateRequest, *, actor_user_id: str | None = None) -> AuthorJobStatusResponse:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
-        preview = self._resolve_preview_for_job(request, actor_user_id=resolved_actor_user_id)
-        job_id = str(uuid4())
-        record = _AuthorJobRecord(
-            job_id=job_id,
-            owner_user_id=resolved_actor_user_id,
-            prompt_seed=request.prompt_seed,
-            preview=preview,
-            status="running",
-            progress=self._progress_for_stage(preview.stage),
-        )
-        with self._lock:
-            record.condition = self._condition_for(job_id)
-            self._checkpointer.copy_thread(preview.preview_id, job_id)
-            self._save_record(record)
-        self._emit_event(job_id, "job_created", self._build_status_event_payload(job_id))
-        self._start_background_job(job_id, resume_from_checkpoint=True)
+        with self._scheduler.admission():
+            preview = self._resolve_preview_for_job(request, actor_user_id=resolved_actor_user_id)
+            job_id = str(uuid4())
+            record = _AuthorJobRecord(
+                job_id=job_id,
+                owner_user_id=resolved_actor_user_id,
+                prompt_seed=request.prompt_seed,
+                preview=preview,
+                status="queued",
+                progress=self._progress_for_stage(preview.stage),
+            )
+            with self._lock:
+                record.condition = self._condition_for(job_id)
+                self._checkpointer.copy_thread(preview.preview_id, job_id)
+                self._save_record(record)
+            self._emit_event(job_id, "job_created", self._build_status_event_payload(job_id))
+            self._start_background_job(job_id, resume_from_checkpoint=True)
         return self.get_job(job_id, actor_user_id=resolved_actor_user_id)
 
     def get_job(self, job_id: str, *, actor_user_id: str | None = None) -> AuthorJobStatusResponse:
@@ -310,6 +336,7 @@ class AuthorJobService:
             progress_snapshot=self._progress_snapshot(record),
             cache_metrics=record.cache_metrics,
             error=record.error,
+            queue_position=self._scheduler.position(job_id) if record.status == "queued" else None,
         )
 
     def get_job_result(self, job_id: str, *, actor_user_id: str | None = None) -> AuthorJobResultResponse:
@@ -406,6 +433,7 @@ class AuthorJobService:
             record = self._get_record(job_id)
             prior_llm_call_trace = list(record.llm_call_trace)
             checkpoint_exists = self._checkpointer.get_tuple(graph_config(run_id=job_id)) is not None
+            self._queue_positions.pop(job_id, None)
             record.status = "running"
             if not checkpoint_exists:
                 record.progress = AuthorJobProgress(
@@ -576,9 +604,18 @@ class AuthorJobService:
             payload.update(self._build_token_snapshot_payload(record))
             return payload
 
-    def _emit_event(self, job_id: str, event_name: str, payload: dict[str, Any]) -> None:
+    def _emit_event(
+        self,
+        job_id: str,
+        event_name: str,
+        payload: dict[str, Any],
+        *,
+        only_if_status: str | None = None,
+    ) -> None:
         with self._lock:
             record = self._get_record(job_id)
+            if only_if_status is not None and record.status != only_if_status:
+                return
             event_id = len(record.events) + 1
             emitted_at = self._now()
             event = {
@@ -595,9 +632,10 @@ class AuthorJobService:
             condition.notify_all()
 
     def _reconcile_interrupted_jobs(self) -> None:
-        for payload in self._storage.list_jobs():
-            if payload.get("status") not in {"queued", "running"}:
-                continue
+        # Jobs that were running go first, then the waiting queue in submission order.
+        pending = [payload for payload in self._storage.list_jobs() if payload.get("status") in {"queued", "running"}]
+        pending.sort(key=lambda payload: (payload["status"] != "running", str(payload["created_at"])))
+        for payload in pending:
             record = self._deserialize_job_record(payload)
             with self._lock:
                 record.condition = self._condition_for(record.job_id)
@@ -1354,7 +1354,7 @@ class UrbanAuthorBundle(BaseModel):
 
 
 class CompiledPlayPlan(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     story_id: str = Field(min_length=1)
     title: str = Field(min_length=1, max_length=120)
@@ -1391,6 +1391,9 @@ class CompiledPlayPlan(BaseModel):
     # engine to cascade reveals: when storylet A reveals secret X, the engine
     # consults this list to auto-reveal Y if X→Y is in the chains graph.
     secret_chains: list[dict[str, Any]] | None = None
+    # Digest of storylet_pool + secret_chains as validated at publish time (see
+    # play_v2.storylet_pool); None for older plans.
+    storylet_pool_digest: str | None = None
 
 
 class UrbanPipelineResult(BaseModel):
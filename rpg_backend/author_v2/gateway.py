@@ -181,6 +181,7 @@ def get_author_v2_llm_gateway(
         ),
         chat_json_stream_mode=resolved.responses_chat_json_stream_mode,
         chat_json_stream_hosts=resolved.responses_chat_json_stream_host_list(),
+        default_priority="background",
     )
     timeout_seconds = float(
         resolved.responses_timeout_seconds_author_v2_qwen
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+import heapq
+from types import MappingProxyType
 from typing import Any
 
 from rpg_backend.author.contracts import StoryShellId
@@ -495,8 +498,95 @@ def _synthetic_profiles() -> list[IPCharacterProfile]:
 URBAN_IP_LIBRARY: tuple[IPCharacterProfile, ...] = tuple([*_legacy_profiles(), *_synthetic_profiles()])
 
 
-def profile_by_id() -> dict[str, IPCharacterProfile]:
-    return {profile.ip_character_id: profile for profile in URBAN_IP_LIBRARY}
+@dataclass(frozen=True)
+class IPProfileFeatures:
+    """Per-profile values the slot ranker needs, derived once from the profile."""
+
+    profile: IPCharacterProfile
+    library_position: int
+    role_fit_by_slot_function: Mapping[str, float]
+    secret_affinity_tags: tuple[str, ...]
+    voice_register_tags: tuple[str, ...]
+    voice_register_tag_set: frozenset[str]
+    taboo_triggers: tuple[str, ...]
+    persona_trait_set: frozenset[str]
+    disallowed_with: frozenset[str]
+
+
+@dataclass(frozen=True)
+class IPLibraryIndex:
+    """Immutable lookup tables over an IP character library.
+
+    The inverted indexes hold profile ids in library order. Tag indexes list a
+    profile once per occurrence of the tag, matching how the fit scores count.
+    Every map is a read-only proxy, since the urban index is shared module state.
+    """
+
+    profiles: tuple[IPCharacterProfile, ...]
+    by_id: Mapping[str, IPCharacterProfile]
+    features_by_id: Mapping[str, IPProfileFeatures]
+    profile_ids_by_slot_function: Mapping[str, tuple[str, ...]]
+    profile_ids_by_secret_affinity: Mapping[str, tuple[str, ...]]
+    profile_ids_by_voice_register: Mapping[str, tuple[str, ...]]
+
+
+def _profile_features(profile: IPCharacterProfile, position: int) -> IPProfileFeatures:
+    role_fit: dict[str, float] = {}
+    for rank, slot_function in enumerate(profile.compatible_slot_functions):
+        role_fit.setdefault(str(slot_function), max(0.0, 3.4 - rank * 0.9))
+    return IPProfileFeatures(
+        profile=profile,
+        library_position=position,
+        role_fit_by_slot_function=MappingProxyType(role_fit),
+        secret_affinity_tags=tuple(profile.secret_affinity_tags),
+        voice_register_tags=tuple(profile.voice_register_tags),
+        voice_register_tag_set=frozenset(profile.voice_register_tags),
+        taboo_triggers=tuple(profile.taboo_triggers),
+        persona_trait_set=frozenset(profile.persona_traits),
+        disallowed_with=frozenset(profile.disallowed_with),
+    )
+
+
+def _frozen_id_index(index: dict[str, list[str]]) -> Mapping[str, tuple[str, ...]]:
+    return MappingProxyType({key: tuple(value) for key, value in index.items()})
+
+
+def build_ip_library_index(profiles: tuple[IPCharacterProfile, ...] | list[IPCharacterProfile]) -> IPLibraryIndex:
+    ordered = tuple(profiles)
+    by_id: dict[str, IPCharacterProfile] = {}
+    features_by_id: dict[str, IPProfileFeatures] = {}
+    by_slot_function: dict[str, list[str]] = {}
+    by_secret_affinity: dict[str, list[str]] = {}
+    by_voice_register: dict[str, list[str]] = {}
+    for position, profile in enumerate(ordered):
+        profile_id = profile.ip_character_id
+        by_id[profile_id] = profile
+        features = features_by_id[profile_id] = _profile_features(profile, position)
+        for slot_function in features.role_fit_by_slot_function:
+            by_slot_function.setdefault(slot_function, []).append(profile_id)
+        for tag in features.secret_affinity_tags:
+            by_secret_affinity.setdefault(tag, []).append(profile_id)
+        for tag in features.voice_register_tags:
+            by_voice_register.setdefault(tag, []).append(profile_id)
+    return IPLibraryIndex(
+        profiles=ordered,
+        by_id=MappingProxyType(by_id),
+        features_by_id=MappingProxyType(features_by_id),
+        profile_ids_by_slot_function=_frozen_id_index(by_slot_function),
+        profile_ids_by_secret_affinity=_frozen_id_index(by_secret_affinity),
+        profile_ids_by_voice_register=_frozen_id_index(by_voice_register),
+    )
+
+
+_URBAN_IP_LIBRARY_INDEX = build_ip_library_index(URBAN_IP_LIBRARY)
+
+
+def ip_library_index() -> IPLibraryIndex:
+    return _URBAN_IP_LIBRARY_INDEX
+
+
+def profile_by_id() -> Mapping[str, IPCharacterProfile]:
+    return _URBAN_IP_LIBRARY_INDEX.by_id
 
 
 def shell_compatible_profiles(_shell_id: StoryShellId) -> list[IPCharacterProfile]:
@@ -511,50 +601,33 @@ class SlotCandidate:
     score_breakdown: dict[str, float]
 
 
-def _role_slot_fit(profile: IPCharacterProfile, slot: CastSlotPlan) -> float:
-    if slot.slot_function not in set(profile.compatible_slot_functions):
-        return 0.0
-    rank = list(profile.compatible_slot_functions).index(slot.slot_function)
-    base = max(0.0, 3.4 - rank * 0.9)
-    if slot.route_eligible and slot.slot_function in {"lead_interest", "rival_interest", "wildcard"}:
-        base += 0.5
-    return base
+def _matched_tags(text: str, keywords_by_tag: dict[str, tuple[str, ...]]) -> list[str]:
+    return [tag for tag, keywords in keywords_by_tag.items() if any(keyword in text for keyword in keywords)]
 
 
-def _secret_type_fit(profile: IPCharacterProfile, blueprint: AcceptedBlueprint, slot: CastSlotPlan) -> float:
-    text = f"{blueprint.taboo_secret} {blueprint.relationship_setup} {slot.secret_pressure}"
-    score = 0.0
-    for tag in profile.secret_affinity_tags:
-        keywords = _SECRET_AFFINITY_KEYWORDS.get(tag, ())
-        if any(keyword in text for keyword in keywords):
-            score += 1.0
-    if score <= 0.0:
-        score += sum(0.4 for trigger in profile.taboo_triggers if trigger in text)
-    return min(score, 3.0)
+def _tag_hit_counts(matched_tags: list[str], profile_ids_by_tag: Mapping[str, tuple[str, ...]]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for tag in matched_tags:
+        for profile_id in profile_ids_by_tag.get(tag, ()):
+            counts[profile_id] = counts.get(profile_id, 0) + 1
+    return counts
 
 
-def _voice_register_fit(profile: IPCharacterProfile, blueprint: AcceptedBlueprint) -> float:
-    text = f"{blueprint.social_arena} {blueprint.share_hook} {blueprint.hook}"
-    score = 0.0
-    for tag in profile.voice_register_tags:
-        keywords = _VOICE_REGISTER_KEYWORDS.get(tag, ())
-        if any(keyword in text for keyword in keywords):
-            score += 0.8
-    return min(score, 2.4)
+def _route_slot_bonus(slot: CastSlotPlan) -> float:
+    if slot.route_eligible and slot.slot_function in {"lead_interest", "rival_interest", "wildcard"}:
+        return 0.5
+    return 0.0
 
 
-def _duplicate_penalty(profile: IPCharacterProfile, selected: list[IPCharacterProfile]) -> float:
+def _duplicate_penalty(features: IPProfileFeatures, selected: list[IPProfileFeatures]) -> float:
     if not selected:
         return 0.0
-    profile_traits = set(profile.persona_traits)
     penalty = 0.0
     for picked in selected:
-        shared_traits = len(profile_traits.intersection(set(picked.persona_traits)))
-        penalty += float(shared_traits) * 0.55
-        if profile.worldly_desire_type == picked.worldly_desire_type:
+        penalty += float(len(features.persona_trait_set & picked.persona_trait_set)) * 0.55
+        if features.profile.worldly_desire_type == picked.profile.worldly_desire_type:
             penalty += 0.4
-        shared_voice_tags = len(set(profile.voice_register_tags).intersection(set(picked.voice_register_tags)))
-        penalty += float(shared_voice_tags) * 0.2
+        penalty += float(len(features.voice_register_tag_set & picked.voice_register_tag_set)) * 0.2
     return min(penalty, 2.4)
 
 
@@ -574,21 +647,24 @@ def _hard_filter_profiles(
     *,
     selected: list[IPCharacterProfile],
     selected_ids: set[str],
-) -> list[IPCharacterProfile]:
+    library: IPLibraryIndex,
+) -> list[IPProfileFeatures]:
     target_gender = blueprint.target_gender_pref
-    output: list[IPCharacterProfile] = []
-    for profile in URBAN_IP_LIBRARY:
-        if profile.ip_character_id in selected_ids:
+    selected_disallowed = {profile_id for picked in selected for profile_id in picked.disallowed_with}
+    picked_ids = {picked.ip_character_id for picked in selected}
+    output: list[IPProfileFeatures] = []
+    for profile_id in library.profile_ids_by_slot_function.get(slot.slot_function, ()):
+        if profile_id in selected_ids or profile_id in selected_disallowed:
             continue
+        features = library.features_by_id[profile_id]
+        profile = features.profile
         if not profile.is_adult:
             continue
         if target_gender in _TARGET_GENDER_VALUES and profile.gender != target_gender:
             continue
-        if slot.slot_function not in set(profile.compatible_slot_functions):
-            continue
-        if _disallowed_hit(profile, selected):
+        if not features.disallowed_with.isdisjoint(picked_ids):
             continue
-        output.append(profile)
+        output.append(features)
     return output
 
 
@@ -599,35 +675,68 @@ def _rank_profiles_for_slot(
     selected: list[IPCharacterProfile],
     selected_ids: set[str],
     limit: int = 8,
+    library: IPLibraryIndex | None = None,
 ) -> list[SlotCandidate]:
-    filtered = _hard_filter_profiles(slot, blueprint, selected=selected, selected_ids=selected_ids)
-    ranked: list[SlotCandidate] = []
-    for profile in filtered:
-        role_slot_fit = _role_slot_fit(profile, slot)
-        secret_type_fit = _secret_type_fit(profile, blueprint, slot)
-        voice_register_fit = _voice_register_fit(profile, blueprint)
-        duplicate_penalty = _duplicate_penalty(profile, selected)
+    library = library or _URBAN_IP_LIBRARY_INDEX
+    filtered = _hard_filter_profiles(slot, blueprint, selected=selected, selected_ids=selected_ids, library=library)
+    if not filtered:
+        return []
+    # Keyword matching depends only on the blueprint and slot, so it runs once per
+    # tag here and the inverted indexes turn the matches into per-profile counts.
+    secret_text = f"{blueprint.taboo_secret} {blueprint.relationship_setup} {slot.secret_pressure}"
+    voice_text = f"{blueprint.social_arena} {blueprint.share_hook} {blueprint.hook}"
+    secret_hits = _tag_hit_counts(
+        _matched_tags(secret_text, _SECRET_AFFINITY_KEYWORDS), library.profile_ids_by_secret_affinity
+    )
+    voice_hits = _tag_hit_counts(
+        _matched_tags(voice_text, _VOICE_REGISTER_KEYWORDS), library.profile_ids_by_voice_register
+    )
+    trigger_hits: dict[str, bool] = {}
+    selected_features = [
+        library.features_by_id.get(picked.ip_character_id) or _profile_features(picked, -1) for picked in selected
+    ]
+    route_bonus = _route_slot_bonus(slot)
+    scored: list[tuple[float, float, str, IPProfileFeatures, float, float, float]] = []
+    for features in filtered:
+        profile_id = features.profile.ip_character_id
+        role_slot_fit = features.role_fit_by_slot_function[slot.slot_function] + route_bonus
+        secret_type_fit = float(secret_hits.get(profile_id, 0))
+        if secret_type_fit <= 0.0:
+            for trigger in features.taboo_triggers:
+                if trigger not in trigger_hits:
+                    trigger_hits[trigger] = trigger in secret_text
+                if trigger_hits[trigger]:
+                    secret_type_fit += 0.4
+        secret_type_fit = min(secret_type_fit, 3.0)
+        voice_register_fit = min(voice_hits.get(profile_id, 0) * 0.8, 2.4)
+        duplicate_penalty = _duplicate_penalty(features, selected_features)
         score = round(role_slot_fit + secret_type_fit + voice_register_fit - duplicate_penalty, 4)
-        ranked.append(
-            SlotCandidate(
-                profile=profile,
-                score=score,
-                score_breakdown={
-                    "role_slot_fit": role_slot_fit,
-                    "secret_type_fit": secret_type_fit,
-                    "voice_register_fit": voice_register_fit,
-                    "duplicate_penalty": duplicate_penalty,
-                },
-            )
+        scored.append(
+            (-score, -role_slot_fit, profile_id, features, secret_type_fit, voice_register_fit, duplicate_penalty)
         )
-    ranked.sort(
-        key=lambda item: (
-            -item.score,
-            -item.score_breakdown["role_slot_fit"],
-            item.profile.ip_character_id,
+    # Candidate objects are only built for the rows that survive the cut.
+    top = heapq.nsmallest(max(1, limit), scored, key=lambda row: row[:3])
+    return [
+        SlotCandidate(
+            profile=features.profile,
+            score=-negative_score,
+            score_breakdown={
+                "role_slot_fit": -negative_role_fit,
+                "secret_type_fit": secret_type_fit,
+                "voice_register_fit": voice_register_fit,
+                "duplicate_penalty": duplicate_penalty,
+            },
         )
-    )
-    return ranked[: max(1, limit)]
+        for (
+            negative_score,
+            negative_role_fit,
+            _profile_id,
+            features,
+            secret_type_fit,
+            voice_register_fit,
+            duplicate_penalty,
+        ) in top
+    ]
 
 
 def build_slot_candidate_pool(
@@ -635,6 +744,7 @@ def build_slot_candidate_pool(
     blueprint: AcceptedBlueprint,
     *,
     top_k: int = 8,
+    library: IPLibraryIndex | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
     selected: list[IPCharacterProfile] = []
     selected_ids: set[str] = set()
@@ -646,6 +756,7 @@ def build_slot_candidate_pool(
             selected=selected,
             selected_ids=selected_ids,
             limit=top_k,
+            library=library,
         )
         output[slot.slot_id] = [
             {
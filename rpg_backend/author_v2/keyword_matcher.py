@@ -0,0 +1,63 @@
+"""Multi-keyword matching in a single pass over the text.
+
+`KeywordMatcher` compiles a fixed vocabulary into an Aho–Corasick automaton, so
+finding every vocabulary keyword that occurs in a seed costs one walk over the
+seed plus the number of hits, however many keywords or keyword families the
+caller registers.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+class KeywordMatcher:
+    __slots__ = ("_goto", "_fail", "_outputs", "vocabulary")
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.vocabulary: frozenset[str] = frozenset(keyword for keyword in keywords if keyword)
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[tuple[str, ...]] = [()]
+        # Insert in sorted order so the automaton (and hit order) is independent of input order.
+        for keyword in sorted(self.vocabulary):
+            node = 0
+            for char in keyword:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    outputs.append(())
+                node = next_node
+            outputs[node] = (*outputs[node], keyword)
+        fail = [0] * len(goto)
+        queue: deque[int] = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                fallback = fail[node]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[child] = target if target != child else 0
+                outputs[child] = (*outputs[child], *outputs[fail[child]])
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def find(self, text: str) -> frozenset[str]:
+        """Every vocabulary keyword that occurs in ``text`` as a substring."""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        hits: set[str] = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                hits.update(outputs[node])
+        return frozenset(hits)
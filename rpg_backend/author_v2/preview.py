@@ -865,6 +865,10 @@ def build_preview_blueprint_graph() -> Any:
     return graph.compile()
 
 
+def new_preview_id(prompt_seed: str) -> str:
+    return f"preview_{slugify(prompt_seed)[:24]}_{uuid4().hex[:8]}"
+
+
 def run_preview_blueprint_graph(
     prompt_seed: str,
     *,
@@ -875,7 +879,7 @@ def run_preview_blueprint_graph(
     compiled = build_preview_blueprint_graph()
     initial_state: PreviewState = {
         "prompt_seed": normalize_whitespace(prompt_seed),
-        "preview_id": preview_id or f"preview_{slugify(prompt_seed)[:24]}_{uuid4().hex[:8]}",
+        "preview_id": preview_id or new_preview_id(prompt_seed),
         "llm_call_trace": [],
         "quality_trace": [],
         "live_mode": live_mode,
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+import hashlib
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable
+
+from rpg_backend.author.normalize import normalize_whitespace
+
+# Trailing sentence punctuation does not change what a seed asks for.
+_TRAILING_SEED_PUNCTUATION = "。．.！!？?～~…"
+
+
+def normalize_preview_seed(prompt_seed: str) -> str:
+    """Canonical form of a seed for cache lookups: collapsed whitespace, no trailing punctuation."""
+    return normalize_whitespace(prompt_seed).rstrip(_TRAILING_SEED_PUNCTUATION).strip()
+
+
+def preview_cache_key(prompt_seed: str, *, live_mode: str) -> str:
+    digest = hashlib.sha256(normalize_preview_seed(prompt_seed).encode("utf-8")).hexdigest()
+    return f"{live_mode}:{digest}"
+
+
+@dataclass(frozen=True)
+class PreviewBlueprintCacheStats:
+    hits: int
+    coalesced: int
+    misses: int
+    resident_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.coalesced + self.misses
+        return round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+
+
+class PreviewBlueprintCache:
+    """TTL + LRU cache of generated preview blueprints with request coalescing.
+
+    ``get_or_build`` returns a fresh entry when there is one. Otherwise the
+    first caller for a key runs ``build`` and every concurrent caller for the
+    same key waits on that one generation instead of starting its own. A
+    build failure reaches every waiter and is never cached. ``build`` returns
+    ``(value, cacheable)`` so results that only exist because generation fell
+    back (e.g. a provider outage) can be shared with the waiters of that
+    flight without being kept around for later requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._ttl_seconds = max(float(ttl_seconds), 0.0)
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._hits = 0
+        self._coalesced = 0
+        self._misses = 0
+
+    def get_or_build(self, key: str, build: Callable[[], tuple[Any, bool]]) -> tuple[Any, str]:
+        """Return ``(value, source)`` where source is ``hit``, ``coalesced`` or ``miss``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry.value, "hit"
+                del self._entries[key]
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._inflight[key] = Future()
+                self._misses += 1
+            else:
+                self._coalesced += 1
+        if not owner:
+            return flight.result(), "coalesced"
+        try:
+            value, cacheable = build()
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.set_exception(exc)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+            if cacheable and self._ttl_seconds > 0:
+                self._entries[key] = _CacheEntry(value=value, expires_at=self._clock() + self._ttl_seconds)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        flight.set_result(value)
+        return value, "miss"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> PreviewBlueprintCacheStats:
+        with self._lock:
+            return PreviewBlueprintCacheStats(
+                hits=self._hits,
+                coalesced=self._coalesced,
+                misses=self._misses,
+                resident_entries=len(self._entries),
+            )
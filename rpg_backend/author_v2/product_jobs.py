@@ -4,11 +4,12 @@ import json
 import threading
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import tempfile
 from typing import Any
 from uuid import uuid4
 
+from rpg_backend.author.checkpointer import get_author_checkpointer, graph_config
 from rpg_backend.author.contracts import (
     AuthorCacheMetrics,
     AuthorJobCreateRequest,
@@ -22,10 +23,18 @@ from rpg_backend.author.contracts import (
 )
 from rpg_backend.author.display import build_progress_snapshot
 from rpg_backend.author.gateway import AuthorGatewayError
+from rpg_backend.author.job_scheduler import AuthorJobScheduler, should_report_queue_position
 from rpg_backend.author.jobs import AuthorJobPublishSource
 from rpg_backend.author.metrics import estimate_token_cost, summarize_cache_metrics
+from rpg_backend.author.normalize import normalize_whitespace
 from rpg_backend.author.storage import SQLiteAuthorJobStorage
-from rpg_backend.author_v2.preview import apply_blueprint_edits, normalize_preview_blueprint, run_preview_blueprint_graph
+from rpg_backend.author_v2.preview import (
+    apply_blueprint_edits,
+    new_preview_id,
+    normalize_preview_blueprint,
+    run_preview_blueprint_graph,
+)
+from rpg_backend.author_v2.preview_cache import PreviewBlueprintCache, preview_cache_key
 from rpg_backend.author_v2.product_adapters import (
     author_preview_from_blueprint,
     author_story_summary_from_package,
@@ -39,7 +48,7 @@ from rpg_backend.author_v2.quality_gates import (
     evaluate_segment_tension_gate,
     evaluate_surface_signal_readability,
 )
-from rpg_backend.author_v2.workflow import run_author_play_graph, select_arc_template
+from rpg_backend.author_v2.workflow import AUTHOR_PLAY_CHECKPOINT_ALLOWLIST, run_author_play_graph, select_arc_template
 from rpg_backend.benchmark.contracts import (
     BenchmarkAuthorJobDiagnosticsResponse,
     BenchmarkAuthorJobEvent,
@@ -84,9 +93,22 @@ class ProductAuthorJobService:
             if settings is not None
             else f"{tempfile.gettempdir()}/rpg_demo_author_jobs_v2_{uuid4()}.sqlite3"
         )
+        self._preview_cache = PreviewBlueprintCache(
+            ttl_seconds=self._settings.author_preview_cache_ttl_seconds,
+            max_entries=self._settings.author_preview_cache_max_entries,
+        )
+        self._checkpointer = get_author_checkpointer(db_path=self._storage.db_path).with_allowlist(
+            AUTHOR_PLAY_CHECKPOINT_ALLOWLIST
+        )
         self._lock = threading.Lock()
         self._jobs: dict[str, _ProductAuthorJobRecord] = {}
         self._conditions: dict[str, threading.Condition] = {}
+        self._queue_positions: dict[str, int] = {}
+        self._scheduler = AuthorJobScheduler(
+            max_concurrent=self._settings.author_job_max_concurrent,
+            max_queue_depth=self._settings.author_job_max_queue_depth,
+            on_queue_changed=self._report_queue_positions,
+        )
         self._reconcile_interrupted_jobs()
 
     @staticmethod
@@ -116,6 +138,32 @@ class ProductAuthorJobService:
     def _run_mode(self) -> str:
         return str(getattr(self._settings, "author_product_run_mode", "deterministic") or "deterministic")
 
+    def _generate_preview_blueprint(self, prompt_seed: str):  # noqa: ANN202
+        """Generate (or reuse) the preview blueprint for a seed.
+
+        Seeds that normalize to the same text share one cached blueprint, and
+        concurrent requests for it share one in-flight generation. Each caller
+        gets its own copy with a fresh preview id. Blueprints that needed a
+        fallback anywhere in the graph are not cached.
+        """
+        live_mode = self._run_mode()
+
+        def _build():  # noqa: ANN202
+            preview_blueprint, state = run_preview_blueprint_graph(prompt_seed, live_mode=live_mode)  # type: ignore[arg-type]
+            cacheable = all(record.get("outcome") == "accepted" for record in state.get("quality_trace", []))
+            return preview_blueprint, cacheable
+
+        preview_blueprint, _source = self._preview_cache.get_or_build(
+            preview_cache_key(prompt_seed, live_mode=live_mode),
+            _build,
+        )
+        return preview_blueprint.model_copy(
+            update={
+                "preview_id": new_preview_id(prompt_seed),
+                "prompt_seed": normalize_whitespace(prompt_seed),
+            }
+        )
+
     @staticmethod
     def _progress_for_stage(stage: str) -> AuthorJobProgress:
         public_stage_to_index = {
@@ -271,9 +319,18 @@ class ProductAuthorJobService:
             payload.update(self._build_token_snapshot_payload(record))
             return payload
 
-    def _emit_event(self, job_id: str, event_name: str, payload: dict[str, Any]) -> None:
+    def _emit_event(
+        self,
+        job_id: str,
+        event_name: str,
+        payload: dict[str, Any],
+        *,
+        only_if_status: str | None = None,
+    ) -> None:
         with self._lock:
             record = self._get_record(job_id)
+            if only_if_status is not None and record.status != only_if_status:
+                return
             event_id = len(record.events) + 1
             emitted_at = self._now()
             event = {"id": event_id, "event": event_name, "emitted_at": emitted_at, "data": payload}
@@ -308,7 +365,7 @@ class ProductAuthorJobService:
         actor_user_id: str | None = None,
     ) -> AuthorPreviewResponse:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
-        preview_blueprint, _state = run_preview_blueprint_graph(request.prompt_seed, live_mode=self._run_mode())  # type: ignore[arg-type]
+        preview_blueprint = self._generate_preview_blueprint(request.prompt_seed)
         preview_blueprint = self._apply_requested_preview_edits(preview_blueprint, request)
         preview = author_preview_from_blueprint(preview_blueprint)
         self._storage.save_preview(
@@ -333,31 +390,48 @@ class ProductAuthorJobService:
                 preview_blueprint = self._apply_requested_preview_edits(preview_blueprint, request)
                 preview = author_preview_from_blueprint(preview_blueprint)
             return preview, preview_blueprint
-        preview_blueprint, _state = run_preview_blueprint_graph(request.prompt_seed, live_mode=self._run_mode())
+        preview_blueprint = self._generate_preview_blueprint(request.prompt_seed)
         preview_blueprint = self._apply_requested_preview_edits(preview_blueprint, request)
         return author_preview_from_blueprint(preview_blueprint), preview_blueprint
 
+    def ensure_job_capacity(self) -> None:
+        """Refuse up front, before any quota is spent, when a new job could not be queued."""
+        self._scheduler.ensure_capacity()
+
     def create_job(self, request: AuthorJobCreateRequest, *, actor_user_id: str | None = None) -> AuthorJobStatusResponse:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
-        preview, preview_blueprint = self._resolve_preview_for_job(request, actor_user_id=resolved_actor_user_id)
-        job_id = str(uuid4())
-        record = _ProductAuthorJobRecord(
-            job_id=job_id,
-            owner_user_id=resolved_actor_user_id,
-            prompt_seed=request.prompt_seed,
-            preview=preview,
-            preview_blueprint=preview_blueprint,
-            status="running",
-            progress=self._progress_for_stage("running"),
-        )
-        with self._lock:
-            record.condition = self._condition_for(job_id)
-            self._save_record(record)
-        self._emit_event(job_id, "job_created", self._build_status_event_payload(job_id))
-        thread = threading.Thread(target=self._run_job, args=(job_id,), daemon=True)
-        thread.start()
+        with self._scheduler.admission():
+            preview, preview_blueprint = self._resolve_preview_for_job(request, actor_user_id=resolved_actor_user_id)
+            job_id = str(uuid4())
+            record = _ProductAuthorJobRecord(
+                job_id=job_id,
+                owner_user_id=resolved_actor_user_id,
+                prompt_seed=request.prompt_seed,
+                preview=preview,
+                preview_blueprint=preview_blueprint,
+                status="queued",
+                progress=self._progress_for_stage("queued"),
+            )
+            with self._lock:
+                record.condition = self._condition_for(job_id)
+                self._save_record(record)
+            self._emit_event(job_id, "job_created", self._build_status_event_payload(job_id))
+            self._scheduler.submit(job_id, resolved_actor_user_id, lambda: self._run_job(job_id))
         return self.get_job(job_id, actor_user_id=resolved_actor_user_id)
 
+    def _report_queue_positions(self, positions: dict[str, int]) -> None:
+        for job_id, position in positions.items():
+            with self._lock:
+                if not should_report_queue_position(self._queue_positions.get(job_id), position):
+                    continue
+                self._queue_positions[job_id] = position
+            self._emit_event(
+                job_id,
+                "queue_position",
+                {**self._build_status_event_payload(job_id), "queue_position": position},
+                only_if_status="queued",
+            )
+
     def get_job(self, job_id: str, *, actor_user_id: str | None = None) -> AuthorJobStatusResponse:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
         with self._lock:
@@ -372,6 +446,7 @@ class ProductAuthorJobService:
             progress_snapshot=self._progress_snapshot(record),
             cache_metrics=record.cache_metrics,
             error=record.error,
+            queue_position=self._scheduler.position(job_id) if record.status == "queued" else None,
         )
 
     def get_job_result(self, job_id: str, *, actor_user_id: str | None = None) -> AuthorJobResultResponse:
@@ -428,7 +503,10 @@ class ProductAuthorJobService:
             llm_call_trace=list(record.llm_call_trace),
             quality_trace=list(record.quality_trace),
             source_summary=dict(record.source_summary),
-            stage_timings=self._build_stage_timings(record.events),
+            stage_timings=[
+                *self._build_stage_timings(record.events),
+                *self._build_policy_compile_timings(record.quality_trace),
+            ],
             events=self._build_diagnostic_events(record.events),
         )
 
@@ -466,19 +544,30 @@ class ProductAuthorJobService:
     def _run_job(self, job_id: str) -> None:
         with self._lock:
             record = self._get_record(job_id)
+            checkpoint_exists = self._checkpointer.get_tuple(graph_config(run_id=job_id)) is not None
+            self._queue_positions.pop(job_id, None)
             record.status = "running"
             record.progress = self._progress_for_stage("cast_planned")
             record.error = None
             record.updated_at = self._now()
             self._save_record(record)
-        self._emit_event(job_id, "job_started", self._build_status_event_payload(job_id))
+        self._emit_event(
+            job_id,
+            "job_resumed" if checkpoint_exists else "job_started",
+            self._build_status_event_payload(job_id),
+        )
         try:
             self._emit_event(job_id, "stage_changed", self._build_status_event_payload(job_id))
             accepted_blueprint = apply_blueprint_edits(record.preview_blueprint)
             if self._settings.author_v3_enabled:
                 self._run_job_v3(job_id, record, accepted_blueprint)
                 return
-            pipeline = run_author_play_graph(accepted_blueprint, live_mode=self._run_mode())  # type: ignore[arg-type]
+            pipeline = run_author_play_graph(
+                accepted_blueprint,
+                live_mode=self._run_mode(),  # type: ignore[arg-type]
+                checkpointer=self._checkpointer,
+                run_id=job_id,
+            )
             package = package_from_pipeline(
                 preview_blueprint=record.preview_blueprint,
                 accepted_blueprint=accepted_blueprint,
@@ -598,6 +687,7 @@ class ProductAuthorJobService:
             preview_blueprint=record.preview_blueprint,
             accepted_blueprint=accepted_blueprint,
             plan=plan,
+            llm_call_trace=v3_result["llm_call_trace"],
         )
         summary = author_story_summary_from_package(package)
         quality_trace = list(package.quality_trace)
@@ -618,6 +708,7 @@ class ProductAuthorJobService:
             current.preview_blueprint = package.preview_blueprint
             current.summary = summary
             current.bundle = package
+            current.llm_call_trace = list(package.llm_call_trace)
             current.quality_trace = quality_trace
             current.source_summary = {
                 "package_version": package.package_version,
@@ -633,6 +724,7 @@ class ProductAuthorJobService:
                 "ending_payoff_gate": "accepted",
                 "author_v3_quality_passed": "yes" if quality_report.passed else "no",
             }
+            current.cache_metrics = summarize_cache_metrics(package.llm_call_trace)
             current.updated_at = self._now()
             current.finished_at = self._now()
             if not quality_report.passed:
@@ -653,15 +745,15 @@ class ProductAuthorJobService:
         )
 
     def _reconcile_interrupted_jobs(self) -> None:
-        for payload in self._storage.list_jobs():
-            if payload.get("status") not in {"queued", "running"}:
-                continue
+        # Jobs that were running go first, then the waiting queue in submission order.
+        pending = [payload for payload in self._storage.list_jobs() if payload.get("status") in {"queued", "running"}]
+        pending.sort(key=lambda payload: (payload["status"] != "running", str(payload["created_at"])))
+        for payload in pending:
             record = self._deserialize_job_record(payload)
             with self._lock:
                 record.condition = self._condition_for(record.job_id)
                 self._save_record(record)
-            thread = threading.Thread(target=self._run_job, args=(record.job_id,), daemon=True)
-            thread.start()
+            self._scheduler.submit(record.job_id, record.owner_user_id, lambda job_id=record.job_id: self._run_job(job_id))
 
     @staticmethod
     def _encode_sse_event(event: dict[str, Any]) -> str:
@@ -689,6 +781,28 @@ class ProductAuthorJobService:
             )
         return payloads
 
+    @staticmethod
+    def _build_policy_compile_timings(quality_trace: list[dict[str, Any]]) -> list[BenchmarkStageTiming]:
+        # compile_play_plan reports how long policy compilation took and whether it hit the cache.
+        timings: list[BenchmarkStageTiming] = []
+        for record in quality_trace:
+            if record.get("stage") != "compile_play_plan" or "policy_compile_ms" not in record:
+                continue
+            try:
+                started_at = datetime.fromisoformat(str(record.get("policy_compile_started_at")))
+            except ValueError:
+                continue
+            elapsed_ms = max(float(record["policy_compile_ms"]), 0.0)
+            timings.append(
+                BenchmarkStageTiming(
+                    stage=f"compile_play_plan.policy_cache_{record.get('policy_cache') or 'miss'}",
+                    started_at=started_at,
+                    ended_at=started_at + timedelta(milliseconds=elapsed_ms),
+                    elapsed_ms=int(round(elapsed_ms)),
+                )
+            )
+        return timings
+
     @staticmethod
     def _build_stage_timings(events: list[dict[str, Any]]) -> list[BenchmarkStageTiming]:
         stage_events: list[tuple[str, datetime]] = []
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, NamedTuple
 
 from rpg_backend.author.normalize import trim_text
 from rpg_backend.author_v2.contracts import (
@@ -27,6 +27,7 @@ from rpg_backend.author_v2.contracts import (
     ToneSignalFamily,
     ToneBias,
 )
+from rpg_backend.author_v2.keyword_matcher import KeywordMatcher
 
 PROMO_SHELLS: tuple[StoryShellId, ...] = (
     "wealth_families",
@@ -107,67 +108,100 @@ _EXPLICIT_OUT_OF_SCOPE_KEYWORDS: tuple[str, ...] = (
 )
 
 
-def _contains_any(seed: str, keywords: tuple[str, ...]) -> bool:
-    return any(keyword in seed for keyword in keywords)
+_ARENA_KEYWORDS: tuple[str, ...] = (
+    "订婚", "遗嘱", "董事会", "发布会", "升职", "空降", "并购", "颁奖", "红毯",
+    "奖项", "直播", "综艺", "录制", "校庆", "导师", "评审", "社团",
+)
+_SECRET_CLASS_KEYWORDS: tuple[str, ...] = ("遗嘱", "旧案证据", "私生", "黑账", "合同", "偷拍视频", "黑料", "热搜", "录音")
+_GEOMETRY_KEYWORDS: tuple[str, ...] = ("未婚夫", "旧爱", "律师", "上司", "对手", "法务", "私生", "继承")
+_COST_KEYWORDS: tuple[str, ...] = ("继承", "遗嘱", "升职", "职位")
+_ROUTE_BIAS_KEYWORDS: tuple[tuple[RoutePreferenceBias, tuple[str, ...]], ...] = (
+    ("side", ("站队", "表态", "背锅", "扛雷")),
+    ("relationship", ("前任", "旧爱", "暧昧", "未婚夫")),
+    ("burst", ("放录音", "翻桌", "公开", "当众", "热搜")),
+)
 
+# One automaton over every keyword family the fingerprint reads, so a seed is
+# scanned once and each axis below is decided by set lookups on the hits.
+_SEED_KEYWORD_MATCHER = KeywordMatcher(
+    [
+        *(keyword for keywords in _SHELL_KEYWORDS.values() for keyword in keywords),
+        *_EXPLICIT_OUT_OF_SCOPE_KEYWORDS,
+        *_ARENA_KEYWORDS,
+        *_SECRET_CLASS_KEYWORDS,
+        *_GEOMETRY_KEYWORDS,
+        *_COST_KEYWORDS,
+        *(keyword for _bias, keywords in _ROUTE_BIAS_KEYWORDS for keyword in keywords),
+    ]
+)
+_SHELL_WEIGHTS_BY_KEYWORD: dict[str, dict[StoryShellId, int]] = {}
+for _shell_id, _keywords in _SHELL_KEYWORDS.items():
+    for _keyword in _keywords:
+        _weights = _SHELL_WEIGHTS_BY_KEYWORD.setdefault(_keyword, {})
+        _weights[_shell_id] = _weights.get(_shell_id, 0) + 1
 
-def _best_shell(seed: str) -> tuple[StoryShellId, int]:
-    scores = {
-        shell_id: sum(1 for keyword in keywords if keyword in seed)
-        for shell_id, keywords in _SHELL_KEYWORDS.items()
-    }
+
+def _contains_any(hits: frozenset[str], keywords: tuple[str, ...]) -> bool:
+    return any(keyword in hits for keyword in keywords)
+
+
+def _best_shell(hits: frozenset[str]) -> tuple[StoryShellId, int]:
+    scores: dict[StoryShellId, int] = {shell_id: 0 for shell_id in _SHELL_KEYWORDS}
+    for keyword in hits:
+        for shell_id, weight in _SHELL_WEIGHTS_BY_KEYWORD.get(keyword, {}).items():
+            scores[shell_id] += weight
     shell_id = max(scores.items(), key=lambda item: (item[1], item[0]))[0]
     return shell_id, int(scores[shell_id])
 
 
-def _arena_type(seed: str, shell_id: StoryShellId) -> ArenaType:
+def _arena_type(hits: frozenset[str], shell_id: StoryShellId) -> ArenaType:
     if shell_id == "wealth_families":
-        if "订婚" in seed:
+        if "订婚" in hits:
             return "engagement_banquet"
-        if "遗嘱" in seed:
+        if "遗嘱" in hits:
             return "will_reading"
         return "family_banquet"
     if shell_id == "office_power":
-        if "董事会" in seed:
+        if "董事会" in hits:
             return "board_vote"
-        if "发布会" in seed:
+        if "发布会" in hits:
             return "launch_event"
-        if "升职" in seed or "空降" in seed:
+        if "升职" in hits or "空降" in hits:
             return "promotion_review"
-        if "并购" in seed:
+        if "并购" in hits:
             return "merger_close"
         return "board_vote"
     if shell_id == "entertainment_scandal":
-        if "颁奖" in seed or "红毯" in seed or "奖项" in seed:
+        if "颁奖" in hits or "红毯" in hits or "奖项" in hits:
             return "awards_backstage"
-        if "直播" in seed:
+        if "直播" in hits:
             return "livestream_room"
-        if "综艺" in seed or "录制" in seed:
+        if "综艺" in hits or "录制" in hits:
             return "variety_set"
         return "awards_backstage"
     if shell_id == "campus_romance":
-        if "校庆" in seed:
+        if "校庆" in hits:
             return "homecoming_stage"
-        if "导师" in seed or "评审" in seed:
+        if "导师" in hits or "评审" in hits:
             return "mentor_review"
-        if "社团" in seed:
+        if "社团" in hits:
             return "club_event"
         return "homecoming_stage"
     return "night_clubfront"
 
 
-def _secret_class(seed: str, shell_id: StoryShellId) -> SecretClass:
-    if "遗嘱" in seed or "旧案证据" in seed:
+def _secret_class(hits: frozenset[str], shell_id: StoryShellId) -> SecretClass:
+    if "遗嘱" in hits or "旧案证据" in hits:
         return "will_evidence"
-    if "私生" in seed:
+    if "私生" in hits:
         return "hidden_heir"
-    if "黑账" in seed:
+    if "黑账" in hits:
         return "black_ledger"
-    if "合同" in seed:
+    if "合同" in hits:
         return "contract_flip"
-    if "偷拍视频" in seed or "黑料" in seed or "热搜" in seed:
+    if "偷拍视频" in hits or "黑料" in hits or "热搜" in hits:
         return "scandal_video"
-    if "录音" in seed:
+    if "录音" in hits:
         return "old_recording"
     if shell_id == "urban_supernatural":
         return "legacy_contract_secret"
@@ -180,15 +214,15 @@ def _secret_class(seed: str, shell_id: StoryShellId) -> SecretClass:
     }[shell_id]
 
 
-def _relationship_geometry(seed: str, shell_id: StoryShellId) -> RelationshipGeometryId:
+def _relationship_geometry(hits: frozenset[str], shell_id: StoryShellId) -> RelationshipGeometryId:
     if shell_id == "wealth_families":
-        if all(token in seed for token in ("未婚夫", "旧爱", "律师")):
+        if all(token in hits for token in ("未婚夫", "旧爱", "律师")):
             return "fiance_oldlove_lawyer"
-        if "私生" in seed or "继承" in seed:
+        if "私生" in hits or "继承" in hits:
             return "heir_oldlove_secret_keeper"
         return "fiance_oldlove_lawyer"
     if shell_id == "office_power":
-        if all(token in seed for token in ("上司", "对手", "法务")):
+        if all(token in hits for token in ("上司", "对手", "法务")):
             return "boss_rival_legal"
         return "power_circle_oldally"
     if shell_id == "entertainment_scandal":
@@ -198,11 +232,11 @@ def _relationship_geometry(seed: str, shell_id: StoryShellId) -> RelationshipGeo
     return "legacy_danger_ally"
 
 
-def _cost_class(seed: str, shell_id: StoryShellId) -> CostClass:
+def _cost_class(hits: frozenset[str], shell_id: StoryShellId) -> CostClass:
     if shell_id == "wealth_families":
-        return "inheritance_status" if "继承" in seed or "遗嘱" in seed else "marriage_face"
+        return "inheritance_status" if "继承" in hits or "遗嘱" in hits else "marriage_face"
     if shell_id == "office_power":
-        return "career_position" if "升职" in seed or "职位" in seed else "career_reputation"
+        return "career_position" if "升职" in hits or "职位" in hits else "career_reputation"
     if shell_id == "entertainment_scandal":
         return "public_reputation"
     if shell_id == "campus_romance":
@@ -224,7 +258,7 @@ def _bomb_family(secret_class: SecretClass, shell_id: StoryShellId) -> PublicBom
     return "evidence_drop"
 
 
-def _protagonist_identity_class(seed: str, shell_id: StoryShellId) -> ProtagonistIdentityClass:
+def _protagonist_identity_class(hits: frozenset[str], shell_id: StoryShellId) -> ProtagonistIdentityClass:
     if shell_id == "wealth_families":
         return "heiress_target"
     if shell_id == "office_power":
@@ -236,7 +270,7 @@ def _protagonist_identity_class(seed: str, shell_id: StoryShellId) -> Protagonis
     return "legacy_urban_outsider"
 
 
-def _tone_bias(seed: str, shell_id: StoryShellId) -> ToneBias:
+def _tone_bias(hits: frozenset[str], shell_id: StoryShellId) -> ToneBias:
     if shell_id in {"wealth_families", "office_power"}:
         return "knife"
     if shell_id == "entertainment_scandal":
@@ -246,13 +280,10 @@ def _tone_bias(seed: str, shell_id: StoryShellId) -> ToneBias:
     return "cold"
 
 
-def _route_preference_bias(seed: str) -> RoutePreferenceBias:
-    if _contains_any(seed, ("站队", "表态", "背锅", "扛雷")):
-        return "side"
-    if _contains_any(seed, ("前任", "旧爱", "暧昧", "未婚夫")):
-        return "relationship"
-    if _contains_any(seed, ("放录音", "翻桌", "公开", "当众", "热搜")):
-        return "burst"
+def _route_preference_bias(hits: frozenset[str]) -> RoutePreferenceBias:
+    for bias, keywords in _ROUTE_BIAS_KEYWORDS:
+        if _contains_any(hits, keywords):
+            return bias
     return "mixed"
 
 
@@ -561,9 +592,10 @@ _TONE_PACKS: dict[ConflictTemplateId, TemplateToneExamplePack] = {
 
 
 def build_seed_fingerprint(seed: str, play_length_preset: str) -> SeedFingerprint:
-    shell_id, score = _best_shell(seed)
+    hits = _SEED_KEYWORD_MATCHER.find(seed)
+    shell_id, score = _best_shell(hits)
     fit_mode: SeedFitMode
-    if score == 0 and _contains_any(seed, _EXPLICIT_OUT_OF_SCOPE_KEYWORDS):
+    if score == 0 and _contains_any(hits, _EXPLICIT_OUT_OF_SCOPE_KEYWORDS):
         fit_mode = "out_of_scope"
     elif shell_id in PROMO_SHELLS and score >= 2:
         fit_mode = "direct_fit"
@@ -581,20 +613,20 @@ def build_seed_fingerprint(seed: str, play_length_preset: str) -> SeedFingerprin
         # base; if they become common we can re-introduce a stricter gate.
         shell_id = "wealth_families"
         fit_mode = "shell_fit"
-    secret_class = _secret_class(seed, shell_id)
+    secret_class = _secret_class(hits, shell_id)
     return SeedFingerprint(
         public_shell_id=shell_id,
         fit_mode=fit_mode,
-        arena_type=_arena_type(seed, shell_id),
+        arena_type=_arena_type(hits, shell_id),
         secret_class=secret_class,
-        relationship_geometry=_relationship_geometry(seed, shell_id),
-        cost_class=_cost_class(seed, shell_id),
+        relationship_geometry=_relationship_geometry(hits, shell_id),
+        cost_class=_cost_class(hits, shell_id),
         public_bomb_family=_bomb_family(secret_class, shell_id),
         play_length_preset=play_length_preset,  # type: ignore[arg-type]
-        protagonist_identity_class=_protagonist_identity_class(seed, shell_id),
-        tone_bias=_tone_bias(seed, shell_id),
-        route_preference_bias=_route_preference_bias(seed),
-        source_markers=[keyword for keyword in _SHELL_KEYWORDS[shell_id] if keyword in seed][:10],
+        protagonist_identity_class=_protagonist_identity_class(hits, shell_id),
+        tone_bias=_tone_bias(hits, shell_id),
+        route_preference_bias=_route_preference_bias(hits),
+        source_markers=[keyword for keyword in _SHELL_KEYWORDS[shell_id] if keyword in hits][:10],
     )
 
 
@@ -857,25 +889,77 @@ TEMPLATE_LIBRARY: tuple[HeroTemplateSpec | LightTemplateSpec, ...] = (
 )
 
 
-def _score_template(fingerprint: SeedFingerprint, template: HeroTemplateSpec | LightTemplateSpec) -> int:
+class _TemplateAxes(NamedTuple):
+    template: HeroTemplateSpec | LightTemplateSpec
+    arena_types: frozenset[str]
+    secret_classes: frozenset[str]
+    relationship_geometries: frozenset[str]
+    cost_classes: frozenset[str]
+    bomb_families: frozenset[str]
+    side_route_verbs: bool
+    burst_route_verbs: bool
+    specificity: int
+
+
+def _template_axes(template: HeroTemplateSpec | LightTemplateSpec) -> _TemplateAxes:
+    verbs = set(template.route_promise_verb_set)
+    # Fewer allowed dimensions means a more specific template and should win ties.
+    total = (
+        len(template.allowed_arena_types)
+        + len(template.allowed_secret_classes)
+        + len(template.allowed_relationship_geometries)
+        + len(template.allowed_cost_classes)
+        + len(template.allowed_bomb_families)
+    )
+    return _TemplateAxes(
+        template=template,
+        arena_types=frozenset(template.allowed_arena_types),
+        secret_classes=frozenset(template.allowed_secret_classes),
+        relationship_geometries=frozenset(template.allowed_relationship_geometries),
+        cost_classes=frozenset(template.allowed_cost_classes),
+        bomb_families=frozenset(template.allowed_bomb_families),
+        side_route_verbs=bool(verbs & {"站谁", "扛雷", "表态"}),
+        burst_route_verbs=bool(verbs & {"先揭谁", "先撕谁", "先爆谁"}),
+        specificity=max(0, 40 - total),
+    )
+
+
+_TEMPLATES_BY_ID: dict[str, HeroTemplateSpec | LightTemplateSpec] = {
+    template.template_id: template for template in TEMPLATE_LIBRARY
+}
+_TEMPLATE_AXES_BY_ID: dict[str, _TemplateAxes] = {
+    template.template_id: _template_axes(template) for template in TEMPLATE_LIBRARY
+}
+_TEMPLATE_AXES_BY_SHELL: dict[StoryShellId, tuple[_TemplateAxes, ...]] = {}
+for _template in TEMPLATE_LIBRARY:
+    _TEMPLATE_AXES_BY_SHELL[_template.shell_id] = (
+        *_TEMPLATE_AXES_BY_SHELL.get(_template.shell_id, ()),
+        _TEMPLATE_AXES_BY_ID[_template.template_id],
+    )
+
+
+def _axes_for(template: HeroTemplateSpec | LightTemplateSpec) -> _TemplateAxes:
+    axes = _TEMPLATE_AXES_BY_ID.get(template.template_id)
+    if axes is None or axes.template is not template:
+        axes = _template_axes(template)
+    return axes
+
+
+def _score_template(fingerprint: SeedFingerprint, axes: _TemplateAxes) -> int:
     score = 0
-    if template.shell_id == fingerprint.public_shell_id:
+    if axes.template.shell_id == fingerprint.public_shell_id:
         score += 5
-    if fingerprint.arena_type in template.allowed_arena_types:
+    if fingerprint.arena_type in axes.arena_types:
         score += 4
-    if fingerprint.secret_class in template.allowed_secret_classes:
+    if fingerprint.secret_class in axes.secret_classes:
         score += 4
-    if fingerprint.relationship_geometry in template.allowed_relationship_geometries:
+    if fingerprint.relationship_geometry in axes.relationship_geometries:
         score += 4
-    if fingerprint.cost_class in template.allowed_cost_classes:
+    if fingerprint.cost_class in axes.cost_classes:
         score += 3
-    if fingerprint.public_bomb_family in template.allowed_bomb_families:
+    if fingerprint.public_bomb_family in axes.bomb_families:
         score += 3
-    if fingerprint.route_preference_bias == "side" and any(token in template.route_promise_verb_set for token in ("站谁", "扛雷", "表态")):
-        score += 1
-    if fingerprint.route_preference_bias == "burst" and any(token in template.route_promise_verb_set for token in ("先揭谁", "先撕谁", "先爆谁")):
-        score += 1
-    return score
+    return score + _route_bias_hit(fingerprint, axes)
 
 
 _TEMPLATE_HINT_WEIGHTS: dict[ConflictTemplateId, tuple[tuple[str, int], ...]] = {
@@ -895,68 +979,59 @@ _TEMPLATE_HINT_WEIGHTS: dict[ConflictTemplateId, tuple[tuple[str, int], ...]] =
     "campus_club_campaign_flip": (("社团", 3), ("站队", 2)),
     "urban_supernatural_legacy_contract": (("契约", 3), ("异能", 2), ("怪谈", 1)),
 }
+_HINT_TOKEN_MATCHER = KeywordMatcher(token for weights in _TEMPLATE_HINT_WEIGHTS.values() for token, _weight in weights)
+
 
+def _fingerprint_hint_tokens(fingerprint: SeedFingerprint) -> frozenset[str]:
+    # A hint token counts when it appears inside any source marker.
+    tokens: set[str] = set()
+    for marker in fingerprint.source_markers:
+        tokens.update(_HINT_TOKEN_MATCHER.find(str(marker)))
+    return frozenset(tokens)
 
-def _route_bias_hit(fingerprint: SeedFingerprint, template: HeroTemplateSpec | LightTemplateSpec) -> int:
-    if fingerprint.route_preference_bias == "side" and any(token in template.route_promise_verb_set for token in ("站谁", "扛雷", "表态")):
+
+def _route_bias_hit(fingerprint: SeedFingerprint, axes: _TemplateAxes) -> int:
+    if fingerprint.route_preference_bias == "side" and axes.side_route_verbs:
         return 1
-    if fingerprint.route_preference_bias == "burst" and any(token in template.route_promise_verb_set for token in ("先揭谁", "先撕谁", "先爆谁")):
+    if fingerprint.route_preference_bias == "burst" and axes.burst_route_verbs:
         return 1
     return 0
 
 
-def _template_hint_affinity(fingerprint: SeedFingerprint, template: HeroTemplateSpec | LightTemplateSpec) -> int:
+def _template_hint_affinity(hint_tokens: frozenset[str], template: HeroTemplateSpec | LightTemplateSpec) -> int:
     weights = _TEMPLATE_HINT_WEIGHTS.get(template.template_id, ())
-    if not weights or not fingerprint.source_markers:
-        return 0
-    marker_values = tuple(str(marker) for marker in fingerprint.source_markers)
-    return sum(weight for token, weight in weights if any(token in marker for marker in marker_values))
+    return sum(weight for token, weight in weights if token in hint_tokens)
 
 
-def _template_hint_hits(fingerprint: SeedFingerprint, template: HeroTemplateSpec | LightTemplateSpec) -> list[str]:
+def _template_hint_hits(hint_tokens: frozenset[str], template: HeroTemplateSpec | LightTemplateSpec) -> list[str]:
     weights = _TEMPLATE_HINT_WEIGHTS.get(template.template_id, ())
-    if not weights or not fingerprint.source_markers:
-        return []
-    marker_values = tuple(str(marker) for marker in fingerprint.source_markers)
-    return [token for token, _weight in weights if any(token in marker for marker in marker_values)]
+    return [token for token, _weight in weights if token in hint_tokens]
 
 
-def _axis_hit_priority(fingerprint: SeedFingerprint, template: HeroTemplateSpec | LightTemplateSpec) -> tuple[int, int, int, int, int, int]:
+def _axis_hit_priority(fingerprint: SeedFingerprint, axes: _TemplateAxes) -> tuple[int, int, int, int, int, int]:
     return (
-        int(fingerprint.secret_class in template.allowed_secret_classes),
-        int(fingerprint.relationship_geometry in template.allowed_relationship_geometries),
-        int(fingerprint.arena_type in template.allowed_arena_types),
-        int(fingerprint.public_bomb_family in template.allowed_bomb_families),
-        int(fingerprint.cost_class in template.allowed_cost_classes),
-        _route_bias_hit(fingerprint, template),
-    )
-
-
-def _template_specificity(template: HeroTemplateSpec | LightTemplateSpec) -> int:
-    # Fewer allowed dimensions means a more specific template and should win ties.
-    total = (
-        len(template.allowed_arena_types)
-        + len(template.allowed_secret_classes)
-        + len(template.allowed_relationship_geometries)
-        + len(template.allowed_cost_classes)
-        + len(template.allowed_bomb_families)
+        int(fingerprint.secret_class in axes.secret_classes),
+        int(fingerprint.relationship_geometry in axes.relationship_geometries),
+        int(fingerprint.arena_type in axes.arena_types),
+        int(fingerprint.public_bomb_family in axes.bomb_families),
+        int(fingerprint.cost_class in axes.cost_classes),
+        _route_bias_hit(fingerprint, axes),
     )
-    return max(0, 40 - total)
 
 
-def _axis_hit_labels(fingerprint: SeedFingerprint, template: HeroTemplateSpec | LightTemplateSpec) -> list[str]:
+def _axis_hit_labels(fingerprint: SeedFingerprint, axes: _TemplateAxes) -> list[str]:
     labels: list[str] = []
-    if fingerprint.secret_class in template.allowed_secret_classes:
+    if fingerprint.secret_class in axes.secret_classes:
         labels.append("secret_class")
-    if fingerprint.relationship_geometry in template.allowed_relationship_geometries:
+    if fingerprint.relationship_geometry in axes.relationship_geometries:
         labels.append("relationship_geometry")
-    if fingerprint.arena_type in template.allowed_arena_types:
+    if fingerprint.arena_type in axes.arena_types:
         labels.append("arena_type")
-    if fingerprint.public_bomb_family in template.allowed_bomb_families:
+    if fingerprint.public_bomb_family in axes.bomb_families:
         labels.append("public_bomb_family")
-    if fingerprint.cost_class in template.allowed_cost_classes:
+    if fingerprint.cost_class in axes.cost_classes:
         labels.append("cost_class")
-    if _route_bias_hit(fingerprint, template):
+    if _route_bias_hit(fingerprint, axes):
         labels.append("route_preference_bias")
     return labels
 
@@ -1016,12 +1091,17 @@ def _template_rule_priority(
 def _template_decision_scorecard(
     fingerprint: SeedFingerprint,
     template: HeroTemplateSpec | LightTemplateSpec,
+    *,
+    hint_tokens: frozenset[str] | None = None,
 ) -> dict[str, Any]:
+    axes = _axes_for(template)
+    if hint_tokens is None:
+        hint_tokens = _fingerprint_hint_tokens(fingerprint)
     rule_priority, rule_hits = _template_rule_priority(fingerprint, template)
-    base_score = _score_template(fingerprint, template)
-    hint_affinity = _template_hint_affinity(fingerprint, template)
-    axis_priority = _axis_hit_priority(fingerprint, template)
-    specificity = _template_specificity(template)
+    base_score = _score_template(fingerprint, axes)
+    hint_affinity = _template_hint_affinity(hint_tokens, template)
+    axis_priority = _axis_hit_priority(fingerprint, axes)
+    specificity = axes.specificity
     return {
         "template_id": template.template_id,
         "rule_priority": rule_priority,
@@ -1030,8 +1110,8 @@ def _template_decision_scorecard(
         "axis_priority": axis_priority,
         "specificity": specificity,
         "rule_hits": rule_hits,
-        "axis_hits": _axis_hit_labels(fingerprint, template),
-        "hint_hits": _template_hint_hits(fingerprint, template),
+        "axis_hits": _axis_hit_labels(fingerprint, axes),
+        "hint_hits": _template_hint_hits(hint_tokens, template),
     }
 
 
@@ -1049,9 +1129,9 @@ def _scorecard_key(scorecard: dict[str, Any]) -> tuple[Any, ...]:
 def match_story_template_with_trace(
     fingerprint: SeedFingerprint,
 ) -> tuple[HeroTemplateSpec | LightTemplateSpec, dict[str, Any]]:
-    candidates = [template for template in TEMPLATE_LIBRARY if template.shell_id == fingerprint.public_shell_id]
+    candidates = [axes.template for axes in _TEMPLATE_AXES_BY_SHELL.get(fingerprint.public_shell_id, ())]
     if not candidates:
-        fallback = next(template for template in TEMPLATE_LIBRARY if template.template_id == "urban_supernatural_legacy_contract")
+        fallback = _TEMPLATES_BY_ID["urban_supernatural_legacy_contract"]
         return fallback, {
             "selected_template_id": fallback.template_id,
             "decision_source": "template_router_deterministic",
@@ -1060,7 +1140,10 @@ def match_story_template_with_trace(
             "decision_hint_hits": [],
             "candidate_scores": [],
         }
-    scored = [_template_decision_scorecard(fingerprint, template) for template in candidates]
+    hint_tokens = _fingerprint_hint_tokens(fingerprint)
+    scored = [
+        _template_decision_scorecard(fingerprint, template, hint_tokens=hint_tokens) for template in candidates
+    ]
     selected_score = max(scored, key=_scorecard_key)
     selected_template = next(
         template for template in candidates if template.template_id == selected_score["template_id"]
@@ -1092,7 +1175,7 @@ def match_story_template(fingerprint: SeedFingerprint) -> HeroTemplateSpec | Lig
 
 
 def get_template_spec(template_id: ConflictTemplateId) -> HeroTemplateSpec | LightTemplateSpec:
-    return next(template for template in TEMPLATE_LIBRARY if template.template_id == template_id)
+    return _TEMPLATES_BY_ID[template_id]
 
 
 def is_hero_template(template_id: ConflictTemplateId) -> bool:
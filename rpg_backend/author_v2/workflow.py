@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import replace
+from datetime import datetime, timezone
+import hashlib
 import json
 import os
 from pathlib import Path
 import re
+from threading import Lock
 from time import perf_counter
 from typing import Any
 from uuid import uuid4
@@ -14,6 +18,7 @@ from langgraph.graph import END, START, StateGraph
 from pydantic import ValidationError
 from typing_extensions import TypedDict
 
+from rpg_backend.author.checkpointer import graph_config
 from rpg_backend.author.contracts import RelationshipMoveFamily
 from rpg_backend.author.normalize import normalize_whitespace, slugify, trim_text, unique_preserve
 from rpg_backend.author_v2.contracts import (
@@ -138,9 +143,17 @@ _SEGMENT_PLAYBOOK_RENDER_CUE_ITEM_MAX_CHARS = 56
 _VOICE_LINE_STUB_SEED_MAX_CHARS = 96
 _VOICE_BATCH_SIZE_DEFAULT = 3
 _VOICE_BATCH_SIZE_STRICT = 2
+_VOICE_BATCH_MAX_WORKERS = 4
 _HERO_MAX_OUTPUT_TOKENS = {
     "segment_playbook": 2200,
 }
+_POLICY_CACHE_MAX_ENTRIES = 64
+
+_policy_cache_lock = Lock()
+_strategy_pack_cache: OrderedDict[Any, TurnSemanticStrategyPack] = OrderedDict()
+_quality_profile_cache: OrderedDict[Any, QualityTuningProfile] = OrderedDict()
+# resolved patch path -> ((mtime_ns, size), parsed payload)
+_patch_file_cache: dict[str, tuple[tuple[int, int], dict[str, Any] | None]] = {}
 
 SEGMENT_PLAYBOOK_SYSTEM_PROMPT = """
 你在为都市关系戏编译单段 segment playbook。
@@ -290,6 +303,22 @@ class AuthorPlayState(TypedDict, total=False):
     live_gateway: AuthorV2LLMGateway | None
 
 
+# Types of the top-level AuthorPlayState values a checkpointer must be allowed to restore
+# (nested models ride along with them).
+AUTHOR_PLAY_CHECKPOINT_ALLOWLIST = (
+    AcceptedBlueprint,
+    AuthorDecisionSnapshot,
+    CastSlotPlan,
+    BoundIPCastMember,
+    VoiceAtom,
+    SegmentContract,
+    SegmentPlaybook,
+    EndingMatrix,
+    UrbanAuthorBundle,
+    CompiledPlayPlan,
+)
+
+
 def _append_quality(
     state: AuthorPlayState,
     *,
@@ -924,6 +953,75 @@ def _merge_voice_atoms(
     return [updated_by_id[atom.atom_id] for atom in deterministic_atoms if atom.atom_id in updated_by_id][:16]
 
 
+def _voice_batch_gateway(gateway: AuthorV2LLMGateway) -> AuthorV2LLMGateway | None:
+    # A private call trace per batch keeps concurrent batches' trace entries apart.
+    if isinstance(gateway, AuthorV2LLMGateway):
+        return replace(gateway, call_trace=[])
+    return None
+
+
+def _compile_voice_atom_batch(
+    *,
+    gateway: AuthorV2LLMGateway,
+    request_payload: dict[str, Any],
+    batch_index: int,
+    batch_count: int,
+    batch_character_ids: list[str],
+    allowed_atom_ids_by_character: dict[str, set[str]],
+) -> tuple[dict[str, list[VoiceAtomDelta]] | None, list[dict[str, Any]], Exception | None, float]:
+    trace_cursor = len(gateway.call_trace)
+    payload_bytes = len(json.dumps(request_payload, ensure_ascii=False))
+    response_payload: dict[str, Any] | None = None
+    batch_delta_map: dict[str, list[VoiceAtomDelta]] | None = None
+    error: Exception | None = None
+    started = perf_counter()
+    elapsed_seconds = 0.0
+    try:
+        response = gateway.invoke_json(
+            system_prompt=VOICE_ATOM_SYSTEM_PROMPT,
+            user_payload=request_payload,
+            max_output_tokens=(
+                getattr(gateway, "max_output_tokens_voice_atoms", None)
+                or getattr(gateway, "max_output_tokens_cast_slots", None)
+                or getattr(gateway, "max_output_tokens_segment_playbook", None)
+            ),
+            operation_name="author_v2.voice_atoms",
+            response_format_type="json_object",
+        )
+        elapsed_seconds = perf_counter() - started
+        response_payload = response.payload
+        batch_delta_map = _validate_voice_atoms_payload(
+            response_payload,
+            expected_character_ids=set(batch_character_ids),
+            allowed_atom_ids_by_character={
+                character_id: set(allowed_atom_ids_by_character.get(character_id) or set())
+                for character_id in batch_character_ids
+            },
+        )
+    except Exception as exc:  # noqa: BLE001
+        error = exc
+    batch_trace = extend_stage_llm_trace(
+        [],
+        gateway=gateway,
+        start_index=trace_cursor,
+        stage="compile_voice_atoms",
+        duration_seconds=elapsed_seconds,
+    )
+    for entry in batch_trace:
+        entry["payload_bytes"] = payload_bytes
+        entry["batch_character_count"] = len(batch_character_ids)
+        entry["batch_index"] = batch_index
+        entry["batch_count"] = batch_count
+        entry["batch_character_ids"] = list(batch_character_ids)
+    if error is not None and batch_trace and response_payload is not None:
+        batch_trace[-1]["validation_failed_reason"] = fallback_reason(error)
+        batch_trace[-1]["returned_keys"] = sorted(str(key) for key in response_payload.keys())[:10]
+        batch_trace[-1]["missing_required_keys"] = [
+            key for key in ("voice_atom_deltas_by_character",) if key not in response_payload
+        ]
+    return batch_delta_map, batch_trace, error, (perf_counter() - started) * 1000
+
+
 def compile_voice_atoms(state: AuthorPlayState) -> AuthorPlayState:
     blueprint = state["accepted_blueprint"]
     bound_cast = state["bound_cast"]
@@ -977,7 +1075,6 @@ def compile_voice_atoms(state: AuthorPlayState) -> AuthorPlayState:
         }
 
     combined_trace = list(state.get("llm_call_trace", []))
-    base_trace_len = len(state.get("llm_call_trace", []))
     attempt_failures: list[str] = []
     live_attempt_count = 0
     provider_failure_count = 0
@@ -1009,158 +1106,146 @@ def compile_voice_atoms(state: AuthorPlayState) -> AuthorPlayState:
         ]
         for character_id, atoms in deterministic_map.items()
     }
-    batch_size = _VOICE_BATCH_SIZE_STRICT if _strict_no_repair_fallback_enabled() else _VOICE_BATCH_SIZE_DEFAULT
+    strict_enabled = _strict_no_repair_fallback_enabled()
+    batch_size = _VOICE_BATCH_SIZE_STRICT if strict_enabled else _VOICE_BATCH_SIZE_DEFAULT
     character_batches = _chunk_list(character_order, batch_size)
     allow_live_downgrade = _allow_live_downgrade(live_mode)
     active_gateways = gateways if allow_live_downgrade else gateways[:1]
+    story_context = {
+        "story_shell_id": blueprint.story_shell_id,
+        "social_arena": blueprint.social_arena,
+        "route_promise": blueprint.route_promise,
+        "taboo_secret": blueprint.taboo_secret,
+        "relationship_setup": blueprint.relationship_setup,
+    }
+    batches_by_index = {batch_index: list(batch) for batch_index, batch in enumerate(character_batches, start=1)}
+    pending_batch_indexes = list(batches_by_index)
+    batch_failures: dict[int, list[str]] = {batch_index: [] for batch_index in batches_by_index}
+    batch_latencies_ms: dict[int, list[float]] = {batch_index: [] for batch_index in batches_by_index}
+    live_delta_map: dict[str, list[VoiceAtomDelta]] = {}
+    max_workers_used = 0
+    source_mode = active_gateways[0][0] if active_gateways else live_mode
     gateway_index = 0
-    while live_attempt_count < MAX_STAGE_REGEN_ATTEMPTS and active_gateways:
+    while pending_batch_indexes and live_attempt_count < MAX_STAGE_REGEN_ATTEMPTS and active_gateways:
         source_mode, gateway = active_gateways[gateway_index % len(active_gateways)]
         live_attempt_count += 1
-        response_payload: dict[str, Any] | None = None
-        current_batch_index = 0
-        current_batch_ids: list[str] = []
-        current_payload_bytes = 0
-        current_trace_cursor = len(gateway.call_trace)
-        current_trace_recorded = False
-        try:
-            retry_feedback = attempt_failures[-1] if attempt_failures else None
-            live_delta_map: dict[str, list[VoiceAtomDelta]] = {}
-            for batch_index, batch_character_ids in enumerate(character_batches, start=1):
-                current_batch_index = batch_index
-                current_batch_ids = list(batch_character_ids)
-                batch_id_set = set(batch_character_ids)
-                current_trace_cursor = len(gateway.call_trace)
-                current_trace_recorded = False
-                started = perf_counter()
-                request_payload: dict[str, Any] = {
-                    "story_context": {
-                        "story_shell_id": blueprint.story_shell_id,
-                        "social_arena": blueprint.social_arena,
-                        "route_promise": blueprint.route_promise,
-                        "taboo_secret": blueprint.taboo_secret,
-                        "relationship_setup": blueprint.relationship_setup,
-                    },
-                    "cast_meta": [
-                        row for row in cast_meta if str(row.get("character_id")) in batch_id_set
-                    ],
-                    "segment_roles": segment_roles,
-                    "voice_atom_catalog_by_character": {
-                        character_id: list(voice_atom_catalog_by_character.get(character_id) or [])
-                        for character_id in batch_character_ids
-                    },
-                    "batch_character_ids": list(batch_character_ids),
-                    "batch_index": batch_index,
-                    "batch_count": len(character_batches),
-                    "regeneration_index": live_attempt_count,
-                    "max_regeneration_attempts": MAX_STAGE_REGEN_ATTEMPTS,
-                }
-                if retry_feedback:
-                    request_payload["validation_feedback"] = retry_feedback
-                current_payload_bytes = len(json.dumps(request_payload, ensure_ascii=False))
-                response = gateway.invoke_json(
-                    system_prompt=VOICE_ATOM_SYSTEM_PROMPT,
-                    user_payload=request_payload,
-                    max_output_tokens=(
-                        getattr(gateway, "max_output_tokens_voice_atoms", None)
-                        or getattr(gateway, "max_output_tokens_cast_slots", None)
-                        or getattr(gateway, "max_output_tokens_segment_playbook", None)
-                    ),
-                    operation_name="author_v2.voice_atoms",
-                    response_format_type="json_object",
-                )
-                extended_trace = _extend_llm_trace(
-                    state,
-                    gateway,
-                    start_index=current_trace_cursor,
-                    stage="compile_voice_atoms",
-                    duration_seconds=perf_counter() - started,
-                )
-                new_entries = extended_trace[base_trace_len:]
-                for entry in new_entries:
-                    entry["payload_bytes"] = current_payload_bytes
-                    entry["batch_character_count"] = len(batch_character_ids)
-                    entry["batch_index"] = batch_index
-                    entry["batch_count"] = len(character_batches)
-                    entry["batch_character_ids"] = list(batch_character_ids)
-                combined_trace.extend(new_entries)
-                current_trace_recorded = True
-                response_payload = response.payload
-                batch_delta_map = _validate_voice_atoms_payload(
-                    response_payload,
-                    expected_character_ids=batch_id_set,
-                    allowed_atom_ids_by_character={
-                        character_id: set(allowed_atom_ids_by_character.get(character_id) or set())
-                        for character_id in batch_character_ids
+        batch_gateways = {batch_index: _voice_batch_gateway(gateway) for batch_index in pending_batch_indexes}
+        # Test doubles that cannot be cloned share one call trace, so their batches run one at a time.
+        concurrent = not strict_enabled and all(item is not None for item in batch_gateways.values())
+        max_workers = min(_VOICE_BATCH_MAX_WORKERS if concurrent else 1, len(pending_batch_indexes))
+        max_workers_used = max(max_workers_used, max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_map = {
+                executor.submit(
+                    _compile_voice_atom_batch,
+                    gateway=batch_gateways[batch_index] or gateway,
+                    request_payload={
+                        "story_context": story_context,
+                        "cast_meta": [
+                            row for row in cast_meta if str(row.get("character_id")) in set(batches_by_index[batch_index])
+                        ],
+                        "segment_roles": segment_roles,
+                        "voice_atom_catalog_by_character": {
+                            character_id: list(voice_atom_catalog_by_character.get(character_id) or [])
+                            for character_id in batches_by_index[batch_index]
+                        },
+                        "batch_character_ids": list(batches_by_index[batch_index]),
+                        "batch_index": batch_index,
+                        "batch_count": len(character_batches),
+                        "regeneration_index": live_attempt_count,
+                        "max_regeneration_attempts": MAX_STAGE_REGEN_ATTEMPTS,
+                        **(
+                            {"validation_feedback": batch_failures[batch_index][-1]}
+                            if batch_failures[batch_index]
+                            else {}
+                        ),
                     },
-                )
+                    batch_index=batch_index,
+                    batch_count=len(character_batches),
+                    batch_character_ids=batches_by_index[batch_index],
+                    allowed_atom_ids_by_character=allowed_atom_ids_by_character,
+                ): batch_index
+                for batch_index in pending_batch_indexes
+            }
+            batch_results = {future_map[future]: future.result() for future in as_completed(future_map)}
+        still_failing: list[int] = []
+        for batch_index in pending_batch_indexes:
+            batch_delta_map, batch_trace, batch_error, latency_ms = batch_results[batch_index]
+            batch_gateway = batch_gateways[batch_index]
+            if batch_gateway is not None:
+                gateway.call_trace.extend(batch_gateway.call_trace)
+            combined_trace.extend(batch_trace)
+            batch_latencies_ms[batch_index].append(round(latency_ms, 2))
+            if batch_error is None and batch_delta_map is not None:
                 live_delta_map.update(batch_delta_map)
-            merged_map = {
-                character_id: _merge_voice_atoms(
-                    deterministic_atoms=deterministic_map[character_id],
-                    live_atom_deltas=live_delta_map.get(character_id, []),
-                )
-                for character_id in character_order
-                if character_id in deterministic_map
+                continue
+            failure = f"{source_mode}:batch_{batch_index}:{fallback_reason(batch_error)}"
+            attempt_failures.append(failure)
+            batch_failures[batch_index].append(failure)
+            if batch_error is not None and is_provider_failure(batch_error):
+                provider_failure_count += 1
+            still_failing.append(batch_index)
+        pending_batch_indexes = still_failing
+        gateway_index += 1
+
+    stage_trace = [entry for entry in combined_trace if entry.get("stage") == "compile_voice_atoms"]
+    actual_modes = [
+        mode
+        for mode in dict.fromkeys(
+            str(entry.get("mode"))
+            for entry in stage_trace
+            if entry.get("response_received")
+        )
+    ]
+    batch_metrics = {
+        "voice_batch_count": len(character_batches),
+        "voice_batch_max_workers": max_workers_used,
+        "voice_batch_retry_count": sum(max(len(latencies) - 1, 0) for latencies in batch_latencies_ms.values()),
+        "voice_batch_breakdown": [
+            {
+                "batch_index": batch_index,
+                "character_ids": list(batches_by_index[batch_index]),
+                "attempts": len(batch_latencies_ms[batch_index]),
+                "latency_ms": list(batch_latencies_ms[batch_index]),
+                "failures": list(batch_failures[batch_index]),
+                "accepted": batch_index not in pending_batch_indexes,
             }
-            stage_trace = [entry for entry in combined_trace if entry.get("stage") == "compile_voice_atoms"]
-            return {
-                "voice_atoms_by_character": merged_map,
-                "llm_call_trace": combined_trace,
-                "quality_trace": _append_quality(
-                    state,
-                    stage="compile_voice_atoms",
-                    outcome="accepted",
-                    reasons=list(attempt_failures),
-                    source=source_mode,
-                    metrics=_quality_metrics(
+            for batch_index in batches_by_index
+        ],
+    }
+    if not pending_batch_indexes:
+        merged_map = {
+            character_id: _merge_voice_atoms(
+                deterministic_atoms=deterministic_map[character_id],
+                live_atom_deltas=live_delta_map.get(character_id, []),
+            )
+            for character_id in character_order
+            if character_id in deterministic_map
+        }
+        return {
+            "voice_atoms_by_character": merged_map,
+            "llm_call_trace": combined_trace,
+            "quality_trace": _append_quality(
+                state,
+                stage="compile_voice_atoms",
+                outcome="accepted",
+                reasons=list(attempt_failures),
+                source=source_mode,
+                metrics={
+                    **_quality_metrics(
                         requested_mode=live_mode,
                         actual_mode=source_mode,
                         used_live_output=True,
                         live_attempt_count=live_attempt_count,
                         live_success_count=1,
                         provider_failure_count=provider_failure_count,
-                        actual_modes=[
-                            mode
-                            for mode in dict.fromkeys(
-                                str(entry.get("mode"))
-                                for entry in stage_trace
-                                if entry.get("response_received")
-                            )
-                        ],
+                        actual_modes=actual_modes,
                     ),
-                ),
-            }
-        except Exception as exc:  # noqa: BLE001
-            if not current_trace_recorded:
-                extended_trace = _extend_llm_trace(
-                    state,
-                    gateway,
-                    start_index=current_trace_cursor,
-                    stage="compile_voice_atoms",
-                    duration_seconds=0.0,
-                )
-                new_entries = extended_trace[base_trace_len:]
-                for entry in new_entries:
-                    entry["payload_bytes"] = current_payload_bytes
-                    entry["batch_character_count"] = len(current_batch_ids)
-                    entry["batch_index"] = current_batch_index
-                    entry["batch_count"] = len(character_batches)
-                    entry["batch_character_ids"] = list(current_batch_ids)
-                combined_trace.extend(new_entries)
-            if combined_trace and response_payload is not None:
-                combined_trace[-1]["validation_failed_reason"] = fallback_reason(exc)
-                combined_trace[-1]["returned_keys"] = sorted(str(key) for key in response_payload.keys())[:10]
-                combined_trace[-1]["missing_required_keys"] = [
-                    key for key in ("voice_atom_deltas_by_character",) if key not in response_payload
-                ]
-            batch_suffix = f":batch_{current_batch_index}" if current_batch_index > 0 else ""
-            attempt_failures.append(f"{source_mode}{batch_suffix}:{fallback_reason(exc)}")
-            if is_provider_failure(exc):
-                provider_failure_count += 1
-        gateway_index += 1
+                    **batch_metrics,
+                },
+            ),
+        }
 
-    stage_trace = [entry for entry in combined_trace if entry.get("stage") == "compile_voice_atoms"]
     exhausted_reason = attempt_failures[-1] if attempt_failures else "live_gateway_unavailable"
     outcome, reasons = _retry_exhausted_outcome(exhausted_reason)
     return {
@@ -1172,26 +1257,23 @@ def compile_voice_atoms(state: AuthorPlayState) -> AuthorPlayState:
             outcome=outcome,
             reasons=reasons,
             source="deterministic",
-            metrics=_quality_metrics(
-                requested_mode=live_mode,
-                actual_mode="deterministic",
-                used_live_output=False,
-                live_attempt_count=live_attempt_count,
-                live_success_count=0,
-                provider_failure_count=provider_failure_count,
-                actual_modes=[
-                    mode
-                    for mode in dict.fromkeys(
-                        str(entry.get("mode"))
-                        for entry in stage_trace
-                        if entry.get("response_received")
-                    )
-                ],
-            ),
+            metrics={
+                **_quality_metrics(
+                    requested_mode=live_mode,
+                    actual_mode="deterministic",
+                    used_live_output=False,
+                    live_attempt_count=live_attempt_count,
+                    live_success_count=0,
+                    provider_failure_count=provider_failure_count,
+                    actual_modes=actual_modes,
+                ),
+                **batch_metrics,
+            },
         ),
     }
 
 
+
 def _progress_budget(template_id: ArcTemplateId) -> list[int]:
     return PROGRESS_REQUIRED_BY_TEMPLATE[template_id]
 
@@ -2031,10 +2113,7 @@ def compile_segment_playbooks(state: AuthorPlayState) -> AuthorPlayState:
     contracts = state["segment_contracts"]
     bound_cast = state["bound_cast"]
     live_mode = state.get("live_mode", "deterministic")
-    quality_tuning_profile = _apply_quality_tuning_patch(
-        profile=_build_quality_tuning_profile(),
-        patch_payload=_load_quality_tuning_patch(),
-    )
+    quality_tuning_profile, _profile_cache_hit = _compiled_quality_tuning_profile()
     control_contract_hint_weight = float(quality_tuning_profile.author.control_contract_hint_weight)
     indexed_contracts = list(enumerate(contracts))
     results: dict[int, SegmentPlaybook] = {}
@@ -3254,38 +3333,48 @@ def _clamp_float(value: float, lower: float, upper: float) -> float:
     return max(lower, min(upper, float(value)))
 
 
-def _load_semantic_autotune_patch() -> dict[str, Any] | None:
-    settings = get_settings()
-    patch_path_raw = (settings.semantic_autotune_patch_path or "").strip()
+def _load_json_patch(patch_path_raw: str) -> dict[str, Any] | None:
+    patch_path_raw = patch_path_raw.strip()
     if not patch_path_raw:
         return None
     patch_path = Path(patch_path_raw).expanduser()
-    if not patch_path.exists() or not patch_path.is_file():
+    try:
+        stat = patch_path.stat()
+    except OSError:
         return None
+    if not patch_path.is_file():
+        return None
+    cache_key = str(patch_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _policy_cache_lock:
+        cached = _patch_file_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
     try:
         payload = json.loads(patch_path.read_text())
     except Exception:  # noqa: BLE001
-        return None
+        payload = None
     if not isinstance(payload, dict):
-        return None
+        payload = None
+    with _policy_cache_lock:
+        _patch_file_cache[cache_key] = (signature, payload)
     return payload
 
 
+def _load_semantic_autotune_patch() -> dict[str, Any] | None:
+    # Re-read only when the file's mtime or size changes; callers must not mutate the payload.
+    return _load_json_patch(get_settings().semantic_autotune_patch_path or "")
+
+
 def _load_quality_tuning_patch() -> dict[str, Any] | None:
-    settings = get_settings()
-    patch_path_raw = (settings.quality_tuning_patch_path or "").strip()
-    if not patch_path_raw:
-        return None
-    patch_path = Path(patch_path_raw).expanduser()
-    if not patch_path.exists() or not patch_path.is_file():
-        return None
-    try:
-        payload = json.loads(patch_path.read_text())
-    except Exception:  # noqa: BLE001
-        return None
-    if not isinstance(payload, dict):
-        return None
-    return payload
+    return _load_json_patch(get_settings().quality_tuning_patch_path or "")
+
+
+def _patch_digest(patch_payload: dict[str, Any] | None) -> str:
+    if not patch_payload:
+        return ""
+    encoded = json.dumps(patch_payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
 
 def _deep_merge_dict(base: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
@@ -3980,6 +4069,77 @@ def _build_semantic_strategy_pack(
     )
 
 
+def _cached_policy(cache: OrderedDict[Any, Any], key: Any, build: Any) -> tuple[Any, bool]:
+    with _policy_cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached, True
+    value = build()
+    with _policy_cache_lock:
+        cache[key] = value
+        while len(cache) > _POLICY_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    return value, False
+
+
+def _compiled_quality_tuning_profile() -> tuple[QualityTuningProfile, bool]:
+    patch_payload = _load_quality_tuning_patch()
+    return _cached_policy(
+        _quality_profile_cache,
+        _patch_digest(patch_payload),
+        lambda: _apply_quality_tuning_patch(profile=_build_quality_tuning_profile(), patch_payload=patch_payload),
+    )
+
+
+def _compiled_semantic_strategy_pack(
+    *,
+    blueprint: AcceptedBlueprint,
+    arc_template_id: str,
+    segment_contracts: list[SegmentContract],
+    cast: list[BoundIPCastMember],
+) -> tuple[TurnSemanticStrategyPack, bool]:
+    """Strategy pack with the autotune patch applied, shared by every job with the same inputs.
+
+    The builders only read the shell, each segment's id and role, and the stake
+    priority resolved from its focus/rival cast, so those (plus the arc template
+    and the patch content) make up the key. The cached pack is shared between
+    plans and must be treated as read-only.
+    """
+    shell_id = blueprint.story_shell_id
+    patch_payload = _load_semantic_autotune_patch()
+    key = (
+        shell_id,
+        arc_template_id,
+        tuple((segment.segment_id, segment.segment_role) for segment in segment_contracts),
+        tuple(
+            tuple(_segment_stake_priority(segment=segment, cast=cast, shell_id=shell_id))
+            for segment in segment_contracts
+        ),
+        _patch_digest(patch_payload),
+    )
+    return _cached_policy(
+        _strategy_pack_cache,
+        key,
+        lambda: _apply_semantic_autotune_patch(
+            strategy_pack=_build_semantic_strategy_pack(
+                blueprint=blueprint,
+                segment_contracts=segment_contracts,
+                cast=cast,
+            ),
+            shell_id=shell_id,
+            patch_payload=patch_payload,
+        ),
+    )
+
+
+def clear_policy_caches() -> None:
+    with _policy_cache_lock:
+        _strategy_pack_cache.clear()
+        _quality_profile_cache.clear()
+        _patch_file_cache.clear()
+
+
 def _build_delta_kernel(bundle: UrbanAuthorBundle) -> BeatDeltaKernel:
     anchor_tokens = _shell_anchor_tokens(bundle.accepted_blueprint.story_shell_id, "opening")
     voice_axes = {
@@ -4155,20 +4315,16 @@ def _build_initial_beat_delta_pack(
 
 def compile_play_plan(state: AuthorPlayState) -> AuthorPlayState:
     bundle = state["urban_bundle"]
-    quality_tuning_profile = _apply_quality_tuning_patch(
-        profile=_build_quality_tuning_profile(),
-        patch_payload=_load_quality_tuning_patch(),
-    )
-    strategy_pack = _build_semantic_strategy_pack(
+    policy_started_at = datetime.now(timezone.utc)
+    started = perf_counter()
+    quality_tuning_profile, profile_cache_hit = _compiled_quality_tuning_profile()
+    strategy_pack, pack_cache_hit = _compiled_semantic_strategy_pack(
         blueprint=bundle.accepted_blueprint,
+        arc_template_id=bundle.arc_template_id,
         segment_contracts=bundle.segment_contracts,
         cast=bundle.bound_cast,
     )
-    strategy_pack = _apply_semantic_autotune_patch(
-        strategy_pack=strategy_pack,
-        shell_id=bundle.accepted_blueprint.story_shell_id,
-        patch_payload=_load_semantic_autotune_patch(),
-    )
+    policy_compile_ms = round((perf_counter() - started) * 1000, 3)
     compiled_segments: list[CompiledSegment] = []
     playbooks_by_id = {playbook.segment_id: playbook for playbook in bundle.segment_playbooks}
     for contract in bundle.segment_contracts:
@@ -4258,7 +4414,16 @@ def compile_play_plan(state: AuthorPlayState) -> AuthorPlayState:
     )
     return {
         "compiled_play_plan": play_plan,
-        "quality_trace": _append_quality(state, stage="compile_play_plan", outcome="accepted"),
+        "quality_trace": _append_quality(
+            state,
+            stage="compile_play_plan",
+            outcome="accepted",
+            metrics={
+                "policy_cache": "hit" if profile_cache_hit and pack_cache_hit else "miss",
+                "policy_compile_ms": policy_compile_ms,
+                "policy_compile_started_at": policy_started_at.isoformat(),
+            },
+        ),
     }
 
 
@@ -4270,28 +4435,37 @@ def _set_arc_template(state: AuthorPlayState) -> AuthorPlayState:
     }
 
 
-def build_author_play_graph() -> Any:
+def _bind_live_gateway(node: Any, gateway: AuthorV2LLMGateway) -> Any:
+    # Checkpointed runs keep the gateway out of graph state: it holds a live transport and
+    # cannot be serialized, so it is handed to each node instead of being written to a channel.
+    def _node(state: AuthorPlayState) -> dict[str, Any]:
+        return node({**state, "live_gateway": gateway})
+
+    return _node
+
+
+def build_author_play_graph(*, checkpointer: Any | None = None, gateway: AuthorV2LLMGateway | None = None) -> Any:
+    nodes = [
+        ("select_arc_template", _set_arc_template),
+        ("plan_cast_slots", plan_cast_slots),
+        ("bind_ip_cast", bind_ip_cast),
+        ("compile_voice_atoms", compile_voice_atoms),
+        ("allocate_segment_contracts", allocate_segment_contracts),
+        ("compile_segment_playbooks", compile_segment_playbooks),
+        ("compile_ending_matrix", compile_ending_matrix),
+        ("assemble_urban_bundle", assemble_urban_bundle),
+        ("compile_play_plan", compile_play_plan),
+    ]
     graph = StateGraph(AuthorPlayState)
-    graph.add_node("select_arc_template", _set_arc_template)
-    graph.add_node("plan_cast_slots", plan_cast_slots)
-    graph.add_node("bind_ip_cast", bind_ip_cast)
-    graph.add_node("compile_voice_atoms", compile_voice_atoms)
-    graph.add_node("allocate_segment_contracts", allocate_segment_contracts)
-    graph.add_node("compile_segment_playbooks", compile_segment_playbooks)
-    graph.add_node("compile_ending_matrix", compile_ending_matrix)
-    graph.add_node("assemble_urban_bundle", assemble_urban_bundle)
-    graph.add_node("compile_play_plan", compile_play_plan)
+    for name, node in nodes:
+        graph.add_node(name, _bind_live_gateway(node, gateway) if gateway is not None else node)
     graph.add_edge(START, "select_arc_template")
-    graph.add_edge("select_arc_template", "plan_cast_slots")
-    graph.add_edge("plan_cast_slots", "bind_ip_cast")
-    graph.add_edge("bind_ip_cast", "compile_voice_atoms")
-    graph.add_edge("compile_voice_atoms", "allocate_segment_contracts")
-    graph.add_edge("allocate_segment_contracts", "compile_segment_playbooks")
-    graph.add_edge("compile_segment_playbooks", "compile_ending_matrix")
-    graph.add_edge("compile_ending_matrix", "assemble_urban_bundle")
-    graph.add_edge("assemble_urban_bundle", "compile_play_plan")
+    for (name, _), (next_name, _) in zip(nodes, nodes[1:]):
+        graph.add_edge(name, next_name)
     graph.add_edge("compile_play_plan", END)
-    return graph.compile()
+    if checkpointer is not None:
+        checkpointer = checkpointer.with_allowlist(AUTHOR_PLAY_CHECKPOINT_ALLOWLIST)
+    return graph.compile(checkpointer=checkpointer)
 
 
 def run_author_play_graph(
@@ -4299,16 +4473,43 @@ def run_author_play_graph(
     *,
     live_mode: AuthorV2RunMode = "deterministic",
     gateway: AuthorV2LLMGateway | None = None,
+    checkpointer: Any | None = None,
+    run_id: str | None = None,
 ) -> UrbanPipelineResult:
-    compiled = build_author_play_graph()
-    initial_state: AuthorPlayState = {
-        "accepted_blueprint": accepted_blueprint,
-        "llm_call_trace": [],
-        "quality_trace": [],
-        "live_mode": live_mode,
-        "live_gateway": gateway,
-    }
-    state = compiled.invoke(initial_state)
+    """Run the author_v2 graph, optionally checkpointing after every node.
+
+    With a ``checkpointer`` and ``run_id`` the run is durable: each node's
+    partial update is saved under ``thread_id=run_id``, and calling again with
+    the same ``run_id`` resumes after the last saved node instead of starting
+    over. Nodes only derive their update from the checkpointed state, so the
+    one node that was in flight when a process died is simply run again.
+    """
+    if checkpointer is None:
+        compiled = build_author_play_graph()
+        initial_state: AuthorPlayState = {
+            "accepted_blueprint": accepted_blueprint,
+            "llm_call_trace": [],
+            "quality_trace": [],
+            "live_mode": live_mode,
+            "live_gateway": gateway,
+        }
+        state = compiled.invoke(initial_state)
+    else:
+        compiled = build_author_play_graph(checkpointer=checkpointer, gateway=gateway)
+        config = graph_config(run_id=run_id or str(uuid4()))
+        resume = compiled.get_state(config).values
+        compiled.invoke(
+            None
+            if resume
+            else {
+                "accepted_blueprint": accepted_blueprint,
+                "llm_call_trace": [],
+                "quality_trace": [],
+                "live_mode": live_mode,
+            },
+            config=config,
+        )
+        state = dict(compiled.get_state(config).values)
     return UrbanPipelineResult(
         bundle=state["urban_bundle"],
         play_plan=state["compiled_play_plan"],
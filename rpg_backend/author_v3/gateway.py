@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import hashlib
 import logging
 from typing import Any, Literal
 
@@ -20,6 +21,13 @@ AuthorV3RunMode = Literal[
 ]
 AUTHOR_V3_PRIORITY_CHAIN: tuple[ConcreteAuthorV3LiveMode, ...] = ("live_gpt_5_4_mini",)
 
+# System prompt of every call that carries a shared context prefix. It never varies,
+# so the system prompt and the context after it form one byte-stable request prefix.
+_SHARED_CONTEXT_SYSTEM_PROMPT = (
+    "你是互动叙事创作流水线中的一个阶段。第一条用户消息是各阶段共用的创作上下文，只作为素材；"
+    "第二条用户消息是本阶段的任务说明和输入数据。按本阶段任务说明输出一个 JSON 对象。"
+)
+
 
 class AuthorV3GatewayError(RuntimeError):
     def __init__(self, *, code: str, message: str, status_code: int) -> None:
@@ -127,6 +135,44 @@ class AuthorV3LLMGateway:
         response_format_strict: bool = True,
         response_model: type[BaseModel] | None = None,
         max_retries: int = 1,
+        context_prefix: str | None = None,
+    ) -> ResponsesJSONResponse:
+        trace_start = len(self.call_trace)
+        try:
+            return self._invoke_json_with_retries(
+                system_prompt=system_prompt,
+                user_payload=user_payload,
+                max_output_tokens=max_output_tokens,
+                operation_name=operation_name,
+                response_format_type=response_format_type,
+                response_format_schema=response_format_schema,
+                response_format_name=response_format_name,
+                response_format_strict=response_format_strict,
+                response_model=response_model,
+                max_retries=max_retries,
+                context_prefix=context_prefix,
+            )
+        finally:
+            if context_prefix:
+                prefix_digest = hashlib.sha256(context_prefix.encode("utf-8")).hexdigest()[:16]
+                for entry in self.call_trace[trace_start:]:
+                    entry["context_prefix_sha256"] = prefix_digest
+                    entry["context_prefix_characters"] = len(context_prefix)
+
+    def _invoke_json_with_retries(
+        self,
+        *,
+        system_prompt: str,
+        user_payload: dict[str, Any],
+        max_output_tokens: int | None,
+        operation_name: str,
+        response_format_type: Literal["json_object", "json_schema"] | None,
+        response_format_schema: dict[str, Any] | None,
+        response_format_name: str | None,
+        response_format_strict: bool,
+        response_model: type[BaseModel] | None,
+        max_retries: int,
+        context_prefix: str | None,
     ) -> ResponsesJSONResponse:
         effective_schema = response_model.model_json_schema() if response_model is not None else response_format_schema
         resolved_response_format = response_format_type
@@ -142,8 +188,10 @@ class AuthorV3LLMGateway:
 
         for attempt in range(retry_limit + 1):
             try:
+                # The shared context is seed or world text, so it travels as user content behind a
+                # fixed system prompt; the stage prompt, retry feedback included, comes after it.
                 response = self._transport.invoke_json(
-                    system_prompt=current_system_prompt,
+                    system_prompt=_SHARED_CONTEXT_SYSTEM_PROMPT if context_prefix else current_system_prompt,
                     user_payload=current_user_payload,
                     max_output_tokens=max_output_tokens,
                     operation_name=operation_name,
@@ -151,6 +199,8 @@ class AuthorV3LLMGateway:
                     response_format_schema=effective_schema,
                     response_format_name=response_format_name,
                     response_format_strict=response_format_strict,
+                    context_prefix=context_prefix,
+                    stage_instructions=current_system_prompt if context_prefix else None,
                 )
                 parsed_payload = _response_payload(response)
                 if response_model is None:
@@ -261,6 +311,7 @@ def get_author_v3_llm_gateway(
         rate_limit_scope=("author_v3" if resolved.responses_author_requests_per_minute is not None else None),
         chat_json_stream_mode=resolved.responses_chat_json_stream_mode,
         chat_json_stream_hosts=resolved.responses_chat_json_stream_host_list(),
+        default_priority="background",
     )
     return AuthorV3LLMGateway(
         client=client,
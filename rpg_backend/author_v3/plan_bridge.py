@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+import hashlib
+import json
 import re
+from threading import Lock
 from typing import Any
 from uuid import uuid4
 
+from pydantic import BaseModel
+
 from rpg_backend.author.contracts import RelationshipMoveFamily, StoryShellId
 from rpg_backend.author_v2.contracts import (
     AcceptedBlueprint,
@@ -86,6 +93,15 @@ from rpg_backend.author_v3.storylet_compiler import MappedSegment, StoryletPool
 from rpg_backend.author_v3.tension_weaver import TensionWeb
 
 
+_PROJECTION_CACHE_MAX_ENTRIES = 64
+
+_projection_cache_lock = Lock()
+# One LRU per projection, keyed by a digest of the input slice that projection reads.
+_projection_caches: dict[str, OrderedDict[str, Any]] = {
+    name: OrderedDict() for name in ("shell", "cast", "storylets", "segments", "policies")
+}
+
+
 @dataclass(frozen=True)
 class _ShellDefaults:
     template_id: ConflictTemplateId
@@ -841,6 +857,150 @@ def _relationship_summary_for(
     return "一般关系"
 
 
+@dataclass(frozen=True)
+class _ShellProjection:
+    defaults: _ShellDefaults
+    source_markers: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _CastProjection:
+    cast: tuple[BoundIPCastMember, ...]
+    route_target_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _StoryletProjection:
+    storylet_pool: tuple[dict[str, Any], ...]
+    by_id: dict[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class _PolicyProjection:
+    strategy_pack: TurnSemanticStrategyPack
+    ending_matrix: EndingMatrix
+
+
+def _slice_digest(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _models_json(models: Iterable[BaseModel]) -> str:
+    return "[" + ",".join(model.model_dump_json() for model in models) + "]"
+
+
+def _cached_projection(name: str, key: str, build: Callable[[], Any]) -> tuple[Any, bool]:
+    cache = _projection_caches[name]
+    with _projection_cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached, True
+    value = build()
+    with _projection_cache_lock:
+        cache[key] = value
+        while len(cache) > _PROJECTION_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    return value, False
+
+
+def clear_projection_caches() -> None:
+    with _projection_cache_lock:
+        for cache in _projection_caches.values():
+            cache.clear()
+
+
+def _project_shell(config: WorldConfiguration, protagonist: Any) -> tuple[_ShellProjection, bool]:
+    texts = (
+        config.seed.raw_seed,
+        config.setting,
+        config.social_arena,
+        protagonist.public_identity,
+        protagonist.hidden_need,
+    )
+    return _cached_projection(
+        "shell",
+        _slice_digest(config.story_shell_id, *texts),
+        lambda: _ShellProjection(
+            defaults=_resolve_shell_defaults(config, protagonist.public_identity, protagonist.hidden_need),
+            source_markers=tuple(_resolve_source_markers(config.story_shell_id, *texts)),
+        ),
+    )
+
+
+def _project_cast(config: WorldConfiguration, matrix: RelationshipMatrix) -> tuple[_CastProjection, bool]:
+    def _build() -> _CastProjection:
+        cast = [
+            _build_cast_member(
+                char,
+                matrix.slot_assignments.get(char.character_id, "wildcard"),
+                config.protagonist_id,
+                _relationship_summary_for(char.character_id, config.protagonist_id, config),
+            )
+            for char in config.characters
+        ]
+        route_target_ids = [
+            c.character_id for c in config.characters
+            if c.route_eligible and c.character_id != config.protagonist_id
+        ]
+        return _CastProjection(cast=tuple(cast), route_target_ids=tuple(route_target_ids))
+
+    key = _slice_digest(
+        config.protagonist_id,
+        _models_json(config.characters),
+        _models_json(config.relationship_edges),
+        json.dumps(matrix.slot_assignments, ensure_ascii=False, sort_keys=True),
+    )
+    return _cached_projection("cast", key, _build)
+
+
+def _project_storylets(pool: StoryletPool) -> tuple[_StoryletProjection, bool]:
+    def _build() -> _StoryletProjection:
+        dumped = tuple(storylet.model_dump(mode="json") for storylet in pool.storylets)
+        return _StoryletProjection(
+            storylet_pool=dumped,
+            by_id={payload["storylet_id"]: payload for payload in dumped},
+        )
+
+    return _cached_projection("storylets", _slice_digest(_models_json(pool.storylets)), _build)
+
+
+def _project_segments(mapped_segments: list[MappedSegment]) -> tuple[tuple[CompiledSegment, ...], bool]:
+    # Storylet payloads are attached at assembly, so a storylet edit does not re-project segments.
+    return _cached_projection(
+        "segments",
+        _slice_digest(_models_json(mapped_segments)),
+        lambda: tuple(_build_compiled_segment(seg) for seg in mapped_segments),
+    )
+
+
+def _project_policies(
+    config: WorldConfiguration,
+    matrix: RelationshipMatrix,
+    segments: tuple[CompiledSegment, ...],
+    route_target_ids: tuple[str, ...],
+) -> tuple[_PolicyProjection, bool]:
+    terminal_seg_id = segments[-1].segment_id if segments else "seg_terminal"
+    key = _slice_digest(
+        config.story_shell_id,
+        json.dumps([[segment.segment_id, segment.segment_role] for segment in segments]),
+        json.dumps(list(route_target_ids)),
+        terminal_seg_id,
+    )
+    return _cached_projection(
+        "policies",
+        key,
+        lambda: _PolicyProjection(
+            strategy_pack=_build_semantic_strategy_pack(config.story_shell_id, list(segments)),
+            ending_matrix=_build_ending_matrix(config, matrix, terminal_seg_id),
+        ),
+    )
+
+
 def bridge_to_plan(
     config: WorldConfiguration,
     matrix: RelationshipMatrix,
@@ -852,48 +1012,29 @@ def bridge_to_plan(
     arc_template_id: ArcTemplateId = "flagship_6",
     play_length_preset_override: PlayLengthPresetId | None = None,
 ) -> CompiledPlayPlan:
-    protagonist = next(c for c in config.characters if c.character_id == config.protagonist_id)
-    shell_defaults = _resolve_shell_defaults(
-        config,
-        protagonist.public_identity,
-        protagonist.hidden_need,
-    )
-    source_markers = _resolve_source_markers(
-        config.story_shell_id,
-        config.seed.raw_seed,
-        config.setting,
-        config.social_arena,
-        protagonist.public_identity,
-        protagonist.hidden_need,
-    )
-    route_targets = [
-        c.character_id for c in config.characters
-        if c.route_eligible and c.character_id != config.protagonist_id
-    ]
+    """Assemble a play plan from separately cached projections of the v3 bundle.
 
-    cast: list[BoundIPCastMember] = []
-    for char in config.characters:
-        slot = matrix.slot_assignments.get(char.character_id, "wildcard")
-        rel_summary = _relationship_summary_for(char.character_id, config.protagonist_id, config)
-        cast.append(_build_cast_member(char, slot, config.protagonist_id, rel_summary))
-
-    storylet_lookup = {
-        storylet.storylet_id: storylet.model_dump(mode="json")
-        for storylet in pool.storylets
-    }
+    Shell defaults, cast, storylets, segments and policies are each keyed by a
+    digest of the inputs they read, so re-bridging after an edit to one part
+    (e.g. the storylet pool) rebuilds only that projection. Cached projections
+    are shared between plans and must be treated as read-only.
+    """
+    protagonist = next(c for c in config.characters if c.character_id == config.protagonist_id)
+    shell, _ = _project_shell(config, protagonist)
+    shell_defaults = shell.defaults
+    cast_projection, _ = _project_cast(config, matrix)
+    cast = list(cast_projection.cast)
+    route_targets = list(cast_projection.route_target_ids)
+    storylets, _ = _project_storylets(pool)
+    segments, _ = _project_segments(mapped_segments)
     compiled_segments = [
-        _build_compiled_segment(
-            seg,
-            source_storylet=storylet_lookup.get(seg.source_storylet_id),
-        )
-        for seg in mapped_segments
+        segment.model_copy(update={"source_storylet": storylets.by_id.get(segment.source_storylet_id)})
+        for segment in segments
     ]
+    policies, _ = _project_policies(config, matrix, segments, cast_projection.route_target_ids)
 
-    strategy_pack = _build_semantic_strategy_pack(config.story_shell_id, compiled_segments)
     delta_kernel = _build_delta_kernel(config, cast, arc_template_id, shell_defaults.template_id)
     initial_delta_pack = _build_initial_delta_pack(compiled_segments)
-    terminal_seg_id = compiled_segments[-1].segment_id if compiled_segments else "seg_terminal"
-    ending_matrix = _build_ending_matrix(config, matrix, terminal_seg_id)
 
     max_turns = len(compiled_segments) * 8
     play_length_preset = play_length_preset_override or shell_defaults.play_length_preset
@@ -916,7 +1057,7 @@ def bridge_to_plan(
             protagonist_identity_class=shell_defaults.protagonist_identity_class,
             tone_bias=shell_defaults.tone_bias,
             route_preference_bias=shell_defaults.route_preference_bias,
-            source_markers=source_markers,
+            source_markers=list(shell.source_markers),
         ),
         arc_template_id=arc_template_id,
         protagonist_public_identity=protagonist.public_identity[:120],
@@ -932,13 +1073,13 @@ def bridge_to_plan(
         delta_kernel=delta_kernel,
         initial_beat_delta_pack=initial_delta_pack,
         segments=compiled_segments,
-        ending_matrix=ending_matrix,
+        ending_matrix=policies.ending_matrix,
         opening_narration=f"{protagonist.display_name}踏入{config.setting}，一切看似平静，暗流却已涌动。"[:320],
         max_turns=max(8, min(56, max_turns)),
         semantic_strategy_version=9,
-        semantic_strategy_pack=strategy_pack,
+        semantic_strategy_pack=policies.strategy_pack,
         author_version="v3",
-        storylet_pool=[s.model_dump(mode="json") for s in pool.storylets],
+        storylet_pool=list(storylets.storylet_pool),
         organic_secrets=[s.model_dump() for s in web.secrets],
         hooks=[h.model_dump() for h in web.hooks],
         secret_chains=[c.model_dump() for c in web.chains],
@@ -950,6 +1091,7 @@ def package_from_v3_pipeline(
     preview_blueprint: UrbanPreviewBlueprint,
     accepted_blueprint: AcceptedBlueprint,
     plan: CompiledPlayPlan,
+    llm_call_trace: list[dict[str, Any]] | None = None,
 ) -> RelationshipDramaV2Package:
     cast_slots = [
         CastSlotPlan(
@@ -1017,4 +1159,5 @@ def package_from_v3_pipeline(
         urban_bundle=bundle,
         compiled_play_plan=plan,
         quality_trace=[{"stage": "author_v3_quality_evaluator", "source": "author_v3", "outcome": "accepted"}],
+        llm_call_trace=list(llm_call_trace or []),
     )
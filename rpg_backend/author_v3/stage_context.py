@@ -0,0 +1,86 @@
+"""Shared context prefixes for author_v3 live stages.
+
+The weave, strengthen and compile calls of a run all work from the same world:
+the cast, their relationship edges and the protagonist. `world_context_prefix`
+renders that world once, canonically (sorted keys and rows, compact
+separators). The gateway sends a fixed system prompt, then the prefix as the
+first user message, then the stage's own instructions and data. The prefix
+holds seed and generated world text, so it never goes in the system role.
+Every call over the same world therefore opens with identical bytes, which the
+provider can serve from its prompt-prefix cache; stage instructions, stage data
+and retry feedback only ever follow the prefix. World forging has no world yet,
+so its three calls share `seed_context_prefix` instead.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from rpg_backend.author.contracts import StoryShellId
+from rpg_backend.author_v3.contracts import RelationshipMatrix, WorldConfiguration
+
+_SEED_CONTEXT_HEADER = "【共享创作上下文：故事种子】以下 JSON 是本次创作各阶段共用的输入，阶段任务说明见其后。"
+_WORLD_CONTEXT_HEADER = "【共享创作上下文：世界配置与关系网】以下 JSON 是本次创作各阶段共用的世界，阶段任务说明见其后。"
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def seed_context_prefix(seed_text: str, shell_hint: StoryShellId | None) -> str:
+    return f"{_SEED_CONTEXT_HEADER}\n{_canonical_json({'seed_text': seed_text, 'shell_hint': shell_hint})}"
+
+
+def world_context_prefix(config: WorldConfiguration, matrix: RelationshipMatrix) -> str:
+    characters = [
+        {
+            "character_id": c.character_id,
+            "display_name": c.display_name,
+            "public_identity": c.public_identity,
+            "hidden_need": c.hidden_need,
+            "worldly_desire": c.worldly_desire,
+            "fear": c.fear,
+            "shame_trigger": c.shame_trigger,
+            "breaking_point": c.breaking_point,
+        }
+        for c in sorted(config.characters, key=lambda c: c.character_id)
+    ]
+    relationships = [
+        {
+            "character_a": e.character_a_id,
+            "character_b": e.character_b_id,
+            "hidden_truth": e.hidden_truth,
+            "tension_score": e.tension_score,
+            "hooks": e.hooks,
+        }
+        for e in sorted(matrix.edges, key=lambda e: (e.character_a_id, e.character_b_id))
+    ]
+    world = {
+        "setting": config.setting,
+        "social_arena": config.social_arena,
+        "story_shell_id": config.story_shell_id,
+        "tone": config.seed.tone,
+        "theme_keywords": config.seed.theme_keywords,
+        "protagonist_id": config.protagonist_id,
+        "characters": characters,
+        "relationships": relationships,
+        "slot_assignments": matrix.slot_assignments,
+    }
+    return f"{_WORLD_CONTEXT_HEADER}\n{_canonical_json(world)}"
+
+
+def summarize_stage_usage(call_trace: list[dict[str, Any]]) -> dict[str, dict[str, int]]:
+    """Per-operation input tokens, cached input tokens and provider wall time, in call order."""
+    stages: dict[str, dict[str, int]] = {}
+    for entry in call_trace:
+        usage = dict(entry.get("usage") or {})
+        stage = stages.setdefault(
+            str(entry.get("operation") or "unknown"),
+            {"calls": 0, "input_tokens": 0, "cached_input_tokens": 0, "elapsed_ms": 0},
+        )
+        stage["calls"] += 1
+        stage["input_tokens"] += int(usage.get("input_tokens") or 0)
+        stage["cached_input_tokens"] += int(usage.get("cached_input_tokens") or 0)
+        stage["elapsed_ms"] += int(entry.get("elapsed_ms") or 0)
+    return stages
@@ -9,6 +9,7 @@ from rpg_backend.author.contracts import RelationshipMoveFamily
 from rpg_backend.author_v2.contracts import SegmentRoleId
 from rpg_backend.author_v3.contracts import RelationshipMatrix, WorldConfiguration
 from rpg_backend.author_v3.gateway import AuthorV3LLMGateway
+from rpg_backend.author_v3.stage_context import world_context_prefix
 from rpg_backend.author_v3.tension_weaver import TensionWeb
 
 
@@ -748,15 +749,6 @@ def _compile_live(
 ) -> list[Storylet]:
     char_ids = {c.character_id for c in config.characters}
     secret_ids = {s.secret_id for s in web.secrets}
-    char_summaries = [
-        {
-            "character_id": c.character_id,
-            "display_name": c.display_name,
-            "public_identity": c.public_identity,
-            "worldly_desire": c.worldly_desire,
-        }
-        for c in config.characters
-    ]
     secret_summaries = [
         {
             "secret_id": s.secret_id,
@@ -775,16 +767,13 @@ def _compile_live(
     result = gateway.invoke_json(
         system_prompt=_COMPILE_SYSTEM,
         user_payload={
-            "characters": char_summaries,
             "secrets": secret_summaries,
             "hooks": hook_summaries,
-            "protagonist_id": config.protagonist_id,
-            "setting": config.setting,
-            "social_arena": config.social_arena,
-            "slot_assignments": matrix.slot_assignments,
         },
         max_output_tokens=gateway.max_output_tokens_storylet_compiler,
         operation_name="author_v3_compile_storylets",
         max_retries=3,
+        # Characters, setting, protagonist and slot assignments travel in the shared world prefix.
+        context_prefix=world_context_prefix(config, matrix),
     )
     return _parse_storylets_from_llm(result.parsed, char_ids, secret_ids)
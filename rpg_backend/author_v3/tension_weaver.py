@@ -8,6 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from rpg_backend.author_v2.contracts import SecretClass
 from rpg_backend.author_v3.contracts import RelationshipMatrix, WorldConfiguration
 from rpg_backend.author_v3.gateway import AuthorV3LLMGateway
+from rpg_backend.author_v3.stage_context import world_context_prefix
 
 
 class OrganicSecret(BaseModel):
@@ -455,40 +456,16 @@ def _weave_live(
     threshold: float,
 ) -> TensionWeb:
     char_ids = {c.character_id for c in config.characters}
-    char_summaries = [
-        {
-            "character_id": c.character_id,
-            "display_name": c.display_name,
-            "public_identity": c.public_identity,
-            "hidden_need": c.hidden_need,
-            "worldly_desire": c.worldly_desire,
-            "fear": c.fear,
-            "shame_trigger": c.shame_trigger,
-            "breaking_point": c.breaking_point,
-        }
-        for c in config.characters
-    ]
-    edge_summaries = [
-        {
-            "character_a": e.character_a_id,
-            "character_b": e.character_b_id,
-            "hidden_truth": e.hidden_truth,
-            "tension_score": e.tension_score,
-            "hooks": e.hooks,
-        }
-        for e in matrix.edges
-    ]
+    # Characters, relationships and the protagonist travel in the shared world prefix.
+    context_prefix = world_context_prefix(config, matrix)
 
     result = gateway.invoke_json(
         system_prompt=_WEAVE_SYSTEM,
-        user_payload={
-            "characters": char_summaries,
-            "relationships": edge_summaries,
-            "protagonist_id": config.protagonist_id,
-        },
+        user_payload={"stage": "weave_secrets"},
         max_output_tokens=gateway.max_output_tokens_tension_weaver,
         operation_name="author_v3_weave_secrets",
         max_retries=3,
+        context_prefix=context_prefix,
     )
 
     secrets = _parse_secrets_from_llm(result.parsed, char_ids)
@@ -511,7 +488,6 @@ def _weave_live(
             system_prompt=_STRENGTHEN_SYSTEM,
             user_payload={
                 "current_web": web.model_dump(),
-                "characters": char_summaries,
                 "weakest_dimension": weakest,
                 "current_score": score,
                 "target_score": threshold,
@@ -519,6 +495,7 @@ def _weave_live(
             max_output_tokens=gateway.max_output_tokens_tension_weaver,
             operation_name="author_v3_strengthen_tension",
             max_retries=3,
+            context_prefix=context_prefix,
         )
         new_secrets = _parse_secrets_from_llm(strengthen_result.parsed, char_ids)
         new_secret_ids = {s.secret_id for s in new_secrets}
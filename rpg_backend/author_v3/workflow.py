@@ -15,6 +15,7 @@ from rpg_backend.author_v3.gateway import (
 from rpg_backend.author_v3.plan_bridge import bridge_to_plan
 from rpg_backend.author_v3.quality_evaluator import QualityReport, evaluate_quality
 from rpg_backend.author_v3.relationship_matrix import build_relationship_matrix
+from rpg_backend.author_v3.stage_context import summarize_stage_usage
 from rpg_backend.author_v3.storylet_compiler import (
     MappedSegment,
     StoryletPool,
@@ -136,4 +137,6 @@ def run_author_v3_pipeline(
         "storylet_pool": pool,
         "relationship_matrix": matrix,
         "mapped_segments": mapped_segments,
+        "llm_call_trace": list(gateway.call_trace) if gateway is not None else [],
+        "stage_usage": summarize_stage_usage(gateway.call_trace) if gateway is not None else {},
     }
@@ -14,6 +14,7 @@ from rpg_backend.author_v3.contracts import (
     WorldSeed,
 )
 from rpg_backend.author_v3.gateway import AuthorV3LLMGateway
+from rpg_backend.author_v3.stage_context import seed_context_prefix
 
 
 _SEED_PARSE_SYSTEM_PROMPT = """
@@ -176,13 +177,15 @@ def _forge_world_with_gateway(
     validation_feedback: str | None,
     validation_retry: int,
 ) -> WorldConfiguration:
+    context_prefix = seed_context_prefix(seed_text, shell_hint)
     seed_response = gateway.invoke_json(
         system_prompt=_SEED_PARSE_SYSTEM_PROMPT,
-        user_payload={"seed_text": seed_text, "shell_hint": shell_hint},
+        user_payload={"stage": "seed_parsing"},
         max_output_tokens=gateway.max_output_tokens_world_forge,
         operation_name="author_v3.world_forge.seed_parsing",
         response_model=WorldSeed,
         max_retries=3,
+        context_prefix=context_prefix,
     )
     seed = _parse_seed_payload(seed_response.payload)
 
@@ -198,6 +201,7 @@ def _forge_world_with_gateway(
         operation_name="author_v3.world_forge.character_batch",
         response_model=_CharacterBatchResponse,
         max_retries=3,
+        context_prefix=context_prefix,
     )
     characters_payload = _parse_character_batch_payload(characters_response.payload)
     characters = characters_payload["characters"]
@@ -209,6 +213,7 @@ def _forge_world_with_gateway(
         operation_name="author_v3.world_forge.relationship_negotiation",
         response_model=_RelationshipNegotiationResponse,
         max_retries=3,
+        context_prefix=context_prefix,
     )
     relationship_edges = _parse_relationship_payload(relationships_response.payload)
 
@@ -79,6 +79,20 @@ class BenchmarkPlayTraceSummary(BaseModel):
     end_reason: str | None = Field(default=None, max_length=120)
 
 
+class BenchmarkPlaySessionCacheStats(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    hits: int = Field(ge=0)
+    misses: int = Field(ge=0)
+    hit_rate: float = Field(ge=0.0, le=1.0)
+    capacity_evictions: int = Field(ge=0)
+    idle_evictions: int = Field(ge=0)
+    resident_entries: int = Field(ge=0)
+    resident_bytes: int = Field(ge=0)
+    max_entries: int = Field(ge=1)
+    max_bytes: int = Field(ge=1)
+
+
 class BenchmarkPlaySessionDiagnosticsResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -89,4 +103,6 @@ class BenchmarkPlaySessionDiagnosticsResponse(BaseModel):
     expires_at: datetime
     finished_at: datetime | None = None
     turn_traces: list[dict[str, Any]] = Field(default_factory=list)
+    turn_traces_has_more: bool = False
     summary: BenchmarkPlayTraceSummary
+    session_cache: BenchmarkPlaySessionCacheStats | None = None
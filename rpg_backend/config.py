@@ -30,12 +30,24 @@ class Settings(BaseSettings):
     auth_session_cookie_domain: str | None = None
     auth_session_cookie_samesite: str = "lax"
     play_session_ttl_seconds: int = Field(default=900, ge=60)
+    play_session_state_codec: Literal["json", "json+zlib", "orjson", "msgpack", "msgpack+zstd"] = "json"
+    play_session_state_zstd_dict_path: str | None = None
+    play_session_cache_max_entries: int = Field(default=512, ge=1)
+    play_session_cache_max_bytes: int = Field(default=256 * 1024 * 1024, ge=1)
+    play_session_cache_max_idle_seconds: int = Field(default=1800, ge=1)
+    play_session_cache_sweep_interval_seconds: float = Field(default=30.0, ge=0)
     enable_benchmark_api: bool = False
     public_demo_authoring_enabled: bool = True
     public_demo_daily_ip_llm_limit: int | None = Field(default=500, ge=1)
     public_demo_daily_user_llm_limit: int | None = Field(default=120, ge=1)
+    llm_quota_backend: Literal["memory", "sqlite"] = "memory"
+    llm_quota_db_path: str | None = None
     trusted_proxy_ips: str = "127.0.0.1,::1"
     author_product_run_mode: str = "deterministic"
+    author_preview_cache_ttl_seconds: float = Field(default=600.0, ge=0)
+    author_preview_cache_max_entries: int = Field(default=256, ge=1)
+    author_job_max_concurrent: int = Field(default=4, ge=1)
+    author_job_max_queue_depth: int = Field(default=100, ge=0)
     author_v3_enabled: bool = False
     author_v3_run_mode: str = "deterministic"
     author_v3_max_llm_rounds: int = Field(default=2, ge=1, le=5)
@@ -122,11 +134,17 @@ class Settings(BaseSettings):
     play_v2_micro_sim_use_llm: bool = True
     play_v2_micro_sim_max_output_tokens: int = Field(default=260, ge=80, le=1200)
     play_v2_micro_sim_max_candidates: int = Field(default=5, ge=1, le=5)
+    play_v2_micro_sim_speculative_enabled: bool = False
+    play_v2_turn_worker_processes: int = Field(default=0, ge=0, le=64)
     play_v2_policy_cost_visibility_enabled: bool = True
     play_v2_policy_question_progress_v2_enabled: bool = True
     play_v2_policy_role_divergence_v2_enabled: bool = True
     play_v2_dramatic_rewrite_use_llm: bool = True
     play_v2_dramatic_rewrite_max_output_tokens: int = Field(default=360, ge=120, le=1400)
+    play_v2_compose_hedge_mode: Literal["off", "parallel", "delayed"] = "off"
+    play_v2_compose_hedge_candidates: int = Field(default=2, ge=1, le=3)
+    play_v2_compose_hedge_delay_ms: int = Field(default=1500, ge=0)
+    play_v2_compose_hedge_delay_percentile: float = Field(default=90.0, ge=50.0, le=99.9)
     play_v2_spec_compose_prewarm_enabled: bool = False
     semantic_autotune_patch_path: str | None = None
     quality_tuning_patch_path: str | None = None
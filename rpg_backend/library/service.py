@@ -27,6 +27,12 @@ from rpg_backend.library.contracts import (
     UpdateStoryVisibilityRequest,
 )
 from rpg_backend.library.storage import SQLiteStoryLibraryStorage
+from rpg_backend.play_v2.storylet_pool import (
+    StoryletPoolValidationError,
+    compile_plan_storylet_pool,
+    storylet_pool_digest,
+    storylet_pool_index,
+)
 
 
 class LibraryServiceError(RuntimeError):
@@ -140,6 +146,7 @@ class StoryLibraryService:
                     message="only relationship_drama_v2 package can be published",
                     status_code=400,
                 )
+            bundle = self._with_storylet_pool_digest(bundle)
             published_at = datetime.now(timezone.utc)
             package_version = "relationship_drama_v2"
             resolved_summary = summary
@@ -171,6 +178,24 @@ class StoryLibraryService:
                 return existing.story
         return inserted.story
 
+    @staticmethod
+    def _with_storylet_pool_digest(bundle: RelationshipDramaV2Package) -> RelationshipDramaV2Package:
+        plan = bundle.compiled_play_plan
+        try:
+            compiled_pool = compile_plan_storylet_pool(plan)
+        except StoryletPoolValidationError as exc:
+            raise LibraryServiceError(
+                code="story_storylet_pool_invalid",
+                message=f"storylet pool failed validation: {exc}",
+                status_code=400,
+            ) from exc
+        if compiled_pool is None:
+            return bundle
+        plan = plan.model_copy(update={"storylet_pool_digest": storylet_pool_digest(plan)})
+        # Warm the shared index so the first session of this story hydrates nothing.
+        storylet_pool_index(plan)
+        return bundle.model_copy(update={"compiled_play_plan": plan})
+
     @staticmethod
     def _decode_cursor(
         cursor: str | None,
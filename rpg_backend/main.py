@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 import ipaddress
+from typing import AsyncIterator
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -22,6 +24,7 @@ from rpg_backend.author.contracts import (
     AuthorPreviewResponse,
 )
 from rpg_backend.author.gateway import AuthorGatewayError
+from rpg_backend.author.job_scheduler import AuthorJobQueueFullError
 from rpg_backend.benchmark.contracts import (
     BenchmarkAuthorJobDiagnosticsResponse,
     BenchmarkPlaySessionDiagnosticsResponse,
@@ -46,9 +49,11 @@ from rpg_backend.play.contracts import (
     PlaySessionCreateRequest,
     PlaySessionReplayResponse,
     PlaySessionSnapshot,
+    PlaySessionSnapshotDelta,
     PlayTurnRequest,
 )
 from rpg_backend.play.service import PlayServiceError, PlaySessionService
+from rpg_backend.play_v2.turn_workers import shutdown_turn_worker_pool
 from rpg_backend.narrative.contracts import (
     AdvanceTurnRequest,
     AdvanceTurnResponse,
@@ -69,16 +74,25 @@ from rpg_backend.narrative.contracts import (
     UpdateTemplateVisibilityRequest,
 )
 from rpg_backend.narrative.service import NarrativeServiceError, get_narrative_service
-from rpg_backend.quotas import DailyQuotaLimiter, QuotaExceededError
+from rpg_backend.quotas import DailyQuotaLimiter, QuotaExceededError, build_quota_backend
 
-app = FastAPI(title="rpg-demo-rebuild")
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Stop speculative prewarm before joining the turn worker processes it may feed.
+    play_session_service.close()
+    shutdown_turn_worker_pool()
+
+
+app = FastAPI(title="rpg-demo-rebuild", lifespan=_lifespan)
 settings = get_settings()
 auth_service = AuthService(settings=settings)
 author_job_service = ProductAuthorJobService(settings=settings)
 story_library_service = get_story_library_service(settings)
 play_session_service = PlaySessionService(story_library_service=story_library_service, settings=settings)
 narrative_service = get_narrative_service(settings)
-llm_quota_limiter = DailyQuotaLimiter()
+llm_quota_limiter = DailyQuotaLimiter(backend=build_quota_backend(settings))
 AUTHOR_PREVIEW_LLM_OPERATION_COST = 3
 AUTHOR_JOB_LLM_OPERATION_COST = 7
 
@@ -230,6 +244,21 @@ def handle_gateway_error(_: Request, exc: AuthorGatewayError) -> JSONResponse:
     )
 
 
+@app.exception_handler(AuthorJobQueueFullError)
+def handle_author_job_queue_full(_: Request, exc: AuthorJobQueueFullError) -> JSONResponse:
+    return JSONResponse(
+        status_code=exc.status_code,
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+        content={
+            "error": {
+                "code": exc.code,
+                "message": exc.message,
+                "retry_after_seconds": exc.retry_after_seconds,
+            }
+        },
+    )
+
+
 @app.exception_handler(LibraryServiceError)
 def handle_library_error(_: Request, exc: LibraryServiceError) -> JSONResponse:
     return JSONResponse(
@@ -340,6 +369,7 @@ def create_author_job(
     session: AuthenticatedSession = Depends(get_required_request_session),
 ) -> AuthorJobStatusResponse:
     _require_authoring_enabled()
+    author_job_service.ensure_job_capacity()
     _enforce_llm_quota(
         request,
         user_id=session.user.user_id,
@@ -491,12 +521,28 @@ def get_play_session(
     return play_session_service.get_session(session_id, actor_user_id=user.user_id)
 
 
+@app.get("/play/sessions/{session_id}/delta", response_model=PlaySessionSnapshotDelta)
+def get_play_session_delta(
+    session_id: str,
+    since_turn: int = Query(ge=0),
+    user=Depends(get_required_request_user),
+) -> PlaySessionSnapshotDelta:
+    return play_session_service.get_session_delta(session_id, since_turn=since_turn, actor_user_id=user.user_id)
+
+
 @app.get("/play/sessions/{session_id}/history", response_model=PlaySessionHistoryResponse)
 def get_play_session_history(
     session_id: str,
+    after_turn: int | None = Query(default=None, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=200),
     user=Depends(get_required_request_user),
 ) -> PlaySessionHistoryResponse:
-    return play_session_service.get_session_history(session_id, actor_user_id=user.user_id)
+    return play_session_service.get_session_history(
+        session_id,
+        actor_user_id=user.user_id,
+        after_turn=after_turn,
+        limit=limit,
+    )
 
 
 @app.post("/play/sessions/{session_id}/draft-intent", response_model=PlayDraftIntentResponse)
@@ -546,10 +592,17 @@ def list_my_worlds(
 )
 def get_play_session_diagnostics(
     session_id: str,
+    after_turn: int | None = Query(default=None, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=200),
     session: AuthenticatedSession = Depends(get_required_request_session),
 ) -> BenchmarkPlaySessionDiagnosticsResponse:
     _require_benchmark_api()
-    return play_session_service.get_session_diagnostics(session_id, actor_user_id=session.user.user_id)
+    return play_session_service.get_session_diagnostics(
+        session_id,
+        actor_user_id=session.user.user_id,
+        after_turn=after_turn,
+        limit=limit,
+    )
 
 
 # --------------------------------------------------------------------------
@@ -389,6 +389,7 @@ class PlaySessionHistoryResponse(BaseModel):
     session_id: str = Field(min_length=1)
     story_id: str = Field(min_length=1)
     entries: list[PlaySessionHistoryEntry] = Field(default_factory=list)
+    has_more: bool = False
 
 
 class PlaySessionReplayResponse(BaseModel):
@@ -494,6 +495,38 @@ class PlaySessionSnapshot(BaseModel):
     ending: PlayEnding | None = None
 
 
+class PlaySessionSnapshotDelta(BaseModel):
+    """Snapshot sections that changed after ``since_turn_index``.
+
+    Sections missing from ``changed_sections`` stay as the client last saw
+    them. When the server cannot prove what changed (an evicted or reloaded
+    session, an expired one, a legacy runtime), ``snapshot`` carries the
+    full payload instead.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    session_id: str = Field(min_length=1)
+    turn_index: int = Field(ge=0)
+    since_turn_index: int = Field(ge=0)
+    changed_sections: list[str] = Field(default_factory=list)
+    snapshot: PlaySessionSnapshot | None = None
+    status: Literal["active", "completed", "expired"] | None = None
+    beat_index: int | None = Field(default=None, ge=1)
+    beat_title: str | None = Field(default=None, max_length=120)
+    narration: str | None = Field(default=None, max_length=4000)
+    feedback: PlayFeedbackSnapshot | None = None
+    progress: PlaySessionProgress | None = None
+    state_bars: list[PlayStateBar] | None = Field(default=None, max_length=16)
+    current_route_target_id: str | None = None
+    relationship_state: PlayRelationshipStateSnapshot | None = None
+    suggested_actions: list[PlaySuggestedAction] | None = Field(default=None, max_length=4)
+    story_actions: list[PlaySuggestedAction] | None = Field(default=None, max_length=4)
+    control_actions: list[PlayControlAction] | None = Field(default=None, max_length=3)
+    latent_radar: list[PlayLatentRadarItem] | None = Field(default=None, max_length=4)
+    ending: PlayEnding | None = None
+
+
 class PlayTurnIntentDraft(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -8,6 +8,7 @@ from rpg_backend.responses_transport import (
     ResponsesJSONResponse as PlayGatewayJSONResponse,
     ResponsesJSONTransport,
     build_openai_client,
+    resolve_rate_limit,
 )
 
 
@@ -88,6 +89,18 @@ class PlayLLMGateway:
         )
 
 
+def play_rate_limit_scope(settings: Settings | None = None) -> str | None:
+    """Limiter scope play gateway calls are admitted under; None when they are not rate limited."""
+    resolved = settings or get_settings()
+    requests_per_minute, scope = resolve_rate_limit(
+        requests_per_minute=resolved.responses_play_requests_per_minute,
+        rate_limit_scope="play" if resolved.responses_play_requests_per_minute is not None else None,
+    )
+    if not requests_per_minute:
+        return None
+    return str(scope or "").strip() or "default"
+
+
 def get_play_llm_gateway(settings: Settings | None = None) -> PlayLLMGateway:
     resolved = settings or get_settings()
     base_url = resolved.resolved_play_responses_base_url()
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 import hashlib
 import json
 import re
 from threading import Lock
-from time import perf_counter
+from time import monotonic, perf_counter
 import tempfile
-from typing import Any, Callable, Literal
+from typing import Any, Callable, ContextManager, Literal
 from uuid import uuid4
 from pydantic import ValidationError
 
@@ -17,12 +17,15 @@ from rpg_backend.author.contracts import RouteUnlockRule
 from rpg_backend.author_v2.contracts import CompiledPlayPlan
 from rpg_backend.author_v2.product_package import RelationshipDramaV2Package
 from rpg_backend.benchmark.contracts import (
+    BenchmarkPlaySessionCacheStats,
     BenchmarkPlaySessionDiagnosticsResponse,
     BenchmarkPlayTraceSummary,
 )
 from rpg_backend.config import Settings, get_settings
 from rpg_backend.library.service import StoryLibraryService
-from rpg_backend.play.storage import SQLitePlaySessionStorage
+from rpg_backend.play.session_cache import PlaySessionCache
+from rpg_backend.play.state_codec import build_state_codec
+from rpg_backend.play.storage import SQLitePlaySessionStorage, page_by_turn_index
 from rpg_backend.play.closeout import (
     EndingJudgeResult,
     PyrrhicCriticResult,
@@ -40,12 +43,13 @@ from rpg_backend.play.contracts import (
     PlaySessionHistoryResponse,
     PlaySessionReplayResponse,
     PlaySessionSnapshot,
+    PlaySessionSnapshotDelta,
     PlaySuggestedAction,
     PlayEnding,
     PlayTurnTrace,
     PlayTurnRequest,
 )
-from rpg_backend.play.gateway import PlayGatewayError, PlayLLMGateway, get_play_llm_gateway
+from rpg_backend.play.gateway import PlayGatewayError, PlayLLMGateway, get_play_llm_gateway, play_rate_limit_scope
 from rpg_backend.play.runtime import (
     apply_turn_resolution,
     PlaySessionState,
@@ -65,24 +69,32 @@ from rpg_backend.play.stages import (
     interpret_turn,
     render_turn,
 )
-from rpg_backend.play_v2.contracts import UrbanWorldState
-from rpg_backend.play_v2.product_api import build_v2_snapshot, build_v2_turn_trace
+from rpg_backend.play_v2.contracts import UrbanTurnChangeSet, UrbanWorldState
+from rpg_backend.play_v2.product_api import (
+    apply_v2_turn_changes,
+    build_v2_snapshot,
+    build_v2_snapshot_delta,
+    build_v2_turn_trace,
+)
 from rpg_backend.play_v2.delta_pack_runtime import clear_delta_pack_future
 from rpg_backend.play_v2.runtime import (
     build_control_actions as build_v2_control_actions,
     build_initial_world_state,
+    build_intent_legalization_precompute as build_v2_intent_legalization_precompute,
     run_intent_stage as run_v2_intent_stage,
     run_speculative_compose_prewarm as run_v2_speculative_compose_prewarm,
     build_suggested_actions as build_v2_suggested_actions,
     run_turn as run_v2_turn,
 )
 from rpg_backend.play.session_handlers import LegacyPlaySessionHandler, V2PlaySessionHandler
+from rpg_backend.responses_transport import llm_admission_open, llm_request_priority
 
 URBAN_V2_STATE_SCHEMA_VERSION = "urban_v2_20260406_super_flagship_v4"
 URBAN_PLAN_CONTRACT_VERSIONS = {4, 5}
 _DRAFT_INTENT_TTL_SECONDS = 75
 _DRAFT_INTENT_MAX_ENTRIES_PER_SESSION = 24
 _SPEC_COMPOSE_TTL_SECONDS = 90
+_CHANGE_SET_WINDOW = 16
 _SPEC_COMPOSE_PENDING_WAIT_MS_FREE_INPUT = 10
 _SPEC_COMPOSE_PENDING_WAIT_MS_SELECT_ID_IDLE = 200
 _SPEC_COMPOSE_PENDING_WAIT_MS_SELECT_ID_BUSY = 100
@@ -94,6 +106,7 @@ _SPEC_COMPOSE_TYPING_MIN_TEXT_LEN = 18
 _SPEC_COMPOSE_TYPING_HIGH_VALUE_MOVES = frozenset({"accuse", "public_reveal", "betray", "probe_secret"})
 _SPEC_COMPOSE_KEY_SEGMENT_ROLES = frozenset({"pressure", "reversal", "reveal", "terminal"})
 _SPEC_COMPOSE_PREWARM_ENABLED = False
+_PREWARM_EXECUTOR_MAX_WORKERS = 2
 _NORMALIZE_SPACES_RE = re.compile(r"\s+")
 
 
@@ -118,6 +131,27 @@ class _PlaySessionRecord:
     turn_traces: list[PlayTurnTrace]
     library_story_id: str | None = None  # library publish id; falls back to plan.story_id when absent
     player_user_id: str | None = None  # logged-in player; None for anonymous plays
+    # Rows already in storage; None until the session row itself exists.
+    persisted_history_count: int | None = None
+    persisted_trace_count: int | None = None
+    # Leading stored entries that were never hydrated; `history` and
+    # `turn_traces` hold only what comes after them.
+    history_offset: int = 0
+    trace_offset: int = 0
+    # Serialized sizes from the last write/load, used as the cache's byte weight.
+    plan_bytes: int = 0
+    state_bytes: int = 0
+    row_bytes: int = 0
+    # Recent v2 turn change sets, in memory only; delta polls fall back to a
+    # full snapshot once the window no longer reaches back far enough.
+    change_sets: list[UrbanTurnChangeSet] = field(default_factory=list)
+    # Last v2 snapshot served for `state`, in memory only; the next turn patches
+    # the sections its change set touched instead of rebuilding every section.
+    snapshot: PlaySessionSnapshot | None = None
+
+    @property
+    def resident_bytes(self) -> int:
+        return self.plan_bytes + self.state_bytes + self.row_bytes
 
 
 @dataclass
@@ -144,6 +178,15 @@ class _PrewarmBundle:
     suggested_actions: tuple[Any, ...]
     control_actions: tuple[Any, ...]
     created_at: datetime
+    legalization: Any = None
+    source: str = "inline"
+
+
+@dataclass
+class _PrewarmFutureEntry:
+    turn_index: int
+    state_snapshot_id: str
+    future: Future[_PrewarmBundle]
 
 
 @dataclass(frozen=True)
@@ -200,15 +243,27 @@ class PlaySessionService:
         self._storage = storage or SQLitePlaySessionStorage(
             self._settings.runtime_state_db_path
             if settings is not None
-            else f"{tempfile.gettempdir()}/rpg_demo_play_sessions_{uuid4()}.sqlite3"
+            else f"{tempfile.gettempdir()}/rpg_demo_play_sessions_{uuid4()}.sqlite3",
+            state_codec=build_state_codec(
+                self._settings.play_session_state_codec,
+                zstd_dict_path=self._settings.play_session_state_zstd_dict_path,
+            ),
         )
         self._lock = Lock()
-        self._session_locks: dict[str, Lock] = {}
-        self._sessions: dict[str, _PlaySessionRecord] = {}
+        self._session_cache = PlaySessionCache(
+            max_entries=self._settings.play_session_cache_max_entries,
+            max_bytes=self._settings.play_session_cache_max_bytes,
+            max_idle_seconds=self._settings.play_session_cache_max_idle_seconds,
+            on_evict=self._write_through_evicted_record,
+        )
+        self._session_cache_sweep_lock = Lock()
+        self._next_session_cache_sweep_at = monotonic() + float(self._settings.play_session_cache_sweep_interval_seconds)
         self._draft_intents_by_id: dict[str, _DraftIntentEntry] = {}
         self._draft_intent_lookup: dict[tuple[str, int, str, str], str] = {}
         self._draft_intent_ids_by_session: dict[str, list[str]] = {}
         self._prewarm_bundles: dict[str, _PrewarmBundle] = {}
+        self._prewarm_futures: dict[str, _PrewarmFutureEntry] = {}
+        self._prewarm_executor: ThreadPoolExecutor | None = None
         self._spec_compose_cache: dict[_SpecComposeCacheKey, _SpecComposeResult] = {}
         self._spec_compose_futures: dict[_SpecComposeCacheKey, _SpecComposeFutureEntry] = {}
         self._spec_compose_session_keys: dict[str, list[_SpecComposeCacheKey]] = {}
@@ -224,6 +279,40 @@ class PlaySessionService:
     def _now(self) -> datetime:
         return self._now_provider()
 
+    def _maybe_sweep_session_cache(self) -> None:
+        # Sweeps piggyback on session access instead of a per-service thread;
+        # at most one caller sweeps at a time and the others carry on.
+        interval_seconds = float(self._settings.play_session_cache_sweep_interval_seconds)
+        if interval_seconds <= 0 or monotonic() < self._next_session_cache_sweep_at:
+            return
+        if not self._session_cache_sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_session_cache_sweep_at = monotonic() + interval_seconds
+            self.sweep_session_cache()
+        except Exception:  # noqa: BLE001 — a failed sweep must not fail the request
+            pass
+        finally:
+            self._session_cache_sweep_lock.release()
+
+    def sweep_session_cache(self) -> None:
+        """Expire idle-past-TTL resident sessions, then evict idle records."""
+        now = self._now()
+        for session_id, record in self._session_cache.resident_items():
+            if record.state.status != "active" or now < record.expires_at:
+                continue
+            # Sessions busy in a request are skipped; the request refreshes them.
+            with self._session_cache.try_lock(session_id) as acquired:
+                current = self._session_cache.peek(session_id) if acquired else None
+                if current is not None:
+                    self._expire_record_if_needed(current)
+        self._session_cache.sweep_idle()
+
+    def close(self) -> None:
+        if self._prewarm_executor is not None:
+            self._prewarm_executor.shutdown(wait=False, cancel_futures=True)
+            self._prewarm_executor = None
+
     @staticmethod
     def _serialize_state(state: PlaySessionState) -> dict[str, object]:
         if isinstance(state, UrbanWorldState):
@@ -402,6 +491,12 @@ class PlaySessionService:
             library_story_id = library_story_id_raw
         player_user_id_raw = payload.get("player_user_id")
         player_user_id = str(player_user_id_raw) if isinstance(player_user_id_raw, str) and player_user_id_raw else None
+        history = [PlaySessionHistoryEntry.model_validate(item) for item in (payload.get("history") or [])]
+        turn_traces = [PlayTurnTrace.model_validate(item) for item in (payload.get("turn_traces") or [])]
+        # Lazy loads carry only row counts; entries are paged in on request.
+        history_offset = int(payload.get("history_count") or 0) if "history" not in payload else 0
+        trace_offset = int(payload.get("turn_trace_count") or 0) if "turn_traces" not in payload else 0
+        stored_bytes = dict(payload.get("stored_bytes") or {})
         return _PlaySessionRecord(
             owner_user_id=str(payload["owner_user_id"]),
             runtime_kind=(
@@ -414,24 +509,77 @@ class PlaySessionService:
             created_at=datetime.fromisoformat(str(payload["created_at"])),
             expires_at=datetime.fromisoformat(str(payload["expires_at"])),
             finished_at=datetime.fromisoformat(str(payload["finished_at"])) if payload.get("finished_at") else None,
-            history=[PlaySessionHistoryEntry.model_validate(item) for item in (payload.get("history") or [])],
-            turn_traces=[PlayTurnTrace.model_validate(item) for item in (payload.get("turn_traces") or [])],
+            history=history,
+            turn_traces=turn_traces,
             library_story_id=library_story_id,
             player_user_id=player_user_id,
+            persisted_history_count=history_offset + len(history),
+            persisted_trace_count=trace_offset + len(turn_traces),
+            history_offset=history_offset,
+            trace_offset=trace_offset,
+            plan_bytes=int(stored_bytes.get("plan") or 0),
+            state_bytes=int(stored_bytes.get("state") or 0),
+            row_bytes=int(stored_bytes.get("rows") or 0),
         )
 
     def _save_record(self, record: _PlaySessionRecord) -> None:
-        with self._lock:
-            self._sessions[record.state.session_id] = record
-        self._storage.save_session(self._serialize_record(record))
+        self._persist_record(record)
+        self._session_cache.put(record.state.session_id, record, size_bytes=record.resident_bytes)
+
+    def _persist_record(self, record: _PlaySessionRecord) -> None:
+        if record.persisted_history_count is None or record.persisted_trace_count is None:
+            # First write stores the immutable plan; every later save is a delta.
+            stats = self._storage.save_session(self._serialize_record(record))
+            record.plan_bytes = stats.plan_bytes
+            record.row_bytes = stats.appended_bytes
+        else:
+            stats = self._storage.save_session_delta(
+                session_id=record.state.session_id,
+                expires_at=record.expires_at.isoformat(),
+                finished_at=record.finished_at.isoformat() if record.finished_at is not None else None,
+                state=self._serialize_state(record.state),
+                history_start=record.persisted_history_count,
+                new_history=[
+                    entry.model_dump(mode="json")
+                    for entry in record.history[record.persisted_history_count - record.history_offset:]
+                ],
+                traces_start=record.persisted_trace_count,
+                new_turn_traces=[
+                    trace.model_dump(mode="json")
+                    for trace in record.turn_traces[record.persisted_trace_count - record.trace_offset:]
+                ],
+            )
+            if stats is None:
+                self._session_cache.discard(record.state.session_id)
+                raise PlayServiceError(
+                    code="play_session_not_found",
+                    message=f"play session '{record.state.session_id}' was not found",
+                    status_code=404,
+                )
+            record.row_bytes += stats.appended_bytes
+        record.state_bytes = stats.state_bytes
+        record.persisted_history_count = record.history_offset + len(record.history)
+        record.persisted_trace_count = record.trace_offset + len(record.turn_traces)
 
-    def _session_lock_for(self, session_id: str) -> Lock:
-        with self._lock:
-            lock = self._session_locks.get(session_id)
-            if lock is None:
-                lock = Lock()
-                self._session_locks[session_id] = lock
-            return lock
+    @staticmethod
+    def _record_has_unsaved_rows(record: _PlaySessionRecord) -> bool:
+        return (
+            record.persisted_history_count is None
+            or record.persisted_trace_count is None
+            or record.persisted_history_count != record.history_offset + len(record.history)
+            or record.persisted_trace_count != record.trace_offset + len(record.turn_traces)
+        )
+
+    def _write_through_evicted_record(self, session_id: str, record: _PlaySessionRecord) -> None:
+        # _save_record already persisted every completed write; only a record
+        # evicted before its first save still needs writing.
+        if self._record_has_unsaved_rows(record):
+            self._persist_record(record)
+        self._clear_transients_for_session(session_id)
+
+    def _session_lock_for(self, session_id: str) -> ContextManager[None]:
+        self._maybe_sweep_session_cache()
+        return self._session_cache.lock(session_id)
 
     @staticmethod
     def _ensure_owner_access(owner_user_id: str, actor_user_id: str, *, session_id: str) -> None:
@@ -533,7 +681,11 @@ class PlaySessionService:
         return sum(1 for entry in self._spec_compose_futures.values() if not entry.future.done())
 
     def _spec_compose_backpressure_active(self) -> bool:
-        return self._spec_compose_inflight_count() >= _SPEC_COMPOSE_MAX_INFLIGHT
+        if self._spec_compose_inflight_count() >= _SPEC_COMPOSE_MAX_INFLIGHT:
+            return True
+        # Prewarms are the first thing to give up when the shared provider
+        # rate limit runs low; interactive turns keep the reserved headroom.
+        return not llm_admission_open("speculative", scope=play_rate_limit_scope(self._settings))
 
     @staticmethod
     def _current_segment_role(plan: CompiledPlayPlan, state: UrbanWorldState) -> str:
@@ -713,26 +865,32 @@ class PlaySessionService:
     ) -> _SpecComposeResult:
         gateway = self._resolve_gateway()
         try:
-            payload = run_v2_speculative_compose_prewarm(
-                plan,
-                state,
-                input_text,
-                gateway=gateway,
-                selected_suggestion_id=selected_suggestion_id,
-                selected_story_action_id=selected_story_action_id,
-                selected_control_action_id=selected_control_action_id,
-                control_action=control_action,
-                control_target_kind=control_target_kind,
-                control_target_id=control_target_id,
-                control_target_mode=control_target_mode,
-                precomputed_intent=precomputed_intent,
-                precomputed_micro_sim=precomputed_micro_sim,
-                precomputed_intent_diagnostics=precomputed_intent_diagnostics,
-                prefetched_suggestions=prefetched_suggestions,
-                prefetched_control_actions=prefetched_control_actions,
-            )
+            with llm_request_priority("speculative") as admission:
+                payload = run_v2_speculative_compose_prewarm(
+                    plan,
+                    state,
+                    input_text,
+                    gateway=gateway,
+                    selected_suggestion_id=selected_suggestion_id,
+                    selected_story_action_id=selected_story_action_id,
+                    selected_control_action_id=selected_control_action_id,
+                    control_action=control_action,
+                    control_target_kind=control_target_kind,
+                    control_target_id=control_target_id,
+                    control_target_mode=control_target_mode,
+                    precomputed_intent=precomputed_intent,
+                    precomputed_micro_sim=precomputed_micro_sim,
+                    precomputed_intent_diagnostics=precomputed_intent_diagnostics,
+                    prefetched_suggestions=prefetched_suggestions,
+                    prefetched_control_actions=prefetched_control_actions,
+                )
             narration = _NORMALIZE_SPACES_RE.sub(" ", str(payload.get("narration") or "")).strip()
             diagnostics = self._sanitize_scalar_diagnostics(dict(payload.get("diagnostics") or {}))
+            if admission.rejected:
+                # A dropped compose call leaves fallback narration behind;
+                # never hand that to the committed turn as a prewarm hit.
+                narration = ""
+                diagnostics["spec_compose_admission_rejected"] = admission.rejected
             compose_input_tokens = max(int(payload.get("compose_input_tokens", 0) or 0), 0)
             compose_output_tokens = max(int(payload.get("compose_output_tokens", 0) or 0), 0)
             compose_total_tokens = max(int(payload.get("compose_total_tokens", 0) or 0), 0)
@@ -748,7 +906,7 @@ class PlaySessionService:
                     compose_output_tokens=compose_output_tokens,
                     compose_total_tokens=compose_total_tokens,
                     expires_at=expires_at,
-                    failed_reason="empty_narration",
+                    failed_reason="admission_rejected" if admission.rejected else "empty_narration",
                 )
             return _SpecComposeResult(
                 key=key,
@@ -1035,6 +1193,9 @@ class PlaySessionService:
 
     def _clear_transients_for_session(self, session_id: str) -> None:
         self._prewarm_bundles.pop(session_id, None)
+        pending_prewarm = self._prewarm_futures.pop(session_id, None)
+        if pending_prewarm is not None:
+            pending_prewarm.future.cancel()
         draft_ids = list(self._draft_intent_ids_by_session.pop(session_id, []))
         for draft_intent_id in draft_ids:
             self._evict_draft_intent(draft_intent_id)
@@ -1049,6 +1210,136 @@ class PlaySessionService:
         for scope_key in stale_scope_keys:
             self._spec_compose_latest_generation.pop(scope_key, None)
 
+    def _prewarm_executor_instance(self) -> ThreadPoolExecutor:
+        if self._prewarm_executor is None:
+            self._prewarm_executor = ThreadPoolExecutor(
+                max_workers=_PREWARM_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="turn-prewarm",
+            )
+        return self._prewarm_executor
+
+    def _build_prewarm_bundle(
+        self,
+        *,
+        session_id: str,
+        plan: CompiledPlayPlan,
+        state: UrbanWorldState,
+        snapshot_id: str,
+        source: str,
+    ) -> _PrewarmBundle:
+        legalization = build_v2_intent_legalization_precompute(plan, state)
+        return _PrewarmBundle(
+            session_id=session_id,
+            turn_index=state.turn_index,
+            state_snapshot_id=snapshot_id,
+            suggested_actions=legalization.suggestions,
+            control_actions=legalization.control_actions,
+            created_at=self._now(),
+            legalization=legalization,
+            source=source,
+        )
+
+    def _run_prewarm_job(
+        self,
+        *,
+        session_id: str,
+        plan: CompiledPlayPlan,
+        state: UrbanWorldState,
+        snapshot_id: str,
+        read_phase_spec_compose: bool,
+    ) -> _PrewarmBundle:
+        bundle = self._build_prewarm_bundle(
+            session_id=session_id,
+            plan=plan,
+            state=state,
+            snapshot_id=snapshot_id,
+            source="background",
+        )
+        if read_phase_spec_compose:
+            try:
+                self._schedule_read_phase_spec_compose(
+                    session_id=session_id,
+                    plan=plan,
+                    state=state,
+                    snapshot_id=snapshot_id,
+                    bundle=bundle,
+                )
+            except Exception:  # noqa: BLE001 — speculation must not cost the next turn its bundle
+                pass
+        return bundle
+
+    def _schedule_read_phase_spec_compose(
+        self,
+        *,
+        session_id: str,
+        plan: CompiledPlayPlan,
+        state: UrbanWorldState,
+        snapshot_id: str,
+        bundle: _PrewarmBundle,
+    ) -> None:
+        for action in list(state.story_actions[:_SPEC_COMPOSE_READ_PHASE_TOP_K]):
+            action_prompt = str(action.prompt or "").strip()
+            if not action_prompt:
+                continue
+            self._schedule_spec_compose_job(
+                session_id=session_id,
+                turn_index=int(state.turn_index),
+                state_snapshot_id=snapshot_id,
+                normalized_text_hash=self._normalized_text_hash(action_prompt),
+                source="read_phase:auto_top1",
+                plan=plan,
+                state=state,
+                input_text=action_prompt,
+                selected_suggestion_id=action.suggestion_id,
+                selected_story_action_id=action.suggestion_id,
+                selected_control_action_id=None,
+                control_action="none",
+                control_target_kind=None,
+                control_target_id=None,
+                control_target_mode=None,
+                precomputed_intent=None,
+                precomputed_micro_sim=None,
+                precomputed_intent_diagnostics=None,
+                prefetched_suggestions=bundle.suggested_actions,
+                prefetched_control_actions=bundle.control_actions,
+                latest_wins_scope=None,
+            )
+
+    def _schedule_prewarm_bundle(
+        self,
+        *,
+        session_id: str,
+        plan: CompiledPlayPlan,
+        state: UrbanWorldState,
+        read_phase_spec_compose: bool = False,
+    ) -> None:
+        """Build the next turn's suggestions, control actions and legalization context off the request path.
+
+        With ``read_phase_spec_compose`` the same job then starts speculative
+        compose for the top story actions, fed by the bundle it just built. The
+        job only reads ``state``; the session lock keeps the next turn from
+        mutating it until ``_prewarm_bundle_for_state`` has collected the result.
+        """
+        if state.status != "active":
+            return
+        snapshot_id = self._state_snapshot_id(state)
+        previous = self._prewarm_futures.pop(session_id, None)
+        if previous is not None:
+            previous.future.cancel()
+        future = self._prewarm_executor_instance().submit(
+            self._run_prewarm_job,
+            session_id=session_id,
+            plan=plan,
+            state=state,
+            snapshot_id=snapshot_id,
+            read_phase_spec_compose=read_phase_spec_compose,
+        )
+        self._prewarm_futures[session_id] = _PrewarmFutureEntry(
+            turn_index=int(state.turn_index),
+            state_snapshot_id=snapshot_id,
+            future=future,
+        )
+
     def _prewarm_bundle_for_state(
         self,
         *,
@@ -1064,13 +1355,29 @@ class PlaySessionService:
             and existing.state_snapshot_id == snapshot_id
         ):
             return existing
-        bundle = _PrewarmBundle(
+        pending = self._prewarm_futures.pop(session_id, None)
+        if (
+            pending is not None
+            and pending.turn_index == state.turn_index
+            and pending.state_snapshot_id == snapshot_id
+            # A job that never started is cheaper to run inline than to wait behind the queue.
+            and not pending.future.cancel()
+        ):
+            try:
+                bundle = pending.future.result()
+            except Exception:  # noqa: BLE001 — fall back to the synchronous build
+                bundle = None
+            if bundle is not None:
+                self._prewarm_bundles[session_id] = bundle
+                return bundle
+        elif pending is not None:
+            pending.future.cancel()
+        bundle = self._build_prewarm_bundle(
             session_id=session_id,
-            turn_index=state.turn_index,
-            state_snapshot_id=snapshot_id,
-            suggested_actions=tuple(build_v2_suggested_actions(plan, state)),
-            control_actions=tuple(build_v2_control_actions(plan, state)),
-            created_at=self._now(),
+            plan=plan,
+            state=state,
+            snapshot_id=snapshot_id,
+            source="inline",
         )
         self._prewarm_bundles[session_id] = bundle
         return bundle
@@ -1137,12 +1444,11 @@ class PlaySessionService:
         )
 
     def _get_record(self, session_id: str) -> _PlaySessionRecord:
-        with self._lock:
-            cached = self._sessions.get(session_id)
+        cached = self._session_cache.get(session_id)
         if cached is not None:
             record = cached
         else:
-            payload = self._storage.get_session(session_id)
+            payload = self._storage.get_session(session_id, include_turn_log=False)
             if payload is None:
                 raise PlayServiceError(
                     code="play_session_not_found",
@@ -1150,14 +1456,14 @@ class PlaySessionService:
                     status_code=404,
                 )
             record = self._deserialize_record(payload)
-            with self._lock:
-                self._sessions[session_id] = record
+            self._session_cache.put(session_id, record, size_bytes=record.resident_bytes)
         return record
 
     def _expire_record_if_needed(self, record: _PlaySessionRecord) -> None:
         if record.state.status != "active" or self._now() < record.expires_at:
             return
         record.state.status = "expired"
+        record.snapshot = None
         if isinstance(record.state, UrbanWorldState):
             clear_delta_pack_future(record.state.session_id)
             record.state.suggested_actions = []
@@ -1224,6 +1530,24 @@ class PlaySessionService:
         })
         return snapshot
 
+    def _record_snapshot(
+        self,
+        record: _PlaySessionRecord,
+        change_set: UrbanTurnChangeSet | None = None,
+    ) -> PlaySessionSnapshot:
+        """Snapshot of ``record``'s current state, patched from the cached one when ``change_set`` allows."""
+        if not isinstance(record.plan, CompiledPlayPlan) or not isinstance(record.state, UrbanWorldState):
+            return self._snapshot_for(record.plan, record.state, library_story_id=record.library_story_id)
+        cached = record.snapshot
+        if cached is not None and cached.turn_index == record.state.turn_index and change_set is None:
+            return cached
+        if cached is not None and change_set is not None and cached.turn_index == change_set.turn_index_before:
+            snapshot = apply_v2_turn_changes(record.plan, record.state, cached, change_set)
+        else:
+            snapshot = self._snapshot_for(record.plan, record.state, library_story_id=record.library_story_id)
+        record.snapshot = snapshot
+        return snapshot
+
     @staticmethod
     def _add_usage(total: dict[str, int], usage: dict[str, int | str] | None) -> None:
         if not usage:
@@ -1371,7 +1695,6 @@ class PlaySessionService:
             ],
             turn_traces=[],
         )
-        self._session_lock_for(session_id)
         self._save_record(record)
         return self._snapshot_for(plan, state)
 
@@ -1395,6 +1718,7 @@ class PlaySessionService:
         state.story_actions = build_v2_suggested_actions(plan, state)
         state.suggested_actions = list(state.story_actions)
         state.control_actions = build_v2_control_actions(plan, state)
+        self._schedule_prewarm_bundle(session_id=session_id, plan=plan, state=state)
         now = self._now()
         record = _PlaySessionRecord(
             owner_user_id=resolved_actor_user_id,
@@ -1416,36 +1740,125 @@ class PlaySessionService:
             library_story_id=library_story_id,
             player_user_id=player_user_id,
         )
-        self._session_lock_for(session_id)
         self._save_record(record)
         return self._snapshot_for(plan, state, library_story_id=library_story_id)
 
+    def _page_history(
+        self,
+        record: _PlaySessionRecord,
+        *,
+        after_turn: int | None,
+        limit: int | None,
+    ) -> tuple[list[PlaySessionHistoryEntry], bool]:
+        if record.history_offset == 0:
+            return page_by_turn_index(record.history, after_turn=after_turn, limit=limit)
+        # Every mutation is persisted before the session lock is released, so
+        # storage holds the complete log whenever part of it is not resident.
+        items, has_more = self._storage.list_history(record.state.session_id, after_turn=after_turn, limit=limit)
+        return [PlaySessionHistoryEntry.model_validate(item) for item in items], has_more
+
+    def _page_turn_traces(
+        self,
+        record: _PlaySessionRecord,
+        *,
+        after_turn: int | None,
+        limit: int | None,
+    ) -> tuple[list[PlayTurnTrace], bool]:
+        if record.trace_offset == 0:
+            return page_by_turn_index(record.turn_traces, after_turn=after_turn, limit=limit)
+        items, has_more = self._storage.list_turn_traces(record.state.session_id, after_turn=after_turn, limit=limit)
+        return [PlayTurnTrace.model_validate(item) for item in items], has_more
+
     def get_session(self, session_id: str, *, actor_user_id: str | None = None) -> PlaySessionSnapshot:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
         with self._session_lock_for(session_id):
             record = self._get_record(session_id)
             self._ensure_owner_access(record.owner_user_id, resolved_actor_user_id, session_id=session_id)
             self._expire_record_if_needed(record)
-            return self._snapshot_for(record.plan, record.state, library_story_id=record.library_story_id)
+            return self._record_snapshot(record)
+
+    def get_session_delta(
+        self,
+        session_id: str,
+        *,
+        since_turn: int,
+        actor_user_id: str | None = None,
+    ) -> PlaySessionSnapshotDelta:
+        resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
+        with self._session_lock_for(session_id):
+            record = self._get_record(session_id)
+            self._ensure_owner_access(record.owner_user_id, resolved_actor_user_id, session_id=session_id)
+            self._expire_record_if_needed(record)
+            change_sets = self._change_sets_since(record, since_turn=since_turn)
+            if change_sets is None:
+                snapshot = self._record_snapshot(record)
+                return PlaySessionSnapshotDelta(
+                    session_id=session_id,
+                    turn_index=snapshot.turn_index,
+                    since_turn_index=since_turn,
+                    snapshot=snapshot,
+                )
+            return build_v2_snapshot_delta(
+                record.plan,
+                record.state,
+                since_turn_index=since_turn,
+                change_sets=change_sets,
+            )
 
-    def get_turn_traces(self, session_id: str, *, actor_user_id: str | None = None) -> list[PlayTurnTrace]:
+    @staticmethod
+    def _change_sets_since(record: _PlaySessionRecord, *, since_turn: int) -> list[UrbanTurnChangeSet] | None:
+        """Contiguous change sets covering ``since_turn`` up to now, or None when they cannot."""
+        if not isinstance(record.plan, CompiledPlayPlan) or not isinstance(record.state, UrbanWorldState):
+            return None
+        if record.state.status == "expired" or since_turn > record.state.turn_index:
+            return None
+        if since_turn == record.state.turn_index:
+            return []
+        pending = [item for item in record.change_sets if item.turn_index_after > since_turn]
+        if not pending or pending[0].turn_index_before != since_turn:
+            return None
+        for previous, current in zip(pending, pending[1:]):
+            if current.turn_index_before != previous.turn_index_after:
+                return None
+        if pending[-1].turn_index_after != record.state.turn_index:
+            return None
+        return pending
+
+    def get_turn_traces(
+        self,
+        session_id: str,
+        *,
+        actor_user_id: str | None = None,
+        after_turn: int | None = None,
+        limit: int | None = None,
+    ) -> list[PlayTurnTrace]:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
         with self._session_lock_for(session_id):
             record = self._get_record(session_id)
             self._ensure_owner_access(record.owner_user_id, resolved_actor_user_id, session_id=session_id)
             self._expire_record_if_needed(record)
-            return list(record.turn_traces)
+            traces, _has_more = self._page_turn_traces(record, after_turn=after_turn, limit=limit)
+            return traces
 
-    def get_session_history(self, session_id: str, *, actor_user_id: str | None = None) -> PlaySessionHistoryResponse:
+    def get_session_history(
+        self,
+        session_id: str,
+        *,
+        actor_user_id: str | None = None,
+        after_turn: int | None = None,
+        limit: int | None = None,
+    ) -> PlaySessionHistoryResponse:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
         with self._session_lock_for(session_id):
             record = self._get_record(session_id)
             self._ensure_owner_access(record.owner_user_id, resolved_actor_user_id, session_id=session_id)
             self._expire_record_if_needed(record)
+            entries, has_more = self._page_history(record, after_turn=after_turn, limit=limit)
             return PlaySessionHistoryResponse(
                 session_id=session_id,
                 story_id=record.library_story_id or record.plan.story_id,
-                entries=list(record.history),
+                entries=entries,
+                has_more=has_more,
             )
 
     def get_session_replay(self, session_id: str) -> PlaySessionReplayResponse:
@@ -1473,7 +1886,7 @@ class PlaySessionService:
                 completed_at=record.finished_at,
                 final_narration=str(getattr(record.state, "narration", "") or ""),
                 ending=ending,
-                entries=list(record.history),
+                entries=self._page_history(record, after_turn=None, limit=None)[0],
             )
 
     def draft_intent(
@@ -1549,6 +1962,7 @@ class PlaySessionService:
                 control_target_mode=request.control_target_mode,
                 prefetched_suggestions=prewarm.suggested_actions,
                 prefetched_control_actions=prewarm.control_actions,
+                prefetched_legalization=prewarm.legalization,
             )
             usage = self._draft_usage_from_diagnostics(diagnostics)
             draft_diagnostics = dict(diagnostics or {})
@@ -1605,13 +2019,37 @@ class PlaySessionService:
                 )
             return self._draft_response_from_entry(draft_entry)
 
-    def get_session_diagnostics(self, session_id: str, *, actor_user_id: str | None = None) -> BenchmarkPlaySessionDiagnosticsResponse:
+    def _session_cache_stats(self) -> BenchmarkPlaySessionCacheStats:
+        stats = self._session_cache.stats()
+        return BenchmarkPlaySessionCacheStats(
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_rate=stats.hit_rate,
+            capacity_evictions=stats.capacity_evictions,
+            idle_evictions=stats.idle_evictions,
+            resident_entries=stats.resident_entries,
+            resident_bytes=stats.resident_bytes,
+            max_entries=stats.max_entries,
+            max_bytes=stats.max_bytes,
+        )
+
+    def get_session_diagnostics(
+        self,
+        session_id: str,
+        *,
+        actor_user_id: str | None = None,
+        after_turn: int | None = None,
+        limit: int | None = None,
+    ) -> BenchmarkPlaySessionDiagnosticsResponse:
         resolved_actor_user_id = actor_user_id or self._settings.default_actor_id
         with self._session_lock_for(session_id):
             record = self._get_record(session_id)
             self._ensure_owner_access(record.owner_user_id, resolved_actor_user_id, session_id=session_id)
             self._expire_record_if_needed(record)
-            traces = list(record.turn_traces)
+            # The summary always covers the whole session; only the raw trace
+            # payload is paged.
+            all_traces, _ = self._page_turn_traces(record, after_turn=None, limit=None)
+            traces, has_more = page_by_turn_index(all_traces, after_turn=after_turn, limit=limit)
             return BenchmarkPlaySessionDiagnosticsResponse(
                 session_id=session_id,
                 story_id=record.plan.story_id,
@@ -1620,7 +2058,9 @@ class PlaySessionService:
                 expires_at=record.expires_at,
                 finished_at=record.finished_at,
                 turn_traces=[trace.model_dump(mode="json") for trace in traces],
-                summary=self._build_trace_summary(traces),
+                turn_traces_has_more=has_more,
+                summary=self._build_trace_summary(all_traces),
+                session_cache=self._session_cache_stats(),
             )
 
     def submit_turn(self, session_id: str, request: PlayTurnRequest, *, actor_user_id: str | None = None) -> PlaySessionSnapshot:
@@ -1656,7 +2096,6 @@ class PlaySessionService:
                 message="only urban_v2 play sessions are supported",
                 status_code=409,
             )
-        before_state = record.state.model_copy(deep=True)
         prewarm = self._prewarm_bundle_for_state(
             session_id=session_id,
             plan=record.plan,
@@ -1714,6 +2153,8 @@ class PlaySessionService:
                 precomputed_compose=precomputed_compose,
                 prefetched_suggestions=prewarm.suggested_actions,
                 prefetched_control_actions=prewarm.control_actions,
+                prefetched_legalization=prewarm.legalization,
+                prefetch_source=prewarm.source,
                 draft_usage=draft_usage,
                 draft_call_count=draft_call_count,
                 draft_intent_status=draft_status,
@@ -1735,6 +2176,8 @@ class PlaySessionService:
             ) from exc
         turn_elapsed_ms = max(int((perf_counter() - turn_started_at) * 1000), 0)
         record.state = result.state
+        if result.change_set is not None:
+            record.change_sets = [*record.change_sets, result.change_set][-_CHANGE_SET_WINDOW:]
         record.history.append(
             PlaySessionHistoryEntry(
                 speaker="player",
@@ -1755,7 +2198,6 @@ class PlaySessionService:
         if self._enable_turn_telemetry:
             trace, payload = build_v2_turn_trace(
                 plan=record.plan,
-                before_state=before_state,
                 result=result,
                 player_input=request.input_text,
                 selected_suggestion_id=request.selected_suggestion_id,
@@ -1767,57 +2209,23 @@ class PlaySessionService:
             if payload.ending_family:
                 trace.resolution.ending_id = payload.ending_family
             record.turn_traces.append(trace)
-        self._prewarm_bundle_for_state(
-            session_id=session_id,
-            plan=record.plan,
-            state=record.state,
-        )
         previous_turn_select_id = has_selected_ids
-        if (
-            record.state.status == "active"
-            and self._spec_compose_prewarm_enabled()
-            and self._should_schedule_read_phase_prewarm(
+        self._schedule_prewarm_bundle(
+            session_id=session_id,
             plan=record.plan,
             state=record.state,
-            previous_turn_select_id=previous_turn_select_id,
-            )
-        ):
-            refreshed_prewarm = self._prewarm_bundle_for_state(
-                session_id=session_id,
-                plan=record.plan,
-                state=record.state,
-            )
-            state_snapshot_id = self._state_snapshot_id(record.state)
-            for action in list(record.state.story_actions[:_SPEC_COMPOSE_READ_PHASE_TOP_K]):
-                action_prompt = str(action.prompt or "").strip()
-                if not action_prompt:
-                    continue
-                self._schedule_spec_compose_job(
-                    session_id=session_id,
-                    turn_index=int(record.state.turn_index),
-                    state_snapshot_id=state_snapshot_id,
-                    normalized_text_hash=self._normalized_text_hash(action_prompt),
-                    source="read_phase:auto_top1",
+            read_phase_spec_compose=(
+                self._spec_compose_prewarm_enabled()
+                and self._should_schedule_read_phase_prewarm(
                     plan=record.plan,
                     state=record.state,
-                    input_text=action_prompt,
-                    selected_suggestion_id=action.suggestion_id,
-                    selected_story_action_id=action.suggestion_id,
-                    selected_control_action_id=None,
-                    control_action="none",
-                    control_target_kind=None,
-                    control_target_id=None,
-                    control_target_mode=None,
-                    precomputed_intent=None,
-                    precomputed_micro_sim=None,
-                    precomputed_intent_diagnostics=None,
-                    prefetched_suggestions=refreshed_prewarm.suggested_actions,
-                    prefetched_control_actions=refreshed_prewarm.control_actions,
-                    latest_wins_scope=None,
+                    previous_turn_select_id=previous_turn_select_id,
                 )
+            ),
+        )
         self._refresh_record_expiry(record)
         self._save_record(record)
-        return self._snapshot_for(record.plan, record.state, library_story_id=record.library_story_id)
+        return self._record_snapshot(record, result.change_set)
 
     def _submit_turn_legacy(self, *, session_id: str, record: _PlaySessionRecord, request: PlayTurnRequest) -> PlaySessionSnapshot:
         if isinstance(record.plan, CompiledPlayPlan) or isinstance(record.state, UrbanWorldState):
@@ -2138,11 +2546,10 @@ class PlaySessionService:
             )
             stale_session_ids = [
                 session_id
-                for session_id, record in self._sessions.items()
+                for session_id, record in self._session_cache.resident_items()
                 if record.plan.story_id == story_id and (actor_user_id is None or record.owner_user_id == resolved_actor_user_id)
             ]
             for session_id in stale_session_ids:
-                self._sessions.pop(session_id, None)
-                self._session_locks.pop(session_id, None)
+                self._session_cache.discard(session_id)
                 self._clear_transients_for_session(session_id)
             return deleted
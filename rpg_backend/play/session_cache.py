@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Iterator
+
+
+@dataclass
+class _CacheSlot:
+    lock: Lock = field(default_factory=Lock)
+    record: Any = None
+    size_bytes: int = 0
+    pins: int = 0
+    last_access: float = 0.0
+
+
+@dataclass(frozen=True)
+class PlaySessionCacheStats:
+    hits: int
+    misses: int
+    capacity_evictions: int
+    idle_evictions: int
+    resident_entries: int
+    resident_bytes: int
+    max_entries: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups, 4) if lookups else 0.0
+
+
+class PlaySessionCache:
+    """LRU session cache bounded by entry count, resident bytes and idle age.
+
+    Each slot owns the per-session lock. Holders of ``lock(session_id)`` pin
+    the slot so it is never evicted while a request is using it, and a slot's
+    lock is dropped together with its record once nobody is pinned to it.
+    Evicted records are handed to ``on_evict`` while their session lock is
+    held, so write-through finishes before any other request can reload them;
+    a record whose write-through fails stays resident.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_bytes: int,
+        max_idle_seconds: float,
+        on_evict: Callable[[str, Any], None],
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._max_bytes = max(1, int(max_bytes))
+        self._max_idle_seconds = max(float(max_idle_seconds), 0.0)
+        self._on_evict = on_evict
+        self._clock = clock
+        self._lock = Lock()
+        self._slots: OrderedDict[str, _CacheSlot] = OrderedDict()
+        self._resident_entries = 0
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._capacity_evictions = 0
+        self._idle_evictions = 0
+
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[None]:
+        with self._lock:
+            slot = self._slots.get(session_id)
+            if slot is None:
+                slot = _CacheSlot(last_access=self._clock())
+                self._slots[session_id] = slot
+            slot.pins += 1
+        try:
+            with slot.lock:
+                yield
+        finally:
+            with self._lock:
+                self._unpin(session_id, slot)
+
+    @contextmanager
+    def try_lock(self, session_id: str) -> Iterator[bool]:
+        """Like ``lock`` but yields False instead of waiting for a busy session."""
+        with self._lock:
+            slot = self._slots.get(session_id)
+            if slot is None:
+                slot = _CacheSlot(last_access=self._clock())
+                self._slots[session_id] = slot
+            slot.pins += 1
+        acquired = slot.lock.acquire(blocking=False)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                slot.lock.release()
+            with self._lock:
+                self._unpin(session_id, slot)
+
+    def _unpin(self, session_id: str, slot: _CacheSlot) -> None:
+        slot.pins -= 1
+        if slot.pins <= 0 and slot.record is None and self._slots.get(session_id) is slot:
+            del self._slots[session_id]
+
+    def get(self, session_id: str) -> Any:
+        with self._lock:
+            slot = self._slots.get(session_id)
+            if slot is None or slot.record is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            slot.last_access = self._clock()
+            self._slots.move_to_end(session_id)
+            return slot.record
+
+    def peek(self, session_id: str) -> Any:
+        with self._lock:
+            slot = self._slots.get(session_id)
+            return slot.record if slot is not None else None
+
+    def put(self, session_id: str, record: Any, *, size_bytes: int) -> None:
+        with self._lock:
+            slot = self._slots.get(session_id)
+            if slot is None:
+                slot = _CacheSlot()
+                self._slots[session_id] = slot
+            if slot.record is None:
+                self._resident_entries += 1
+            self._resident_bytes += int(size_bytes) - slot.size_bytes
+            slot.record = record
+            slot.size_bytes = int(size_bytes)
+            slot.last_access = self._clock()
+            self._slots.move_to_end(session_id)
+            victims = self._claim_capacity_victims(keep=session_id)
+        self._flush_victims(victims)
+
+    def discard(self, session_id: str) -> None:
+        """Drop a record without write-through (the session row is gone)."""
+        with self._lock:
+            slot = self._slots.get(session_id)
+            if slot is None:
+                return
+            self._release_record(slot)
+            if slot.pins <= 0:
+                del self._slots[session_id]
+
+    def resident_items(self) -> list[tuple[str, Any]]:
+        with self._lock:
+            return [
+                (session_id, slot.record)
+                for session_id, slot in self._slots.items()
+                if slot.record is not None
+            ]
+
+    def sweep_idle(self) -> int:
+        with self._lock:
+            cutoff = self._clock() - self._max_idle_seconds
+            victims = self._claim_victims(
+                lambda slot: slot.last_access <= cutoff,
+                stop_when_within_bounds=False,
+            )
+            self._idle_evictions += len(victims)
+        self._flush_victims(victims)
+        return len(victims)
+
+    def stats(self) -> PlaySessionCacheStats:
+        with self._lock:
+            return PlaySessionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                capacity_evictions=self._capacity_evictions,
+                idle_evictions=self._idle_evictions,
+                resident_entries=self._resident_entries,
+                resident_bytes=self._resident_bytes,
+                max_entries=self._max_entries,
+                max_bytes=self._max_bytes,
+            )
+
+    def _within_bounds(self) -> bool:
+        return self._resident_entries <= self._max_entries and self._resident_bytes <= self._max_bytes
+
+    def _claim_capacity_victims(self, *, keep: str) -> list[tuple[str, _CacheSlot, Any, int]]:
+        if self._within_bounds():
+            return []
+        victims = self._claim_victims(
+            lambda slot: True,
+            stop_when_within_bounds=True,
+            keep=keep,
+        )
+        self._capacity_evictions += len(victims)
+        return victims
+
+    def _claim_victims(
+        self,
+        predicate: Callable[[_CacheSlot], bool],
+        *,
+        stop_when_within_bounds: bool,
+        keep: str | None = None,
+    ) -> list[tuple[str, _CacheSlot, Any, int]]:
+        # Caller holds self._lock. Victims are pinned and their session lock is
+        # taken so concurrent lookups wait for write-through instead of
+        # reloading a stale row.
+        victims: list[tuple[str, _CacheSlot, Any, int]] = []
+        for session_id, slot in self._slots.items():
+            if stop_when_within_bounds and self._within_bounds():
+                break
+            if session_id == keep or slot.record is None or slot.pins > 0 or not predicate(slot):
+                continue
+            if not slot.lock.acquire(blocking=False):
+                continue
+            slot.pins += 1
+            victims.append((session_id, slot, slot.record, slot.size_bytes))
+            self._release_record(slot)
+        return victims
+
+    def _release_record(self, slot: _CacheSlot) -> None:
+        if slot.record is not None:
+            self._resident_entries -= 1
+        self._resident_bytes -= slot.size_bytes
+        slot.record = None
+        slot.size_bytes = 0
+
+    def _flush_victims(self, victims: list[tuple[str, _CacheSlot, Any, int]]) -> None:
+        for session_id, slot, record, size_bytes in victims:
+            try:
+                self._on_evict(session_id, record)
+            except Exception:  # noqa: BLE001 — keep the record rather than lose unsaved state
+                with self._lock:
+                    if slot.record is None:
+                        slot.record = record
+                        slot.size_bytes = size_bytes
+                        self._resident_entries += 1
+                        self._resident_bytes += size_bytes
+            finally:
+                with self._lock:
+                    self._unpin(session_id, slot)
+                slot.lock.release()
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib
+import json
+from pathlib import Path
+import zlib
+from typing import Any, Literal, Protocol
+
+PlayStateCodecName = Literal["json", "json+zlib", "orjson", "msgpack", "msgpack+zstd"]
+
+# Tags are written to ``play_sessions.state_encoding`` next to every state, so
+# rows stay readable after the configured codec changes. Bump the ``.vN``
+# suffix whenever an encoding stops being byte-compatible with older rows.
+STATE_ENCODING_JSON = "json"
+STATE_ENCODING_JSON_ZLIB = "json+zlib"
+STATE_ENCODING_ORJSON = "orjson.v1"
+STATE_ENCODING_MSGPACK = "msgpack.v1"
+STATE_ENCODING_MSGPACK_ZSTD = "msgpack.v1+zstd"
+_ZSTD_DICT_TAG_PREFIX = f"{STATE_ENCODING_MSGPACK_ZSTD}.d"
+
+
+class PlayStateCodecError(RuntimeError):
+    pass
+
+
+class PlayStateCodec(Protocol):
+    @property
+    def encoding(self) -> str: ...
+
+    @property
+    def is_text(self) -> bool:
+        """True when ``encode`` output belongs in the ``state_json`` text column."""
+
+    def encode(self, payload: Any) -> bytes: ...
+
+    def decode(self, data: bytes) -> Any: ...
+
+
+def _json_default(item: Any) -> str:
+    if hasattr(item, "isoformat"):
+        return item.isoformat()
+    raise TypeError(f"Object of type {type(item).__name__} is not JSON serializable")
+
+
+@dataclass(frozen=True)
+class JsonStateCodec:
+    """The original text encoding; still the default for compatibility."""
+
+    encoding: str = STATE_ENCODING_JSON
+    is_text: bool = True
+
+    def encode(self, payload: Any) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+@dataclass(frozen=True)
+class JsonZlibStateCodec:
+    encoding: str = STATE_ENCODING_JSON_ZLIB
+    is_text: bool = False
+
+    def encode(self, payload: Any) -> bytes:
+        return zlib.compress(JsonStateCodec().encode(payload), 6)
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(zlib.decompress(data))
+
+
+@dataclass(frozen=True)
+class OrjsonStateCodec:
+    encoding: str = STATE_ENCODING_ORJSON
+    is_text: bool = False
+
+    def encode(self, payload: Any) -> bytes:
+        orjson = _import_codec_module("orjson")
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, data: bytes) -> Any:
+        return _import_codec_module("orjson").loads(data)
+
+
+@dataclass(frozen=True)
+class MsgpackStateCodec:
+    encoding: str = STATE_ENCODING_MSGPACK
+    is_text: bool = False
+
+    def encode(self, payload: Any) -> bytes:
+        return _import_codec_module("ormsgpack").packb(payload)
+
+    def decode(self, data: bytes) -> Any:
+        return _import_codec_module("ormsgpack").unpackb(data)
+
+
+class ZstdMsgpackStateCodec:
+    """MessagePack compressed with zstd, optionally with a trained dictionary.
+
+    World states share most of their keys and enum-like values, so a
+    dictionary trained on real states (see ``train_zstd_dictionary``) shrinks
+    small frames far more than plain zstd. The dictionary id is part of the
+    encoding tag; rows written with one dictionary need that same dictionary
+    to be read back.
+    """
+
+    is_text = False
+
+    def __init__(self, *, dictionary: bytes | None = None, level: int = 3) -> None:
+        zstandard = _import_codec_module("zstandard")
+        self._dictionary = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        self._level = level
+        if self._dictionary is not None:
+            self._dictionary.precompute_compress(level=level)
+        if self._dictionary is None:
+            self.encoding = STATE_ENCODING_MSGPACK_ZSTD
+        else:
+            self.encoding = f"{_ZSTD_DICT_TAG_PREFIX}{self._dictionary.dict_id()}"
+
+    def encode(self, payload: Any) -> bytes:
+        zstandard = _import_codec_module("zstandard")
+        compressor = zstandard.ZstdCompressor(level=self._level, dict_data=self._dictionary)
+        return compressor.compress(MsgpackStateCodec().encode(payload))
+
+    def decode(self, data: bytes) -> Any:
+        zstandard = _import_codec_module("zstandard")
+        decompressor = zstandard.ZstdDecompressor(dict_data=self._dictionary)
+        return MsgpackStateCodec().decode(decompressor.decompress(data))
+
+
+def _import_codec_module(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as exc:
+        raise PlayStateCodecError(
+            f"play state codec requires the '{name}' package; install it or set APP_PLAY_SESSION_STATE_CODEC=json"
+        ) from exc
+
+
+def build_state_codec(name: PlayStateCodecName | str, *, zstd_dict_path: str | None = None) -> PlayStateCodec:
+    if name == "json":
+        return JsonStateCodec()
+    if name == "json+zlib":
+        return JsonZlibStateCodec()
+    if name == "orjson":
+        return OrjsonStateCodec()
+    if name == "msgpack":
+        return MsgpackStateCodec()
+    if name == "msgpack+zstd":
+        dictionary = Path(zstd_dict_path).read_bytes() if zstd_dict_path else None
+        return ZstdMsgpackStateCodec(dictionary=dictionary)
+    raise PlayStateCodecError(f"unknown play state codec '{name}'")
+
+
+class PlayStateCodecRegistry:
+    """Resolves the decoder for any stored encoding tag.
+
+    The write codec only decides how new states are stored; every known tag
+    stays readable so switching codecs never strands existing sessions.
+    """
+
+    def __init__(self, write_codec: PlayStateCodec) -> None:
+        self.write_codec = write_codec
+        self._decoders: dict[str, PlayStateCodec] = {write_codec.encoding: write_codec}
+
+    def decoder_for(self, encoding: str) -> PlayStateCodec:
+        decoder = self._decoders.get(encoding)
+        if decoder is not None:
+            return decoder
+        if encoding == STATE_ENCODING_JSON:
+            decoder = JsonStateCodec()
+        elif encoding == STATE_ENCODING_JSON_ZLIB:
+            decoder = JsonZlibStateCodec()
+        elif encoding == STATE_ENCODING_ORJSON:
+            decoder = OrjsonStateCodec()
+        elif encoding == STATE_ENCODING_MSGPACK:
+            decoder = MsgpackStateCodec()
+        elif encoding == STATE_ENCODING_MSGPACK_ZSTD:
+            decoder = ZstdMsgpackStateCodec()
+        elif encoding.startswith(_ZSTD_DICT_TAG_PREFIX):
+            raise PlayStateCodecError(
+                f"play state was written with zstd dictionary '{encoding}'; configure the same dictionary to read it"
+            )
+        else:
+            raise PlayStateCodecError(f"unknown play state encoding '{encoding}'")
+        self._decoders[encoding] = decoder
+        return decoder
+
+
+def train_zstd_dictionary(states: list[Any], *, dict_size: int = 16 * 1024) -> bytes:
+    """Train a zstd dictionary from MessagePack-encoded world states."""
+    zstandard = _import_codec_module("zstandard")
+    samples = [MsgpackStateCodec().encode(state) for state in states]
+    return zstandard.train_dictionary(dict_size, samples).as_bytes()
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import json
 import sqlite3
 from datetime import datetime
 from typing import Any
 
 from rpg_backend.config import get_settings
+from rpg_backend.play.state_codec import (
+    STATE_ENCODING_JSON,
+    JsonStateCodec,
+    PlayStateCodec,
+    PlayStateCodecRegistry,
+)
 from rpg_backend.sqlite_utils import connect_sqlite
 
 
@@ -28,9 +35,64 @@ def _load_json(value: str | None) -> Any:
     return json.loads(value)
 
 
+def _utf8_len(value: str) -> int:
+    return len(value.encode("utf-8"))
+
+
+def page_by_turn_index(
+    items: list[Any],
+    *,
+    after_turn: int | None = None,
+    limit: int | None = None,
+) -> tuple[list[Any], bool]:
+    """Return items for the first ``limit`` turns after ``after_turn``.
+
+    ``limit`` counts turns rather than items so the player and GM entries of
+    one turn are never split across pages. The flag reports whether later
+    turns exist.
+    """
+    turn_indexes: list[int] = []
+    page: list[Any] = []
+    for item in items:
+        turn_index = SQLitePlaySessionStorage._turn_index_of(item)
+        if after_turn is not None and turn_index <= after_turn:
+            continue
+        if not turn_indexes or turn_indexes[-1] != turn_index:
+            if limit is not None and len(turn_indexes) >= limit:
+                return page, True
+            turn_indexes.append(turn_index)
+        page.append(item)
+    return page, False
+
+
+@dataclass(frozen=True)
+class PlaySessionWriteStats:
+    plan_bytes: int
+    state_bytes: int
+    appended_bytes: int
+
+    @property
+    def total_bytes(self) -> int:
+        return self.plan_bytes + self.state_bytes + self.appended_bytes
+
+
 class SQLitePlaySessionStorage:
-    def __init__(self, db_path: str) -> None:
+    """Play session rows with append-only history and trace tables.
+
+    The plan is written once when a session is created. After that,
+    ``save_session_delta`` only rewrites the compact current state and
+    appends the new history entries and turn traces, so per-turn write volume
+    stays flat instead of growing with turn count. ``save_session`` remains a
+    full-document rewrite for migrations and tooling.
+
+    ``get_session(..., include_turn_log=False)`` skips the history and trace
+    rows entirely; callers page them in through ``list_history`` and
+    ``list_turn_traces`` when they are actually requested.
+    """
+
+    def __init__(self, db_path: str, *, state_codec: PlayStateCodec | None = None) -> None:
         self._db_path = db_path
+        self._state_codecs = PlayStateCodecRegistry(state_codec or JsonStateCodec())
 
     @property
     def db_path(self) -> str:
@@ -59,12 +121,43 @@ class SQLitePlaySessionStorage:
             """
         )
         self._migrate_owner_column(connection)
+        self._migrate_state_blob_columns(connection)
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS play_session_history (
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                turn_index INTEGER NOT NULL,
+                entry_json TEXT NOT NULL,
+                PRIMARY KEY (session_id, seq),
+                FOREIGN KEY (session_id) REFERENCES play_sessions(session_id) ON DELETE CASCADE
+            )
+            """
+        )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS play_session_turn_traces (
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                turn_index INTEGER NOT NULL,
+                trace_json TEXT NOT NULL,
+                PRIMARY KEY (session_id, seq),
+                FOREIGN KEY (session_id) REFERENCES play_sessions(session_id) ON DELETE CASCADE
+            )
+            """
+        )
         connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_play_sessions_story_id ON play_sessions (story_id, created_at DESC)"
         )
         connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_play_sessions_owner_created_at ON play_sessions (owner_user_id, created_at DESC)"
         )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_play_session_history_turn ON play_session_history (session_id, turn_index)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_play_session_turn_traces_turn ON play_session_turn_traces (session_id, turn_index)"
+        )
         connection.commit()
 
     def _migrate_owner_column(self, connection: sqlite3.Connection) -> None:
@@ -83,8 +176,66 @@ class SQLitePlaySessionStorage:
             (default_actor_id,),
         )
 
-    def save_session(self, payload: dict[str, Any]) -> None:
+    @staticmethod
+    def _migrate_state_blob_columns(connection: sqlite3.Connection) -> None:
+        existing_columns = {str(row["name"]) for row in connection.execute("PRAGMA table_info(play_sessions)").fetchall()}
+        if "state_encoding" not in existing_columns:
+            connection.execute(
+                f"ALTER TABLE play_sessions ADD COLUMN state_encoding TEXT NOT NULL DEFAULT '{STATE_ENCODING_JSON}'"
+            )
+        if "state_blob" not in existing_columns:
+            connection.execute("ALTER TABLE play_sessions ADD COLUMN state_blob BLOB")
+
+    def _encode_state(self, state: Any) -> tuple[str, str, bytes | None]:
+        """Return ``(state_encoding, state_json, state_blob)`` for the current snapshot."""
+        codec = self._state_codecs.write_codec
+        if hasattr(state, "model_dump"):
+            state = state.model_dump(mode="json")
+        encoded = codec.encode(state)
+        if codec.is_text:
+            return codec.encoding, encoded.decode("utf-8"), None
+        return codec.encoding, "", encoded
+
+    def _decode_state(self, row: sqlite3.Row) -> Any:
+        codec = self._state_codecs.decoder_for(str(row["state_encoding"] or STATE_ENCODING_JSON))
+        if codec.is_text:
+            return codec.decode(str(row["state_json"]).encode("utf-8"))
+        return codec.decode(bytes(row["state_blob"]))
+
+    @staticmethod
+    def _turn_index_of(item: Any) -> int:
+        if isinstance(item, dict):
+            return int(item.get("turn_index") or 0)
+        return int(getattr(item, "turn_index", 0) or 0)
+
+    @classmethod
+    def _append_rows(
+        cls,
+        connection: sqlite3.Connection,
+        *,
+        table: str,
+        column: str,
+        session_id: str,
+        start_seq: int,
+        items: list[Any],
+    ) -> int:
+        rows = [
+            (session_id, start_seq + offset, cls._turn_index_of(item), _dump_json(item))
+            for offset, item in enumerate(items)
+        ]
+        if rows:
+            connection.executemany(
+                f"INSERT INTO {table} (session_id, seq, turn_index, {column}) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return sum(_utf8_len(row[3]) for row in rows)
+
+    def save_session(self, payload: dict[str, Any]) -> PlaySessionWriteStats:
+        """Write the whole session document, replacing any existing rows."""
         resolved_owner_user_id = str(payload.get("owner_user_id") or get_settings().default_actor_id)
+        session_id = str(payload["session_id"])
+        plan_json = _dump_json(payload["plan"])
+        state_encoding, state_json, state_blob = self._encode_state(payload["state"])
         with self._connect() as connection:
             connection.execute(
                 """
@@ -98,8 +249,10 @@ class SQLitePlaySessionStorage:
                     plan_json,
                     state_json,
                     history_json,
-                    turn_traces_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    turn_traces_json,
+                    state_encoding,
+                    state_blob
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, '[]', '[]', ?, ?)
                 ON CONFLICT(session_id) DO UPDATE SET
                     owner_user_id = excluded.owner_user_id,
                     story_id = excluded.story_id,
@@ -109,43 +262,279 @@ class SQLitePlaySessionStorage:
                     plan_json = excluded.plan_json,
                     state_json = excluded.state_json,
                     history_json = excluded.history_json,
-                    turn_traces_json = excluded.turn_traces_json
+                    turn_traces_json = excluded.turn_traces_json,
+                    state_encoding = excluded.state_encoding,
+                    state_blob = excluded.state_blob
                 """,
                 (
-                    payload["session_id"],
+                    session_id,
                     resolved_owner_user_id,
                     payload["story_id"],
                     payload["created_at"],
                     payload["expires_at"],
                     payload["finished_at"],
-                    _dump_json(payload["plan"]),
-                    _dump_json(payload["state"]),
-                    _dump_json(payload.get("history") or []),
-                    _dump_json(payload.get("turn_traces") or []),
+                    plan_json,
+                    state_json,
+                    state_encoding,
+                    state_blob,
                 ),
             )
+            connection.execute("DELETE FROM play_session_history WHERE session_id = ?", (session_id,))
+            connection.execute("DELETE FROM play_session_turn_traces WHERE session_id = ?", (session_id,))
+            appended_bytes = self._append_rows(
+                connection,
+                table="play_session_history",
+                column="entry_json",
+                session_id=session_id,
+                start_seq=0,
+                items=list(payload.get("history") or []),
+            )
+            appended_bytes += self._append_rows(
+                connection,
+                table="play_session_turn_traces",
+                column="trace_json",
+                session_id=session_id,
+                start_seq=0,
+                items=list(payload.get("turn_traces") or []),
+            )
             connection.commit()
+        return PlaySessionWriteStats(
+            plan_bytes=_utf8_len(plan_json),
+            state_bytes=_utf8_len(state_json) + len(state_blob or b""),
+            appended_bytes=appended_bytes,
+        )
+
+    def save_session_delta(
+        self,
+        *,
+        session_id: str,
+        expires_at: str,
+        finished_at: str | None,
+        state: Any,
+        history_start: int,
+        new_history: list[Any],
+        traces_start: int,
+        new_turn_traces: list[Any],
+    ) -> PlaySessionWriteStats | None:
+        """Overwrite the current state and append history/trace rows.
+
+        ``history_start`` and ``traces_start`` are the sequence numbers of the
+        first new rows, i.e. how many rows the caller has already persisted.
+        Returns ``None`` without writing anything when the session row no
+        longer exists, e.g. after its story was deleted.
+        """
+        state_encoding, state_json, state_blob = self._encode_state(state)
+        with self._connect() as connection:
+            cursor = connection.execute(
+                """
+                UPDATE play_sessions
+                SET expires_at = ?,
+                    finished_at = ?,
+                    state_json = ?,
+                    state_encoding = ?,
+                    state_blob = ?
+                WHERE session_id = ?
+                """,
+                (expires_at, finished_at, state_json, state_encoding, state_blob, session_id),
+            )
+            if cursor.rowcount == 0:
+                connection.rollback()
+                return None
+            appended_bytes = self._append_rows(
+                connection,
+                table="play_session_history",
+                column="entry_json",
+                session_id=session_id,
+                start_seq=history_start,
+                items=new_history,
+            )
+            appended_bytes += self._append_rows(
+                connection,
+                table="play_session_turn_traces",
+                column="trace_json",
+                session_id=session_id,
+                start_seq=traces_start,
+                items=new_turn_traces,
+            )
+            connection.commit()
+        return PlaySessionWriteStats(
+            plan_bytes=0,
+            state_bytes=_utf8_len(state_json) + len(state_blob or b""),
+            appended_bytes=appended_bytes,
+        )
 
-    def get_session(self, session_id: str) -> dict[str, Any] | None:
+    def get_session(self, session_id: str, *, include_turn_log: bool = True) -> dict[str, Any] | None:
         with self._connect() as connection:
             row = connection.execute(
                 "SELECT * FROM play_sessions WHERE session_id = ?",
                 (session_id,),
             ).fetchone()
-        if row is None:
-            return None
-        return {
-            "session_id": str(row["session_id"]),
-            "owner_user_id": str(row["owner_user_id"]),
-            "story_id": str(row["story_id"]),
-            "created_at": str(row["created_at"]),
-            "expires_at": str(row["expires_at"]),
-            "finished_at": str(row["finished_at"]) if row["finished_at"] is not None else None,
-            "plan": _load_json(str(row["plan_json"])),
-            "state": _load_json(str(row["state_json"])),
-            "history": _load_json(str(row["history_json"])) or [],
-            "turn_traces": _load_json(str(row["turn_traces_json"])) or [],
-        }
+            if row is None:
+                return None
+            payload = {
+                "session_id": str(row["session_id"]),
+                "owner_user_id": str(row["owner_user_id"]),
+                "story_id": str(row["story_id"]),
+                "created_at": str(row["created_at"]),
+                "expires_at": str(row["expires_at"]),
+                "finished_at": str(row["finished_at"]) if row["finished_at"] is not None else None,
+                "plan": _load_json(str(row["plan_json"])),
+                "state": self._decode_state(row),
+                "stored_bytes": {
+                    "plan": _utf8_len(str(row["plan_json"])),
+                    "state": _utf8_len(str(row["state_json"])) + len(row["state_blob"] or b""),
+                    "rows": 0,
+                },
+            }
+            if not include_turn_log:
+                payload["history_count"] = self._count_rows(
+                    connection,
+                    table="play_session_history",
+                    inline_column="history_json",
+                    session_id=session_id,
+                )
+                payload["turn_trace_count"] = self._count_rows(
+                    connection,
+                    table="play_session_turn_traces",
+                    inline_column="turn_traces_json",
+                    session_id=session_id,
+                )
+                return payload
+            history_rows = connection.execute(
+                "SELECT entry_json FROM play_session_history WHERE session_id = ? ORDER BY seq",
+                (session_id,),
+            ).fetchall()
+            trace_rows = connection.execute(
+                "SELECT trace_json FROM play_session_turn_traces WHERE session_id = ? ORDER BY seq",
+                (session_id,),
+            ).fetchall()
+        # Rows written before the append-only tables existed keep their
+        # history inline; appended rows continue after them.
+        history = list(_load_json(str(row["history_json"])) or [])
+        history.extend(_load_json(str(item["entry_json"])) for item in history_rows)
+        turn_traces = list(_load_json(str(row["turn_traces_json"])) or [])
+        turn_traces.extend(_load_json(str(item["trace_json"])) for item in trace_rows)
+        row_bytes = _utf8_len(str(row["history_json"])) + _utf8_len(str(row["turn_traces_json"]))
+        row_bytes += sum(_utf8_len(str(item["entry_json"])) for item in history_rows)
+        row_bytes += sum(_utf8_len(str(item["trace_json"])) for item in trace_rows)
+        payload["history"] = history
+        payload["turn_traces"] = turn_traces
+        payload["stored_bytes"]["rows"] = row_bytes
+        return payload
+
+    @staticmethod
+    def _count_rows(
+        connection: sqlite3.Connection,
+        *,
+        table: str,
+        inline_column: str,
+        session_id: str,
+    ) -> int:
+        # Appended rows continue the inline sequence, so the highest seq
+        # already accounts for any legacy inline entries.
+        row = connection.execute(
+            f"""
+            SELECT
+                (SELECT MAX(seq) FROM {table} WHERE session_id = ?) AS max_seq,
+                (SELECT json_array_length({inline_column}) FROM play_sessions WHERE session_id = ?) AS inline_count
+            """,
+            (session_id, session_id),
+        ).fetchone()
+        if row["max_seq"] is not None:
+            return int(row["max_seq"]) + 1
+        return int(row["inline_count"] or 0)
+
+    def _page_rows(
+        self,
+        *,
+        table: str,
+        column: str,
+        inline_column: str,
+        session_id: str,
+        after_turn: int | None,
+        limit: int | None,
+    ) -> tuple[list[Any], bool]:
+        floor = -1 if after_turn is None else int(after_turn)
+        with self._connect() as connection:
+            inline = connection.execute(
+                f"SELECT {inline_column} AS inline_json FROM play_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if inline is None:
+                return [], False
+            inline_items = list(_load_json(str(inline["inline_json"])) or [])
+            if inline_items:
+                # Legacy rows: merge inline entries with appended rows in Python.
+                rows = connection.execute(
+                    f"SELECT {column} AS item_json FROM {table} WHERE session_id = ? ORDER BY seq",
+                    (session_id,),
+                ).fetchall()
+                items = inline_items + [_load_json(str(item["item_json"])) for item in rows]
+                return page_by_turn_index(items, after_turn=after_turn, limit=limit)
+            if limit is None:
+                rows = connection.execute(
+                    f"""
+                    SELECT {column} AS item_json FROM {table}
+                    WHERE session_id = ? AND turn_index > ?
+                    ORDER BY seq
+                    """,
+                    (session_id, floor),
+                ).fetchall()
+                return [_load_json(str(item["item_json"])) for item in rows], False
+            turn_rows = connection.execute(
+                f"""
+                SELECT DISTINCT turn_index FROM {table}
+                WHERE session_id = ? AND turn_index > ?
+                ORDER BY turn_index
+                LIMIT ?
+                """,
+                (session_id, floor, int(limit) + 1),
+            ).fetchall()
+            has_more = len(turn_rows) > limit
+            if not turn_rows or limit <= 0:
+                return [], has_more
+            ceiling = int(turn_rows[min(limit, len(turn_rows)) - 1]["turn_index"])
+            rows = connection.execute(
+                f"""
+                SELECT {column} AS item_json FROM {table}
+                WHERE session_id = ? AND turn_index > ? AND turn_index <= ?
+                ORDER BY seq
+                """,
+                (session_id, floor, ceiling),
+            ).fetchall()
+        return [_load_json(str(item["item_json"])) for item in rows], has_more
+
+    def list_history(
+        self,
+        session_id: str,
+        *,
+        after_turn: int | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[Any], bool]:
+        return self._page_rows(
+            table="play_session_history",
+            column="entry_json",
+            inline_column="history_json",
+            session_id=session_id,
+            after_turn=after_turn,
+            limit=limit,
+        )
+
+    def list_turn_traces(
+        self,
+        session_id: str,
+        *,
+        after_turn: int | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[Any], bool]:
+        return self._page_rows(
+            table="play_session_turn_traces",
+            column="trace_json",
+            inline_column="turn_traces_json",
+            session_id=session_id,
+            after_turn=after_turn,
+            limit=limit,
+        )
 
     def delete_sessions_for_story(self, *, story_id: str, owner_user_id: str | None = None) -> int:
         with self._connect() as connection:
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from rpg_backend.author.normalize import trim_text, unique_preserve
 from rpg_backend.author_v2.contracts import CompiledPlayPlan, CompiledSegment
+from rpg_backend.play_v2.turn_changes import record_global_change
 from rpg_backend.play_v2.contracts import (
     CausalContractStateRecord,
     CallbackTurnStatusRecord,
@@ -48,6 +49,7 @@ def _apply_global_delta(state: UrbanWorldState, key: str, delta: int) -> bool:
     if updated == current:
         return False
     setattr(state, key, updated)
+    record_global_change(key, current, updated)
     return True
 
 
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from threading import Lock
+import time
+from typing import Callable, Generic, Literal, TypeVar
+
+ComposeHedgeMode = Literal["off", "parallel", "delayed"]
+
+_HEDGE_EXECUTOR_MAX_WORKERS = 8
+_LATENCY_WINDOW_SIZE = 64
+_LATENCY_WINDOW_MIN_SAMPLES = 8
+
+CandidateT = TypeVar("CandidateT")
+
+_hedge_lock = Lock()
+_hedge_executor: ThreadPoolExecutor | None = None
+_latency_window: deque[float] = deque(maxlen=_LATENCY_WINDOW_SIZE)
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=_HEDGE_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="compose-hedge",
+            )
+        return _hedge_executor
+
+
+def record_compose_latency(latency_ms: float) -> None:
+    with _hedge_lock:
+        _latency_window.append(max(float(latency_ms), 0.0))
+
+
+def reset_compose_latency_window() -> None:
+    with _hedge_lock:
+        _latency_window.clear()
+
+
+def hedge_delay_ms(*, percentile: float, fallback_ms: float) -> float:
+    """Delay before a backup candidate, from recent single-candidate latencies.
+
+    Until enough samples exist the configured fallback is used, so a cold
+    process does not hedge every turn on an empty window.
+    """
+    with _hedge_lock:
+        samples = sorted(_latency_window)
+    if len(samples) < _LATENCY_WINDOW_MIN_SAMPLES:
+        return max(float(fallback_ms), 0.0)
+    rank = min(max(float(percentile), 0.0), 100.0) / 100.0 * (len(samples) - 1)
+    lower = int(rank)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (rank - lower)
+
+
+@dataclass
+class HedgeOutcome(Generic[CandidateT]):
+    winner: CandidateT | None = None
+    winner_index: int = -1
+    rejected: list[CandidateT] = field(default_factory=list)
+    launched: int = 0
+    cancelled: int = 0
+    abandoned: int = 0
+    delay_ms: float = 0.0
+
+
+def run_hedged(
+    run_candidate: Callable[[int], CandidateT],
+    *,
+    is_valid: Callable[[CandidateT], bool],
+    mode: ComposeHedgeMode,
+    candidates: int,
+    delay_ms: float = 0.0,
+) -> HedgeOutcome[CandidateT]:
+    """Run up to ``candidates`` generations and keep the first valid arrival.
+
+    ``parallel`` submits every candidate at once. ``delayed`` submits one and
+    only adds a backup when the current ones have all failed or ``delay_ms``
+    passes without a valid result. Candidates still queued when a winner
+    lands are cancelled; ones already in flight cannot be interrupted and are
+    reported as abandoned so callers can account for their token budget.
+    """
+    total = max(int(candidates), 1)
+    executor = _executor()
+    pending: dict[Future[CandidateT], int] = {}
+    outcome: HedgeOutcome[CandidateT] = HedgeOutcome(delay_ms=float(delay_ms) if mode == "delayed" else 0.0)
+    last_launch = time.perf_counter()
+
+    def _launch() -> None:
+        nonlocal last_launch
+        index = outcome.launched
+        # Candidates inherit the caller's context so LLM request priority tags follow them.
+        pending[executor.submit(copy_context().run, run_candidate, index)] = index
+        outcome.launched += 1
+        last_launch = time.perf_counter()
+
+    _launch()
+    while mode == "parallel" and outcome.launched < total:
+        _launch()
+    while pending:
+        timeout: float | None = None
+        if outcome.launched < total:
+            timeout = max(outcome.delay_ms / 1000.0 - (time.perf_counter() - last_launch), 0.0)
+        done, _ = wait(set(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in sorted(done, key=lambda item: pending[item]):
+            index = pending.pop(future)
+            candidate = future.result()
+            if outcome.winner is None and is_valid(candidate):
+                outcome.winner = candidate
+                outcome.winner_index = index
+            else:
+                outcome.rejected.append(candidate)
+        if outcome.winner is not None:
+            break
+        if outcome.launched < total and (not done or not pending):
+            _launch()
+    for future in pending:
+        if future.cancel():
+            outcome.cancelled += 1
+        else:
+            outcome.abandoned += 1
+    return outcome
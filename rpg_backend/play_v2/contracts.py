@@ -94,6 +94,19 @@ CausalContractStatus = Literal["pending", "resolved"]
 CostQuestionFocus = Literal["who_pays", "who_takes_blame", "who_gets_chased"]
 UnresolvedCostStatus = Literal["pending", "returned", "resolved", "expired"]
 TurnPrimaryDriver = Literal["latent", "cost_return", "none"]
+SnapshotSection = Literal[
+    "status",
+    "beat",
+    "narration",
+    "feedback",
+    "progress",
+    "state_bars",
+    "relationship_state",
+    "route_target",
+    "actions",
+    "latent_radar",
+    "ending",
+]
 
 
 class NpcUtilityDeltaItem(BaseModel):
@@ -578,6 +591,46 @@ class UrbanTurnIntent(BaseModel):
     semantic_effects: list[SemanticEffect] = Field(default_factory=list, max_length=6)
 
 
+class HookTransitionRecord(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    hook_id: str = Field(min_length=1)
+    before_status: str | None = None
+    after_status: str | None = None
+
+
+class CostUpdateRecord(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    cost_id: str = Field(min_length=1, max_length=120)
+    before_status: UnresolvedCostStatus | None = None
+    after_status: UnresolvedCostStatus | None = None
+
+
+class UrbanTurnChangeSet(BaseModel):
+    """What one committed turn changed, in the shape snapshot sections need."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    turn_index_before: int = Field(ge=0)
+    turn_index_after: int = Field(ge=0)
+    segment_index_before: int = Field(ge=0)
+    segment_index_after: int = Field(ge=0)
+    status_before: Literal["active", "completed", "expired"] = "active"
+    status_after: Literal["active", "completed", "expired"] = "active"
+    global_deltas: dict[str, int] = Field(default_factory=dict)
+    relationship_deltas: dict[str, dict[str, int]] = Field(default_factory=dict)
+    npc_mind_changed_ids: list[str] = Field(default_factory=list)
+    hook_transitions: list[HookTransitionRecord] = Field(default_factory=list)
+    latent_ops: list[str] = Field(default_factory=list, max_length=6)
+    cost_updates: list[CostUpdateRecord] = Field(default_factory=list)
+    revealed_secret_ids: list[str] = Field(default_factory=list, max_length=4)
+    route_target_before: str | None = None
+    route_target_after: str | None = None
+    ending_id_after: str | None = None
+    changed_sections: list[SnapshotSection] = Field(default_factory=list)
+
+
 class UrbanTurnResult(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -596,3 +649,4 @@ class UrbanTurnResult(BaseModel):
     progress_summary: str = Field(min_length=1, max_length=220)
     intent: UrbanTurnIntent
     intent_stage_diagnostics: dict[str, int | float | str | bool | list[str]] = Field(default_factory=dict)
+    change_set: UrbanTurnChangeSet | None = None
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from rpg_backend.author.normalize import trim_text
 from rpg_backend.author_v2.contracts import CompiledPlayPlan
 from rpg_backend.play_v2.contracts import CallbackQueueItem, HookState, UrbanWorldState
+from rpg_backend.play_v2.turn_changes import record_hook_transition
 
 
 @dataclass(slots=True)
@@ -274,6 +275,7 @@ def update_hook_states(state: UrbanWorldState, turn_events: HookTurnEvents, turn
                 "leverage_value": next_leverage_value,
             }
         )
+        record_hook_transition(hook_id, current_status, next_status)
         changed_hook_ids.append(hook_id)
     state.hook_states = hook_states
     resolved_turn_index = turn_index
@@ -3,6 +3,12 @@ from __future__ import annotations
 from rpg_backend.author.normalize import trim_text, unique_preserve
 from rpg_backend.author_v2.contracts import CompiledPlayPlan, CompiledSegment
 from rpg_backend.play_v2.contracts import UnresolvedCostRecord, UrbanWorldState
+from rpg_backend.play_v2.turn_changes import (
+    record_cost_status,
+    record_global_change,
+    record_relationship_change,
+    relationship_values,
+)
 
 
 def _clamp(value: int, lower: int, upper: int) -> int:
@@ -101,6 +107,7 @@ class InvariantValidator:
                     setattr(state, key, _clamp(current + delta, 0, 6))
                 else:
                     setattr(state, key, current + delta)
+                record_global_change(key, current, int(getattr(state, key)))
                 state.last_turn_global_deltas[key] = delta
                 if state.last_turn_semantic_plan is not None:
                     payoff = state.last_turn_semantic_plan.payoff_plan
@@ -142,7 +149,9 @@ class InvariantValidator:
                 if fallback_owner is not None:
                     rel = state.relationships.get(fallback_owner)
                     if rel is not None:
+                        relationship_before = relationship_values(rel)
                         rel.tension = _clamp(rel.tension + 1, 0, 6)
+                        record_relationship_change(fallback_owner, relationship_before, rel)
                     if route is not None:
                         route.target_character_ids = [fallback_owner]
                         route.owner_character_ids = [fallback_owner]
@@ -178,17 +187,22 @@ class InvariantValidator:
                 None,
             )
             if overdue_item is not None:
+                record_cost_status(overdue_item.cost_id, overdue_item.status, "returned")
                 overdue_item.status = "returned"
                 overdue_item.resolved_turn_index = state.turn_index
                 payer_id = overdue_item.payer_character_id
                 if payer_id and payer_id in state.relationships:
                     rel = state.relationships[payer_id]
+                    relationship_before = relationship_values(rel)
                     rel.tension = _clamp(rel.tension + 1, 0, 6)
+                    record_relationship_change(payer_id, relationship_before, rel)
                     rel_delta = dict(state.last_turn_relationship_deltas.get(payer_id) or {})
                     rel_delta["tension"] = int(rel_delta.get("tension", 0)) + 1
                     state.last_turn_relationship_deltas[payer_id] = rel_delta
                 else:
-                    state.scene_heat = _clamp(state.scene_heat + 1, 0, 6)
+                    scene_heat = state.scene_heat
+                    state.scene_heat = _clamp(scene_heat + 1, 0, 6)
+                    record_global_change("scene_heat", scene_heat, state.scene_heat)
                     state.last_turn_global_deltas["scene_heat"] = int(state.last_turn_global_deltas.get("scene_heat", 0)) + 1
                 if state.last_turn_semantic_plan is not None:
                     payoff = state.last_turn_semantic_plan.payoff_plan
@@ -265,14 +279,18 @@ class InvariantValidator:
                 patched = False
                 if payer_id and payer_score < min_payer_loss and payer_id in state.relationships:
                     rel = state.relationships[payer_id]
+                    relationship_before = relationship_values(rel)
                     rel.tension = _clamp(rel.tension + (min_payer_loss - payer_score), 0, 6)
+                    record_relationship_change(payer_id, relationship_before, rel)
                     payer_delta = dict(rel_deltas.get(payer_id) or {})
                     payer_delta["tension"] = int(payer_delta.get("tension", 0)) + (min_payer_loss - payer_score)
                     rel_deltas[payer_id] = payer_delta
                     patched = True
                 if beneficiary_id and beneficiary_score < min_beneficiary_gain and beneficiary_id in state.relationships:
                     rel = state.relationships[beneficiary_id]
+                    relationship_before = relationship_values(rel)
                     rel.trust = _clamp(rel.trust + (min_beneficiary_gain - beneficiary_score), -3, 6)
+                    record_relationship_change(beneficiary_id, relationship_before, rel)
                     beneficiary_delta = dict(rel_deltas.get(beneficiary_id) or {})
                     beneficiary_delta["trust"] = int(beneficiary_delta.get("trust", 0)) + (min_beneficiary_gain - beneficiary_score)
                     rel_deltas[beneficiary_id] = beneficiary_delta
@@ -381,6 +399,8 @@ class InvariantValidator:
                                 route.beneficiary_character_id if route is not None else None
                             )
                             due_turn = state.turn_index + 2
+                            if len(state.unresolved_costs) < 12:
+                                record_cost_status(f"uc_inv_press_{state.turn_index}", None, "pending")
                             state.unresolved_costs = [
                                 *state.unresolved_costs,
                                 UnresolvedCostRecord(
@@ -421,12 +441,15 @@ class InvariantValidator:
                             fail_safe_applied = True
                     elif action == "detonate":
                         if not state.last_turn_global_deltas and not state.last_turn_relationship_deltas:
-                            state.scene_heat = _clamp(state.scene_heat + 1, 0, 6)
+                            scene_heat = state.scene_heat
+                            state.scene_heat = _clamp(scene_heat + 1, 0, 6)
+                            record_global_change("scene_heat", scene_heat, state.scene_heat)
                             state.last_turn_global_deltas["scene_heat"] = int(state.last_turn_global_deltas.get("scene_heat", 0)) + 1
                             payoff.global_delta_keys = unique_preserve(["scene_heat", *payoff.global_delta_keys])[:8]
                             fail_safe_applied = True
                         pending_item = next((item for item in state.unresolved_costs if item.status == "pending"), None)
                         if pending_item is not None:
+                            record_cost_status(pending_item.cost_id, pending_item.status, "returned")
                             pending_item.status = "returned"
                             pending_item.resolved_turn_index = state.turn_index
                             fail_safe_applied = True
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from rpg_backend.author.normalize import trim_text, unique_preserve
 from rpg_backend.author_v2.contracts import CompiledPlayPlan, CompiledSegment
 from rpg_backend.play_v2.shell_propagation import pick_shell_edge
+from rpg_backend.play_v2.turn_changes import record_global_change
 from rpg_backend.play_v2.contracts import (
     CallbackQueueItem,
     CallbackTurnStatusRecord,
@@ -970,10 +971,15 @@ class LatentEventEngine:
             total = sum(event.pressure + event.maturity for event in state.latent_events if event.kind == kind and event.status != "cooled")
             return _clamp((total + 1) // 2, 0, 6)
 
-        state.relationship_debt_pressure = _score("relationship_debt")
-        state.public_wave_pressure = _score("public_wave")
-        state.secret_pressure = _score("secret_pressure")
-        state.npc_action_pressure = _score("npc_action")
+        for field_name, kind in (
+            ("relationship_debt_pressure", "relationship_debt"),
+            ("public_wave_pressure", "public_wave"),
+            ("secret_pressure", "secret_pressure"),
+            ("npc_action_pressure", "npc_action"),
+        ):
+            before = int(getattr(state, field_name))
+            setattr(state, field_name, _score(kind))
+            record_global_change(field_name, before, int(getattr(state, field_name)))
 
     @staticmethod
     def _build_latent_radar(
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+_SPECULATION_EXECUTOR_MAX_WORKERS = 4
+_OUTCOME_WINDOW_SIZE = 128
+
+ResultT = TypeVar("ResultT")
+
+_speculation_lock = Lock()
+_speculation_executor: ThreadPoolExecutor | None = None
+_outcome_window: deque[bool] = deque(maxlen=_OUTCOME_WINDOW_SIZE)
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _speculation_executor
+    with _speculation_lock:
+        if _speculation_executor is None:
+            _speculation_executor = ThreadPoolExecutor(
+                max_workers=_SPECULATION_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="micro-sim-speculation",
+            )
+        return _speculation_executor
+
+
+def submit_speculation(run: Callable[..., ResultT], /, *args: Any, **kwargs: Any) -> Future[ResultT]:
+    return _executor().submit(copy_context().run, run, *args, **kwargs)
+
+
+def record_speculation_outcome(hit: bool) -> None:
+    with _speculation_lock:
+        _outcome_window.append(bool(hit))
+
+
+def reset_speculation_outcomes() -> None:
+    with _speculation_lock:
+        _outcome_window.clear()
+
+
+def speculation_hit_rate() -> float:
+    """Share of recent speculative micro-sims whose result was kept."""
+    with _speculation_lock:
+        outcomes = list(_outcome_window)
+    if not outcomes:
+        return 0.0
+    return sum(1 for hit in outcomes if hit) / len(outcomes)
@@ -578,9 +578,76 @@ def _target_band(layer: ToneLayer, mode: DramaticMode, *, explosive_boost: bool
     return mode
 
 
+_DRAMATIC_MODES: tuple[DramaticMode, ...] = ("steady", "rising", "explosive", "aftermath")
+_TONE_LAYERS: tuple[ToneLayer, ...] = ("primary", "supporting", "fallout")
+
+
+@dataclass(frozen=True)
+class ToneExamplePools:
+    """Segment-static inputs of ``build_tone_example_style_hints``.
+
+    Pools, band candidates, slot seeds and per-text token lookups depend only
+    on the compiled segment, so they are built once and reused across turns;
+    bucket rotation and clause picks stay per turn.
+    """
+
+    candidates: dict[tuple[str, ToneLayer, DramaticMode], tuple[ToneExampleLine | ToneSceneExample, ...]]
+    slot_seeds: dict[tuple[str, ToneLayer], int]
+    anchor_tokens_by_text: dict[str, tuple[str, ...]]
+    style_keywords_by_text: dict[str, tuple[str, ...]]
+    reason_pool: tuple[str, ...]
+    signal_pool: tuple[str, ...]
+    cost_pool: tuple[str, ...]
+    cadence_pool: tuple[str, ...]
+    inferred_shell_id: str
+
+
+def build_tone_example_pools(segment: CompiledSegment) -> ToneExamplePools:
+    candidates: dict[tuple[str, ToneLayer, DramaticMode], tuple[ToneExampleLine | ToneSceneExample, ...]] = {}
+    slot_seeds: dict[tuple[str, ToneLayer], int] = {}
+    texts: list[str] = []
+    for kind in ("line", "scene"):
+        for layer in _TONE_LAYERS:
+            items: list[ToneExampleLine] | list[ToneSceneExample]
+            if kind == "line":
+                items = _line_pool_for_layer(segment, layer=layer)
+            else:
+                items = _scene_pool_for_layer(segment, layer=layer)
+            slot_seeds[(kind, layer)] = sum(ord(char) for char in f"{kind}:{layer}:{segment.segment_id}")
+            texts.extend(item.text for item in items)
+            for mode in _DRAMATIC_MODES:
+                band_items = [item for item in items if getattr(item, "dramatic_band", "steady") == mode]
+                candidates[(kind, layer, mode)] = tuple(band_items or items)
+    profile = segment.segment_style_profile
+    role_reason_fallback = {
+        "opening": ["opportunity_window", "self_preserve", "loss_position"],
+        "misread": ["opportunity_window", "self_preserve", "loss_position"],
+        "pressure": ["self_preserve", "loss_position", "old_debt"],
+        "reversal": ["loss_position", "old_debt", "opportunity_window"],
+        "reveal": ["loss_position", "old_debt", "self_preserve", "opportunity_window"],
+        "terminal": ["old_debt", "loss_position", "self_preserve", "opportunity_window"],
+    }
+    unique_texts = unique_preserve([text for text in texts if text])
+    return ToneExamplePools(
+        candidates=candidates,
+        slot_seeds=slot_seeds,
+        anchor_tokens_by_text={text: _extract_anchor_tokens([text]) for text in unique_texts},
+        style_keywords_by_text={text: _style_case_keywords_from_text(text) for text in unique_texts},
+        reason_pool=tuple(
+            unique_preserve(
+                [*list(profile.reason_families or []), *(role_reason_fallback.get(segment.segment_role, [])), "mixed"]
+            )[:4]
+        ),
+        signal_pool=tuple(unique_preserve([*list(profile.signal_families or []), "mixed"])[:4]),
+        cost_pool=tuple(unique_preserve([*list(profile.cost_families or []), "mixed"])[:4]),
+        cadence_pool=tuple(unique_preserve([*list(profile.cadence_order or []), "mixed"])[:4]),
+        inferred_shell_id=_infer_shell_id_from_anchor_tokens(list(profile.shell_anchor_tokens)),
+    )
+
+
 def _select_bucket(
     *,
-    segment: CompiledSegment,
+    pools: ToneExamplePools,
     state: UrbanWorldState,
     kind: Literal["line", "scene"],
     layer: ToneLayer,
@@ -589,17 +656,11 @@ def _select_bucket(
     recent: set[str],
     used_now: set[str],
 ) -> tuple[str | None, str]:
-    if kind == "line":
-        items = _line_pool_for_layer(segment, layer=layer)
-    else:
-        items = _scene_pool_for_layer(segment, layer=layer)
-    if not items:
-        return None, ""
     target_mode = _target_band(layer, desired_mode, explosive_boost=explosive_boost)
-    band_items = [item for item in items if getattr(item, "dramatic_band", "steady") == target_mode]
-    candidates = band_items or items
-    slot_seed = sum(ord(char) for char in f"{kind}:{layer}:{segment.segment_id}")
-    start = (state.turn_index + slot_seed) % len(candidates)
+    candidates = pools.candidates.get((kind, layer, target_mode), ())
+    if not candidates:
+        return None, ""
+    start = (state.turn_index + pools.slot_seeds[(kind, layer)]) % len(candidates)
     for offset in range(len(candidates)):
         item = candidates[(start + offset) % len(candidates)]
         if item.bucket_id in recent or item.bucket_id in used_now:
@@ -615,6 +676,14 @@ def _extract_anchor_tokens(texts: list[str]) -> tuple[str, ...]:
     return tuple(token for token in _CONTROLLED_ANCHOR_TOKENS if any(token in text for text in texts))
 
 
+def _pooled_anchor_tokens(pools: ToneExamplePools, texts: list[str]) -> tuple[str, ...]:
+    hits: set[str] = set()
+    for text in texts:
+        cached = pools.anchor_tokens_by_text.get(text)
+        hits.update(cached if cached is not None else _extract_anchor_tokens([text]))
+    return tuple(token for token in _CONTROLLED_ANCHOR_TOKENS if token in hits)
+
+
 def _style_case_keywords_from_text(text: str) -> tuple[str, ...]:
     keywords: list[str] = []
     if not text:
@@ -636,6 +705,7 @@ def _build_style_case_registry(
     signal_family: str,
     cost_family: str,
     shell_id: str,
+    keywords_by_text: dict[str, tuple[str, ...]] | None = None,
 ) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[tuple[str, str], ...]]:
     case_ids: list[str] = []
     case_keywords: list[str] = []
@@ -646,7 +716,10 @@ def _build_style_case_registry(
         case_ids.append(layer_case_id)
         if text:
             case_text_items.append((layer_case_id, text))
-        for keyword in _style_case_keywords_from_text(text):
+        keywords = (keywords_by_text or {}).get(text)
+        if keywords is None:
+            keywords = _style_case_keywords_from_text(text)
+        for keyword in keywords:
             if keyword not in case_keywords:
                 case_keywords.append(keyword)
         slot_constraints.extend(
@@ -705,13 +778,20 @@ def _pick_clause_family(
     return value
 
 
-def build_tone_example_style_hints(segment: CompiledSegment, state: UrbanWorldState) -> ToneExampleStyleHints:
+def build_tone_example_style_hints(
+    segment: CompiledSegment,
+    state: UrbanWorldState,
+    *,
+    pools: ToneExamplePools | None = None,
+) -> ToneExampleStyleHints:
+    if pools is None:
+        pools = build_tone_example_pools(segment)
     mode = _dramatic_mode(segment, state)
     recent = set(state.recent_example_bucket_ids[:3])
     used_now: set[str] = set()
     explosive_boost = bool(getattr(segment.segment_style_profile, "explosive_boost", False))
     primary_bucket_id, primary_text = _select_bucket(
-        segment=segment,
+        pools=pools,
         state=state,
         kind="line",
         layer="primary",
@@ -721,7 +801,7 @@ def build_tone_example_style_hints(segment: CompiledSegment, state: UrbanWorldSt
         used_now=used_now,
     )
     supporting_bucket_id, supporting_text = _select_bucket(
-        segment=segment,
+        pools=pools,
         state=state,
         kind="line",
         layer="supporting",
@@ -731,7 +811,7 @@ def build_tone_example_style_hints(segment: CompiledSegment, state: UrbanWorldSt
         used_now=used_now,
     )
     fallout_bucket_id, fallout_text = _select_bucket(
-        segment=segment,
+        pools=pools,
         state=state,
         kind="line",
         layer="fallout",
@@ -741,7 +821,7 @@ def build_tone_example_style_hints(segment: CompiledSegment, state: UrbanWorldSt
         used_now=used_now,
     )
     scene_bucket_id, scene_text = _select_bucket(
-        segment=segment,
+        pools=pools,
         state=state,
         kind="scene",
         layer="fallout",
@@ -755,25 +835,15 @@ def build_tone_example_style_hints(segment: CompiledSegment, state: UrbanWorldSt
             [item for item in (primary_bucket_id, supporting_bucket_id, fallout_bucket_id, scene_bucket_id) if item]
         )
     )
-    primary_tokens = _extract_anchor_tokens([primary_text])
-    supporting_tokens = _extract_anchor_tokens([supporting_text])
-    fallout_tokens = _extract_anchor_tokens([fallout_text, scene_text])
-    merged_tokens = _extract_anchor_tokens([primary_text, supporting_text, fallout_text, scene_text])
+    primary_tokens = _pooled_anchor_tokens(pools, [primary_text])
+    supporting_tokens = _pooled_anchor_tokens(pools, [supporting_text])
+    fallout_tokens = _pooled_anchor_tokens(pools, [fallout_text, scene_text])
+    merged_tokens = _pooled_anchor_tokens(pools, [primary_text, supporting_text, fallout_text, scene_text])
     profile = segment.segment_style_profile
-    role_reason_fallback = {
-        "opening": ["opportunity_window", "self_preserve", "loss_position"],
-        "misread": ["opportunity_window", "self_preserve", "loss_position"],
-        "pressure": ["self_preserve", "loss_position", "old_debt"],
-        "reversal": ["loss_position", "old_debt", "opportunity_window"],
-        "reveal": ["loss_position", "old_debt", "self_preserve", "opportunity_window"],
-        "terminal": ["old_debt", "loss_position", "self_preserve", "opportunity_window"],
-    }
-    reason_pool = unique_preserve(
-        [*list(profile.reason_families or []), *(role_reason_fallback.get(segment.segment_role, [])), "mixed"]
-    )[:4]
-    signal_pool = unique_preserve([*list(profile.signal_families or []), "mixed"])[:4]
-    cost_pool = unique_preserve([*list(profile.cost_families or []), "mixed"])[:4]
-    cadence_pool = unique_preserve([*list(profile.cadence_order or []), "mixed"])[:4]
+    reason_pool = list(pools.reason_pool)
+    signal_pool = list(pools.signal_pool)
+    cost_pool = list(pools.cost_pool)
+    cadence_pool = list(pools.cadence_pool)
     recent_clause = {
         item.split(":")[-1]
         for item in state.recent_clause_family_ids[:3]
@@ -873,7 +943,6 @@ def build_tone_example_style_hints(segment: CompiledSegment, state: UrbanWorldSt
             f"cadence:{cadence}",
         ]
     )
-    inferred_shell_id = _infer_shell_id_from_anchor_tokens(list(profile.shell_anchor_tokens))
     style_case_ids, style_case_keywords, style_case_slot_constraints, style_case_text_items = _build_style_case_registry(
         segment=segment,
         selected=(
@@ -888,7 +957,8 @@ def build_tone_example_style_hints(segment: CompiledSegment, state: UrbanWorldSt
         },
         signal_family=signal_family,
         cost_family=cost_family,
-        shell_id=inferred_shell_id,
+        shell_id=pools.inferred_shell_id,
+        keywords_by_text=pools.style_keywords_by_text,
     )
     return ToneExampleStyleHints(
         dramatic_mode=mode,
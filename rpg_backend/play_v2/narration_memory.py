@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import Any
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable
+import weakref
 
+from rpg_backend.author_v2.contracts import CompiledPlayPlan
 from rpg_backend.play_v2.contracts import (
     NarrationEventEntry,
     NarrationSegmentSummary,
@@ -12,6 +16,7 @@ from rpg_backend.play_v2.narration_variants import (
     phrase_fingerprint,
     pattern_fingerprint,
 )
+from rpg_backend.play_v2.plan_artefacts import plan_fingerprint
 
 
 _EVENT_LOG_MAX = 16
@@ -21,6 +26,16 @@ _ACTIVE_HOOK_SUMMARY_MAX = 5
 _REVEALED_SECRET_SUMMARY_MAX = 8
 _PRESSURE_FIELDS = ("pressure_load", "humiliation_risk", "betrayal_readiness")
 _RELATIONSHIP_TRAJECTORY_FIELDS = frozenset({"affection", "trust", "tension", "suspicion"})
+_ACTIVE_HOOK_STATUSES = frozenset({"suspected", "active", "leveraged"})
+_MEMORY_CACHE_MAX_ENTRIES = 512
+
+_memory_cache_lock = Lock()
+# Keyed by memory content rather than session, so speculative compose prewarm and
+# the submitted turn (and sessions replaying the same history) share one build.
+_memory_cache: OrderedDict[tuple[Hashable, ...], Any] = OrderedDict()
+_memory_cache_stats = {"hits": 0, "misses": 0}
+# id(state) -> (event log and summaries the keys were built from, their lengths, (segment key, event key))
+_layer_key_memo: dict[int, tuple[tuple[Any, ...], tuple[int, int], tuple[tuple[Hashable, ...], tuple[Hashable, ...]]]] = {}
 
 
 def _get_attr_or_key(obj: object, key: str, default: Any = None) -> Any:
@@ -69,7 +84,6 @@ def _build_active_hook_summary(state: UrbanWorldState) -> list[dict[str, object]
         hook_states = getattr(state, "hook_states", None) or {}
         if not isinstance(hook_states, dict) or not hook_states:
             return []
-        allowed_statuses = {"suspected", "active", "leveraged"}
         summary = [
             {
                 "hook_id": hook.hook_id,
@@ -80,7 +94,7 @@ def _build_active_hook_summary(state: UrbanWorldState) -> list[dict[str, object]
                 "leverage_value": round(float(hook.leverage_value), 2),
             }
             for hook in hook_states.values()
-            if getattr(hook, "status", "") in allowed_statuses
+            if getattr(hook, "status", "") in _ACTIVE_HOOK_STATUSES
         ]
         summary.sort(key=lambda item: float(item["leverage_value"]), reverse=True)
         return summary[:_ACTIVE_HOOK_SUMMARY_MAX]
@@ -171,6 +185,27 @@ def append_narration_event(
     log = [e for e in state.narration_event_log if e.fingerprint != fp]
     log.append(entry)
     state.narration_event_log = log[-_EVENT_LOG_MAX:]
+    _refresh_layer_keys(state)
+
+
+def attach_narration_event_deltas(
+    state: UrbanWorldState,
+    *,
+    turn_index: int,
+    phrase: str,
+    relationship_deltas: dict[str, dict[str, float]],
+) -> None:
+    """Attach the turn's relationship deltas to the event ``append_narration_event`` just logged."""
+    if not state.narration_event_log:
+        return
+    last_event = state.narration_event_log[-1]
+    if last_event.turn_index != turn_index or last_event.phrase != phrase:
+        return
+    state.narration_event_log = [
+        *state.narration_event_log[:-1],
+        last_event.model_copy(update={"relationship_deltas": relationship_deltas}),
+    ]
+    _refresh_layer_keys(state)
 
 
 def consolidate_segment_memory(
@@ -210,35 +245,225 @@ def consolidate_segment_memory(
     summaries.append(summary)
     state.narration_segment_summaries = summaries[-_SUMMARY_MAX:]
     state.narration_event_log = []
+    _refresh_layer_keys(state)
 
 
-def build_narration_memory_context(
-    state: UrbanWorldState,
-    plan: object | None = None,
-    current_turn_npc_ids: list[str] | None = None,
-) -> dict:
-    event_log = list(getattr(state, "narration_event_log", []) or [])
-    summaries = list(getattr(state, "narration_segment_summaries", []) or [])
-    event_fingerprints = {fp for entry in event_log if (fp := _get_attr_or_key(entry, "fingerprint", ""))}
-    event_pattern_fingerprints = {
-        pfp for entry in event_log if (pfp := _get_attr_or_key(entry, "pattern_fingerprint", ""))
-    }
-    event_phrases = [phrase for entry in event_log if (phrase := _get_attr_or_key(entry, "phrase", ""))]
+def _memoised(key: tuple[Hashable, ...], build: Callable[[], Any]) -> Any:
+    with _memory_cache_lock:
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            _memory_cache_stats["hits"] += 1
+            return _memory_cache[key]
+    built = build()
+    with _memory_cache_lock:
+        _memory_cache_stats["misses"] += 1
+        _memory_cache[key] = built
+        while len(_memory_cache) > _MEMORY_CACHE_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+    return built
+
+
+def clear_narration_memory_cache() -> None:
+    with _memory_cache_lock:
+        _memory_cache.clear()
+        _layer_key_memo.clear()
+        _memory_cache_stats.update(hits=0, misses=0)
+
+
+def narration_memory_cache_stats() -> dict[str, int]:
+    with _memory_cache_lock:
+        return {**_memory_cache_stats, "entries": len(_memory_cache)}
+
+
+def _deltas_key(relationship_deltas: object) -> tuple[Hashable, ...]:
+    if not isinstance(relationship_deltas, dict):
+        return ()
+    return tuple(
+        (str(character_id), tuple(sorted(raw_deltas.items())) if isinstance(raw_deltas, dict) else ())
+        for character_id, raw_deltas in relationship_deltas.items()
+    )
+
+
+def _segment_layer_key(summaries: list[Any]) -> tuple[Hashable, ...]:
+    # Summaries only change in consolidate_segment_memory; their texts are the content.
+    return tuple(
+        (
+            _get_attr_or_key(summary, "segment_id", ""),
+            _get_attr_or_key(summary, "summary_text", ""),
+            tuple(_get_attr_or_key(summary, "key_events", []) or []),
+        )
+        for summary in summaries
+    )
+
+
+def _event_layer_key(event_log: list[Any]) -> tuple[Hashable, ...]:
+    # The per-turn tail: one entry per append_narration_event; relationship deltas
+    # only matter for the trajectory window.
+    trajectory_start = max(len(event_log) - _RELATIONSHIP_TRAJECTORY_WINDOW, 0)
+    return tuple(
+        (
+            _get_attr_or_key(entry, "fingerprint", ""),
+            _get_attr_or_key(entry, "pattern_fingerprint", ""),
+            _get_attr_or_key(entry, "phrase", ""),
+            _deltas_key(_get_attr_or_key(entry, "relationship_deltas", {})) if index >= trajectory_start else (),
+        )
+        for index, entry in enumerate(event_log)
+    )
+
+
+def _layer_sources(state: object) -> tuple[tuple[Any, ...], tuple[int, int]]:
+    event_log = getattr(state, "narration_event_log", None)
+    summaries = getattr(state, "narration_segment_summaries", None)
+    objects = (
+        event_log,
+        event_log[-1] if event_log else None,
+        summaries,
+        summaries[-1] if summaries else None,
+    )
+    return objects, (len(event_log or ()), len(summaries or ()))
+
+
+def _forget_state(state_id: int) -> None:
+    with _memory_cache_lock:
+        _layer_key_memo.pop(state_id, None)
+
+
+def _refresh_layer_keys(state: object) -> tuple[tuple[Hashable, ...], tuple[Hashable, ...]]:
+    # Called where the event log or summaries change, so composes on an unchanged
+    # state reuse the layer keys instead of walking the log again.
+    objects, counts = _layer_sources(state)
+    keys = (_segment_layer_key(list(objects[2] or [])), _event_layer_key(list(objects[0] or [])))
+    state_id = id(state)
+    with _memory_cache_lock:
+        if state_id not in _layer_key_memo:
+            try:
+                weakref.finalize(state, _forget_state, state_id)
+            except TypeError:
+                return keys
+        _layer_key_memo[state_id] = (objects, counts, keys)
+    return keys
+
+
+def _layer_keys(state: object) -> tuple[tuple[Hashable, ...], tuple[Hashable, ...]]:
+    # The log and summaries are replaced, not edited, on each change, so the same
+    # lists with the same length and last item mean the layers are unchanged.
+    with _memory_cache_lock:
+        memo = _layer_key_memo.get(id(state))
+    if memo is not None:
+        objects, counts = _layer_sources(state)
+        if counts == memo[1] and all(left is right for left, right in zip(memo[0], objects)):
+            return memo[2]
+    return _refresh_layer_keys(state)
+
+
+def _revealed_secret_key(state: UrbanWorldState, plan: object | None) -> tuple[Hashable, ...]:
+    revealed_secret_ids = tuple(getattr(state, "last_turn_revealed_secret_ids", []) or ())
+    if not revealed_secret_ids:
+        return ()
+    if isinstance(plan, CompiledPlayPlan):
+        return (revealed_secret_ids[:_REVEALED_SECRET_SUMMARY_MAX], plan_fingerprint(plan))
+    return tuple(tuple(item.values()) for item in _build_revealed_secret_summary(state, plan=plan))
+
+
+def _segment_layer(summaries: list[Any]) -> dict[str, list[str]]:
     summary_texts = [summary_text for summary in summaries if (summary_text := _get_attr_or_key(summary, "summary_text", ""))]
-    summary_key_events = []
+    summary_key_events: list[str] = []
     for summary in summaries:
         summary_key_events.extend(list(_get_attr_or_key(summary, "key_events", []) or []))
+    return {"summary_texts": summary_texts[-3:], "summary_key_events": summary_key_events[-12:]}
+
+
+def _event_layer(state: UrbanWorldState, event_log: list[Any]) -> dict[str, Any]:
     return {
-        "event_fingerprints": event_fingerprints,
-        "event_pattern_fingerprints": event_pattern_fingerprints,
-        "event_phrases": event_phrases,
-        "summary_texts": summary_texts[-3:],
-        "summary_key_events": summary_key_events[-12:],
+        "event_fingerprints": {fp for entry in event_log if (fp := _get_attr_or_key(entry, "fingerprint", ""))},
+        "event_pattern_fingerprints": {
+            pfp for entry in event_log if (pfp := _get_attr_or_key(entry, "pattern_fingerprint", ""))
+        },
+        "event_phrases": [phrase for entry in event_log if (phrase := _get_attr_or_key(entry, "phrase", ""))],
         "relationship_trajectory": _build_relationship_trajectory(state),
-        "active_hook_summary": _build_active_hook_summary(state),
-        "revealed_secret_summary": _build_revealed_secret_summary(state, plan=plan),
-        "npc_pressure_snapshot": _build_npc_pressure_snapshot(
-            state,
-            current_turn_npc_ids=current_turn_npc_ids,
-        ),
     }
+
+
+def narration_memory_key(
+    state: UrbanWorldState,
+    plan: object | None = None,
+    current_turn_npc_ids: list[str] | None = None,
+) -> tuple[Hashable, ...]:
+    """Content key for `build_narration_memory_context` on this state.
+
+    Two states with the same key produce the same memory context, whichever
+    session or speculative branch they came from. The event and segment parts
+    are rebuilt where the log or summaries change and reused until they do.
+    """
+    hook_states = getattr(state, "hook_states", None) or {}
+    npc_mind_states = getattr(state, "npc_mind_states", None) or {}
+    segment_key, event_key = _layer_keys(state)
+    return (
+        segment_key,
+        event_key,
+        tuple(
+            (hook.hook_id, hook.holder_id, hook.target_id, hook.leverage_type, hook.status, round(float(hook.leverage_value), 2))
+            for hook in (hook_states.values() if isinstance(hook_states, dict) else ())
+            if getattr(hook, "status", "") in _ACTIVE_HOOK_STATUSES
+        ),
+        _revealed_secret_key(state, plan),
+        tuple(
+            (
+                character_id,
+                tuple(_get_attr_or_key(npc_mind_states[character_id], field_name, None) for field_name in _PRESSURE_FIELDS),
+            )
+            for character_id in current_turn_npc_ids or ()
+            if isinstance(npc_mind_states, dict) and character_id in npc_mind_states
+        )
+        if current_turn_npc_ids is not None
+        else None,
+    )
+
+
+def build_narration_memory_context(
+    state: UrbanWorldState,
+    plan: object | None = None,
+    current_turn_npc_ids: list[str] | None = None,
+    *,
+    key: tuple[Hashable, ...] | None = None,
+) -> dict:
+    """Memory context for narration compose, assembled from memoised layers.
+
+    The segment layer is rebuilt only when the summaries change and the event
+    layer only when the event log does; the assembled context is shared by
+    every state with the same ``key``.
+    Callers get a fresh top-level dict and must not mutate nested values.
+    """
+    resolved_key = key if key is not None else narration_memory_key(state, plan, current_turn_npc_ids)
+    segment_key, event_key = resolved_key[0], resolved_key[1]
+
+    def _build() -> dict:
+        event_log = list(getattr(state, "narration_event_log", []) or [])
+        summaries = list(getattr(state, "narration_segment_summaries", []) or [])
+        segment_layer = _memoised(("segment", segment_key), lambda: _segment_layer(summaries))
+        event_layer = _memoised(("event", event_key), lambda: _event_layer(state, event_log))
+        return {
+            "event_fingerprints": event_layer["event_fingerprints"],
+            "event_pattern_fingerprints": event_layer["event_pattern_fingerprints"],
+            "event_phrases": event_layer["event_phrases"],
+            "summary_texts": segment_layer["summary_texts"],
+            "summary_key_events": segment_layer["summary_key_events"],
+            "relationship_trajectory": event_layer["relationship_trajectory"],
+            "active_hook_summary": _build_active_hook_summary(state),
+            "revealed_secret_summary": _build_revealed_secret_summary(state, plan=plan),
+            "npc_pressure_snapshot": _build_npc_pressure_snapshot(
+                state,
+                current_turn_npc_ids=current_turn_npc_ids,
+            ),
+        }
+
+    return dict(_memoised(("context", resolved_key), _build))
+
+
+def memoised_memory_prompt_section(
+    key: tuple[Hashable, ...],
+    target_id: str,
+    render: Callable[[], tuple[str, int]],
+) -> tuple[str, int]:
+    """Cache a rendered memory-context prompt section per memory key and compose target."""
+    return _memoised(("prompt_section", key, target_id), render)
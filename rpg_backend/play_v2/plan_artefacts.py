@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from threading import Lock
+from typing import Any, Callable, TypeVar
+import weakref
+
+from rpg_backend.author_v2.contracts import CompiledPlayPlan
+
+_PLAN_ARTEFACT_CACHE_MAX_ENTRIES = 256
+
+ArtefactT = TypeVar("ArtefactT")
+
+_artefact_lock = Lock()
+_plan_fingerprints: dict[int, str] = {}
+_segment_artefacts: OrderedDict[tuple[str, str], Any] = OrderedDict()
+_artefact_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _forget_plan(plan_id: int) -> None:
+    with _artefact_lock:
+        _plan_fingerprints.pop(plan_id, None)
+
+
+def plan_fingerprint(plan: CompiledPlayPlan) -> str:
+    """Content hash of a compiled plan, computed once per plan object.
+
+    Sessions of the same story deserialize their own plan objects, so keying
+    artefacts by content rather than identity lets them share one build.
+    ``CompiledPlayPlan`` is frozen, so an edited plan is always a new object
+    (``model_copy``) and never reuses a stale per-object hash.
+    """
+    plan_id = id(plan)
+    with _artefact_lock:
+        fingerprint = _plan_fingerprints.get(plan_id)
+    if fingerprint is not None:
+        return fingerprint
+    fingerprint = hashlib.sha256(plan.model_dump_json().encode("utf-8")).hexdigest()
+    with _artefact_lock:
+        if plan_id not in _plan_fingerprints:
+            _plan_fingerprints[plan_id] = fingerprint
+            weakref.finalize(plan, _forget_plan, plan_id)
+    return fingerprint
+
+
+def segment_artefacts(
+    plan: CompiledPlayPlan,
+    segment_id: str,
+    build: Callable[[], ArtefactT],
+) -> ArtefactT:
+    """Return the cached artefacts for one plan segment, building them on first use."""
+    return _cached_artefact((plan_fingerprint(plan), segment_id), build)
+
+
+def plan_artefact(
+    plan: CompiledPlayPlan,
+    name: str,
+    build: Callable[[], ArtefactT],
+) -> ArtefactT:
+    """Return a cached whole-plan artefact, building it on first use."""
+    # Segment ids never start with "@", so plan-level keys cannot collide with them.
+    return _cached_artefact((plan_fingerprint(plan), f"@{name}"), build)
+
+
+def content_artefact(
+    digest: str,
+    name: str,
+    build: Callable[[], ArtefactT],
+) -> ArtefactT:
+    """Return a cached artefact keyed by the digest of the plan fields it is built from."""
+    # Plan fingerprints are hex digests and never start with "#", so these keys cannot collide.
+    return _cached_artefact((f"#{digest}", name), build)
+
+
+def _cached_artefact(key: tuple[str, str], build: Callable[[], ArtefactT]) -> ArtefactT:
+    with _artefact_lock:
+        cached = _segment_artefacts.get(key)
+        if cached is not None:
+            _segment_artefacts.move_to_end(key)
+            _artefact_stats["hits"] += 1
+            return cached
+    built = build()
+    with _artefact_lock:
+        cached = _segment_artefacts.get(key)
+        if cached is not None:
+            _artefact_stats["hits"] += 1
+            return cached
+        _artefact_stats["misses"] += 1
+        _segment_artefacts[key] = built
+        while len(_segment_artefacts) > _PLAN_ARTEFACT_CACHE_MAX_ENTRIES:
+            _segment_artefacts.popitem(last=False)
+            _artefact_stats["evictions"] += 1
+    return built
+
+
+def plan_artefact_cache_stats() -> dict[str, int]:
+    with _artefact_lock:
+        return {**_artefact_stats, "entries": len(_segment_artefacts)}
+
+
+def clear_plan_artefacts() -> None:
+    with _artefact_lock:
+        _segment_artefacts.clear()
+        for key in _artefact_stats:
+            _artefact_stats[key] = 0
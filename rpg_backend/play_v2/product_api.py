@@ -19,6 +19,7 @@ from rpg_backend.play.contracts import (
     PlaySceneQuestionDebug,
     PlaySessionProgress,
     PlaySessionSnapshot,
+    PlaySessionSnapshotDelta,
     PlayStoryDebug,
     PlayStateBar,
     PlaySuggestedAction,
@@ -32,7 +33,8 @@ from rpg_backend.play.contracts import (
     PlayPayoffCommitDebug,
     PlayStyleCommitDebug,
 )
-from rpg_backend.play_v2.contracts import UrbanTurnResult, UrbanWorldState
+from rpg_backend.play_v2.contracts import SnapshotSection, UrbanTurnChangeSet, UrbanTurnResult, UrbanWorldState
+from rpg_backend.play_v2.turn_changes import merge_changed_sections
 
 
 @dataclass(frozen=True)
@@ -144,19 +146,46 @@ def build_v2_progress(plan: CompiledPlayPlan, state: UrbanWorldState) -> PlaySes
     )
 
 
+def _snapshot_story_actions(state: UrbanWorldState) -> list[PlaySuggestedAction]:
+    story_actions = state.story_actions or state.suggested_actions
+    # Up to 4 suggestions: 3 lane-based (relationship/side/burst) + 1 storylet card.
+    return [
+        PlaySuggestedAction(suggestion_id=item.suggestion_id, action_type="story", label=item.label, prompt=item.prompt)
+        for item in story_actions
+    ][:4]
+
+
+def _snapshot_control_actions(state: UrbanWorldState) -> list[PlayControlAction]:
+    return [
+        PlayControlAction(
+            action_id=item.action_id,
+            action_type=item.action_type,
+            target_mode=item.target_mode,
+            target_kind=item.target_kind,
+            target_id=item.target_id,
+            label=item.label,
+            prompt=item.prompt,
+        )
+        for item in state.control_actions
+    ][:3]
+
+
+def _snapshot_status(state: UrbanWorldState) -> str:
+    return "expired" if state.status == "expired" else "completed" if state.status == "completed" else "active"
+
+
 def build_v2_snapshot(plan: CompiledPlayPlan, state: UrbanWorldState) -> PlaySessionSnapshot:
     protagonist = product_protagonist_from_plan(plan)
     segment = plan.segments[min(state.segment_index, len(plan.segments) - 1)]
     ending = public_ending_from_v2(state.ending_id, state.ending_summary)
-    story_actions = state.story_actions or state.suggested_actions
-    control_actions = state.control_actions
+    story_actions = _snapshot_story_actions(state)
     latent_radar = build_v2_latent_radar(state)
     return PlaySessionSnapshot(
         session_id=state.session_id,
         story_id=state.story_id,
         story_mode="relationship_drama",
         story_shell_id=plan.story_shell_id,
-        status=("expired" if state.status == "expired" else "completed" if state.status == "completed" else "active"),
+        status=_snapshot_status(state),
         turn_index=state.turn_index,
         beat_index=state.segment_index + 1,
         beat_title=segment.scene_goal[:120],
@@ -169,44 +198,104 @@ def build_v2_snapshot(plan: CompiledPlayPlan, state: UrbanWorldState) -> PlaySes
         state_bars=build_v2_state_bars(plan, state),
         current_route_target_id=state.current_route_target_id,
         relationship_state=build_v2_relationship_snapshot(state),
-        # Up to 4 suggestions: 3 lane-based (relationship/side/burst) + 1 storylet card.
-        suggested_actions=[
-            PlaySuggestedAction(suggestion_id=item.suggestion_id, action_type="story", label=item.label, prompt=item.prompt)
-            for item in story_actions
-        ][:4],
-        story_actions=[
-            PlaySuggestedAction(suggestion_id=item.suggestion_id, action_type="story", label=item.label, prompt=item.prompt)
-            for item in story_actions
-        ][:4],
-        control_actions=[
-            PlayControlAction(
-                action_id=item.action_id,
-                action_type=item.action_type,
-                target_mode=item.target_mode,
-                target_kind=item.target_kind,
-                target_id=item.target_id,
-                label=item.label,
-                prompt=item.prompt,
-            )
-            for item in control_actions
-        ][:3],
+        suggested_actions=story_actions,
+        story_actions=list(story_actions),
+        control_actions=_snapshot_control_actions(state),
         latent_radar=latent_radar[:4],
         ending=ending,
     )
 
 
+def _changed_section_fields(
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    sections: list[SnapshotSection],
+) -> dict[str, object]:
+    update: dict[str, object] = {}
+    if "status" in sections:
+        update["status"] = _snapshot_status(state)
+    if "beat" in sections:
+        segment = plan.segments[min(state.segment_index, len(plan.segments) - 1)]
+        update["beat_index"] = state.segment_index + 1
+        update["beat_title"] = segment.scene_goal[:120]
+    if "narration" in sections:
+        update["narration"] = state.narration or plan.opening_narration
+    if "feedback" in sections:
+        update["feedback"] = build_v2_feedback(state)
+    if "progress" in sections:
+        update["progress"] = build_v2_progress(plan, state)
+    if "state_bars" in sections:
+        update["state_bars"] = build_v2_state_bars(plan, state)
+    if "route_target" in sections:
+        update["current_route_target_id"] = state.current_route_target_id
+    if "relationship_state" in sections:
+        update["relationship_state"] = build_v2_relationship_snapshot(state)
+    if "actions" in sections:
+        story_actions = _snapshot_story_actions(state)
+        update["suggested_actions"] = story_actions
+        update["story_actions"] = list(story_actions)
+        update["control_actions"] = _snapshot_control_actions(state)
+    if "latent_radar" in sections:
+        update["latent_radar"] = build_v2_latent_radar(state)[:4]
+    if "ending" in sections:
+        update["ending"] = public_ending_from_v2(state.ending_id, state.ending_summary)
+    return update
+
+
+def apply_v2_turn_changes(
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    snapshot: PlaySessionSnapshot,
+    change_set: UrbanTurnChangeSet,
+) -> PlaySessionSnapshot:
+    """Bring the pre-turn ``snapshot`` up to ``state`` by rebuilding only the sections the turn changed."""
+    return snapshot.model_copy(
+        update={
+            "turn_index": state.turn_index,
+            **_changed_section_fields(plan, state, change_set.changed_sections),
+        }
+    )
+
+
+def build_v2_snapshot_delta(
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    *,
+    since_turn_index: int,
+    change_sets: list[UrbanTurnChangeSet],
+) -> PlaySessionSnapshotDelta:
+    """Build only the snapshot sections the given change sets touched."""
+    sections = merge_changed_sections(change_sets)
+    return PlaySessionSnapshotDelta(
+        session_id=state.session_id,
+        turn_index=state.turn_index,
+        since_turn_index=since_turn_index,
+        changed_sections=list(sections),
+        **_changed_section_fields(plan, state, sections),
+    )
+
+
 def build_v2_turn_trace(
     *,
     plan: CompiledPlayPlan,
-    before_state: UrbanWorldState,
     result: UrbanTurnResult,
     player_input: str,
     selected_suggestion_id: str | None,
     turn_elapsed_ms: int,
     selected_story_action_id: str | None = None,
     selected_control_action_id: str | None = None,
+    before_state: UrbanWorldState | None = None,
 ) -> tuple[PlayTurnTrace, ProductV2TurnTracePayload]:
     ending = public_ending_from_v2(result.state.ending_id, result.state.ending_summary)
+    change_set = result.change_set
+    if change_set is not None:
+        segment_index_before = change_set.segment_index_before
+        global_state_changes = dict(change_set.global_deltas)
+        relationship_state_changes = {key: dict(value) for key, value in change_set.relationship_deltas.items()}
+    else:
+        segment_index_before = before_state.segment_index if before_state is not None else result.state.segment_index
+        global_state_changes = dict(result.state.last_turn_global_deltas)
+        relationship_state_changes = {key: dict(value) for key, value in result.state.last_turn_relationship_deltas.items()}
     diagnostics = dict(result.intent_stage_diagnostics or {})
 
     def _diag_int(key: str) -> int:
@@ -247,6 +336,8 @@ def build_v2_turn_trace(
     intent_parse_latency_ms = _diag_int("intent_parse_latency_ms")
     intent_micro_sim_stage_latency_ms = _diag_int("intent_micro_sim_stage_latency_ms")
     micro_sim_latency_ms = _diag_int("micro_sim_latency_ms")
+    micro_sim_speculative_hit = _diag_bool("micro_sim_speculative_hit")
+    micro_sim_speculative_saved_ms = _diag_int("micro_sim_speculative_saved_ms")
     compose_latency_ms = _diag_int("compose_latency_ms")
     compose_pass_count = _diag_int("compose_pass_count")
     compose_pass2_retry_count = _diag_int("compose_pass2_retry_count")
@@ -484,8 +575,8 @@ def build_v2_turn_trace(
         move_family=result.intent.move_family,
         scene_frame=result.intent.scene_frame,
         target_character_ids=[result.intent.target_id] if result.intent.target_id else [],
-        global_state_changes=dict(result.state.last_turn_global_deltas),
-        relationship_state_changes={key: dict(value) for key, value in result.state.last_turn_relationship_deltas.items()},
+        global_state_changes=dict(global_state_changes),
+        relationship_state_changes={key: dict(value) for key, value in relationship_state_changes.items()},
         revealed_secret_ids=list(result.state.last_turn_revealed_secret_ids),
         ending_id=ending.ending_id if ending else None,
         ending_trigger_reason="v2_direct" if result.ending_triggered else None,
@@ -559,6 +650,8 @@ def build_v2_turn_trace(
             "micro_sim_output_tokens": micro_sim_output_tokens,
             "micro_sim_total_tokens": micro_sim_total_tokens,
             "micro_sim_latency_ms": micro_sim_latency_ms,
+            "micro_sim_speculative_hit": 1 if micro_sim_speculative_hit else 0,
+            "micro_sim_speculative_saved_ms": micro_sim_speculative_saved_ms,
             "compose_input_tokens": compose_input_tokens,
             "compose_output_tokens": compose_output_tokens,
             "compose_total_tokens": compose_total_tokens,
@@ -593,6 +686,7 @@ def build_v2_turn_trace(
             "post_submit_total_tokens": post_submit_total_tokens,
             "play_turn_total_tokens": play_turn_total_tokens,
             "draft_intent_status": draft_intent_status,
+            "prefetch_source": str(diagnostics.get("prefetch_source") or "not_requested"),
             "intent_compile_source": str(result.intent.intent_compile_source),
             "micro_sim_status": str(diagnostics.get("micro_sim_status") or ""),
             "selected_style_case_ids": selected_style_case_ids,
@@ -630,8 +724,8 @@ def build_v2_turn_trace(
             "submitted_with_selected_ids": 1 if submitted_with_selected_ids else 0,
         },
         render_usage={"render_elapsed_ms": 0, "semantic_contract": "v2"},
-        beat_index_before=before_state.segment_index + 1,
-        beat_title_before=plan.segments[min(before_state.segment_index, len(plan.segments) - 1)].scene_goal[:120],
+        beat_index_before=segment_index_before + 1,
+        beat_title_before=plan.segments[min(segment_index_before, len(plan.segments) - 1)].scene_goal[:120],
         beat_index_after=result.state.segment_index + 1,
         beat_title_after=plan.segments[min(result.state.segment_index, len(plan.segments) - 1)].scene_goal[:120],
         status_after="completed" if result.state.status == "completed" else "active",
@@ -643,8 +737,8 @@ def build_v2_turn_trace(
         move_family=result.intent.move_family,
         scene_frame=result.intent.scene_frame,
         target_character_ids=[result.intent.target_id] if result.intent.target_id else [],
-        global_state_changes=dict(result.state.last_turn_global_deltas),
-        relationship_state_changes={key: dict(value) for key, value in result.state.last_turn_relationship_deltas.items()},
+        global_state_changes=dict(global_state_changes),
+        relationship_state_changes={key: dict(value) for key, value in relationship_state_changes.items()},
         revealed_secret_ids=list(result.state.last_turn_revealed_secret_ids),
         resolution=resolution,
         story_debug=story_debug,
@@ -7,7 +7,7 @@ import re
 import time
 from typing import Any, Literal
 from uuid import uuid4
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
 
 from rpg_backend.author.contracts import RelationshipMoveFamily
 from rpg_backend.author.normalize import normalize_whitespace, trim_text, unique_preserve
@@ -24,6 +24,7 @@ from rpg_backend.author_v2.contracts import (
 from rpg_backend.config import get_settings
 from rpg_backend.play.gateway import PlayGatewayError, PlayLLMGateway, get_play_llm_gateway
 from rpg_backend.play_v2.causal_contract import CausalContractEngine
+from rpg_backend.play_v2.compose_hedge import hedge_delay_ms, record_compose_latency, run_hedged
 from rpg_backend.play_v2.delta_pack_runtime import (
     clear_delta_pack_future,
     effective_voice_atom_weight,
@@ -34,17 +35,25 @@ from rpg_backend.play_v2.delta_pack_runtime import (
 from rpg_backend.play_v2.director import EventDirector
 from rpg_backend.play_v2.invariants import InvariantValidator
 from rpg_backend.play_v2.latent_events import LatentEventEngine
+from rpg_backend.play_v2.micro_sim_speculation import (
+    record_speculation_outcome,
+    speculation_hit_rate,
+    submit_speculation,
+)
 from rpg_backend.play_v2.narration_frames import (
     build_npc_reaction_beat,
     build_render_seed,
     build_supporting_reaction_beats,
+    build_tone_example_pools,
     build_tone_example_style_hints,
     NarrationRenderSeed,
     NpcReactionBeat,
     SupportingReactionBeat,
+    ToneExamplePools,
     ToneExampleStyleHints,
 )
 from rpg_backend.play_v2.narration_surface import render_npc_texture_emergency
+from rpg_backend.play_v2.plan_artefacts import segment_artefacts
 from rpg_backend.play_v2.narration_variants import (
     append_narration_history,
     canonicalize_phrase,
@@ -55,10 +64,17 @@ from rpg_backend.play_v2.storylet_engine import (
     StoryletFireResult,
     fire_storylet,
     reset_turn_storylet_state,
-    storylet_pool_iter,
 )
+from rpg_backend.play_v2.storylet_pool import storylet_pool_index
 from rpg_backend.play_v2.semantic_resolver import resolve_semantic_effects
-from rpg_backend.play_v2.narration_memory import append_narration_event, consolidate_segment_memory, build_narration_memory_context
+from rpg_backend.play_v2.narration_memory import (
+    append_narration_event,
+    attach_narration_event_deltas,
+    build_narration_memory_context,
+    consolidate_segment_memory,
+    memoised_memory_prompt_section,
+    narration_memory_key,
+)
 from rpg_backend.play_v2.semantic_planners import (
     EventPlanner,
     PayoffPlanner,
@@ -68,6 +84,18 @@ from rpg_backend.play_v2.semantic_planners import (
 )
 from rpg_backend.play_v2.shell_propagation import pick_shell_edge
 from rpg_backend.play_v2.turn_reducers import HookLifecycleReducer
+from rpg_backend.play_v2.turn_changes import (
+    build_turn_change_set,
+    mind_bar_values,
+    record_cost_status,
+    record_global_change,
+    record_latent_radar_change,
+    record_mind_change,
+    record_relationship_change,
+    record_turn_changes,
+    relationship_values,
+)
+from rpg_backend.play_v2.turn_workers import resolve_turn_state_in_worker
 from rpg_backend.play_v2.contracts import (
     CallbackQueueItem,
     CallbackTurnStatusRecord,
@@ -1546,15 +1574,23 @@ def _refresh_unresolved_cost_ladder(
                 }
             )
         updated.append(record)
-    state.unresolved_costs = sorted(
-        updated,
+    _store_unresolved_costs(state, updated)
+
+
+def _store_unresolved_costs(state: UrbanWorldState, records: list[UnresolvedCostRecord]) -> None:
+    """Keep the 12 most pressing records; the rest are recorded as leaving the ledger."""
+    ordered = sorted(
+        records,
         key=lambda item: (
             item.status != "pending",
             -int(item.ladder_stage or 1),
             int(item.due_turn),
             int(item.source_turn_index),
         ),
-    )[:12]
+    )
+    for item in ordered[12:]:
+        record_cost_status(item.cost_id, item.status, None)
+    state.unresolved_costs = ordered[:12]
 
 
 def _upsert_unresolved_cost(
@@ -1586,7 +1622,9 @@ def _upsert_unresolved_cost(
     )
     if match_index is None:
         records.append(unresolved_cost.model_copy(deep=True))
+        record_cost_status(unresolved_cost.cost_id, None, unresolved_cost.status)
     else:
+        record_cost_status(records[match_index].cost_id, records[match_index].status, "pending")
         retry_bias_steps = max(
             int(records[match_index].ladder_retry_bias_steps or 0),
             int(unresolved_cost.ladder_retry_bias_steps or 0),
@@ -1610,16 +1648,10 @@ def _upsert_unresolved_cost(
                 "summary": unresolved_cost.summary,
             }
         )
-    records = sorted(
-        records,
-        key=lambda item: (
-            item.status != "pending",
-            -int(item.ladder_stage or 1),
-            item.due_turn,
-            item.source_turn_index,
-        ),
-    )
-    state.unresolved_costs = [item for item in records if item.status != "expired"][:12]
+    for item in records:
+        if item.status == "expired":
+            record_cost_status(item.cost_id, item.status, None)
+    _store_unresolved_costs(state, [item for item in records if item.status != "expired"])
 
 
 def _reconcile_unresolved_costs(
@@ -1632,6 +1664,7 @@ def _reconcile_unresolved_costs(
     updated: list[UnresolvedCostRecord] = []
     for item in state.unresolved_costs:
         record = item.model_copy(deep=True)
+        status_before = record.status
         if record.status == "pending":
             if (
                 callback_status is not None
@@ -1655,16 +1688,11 @@ def _reconcile_unresolved_costs(
             record.status = "resolved"
             record.resolved_turn_index = state.turn_index
         if record.status != "expired":
+            record_cost_status(record.cost_id, status_before, record.status)
             updated.append(record)
-    state.unresolved_costs = sorted(
-        updated,
-        key=lambda item: (
-            item.status != "pending",
-            -int(item.ladder_stage or 1),
-            item.due_turn,
-            item.source_turn_index,
-        ),
-    )[:12]
+        else:
+            record_cost_status(record.cost_id, status_before, None)
+    _store_unresolved_costs(state, updated)
 
 
 def _scene_frame_for_segment(segment: CompiledSegment) -> RelationshipSceneFrame:
@@ -1718,6 +1746,7 @@ def _suggestion_match_score(
     suggestion: UrbanSuggestedAction,
     input_text: str,
     input_terms: set[str],
+    suggestion_terms: frozenset[str] | set[str] | None = None,
 ) -> int:
     score = 0
     normalized_input = _normalize_user_text(input_text)
@@ -1730,24 +1759,32 @@ def _suggestion_match_score(
     scene_keywords = PUBLIC_FRAME_KEYWORDS if suggestion.scene_frame == "public" else SEMI_PUBLIC_FRAME_KEYWORDS
     if any(keyword.casefold() in normalized_input for keyword in scene_keywords):
         score += 1
-    suggestion_terms = _text_terms(f"{suggestion.label} {suggestion.prompt}")
+    if suggestion_terms is None:
+        suggestion_terms = _suggestion_text_terms(suggestion)
     overlap = input_terms & suggestion_terms
     score += min(len(overlap), 4)
     return score
 
 
+def _suggestion_text_terms(suggestion: UrbanSuggestedAction) -> frozenset[str]:
+    return frozenset(_text_terms(f"{suggestion.label} {suggestion.prompt}"))
+
+
 def _nearest_legal_suggestion(
     plan: CompiledPlayPlan,
     suggestions: list[UrbanSuggestedAction],
     input_text: str,
+    *,
+    suggestion_terms: dict[str, frozenset[str]] | None = None,
 ) -> UrbanSuggestedAction | None:
     if not suggestions:
         return None
     input_terms = _text_terms(input_text)
+    terms_by_id = suggestion_terms or {}
     ranked = sorted(
         suggestions,
         key=lambda item: (
-            _suggestion_match_score(plan, item, input_text, input_terms),
+            _suggestion_match_score(plan, item, input_text, input_terms, terms_by_id.get(item.suggestion_id)),
             item.lane_id,
             item.suggestion_id,
         ),
@@ -1827,8 +1864,46 @@ def _build_default_suggestion_lanes(segment: CompiledSegment, plan: CompiledPlay
     ]
 
 
+@dataclass(frozen=True)
+class _SegmentArtefacts:
+    tone_pools: ToneExamplePools
+    default_suggestion_lanes: tuple[SegmentSuggestionLane, ...]
+    example_texts_by_bucket: dict[str, str]
+
+
+def _build_segment_artefacts(plan: CompiledPlayPlan, segment_id: str) -> _SegmentArtefacts:
+    segment = next(item for item in plan.segments if item.segment_id == segment_id)
+    example_texts_by_bucket: dict[str, str] = {}
+    for item in (
+        *segment.template_tone_example_lines,
+        *segment.template_tone_scene_examples,
+        *segment.tone_example_pack.author_example_lines,
+        *segment.tone_example_pack.author_example_scene,
+        *segment.tone_example_pack.play_reaction_example_lines,
+        *segment.tone_example_pack.play_supporting_example_lines,
+        *segment.tone_example_pack.play_chain_example_lines,
+        *segment.tone_example_pack.play_debt_example_lines,
+    ):
+        example_texts_by_bucket.setdefault(item.bucket_id, trim_text(item.text, 260))
+    return _SegmentArtefacts(
+        tone_pools=build_tone_example_pools(segment),
+        default_suggestion_lanes=tuple(_build_default_suggestion_lanes(segment, plan)),
+        example_texts_by_bucket=example_texts_by_bucket,
+    )
+
+
+def _segment_artefacts(plan: CompiledPlayPlan, segment: CompiledSegment) -> _SegmentArtefacts:
+    """Per-plan artefacts for ``segment``, shared by every session of the plan.
+
+    Beat delta packs only rewrite priorities, cues and lane objectives, so the
+    artefacts are built from the plan's own segment and stay valid for the
+    resolved one.
+    """
+    return segment_artefacts(plan, segment.segment_id, lambda: _build_segment_artefacts(plan, segment.segment_id))
+
+
 def _segment_suggestion_lanes(segment: CompiledSegment, plan: CompiledPlayPlan) -> list[SegmentSuggestionLane]:
-    return segment.suggestion_lanes or _build_default_suggestion_lanes(segment, plan)
+    return segment.suggestion_lanes or list(_segment_artefacts(plan, segment).default_suggestion_lanes)
 
 
 def _resolve_lane_target_id(plan: CompiledPlayPlan, state: UrbanWorldState, lane: SegmentSuggestionLane) -> str | None:
@@ -2178,15 +2253,16 @@ def _build_storylet_suggestion(
     )
     if not matches:
         return None
-    pool_by_id = {storylet.storylet_id: storylet for storylet in storylet_pool_iter(plan)}
+    pool = storylet_pool_index(plan)
     for match in matches:
-        storylet = pool_by_id.get(match.storylet_id)
+        storylet = pool.by_id.get(match.storylet_id)
         if storylet is None:
             continue
         # Skip if cooldown — there's no point offering a card that engine.fire would refuse
         last_fired = state.fired_storylet_ids.get(storylet.storylet_id)
-        if last_fired is not None and storylet.cooldown_turns > 0:
-            if (state.turn_index - last_fired) < storylet.cooldown_turns:
+        cooldown_turns = pool.cooldown_turns_by_id.get(storylet.storylet_id, 0)
+        if last_fired is not None and cooldown_turns > 0:
+            if (state.turn_index - last_fired) < cooldown_turns:
                 continue
         # Pick a target — prefer storylet's first non-protagonist character that's
         # also active in state.relationships and not already reserved by lane cards.
@@ -3506,6 +3582,46 @@ def _apply_control_bias_if_needed(
     )
 
 
+@dataclass(frozen=True)
+class IntentLegalizationPrecompute:
+    """Input-independent half of intent legalization for one world state.
+
+    Everything here depends only on ``plan`` and ``state``, so the service can
+    build it in the background once a turn commits and hand it to the next
+    submit or draft; ``parse_turn_intent`` then only does the per-input work.
+    """
+
+    suggestions: tuple[UrbanSuggestedAction, ...]
+    control_actions: tuple[UrbanControlAction, ...]
+    allowed_move_families: frozenset[str]
+    # First suggestion per normalised prompt, mirroring the prompt-match lookup.
+    suggestion_ids_by_prompt: dict[str, str]
+    suggestion_terms: dict[str, frozenset[str]]
+
+
+def build_intent_legalization_precompute(
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    *,
+    suggestions: tuple[UrbanSuggestedAction, ...] | None = None,
+    control_actions: tuple[UrbanControlAction, ...] | None = None,
+) -> IntentLegalizationPrecompute:
+    resolved_suggestions = suggestions if suggestions is not None else tuple(build_suggested_actions(plan, state))
+    segment = _resolved_segment(plan, state)
+    suggestion_ids_by_prompt: dict[str, str] = {}
+    for item in resolved_suggestions:
+        suggestion_ids_by_prompt.setdefault(_normalize_user_text(item.prompt), item.suggestion_id)
+    return IntentLegalizationPrecompute(
+        suggestions=resolved_suggestions,
+        control_actions=(
+            control_actions if control_actions is not None else tuple(build_control_actions(plan, state))
+        ),
+        allowed_move_families=frozenset(segment.allowed_move_families or list(MOVE_KEYWORDS.keys())),
+        suggestion_ids_by_prompt=suggestion_ids_by_prompt,
+        suggestion_terms={item.suggestion_id: _suggestion_text_terms(item) for item in resolved_suggestions},
+    )
+
+
 def _legalize_candidate(
     *,
     plan: CompiledPlayPlan,
@@ -3513,9 +3629,13 @@ def _legalize_candidate(
     candidate: _IntentCandidate,
     nearest_suggestion: UrbanSuggestedAction | None,
     suggestions: list[UrbanSuggestedAction],
+    allowed_move_families: frozenset[str] | None = None,
 ) -> _IntentCandidate:
-    segment = _resolved_segment(plan, state)
-    allowed = set(segment.allowed_move_families or list(MOVE_KEYWORDS.keys()))
+    if allowed_move_families is not None:
+        allowed = allowed_move_families
+    else:
+        segment = _resolved_segment(plan, state)
+        allowed = set(segment.allowed_move_families or list(MOVE_KEYWORDS.keys()))
     move_family = candidate.move_family
     target_id = candidate.target_id
     scene_frame = candidate.scene_frame
@@ -3586,6 +3706,7 @@ def parse_turn_intent(
     control_target_mode: str | None = None,
     prefetched_suggestions: tuple[UrbanSuggestedAction, ...] | None = None,
     prefetched_control_actions: tuple[UrbanControlAction, ...] | None = None,
+    prefetched_legalization: IntentLegalizationPrecompute | None = None,
     diagnostics: dict[str, Any] | None = None,
 ) -> UrbanTurnIntent:
     submitted_with_selected_ids = bool((selected_story_action_id or "").strip() or (selected_suggestion_id or "").strip())
@@ -3597,14 +3718,27 @@ def parse_turn_intent(
         diagnostics.setdefault("intent_llm_control_used", False)
         diagnostics.setdefault("intent_tradeoff_markers", "")
     clause_intents = _extract_clause_intents(plan, input_text)
+    if prefetched_legalization is not None:
+        prefetched_suggestions = prefetched_legalization.suggestions
+        prefetched_control_actions = prefetched_legalization.control_actions
     suggestions = list(prefetched_suggestions) if prefetched_suggestions is not None else build_suggested_actions(plan, state)
-    nearest_suggestion = _nearest_legal_suggestion(plan, suggestions, input_text)
+    nearest_suggestion = _nearest_legal_suggestion(
+        plan,
+        suggestions,
+        input_text,
+        suggestion_terms=prefetched_legalization.suggestion_terms if prefetched_legalization is not None else None,
+    )
     selected_story_id = selected_story_action_id or selected_suggestion_id
     normalized_input = _normalize_user_text(input_text)
     if selected_story_id is None and normalized_input:
-        prompt_matched = next((item for item in suggestions if _normalize_user_text(item.prompt) == normalized_input), None)
-        if prompt_matched is not None:
-            selected_story_id = prompt_matched.suggestion_id
+        if prefetched_legalization is not None:
+            selected_story_id = prefetched_legalization.suggestion_ids_by_prompt.get(normalized_input)
+        else:
+            prompt_matched = next(
+                (item for item in suggestions if _normalize_user_text(item.prompt) == normalized_input), None
+            )
+            if prompt_matched is not None:
+                selected_story_id = prompt_matched.suggestion_id
     control_actions = (
         list(prefetched_control_actions)
         if prefetched_control_actions is not None
@@ -3669,6 +3803,9 @@ def parse_turn_intent(
         candidate=candidate,
         nearest_suggestion=nearest_suggestion,
         suggestions=suggestions,
+        allowed_move_families=(
+            prefetched_legalization.allowed_move_families if prefetched_legalization is not None else None
+        ),
     )
     move_family = legalized.move_family
     target_id = legalized.target_id
@@ -3835,6 +3972,153 @@ def parse_turn_intent(
     )
 
 
+@dataclass(frozen=True)
+class _MicroSimSpeculation:
+    intent: UrbanTurnIntent
+    future: Any
+
+
+def _micro_sim_intent_key(intent: UrbanTurnIntent) -> tuple[str, str | None, str, str]:
+    # Every intent field the micro-sim reads; a speculative result is only
+    # reusable when the compiled intent agrees on all of them.
+    return (intent.move_family, intent.target_id, intent.scene_frame, intent.control_action)
+
+
+def _timed_npc_micro_sim(
+    *,
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    intent: UrbanTurnIntent,
+    gateway: PlayLLMGateway | None,
+) -> tuple[_NpcMicroSimResult | None, dict[str, Any], float]:
+    diagnostics: dict[str, Any] = {}
+    started = time.perf_counter()
+    result = _run_npc_micro_sim(plan=plan, state=state, intent=intent, gateway=gateway, diagnostics=diagnostics)
+    return result, diagnostics, (time.perf_counter() - started) * 1000
+
+
+def _start_micro_sim_speculation(
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    input_text: str,
+    *,
+    gateway: PlayLLMGateway | None,
+    selected_control_action_id: str | None,
+    control_action: LatentEventControl | None,
+    control_target_kind: str | None,
+    control_target_id: str | None,
+    control_target_mode: str | None,
+    prefetched_suggestions: tuple[UrbanSuggestedAction, ...],
+    prefetched_control_actions: tuple[UrbanControlAction, ...],
+    diagnostics: dict[str, Any],
+    prefetched_legalization: IntentLegalizationPrecompute | None = None,
+) -> _MicroSimSpeculation | None:
+    """Start the micro-sim on the heuristic intent while the LLM compile runs.
+
+    Speculation only pays off when both calls would go to the LLM, so the
+    intent and micro-sim gates are checked first; the heuristic intent comes
+    from ``parse_turn_intent`` without a gateway, which is exactly the
+    fallback the compiled intent is legalized against.
+    """
+    started = time.perf_counter()
+    settings = get_settings()
+    if gateway is None:
+        diagnostics["micro_sim_speculative_status"] = "skipped:gateway_unavailable"
+        return None
+    segment = _resolved_segment(plan, state)
+    micro_sim_llm, _ = _should_invoke_micro_sim_llm(plan=plan, state=state, segment_role=segment.segment_role)
+    if (
+        segment.segment_role not in {"misread", "pressure", "reveal", "terminal"}
+        or not micro_sim_llm
+        or not _live_llm_calls_enabled(settings=settings, flag_attr="play_v2_micro_sim_use_llm")
+    ):
+        diagnostics["micro_sim_speculative_status"] = "skipped:micro_sim_heuristic"
+        return None
+    scratch: dict[str, Any] = {}
+    heuristic_intent = parse_turn_intent(
+        plan,
+        state,
+        input_text,
+        gateway=None,
+        selected_control_action_id=selected_control_action_id,
+        control_action=control_action,
+        control_target_kind=control_target_kind,
+        control_target_id=control_target_id,
+        control_target_mode=control_target_mode,
+        prefetched_suggestions=prefetched_suggestions,
+        prefetched_control_actions=prefetched_control_actions,
+        prefetched_legalization=prefetched_legalization,
+        diagnostics=scratch,
+    )
+    if scratch.get("intent_llm_status") != "gateway_unavailable":
+        # The intent LLM gate is closed (or live calls are off), so the
+        # compile is heuristic and there is nothing to overlap with.
+        diagnostics["micro_sim_speculative_status"] = "skipped:intent_heuristic"
+        return None
+    future = submit_speculation(
+        _timed_npc_micro_sim,
+        plan=plan,
+        state=state,
+        intent=heuristic_intent,
+        gateway=gateway,
+    )
+    diagnostics["micro_sim_speculative_overhead_ms"] = round((time.perf_counter() - started) * 1000, 4)
+    return _MicroSimSpeculation(intent=heuristic_intent, future=future)
+
+
+def _resolve_micro_sim_speculation(
+    speculation: _MicroSimSpeculation,
+    *,
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    intent: UrbanTurnIntent,
+    gateway: PlayLLMGateway | None,
+    diagnostics: dict[str, Any],
+) -> _NpcMicroSimResult | None:
+    hit = _micro_sim_intent_key(intent) == _micro_sim_intent_key(speculation.intent)
+    diagnostics["micro_sim_speculative_saved_ms"] = 0.0
+    diagnostics["micro_sim_speculative_wasted_total_tokens"] = 0
+    diagnostics["micro_sim_speculative_abandoned"] = False
+    if hit:
+        wait_started = time.perf_counter()
+        try:
+            result, speculative_diagnostics, speculative_latency_ms = speculation.future.result()
+        except Exception:  # noqa: BLE001
+            diagnostics["micro_sim_speculative_status"] = "error"
+            hit = False
+        else:
+            wait_ms = (time.perf_counter() - wait_started) * 1000
+            diagnostics.update(speculative_diagnostics)
+            diagnostics["micro_sim_speculative_status"] = "hit"
+            diagnostics["micro_sim_speculative_latency_ms"] = round(speculative_latency_ms, 4)
+            diagnostics["micro_sim_speculative_saved_ms"] = round(max(speculative_latency_ms - wait_ms, 0.0), 4)
+    else:
+        diagnostics["micro_sim_speculative_status"] = "miss"
+        if speculation.future.done() and speculation.future.exception() is None:
+            _, speculative_diagnostics, _ = speculation.future.result()
+            wasted = {
+                key: int(speculative_diagnostics.get(key, 0) or 0)
+                for key in ("micro_sim_input_tokens", "micro_sim_output_tokens", "micro_sim_total_tokens")
+            }
+            diagnostics["micro_sim_speculative_wasted_total_tokens"] = wasted["micro_sim_total_tokens"]
+        else:
+            speculation.future.cancel()
+            diagnostics["micro_sim_speculative_abandoned"] = True
+            wasted = {}
+    record_speculation_outcome(hit)
+    diagnostics["micro_sim_speculative_hit"] = hit
+    diagnostics["micro_sim_speculative_hit_rate"] = round(speculation_hit_rate(), 4)
+    if hit:
+        return result
+    micro_sim = _run_npc_micro_sim(plan=plan, state=state, intent=intent, gateway=gateway, diagnostics=diagnostics)
+    if diagnostics["micro_sim_speculative_status"] == "miss":
+        # Discarded speculative calls were still billed, so they stay in the
+        # micro-sim token totals.
+        for key, value in wasted.items():
+            diagnostics[key] = int(diagnostics.get(key, 0) or 0) + value
+    return micro_sim
+
+
 def run_intent_stage(
     plan: CompiledPlayPlan,
     state: UrbanWorldState,
@@ -3853,6 +4137,7 @@ def run_intent_stage(
     precomputed_diagnostics: dict[str, Any] | None = None,
     prefetched_suggestions: tuple[UrbanSuggestedAction, ...] | None = None,
     prefetched_control_actions: tuple[UrbanControlAction, ...] | None = None,
+    prefetched_legalization: IntentLegalizationPrecompute | None = None,
 ) -> tuple[UrbanTurnIntent, _NpcMicroSimResult | None, dict[str, Any]]:
     diagnostics: dict[str, Any] = dict(precomputed_diagnostics or {})
     stage_started = time.perf_counter()
@@ -3878,6 +4163,32 @@ def run_intent_stage(
         diagnostics["micro_sim_output_tokens"] = 0
         diagnostics["micro_sim_total_tokens"] = 0
         return intent, precomputed_micro_sim, diagnostics
+    if prefetched_legalization is not None:
+        prefetched_suggestions = prefetched_legalization.suggestions
+        prefetched_control_actions = prefetched_legalization.control_actions
+    speculation: _MicroSimSpeculation | None = None
+    if bool(getattr(get_settings(), "play_v2_micro_sim_speculative_enabled", False)) and not (
+        (selected_story_action_id or "").strip() or (selected_suggestion_id or "").strip()
+    ):
+        if prefetched_suggestions is None:
+            prefetched_suggestions = tuple(build_suggested_actions(plan, state))
+        if prefetched_control_actions is None:
+            prefetched_control_actions = tuple(build_control_actions(plan, state))
+        speculation = _start_micro_sim_speculation(
+            plan,
+            state,
+            input_text,
+            gateway=gateway,
+            selected_control_action_id=selected_control_action_id,
+            control_action=control_action,
+            control_target_kind=control_target_kind,
+            control_target_id=control_target_id,
+            control_target_mode=control_target_mode,
+            prefetched_suggestions=prefetched_suggestions,
+            prefetched_control_actions=prefetched_control_actions,
+            diagnostics=diagnostics,
+            prefetched_legalization=prefetched_legalization,
+        )
     parse_started = time.perf_counter()
     intent = parse_turn_intent(
         plan,
@@ -3893,6 +4204,7 @@ def run_intent_stage(
         control_target_mode=control_target_mode,
         prefetched_suggestions=prefetched_suggestions,
         prefetched_control_actions=prefetched_control_actions,
+        prefetched_legalization=prefetched_legalization,
         diagnostics=diagnostics,
     )
     parse_latency_ms = (time.perf_counter() - parse_started) * 1000
@@ -3900,13 +4212,23 @@ def run_intent_stage(
     diagnostics["intent_compile_source"] = intent.intent_compile_source
     diagnostics["control_source"] = intent.control_source
     micro_started = time.perf_counter()
-    micro_sim = _run_npc_micro_sim(
-        plan=plan,
-        state=state,
-        intent=intent,
-        gateway=gateway,
-        diagnostics=diagnostics,
-    )
+    if speculation is not None:
+        micro_sim = _resolve_micro_sim_speculation(
+            speculation,
+            plan=plan,
+            state=state,
+            intent=intent,
+            gateway=gateway,
+            diagnostics=diagnostics,
+        )
+    else:
+        micro_sim = _run_npc_micro_sim(
+            plan=plan,
+            state=state,
+            intent=intent,
+            gateway=gateway,
+            diagnostics=diagnostics,
+        )
     diagnostics["intent_micro_sim_stage_latency_ms"] = round((time.perf_counter() - micro_started) * 1000, 4)
     diagnostics["intent_stage_latency_ms"] = round((time.perf_counter() - stage_started) * 1000, 4)
     intent_input_tokens = int(diagnostics.get("intent_llm_input_tokens", 0) or 0)
@@ -4002,12 +4324,14 @@ def _apply_relationship_delta(state: UrbanWorldState, target_id: str | None, mov
     if target_id is None or target_id not in state.relationships:
         return
     target = state.relationships[target_id]
+    before = relationship_values(target)
     deltas = MOVE_DELTAS[move_family]
     target.affection = _clamp(target.affection + deltas.get("affection", 0), -3, 6)
     target.trust = _clamp(target.trust + deltas.get("trust", 0), -3, 6)
     target.tension = _clamp(target.tension + deltas.get("tension", 0), 0, 6)
     target.suspicion = _clamp(target.suspicion + deltas.get("suspicion", 0), 0, 6)
     target.dependency = _clamp(target.dependency + deltas.get("dependency", 0), 0, 6)
+    record_relationship_change(target_id, before, target)
 
 
 def _update_commitment_target(mind: NpcMindState, target_id: str | None) -> None:
@@ -4030,6 +4354,7 @@ def _apply_npc_mind_delta(
     if target_id is None or target_id not in state.npc_mind_states:
         return
     mind = state.npc_mind_states[target_id]
+    mind_before = mind_bar_values(mind)
     relationship = state.relationships.get(target_id)
     if move_family == "comfort":
         mind.trust = _clamp(mind.trust + 2, -3, 6)
@@ -4080,12 +4405,15 @@ def _apply_npc_mind_delta(
     elif move_family == "jealousy_trigger":
         mind.jealousy = _clamp(mind.jealousy + 2, 0, 6)
         mind.tension = _clamp(mind.tension + 1, 0, 6)
+    record_mind_change(target_id, mind_before, mind)
     if relationship is not None:
+        relationship_before = relationship_values(relationship)
         relationship.trust = mind.trust
         relationship.affection = mind.affection
         relationship.tension = mind.tension
         relationship.suspicion = mind.suspicion
         relationship.dependency = mind.dependency
+        record_relationship_change(target_id, relationship_before, relationship)
 
 
 def _derive_npc_scene_frame(
@@ -4148,7 +4476,9 @@ def _update_route(state: UrbanWorldState, target_id: str | None, move_family: Re
     )
     state.current_route_target_id = best_target_id
     if move_family in {"ally_with", "private_confession"}:
-        state.route_lock = _clamp(state.route_lock + 1, 0, 6)
+        route_lock = state.route_lock
+        state.route_lock = _clamp(route_lock + 1, 0, 6)
+        record_global_change("route_lock", route_lock, state.route_lock)
 
 
 def _resolve_lane_id_for_intent(
@@ -4229,11 +4559,13 @@ def _apply_relationship_deltas(
     relationship = state.relationships.get(relationship_id)
     if relationship is None:
         return False
+    before = relationship_values(relationship)
     relationship.affection = _clamp(relationship.affection + int(deltas.get("affection", 0)), -3, 6)
     relationship.trust = _clamp(relationship.trust + int(deltas.get("trust", 0)), -3, 6)
     relationship.tension = _clamp(relationship.tension + int(deltas.get("tension", 0)), 0, 6)
     relationship.suspicion = _clamp(relationship.suspicion + int(deltas.get("suspicion", 0)), 0, 6)
     relationship.dependency = _clamp(relationship.dependency + int(deltas.get("dependency", 0)), 0, 6)
+    record_relationship_change(relationship_id, before, relationship)
     return True
 
 
@@ -4252,6 +4584,7 @@ def _apply_global_delta(state: UrbanWorldState, key: str, delta: int) -> None:
         setattr(state, key, _clamp(current + int(delta), 0, 6))
     else:
         setattr(state, key, current + int(delta))
+    record_global_change(key, current, int(getattr(state, key)))
 
 
 def _ensure_two_sided_cost_exchange(
@@ -4302,7 +4635,9 @@ def _ensure_two_sided_cost_exchange(
         )
         required_loss = max(0, int(min_payer_loss) - existing_loss)
         if required_loss > 0:
+            relationship_before = relationship_values(after_rel)
             after_rel.tension = _clamp(after_rel.tension + required_loss, 0, 6)
+            record_relationship_change(payer_id, relationship_before, after_rel)
             payer_loss_committed = True
         else:
             payer_loss_committed = existing_loss > 0
@@ -4321,12 +4656,16 @@ def _ensure_two_sided_cost_exchange(
         )
         required_gain = max(0, int(min_beneficiary_gain) - existing_gain)
         if required_gain > 0:
+            relationship_before = relationship_values(after_rel)
             after_rel.trust = _clamp(after_rel.trust + required_gain, -3, 6)
+            record_relationship_change(beneficiary_id, relationship_before, after_rel)
             beneficiary_gain_committed = True
         else:
             beneficiary_gain_committed = existing_gain > 0
     elif beneficiary_id and beneficiary_id != payer_id:
-        state.route_lock = _clamp(state.route_lock + max(1, int(min_beneficiary_gain)), 0, 6)
+        route_lock = state.route_lock
+        state.route_lock = _clamp(route_lock + max(1, int(min_beneficiary_gain)), 0, 6)
+        record_global_change("route_lock", route_lock, state.route_lock)
         beneficiary_gain_committed = True
 
     return payer_loss_committed, beneficiary_gain_committed
@@ -4513,10 +4852,10 @@ def apply_turn_resolution(
     )
     deltas = MOVE_DELTAS[intent.move_family]
     state.turn_index += 1
-    state.scene_heat = _clamp(state.scene_heat + deltas.get("heat", 0) + (1 if intent.scene_frame == "public" else 0), 0, 6)
-    state.public_image = _clamp(state.public_image + deltas.get("public_image", 0), 0, 6)
-    state.secret_exposure = _clamp(state.secret_exposure + deltas.get("secret_exposure", 0), 0, 6)
-    state.route_lock = _clamp(state.route_lock + deltas.get("route_lock", 0), 0, 6)
+    _apply_global_delta(state, "scene_heat", deltas.get("heat", 0) + (1 if intent.scene_frame == "public" else 0))
+    _apply_global_delta(state, "public_image", deltas.get("public_image", 0))
+    _apply_global_delta(state, "secret_exposure", deltas.get("secret_exposure", 0))
+    _apply_global_delta(state, "route_lock", deltas.get("route_lock", 0))
     _apply_relationship_delta(state, intent.target_id, intent.move_family)
     _update_route(state, intent.target_id, intent.move_family)
     _apply_npc_mind_delta(plan, state, intent.target_id, intent.move_family, intent.scene_frame)
@@ -4796,7 +5135,10 @@ def apply_turn_resolution(
         consequence_tags=consequence_tags,
         required_tags=required_turn_tags,
     )
-    state.latent_radar = list(latent_outcome.latent_radar[:4])
+    latent_radar = list(latent_outcome.latent_radar[:4])
+    if latent_radar != state.latent_radar:
+        record_latent_radar_change()
+    state.latent_radar = latent_radar
     state.last_turn_public_event_text = directed_outcome.public_event_text or (
         triggered_record.text if triggered_record is not None and triggered_record.kind in {"public_wave", "secret_pressure"} else None
     )
@@ -5242,6 +5584,9 @@ class NarrationComposeInput(BaseModel):
     style_card: dict[str, Any]
     storylet_hints: list[dict[str, Any]] = Field(default_factory=list, max_length=3)
     memory_context: dict | None = None
+    # Content key of memory_context (narration_memory_key); lets the rendered
+    # prompt section be shared between compose prewarm and the submitted turn.
+    _memory_context_key: tuple | None = PrivateAttr(default=None)
 
 
 class NarrationComposeOutput(BaseModel):
@@ -5252,7 +5597,12 @@ class NarrationComposeOutput(BaseModel):
     length_profile: Literal["short", "normal", "burst"] = "normal"
 
 
-def _selected_dramatic_example_texts(segment: CompiledSegment, style_hints: ToneExampleStyleHints) -> dict[str, str]:
+def _selected_dramatic_example_texts(
+    segment: CompiledSegment,
+    style_hints: ToneExampleStyleHints,
+    *,
+    example_texts_by_bucket: dict[str, str] | None = None,
+) -> dict[str, str]:
     explicit_cases = {
         case_id: trim_text(text, 260)
         for case_id, text in style_hints.style_case_text_items
@@ -5263,6 +5613,9 @@ def _selected_dramatic_example_texts(segment: CompiledSegment, style_hints: Tone
     bucket_ids = tuple(style_hints.used_bucket_ids)
     if not bucket_ids:
         return {}
+    if example_texts_by_bucket is not None:
+        wanted = set(bucket_ids)
+        return {bucket_id: text for bucket_id, text in example_texts_by_bucket.items() if bucket_id in wanted}
     all_items = [
         *segment.template_tone_example_lines,
         *segment.template_tone_scene_examples,
@@ -5308,6 +5661,7 @@ def _selected_style_cases_for_compose(
     *,
     preferred_bucket_ids: tuple[str, ...] = (),
     max_cases: int = 3,
+    example_texts_by_bucket: dict[str, str] | None = None,
 ) -> tuple[tuple[str, str], ...]:
     layer_order = {"primary": 0, "supporting": 1, "fallout": 2}
     explicit: list[tuple[str, str]] = []
@@ -5329,7 +5683,11 @@ def _selected_style_cases_for_compose(
     selected: list[tuple[str, str]] = explicit[: max(1, max_cases)]
     seen_ids = {item[0] for item in selected}
     if len(selected) < 2:
-        for case_id, text in _selected_dramatic_example_texts(segment, style_hints).items():
+        for case_id, text in _selected_dramatic_example_texts(
+            segment,
+            style_hints,
+            example_texts_by_bucket=example_texts_by_bucket,
+        ).items():
             if not case_id or not text or case_id in seen_ids:
                 continue
             selected.append((case_id, trim_text(text, 260)))
@@ -5659,7 +6017,7 @@ def _auto_fire_storylets(plan: CompiledPlayPlan, state: UrbanWorldState) -> list
     matches = find_matching_storylets(state, plan, max_count=3, min_score=0.5)
     if not matches:
         return []
-    pool_by_id = {storylet.storylet_id: storylet for storylet in storylet_pool_iter(plan)}
+    pool_by_id = storylet_pool_index(plan).by_id
     fired: list[StoryletFireResult] = []
     for match in matches:
         if len(fired) >= MAX_AUTO_FIRES_PER_TURN:
@@ -5683,8 +6041,7 @@ def fire_player_chosen_storylet(
     Bypasses preconditions (the runtime presented this option, the player chose
     it — we honour that). Cooldown is still enforced.
     """
-    pool_by_id = {storylet.storylet_id: storylet for storylet in storylet_pool_iter(plan)}
-    storylet = pool_by_id.get(storylet_id)
+    storylet = storylet_pool_index(plan).by_id.get(storylet_id)
     if storylet is None:
         return None
     return fire_storylet(storylet, state, plan, bypass_preconditions=True)
@@ -5882,6 +6239,18 @@ def _memory_context_has_content(memory_context: dict | None) -> bool:
 
 
 def _memory_context_prompt_section(compose_input: NarrationComposeInput) -> tuple[str, int]:
+    memory_key = compose_input._memory_context_key
+    if memory_key is None:
+        return _render_memory_context_prompt_section(compose_input)
+    target_id = str(dict(compose_input.fact_pack or {}).get("target_id") or "").strip()
+    return memoised_memory_prompt_section(
+        memory_key,
+        target_id,
+        lambda: _render_memory_context_prompt_section(compose_input),
+    )
+
+
+def _render_memory_context_prompt_section(compose_input: NarrationComposeInput) -> tuple[str, int]:
     memory_context = compose_input.memory_context
     if not _memory_context_has_content(memory_context):
         return "", 0
@@ -6089,6 +6458,7 @@ def _build_narration_compose_input(
         style_hints,
         preferred_bucket_ids=preferred_bucket_ids,
         max_cases=max_cases,
+        example_texts_by_bucket=_segment_artefacts(plan, segment).example_texts_by_bucket,
     )
     soft_avoid_stems = _soft_avoid_stems_from_recent(state=state, style_hints=style_hints)
     soft_deweight_stems = _soft_deweight_stems(
@@ -6284,12 +6654,14 @@ def _build_narration_compose_input(
         )
         if item and item != "unknown"
     ]
+    memory_key = narration_memory_key(state, plan=plan, current_turn_npc_ids=current_turn_npc_ids)
     memory_context = build_narration_memory_context(
         state,
         plan=plan,
         current_turn_npc_ids=current_turn_npc_ids,
+        key=memory_key,
     )
-    return NarrationComposeInput(
+    compose_input = NarrationComposeInput(
         fact_pack=fact_pack,
         style_cases=[
             {"case_id": case_id, "text": trim_text(text, 260)}
@@ -6299,6 +6671,8 @@ def _build_narration_compose_input(
         storylet_hints=[dict(item) for item in list(storylet_hints or [])[:3]],
         memory_context=memory_context,
     )
+    compose_input._memory_context_key = memory_key
+    return compose_input
 
 
 def _deterministic_compose_output(compose_input: NarrationComposeInput) -> NarrationComposeOutput:
@@ -6518,70 +6892,104 @@ def _compose_narration_once_with_regen(
         return fallback_text, "fallback", diagnostics
     max_output_tokens = int(getattr(settings, "play_v2_dramatic_rewrite_max_output_tokens", 360) or 360)
     diagnostics["memory_context_total_chars_sent"] = memory_context_chars if memory_context_prompt_section else 0
+    storylet_prompt_section = _storylet_hint_prompt_section(compose_input.storylet_hints)
+    system_prompt = (
+        "你是中文都市关系戏文案作者。请基于给定事实包、style_cases 和 style_card 写一段自然叙事。"
+        "重点是口吻自然、节奏有变化、角色感清晰、现场动作细节可感。"
+        "请优先体现角色差异化表达，尽量避免重复沿用 soft_avoid_stems 里的句干。"
+        "soft_deweight_stems 是近期高频判词降权清单，请尽量换成具体动作和对话。"
+        "可参考 style_card.narrative_technique_card 选择叙述手法，避免每句都写成结论。"
+        "可参考 style_card.move_expression_hints 为同一动作切换表达路径。"
+        "可参考 style_card.voice_phrase_hints 与 voice_hints 写出口吻差异，不要原样复读 line_stub。"
+        "可参考 style_card.control_contract 体现换手感：谁先让步、代价如何落地、拒绝后如何升级、旁观者看到了什么。"
+        "即便是 comfort/flirt/ally_with 这类软动作，也要写出可观测换手，不要只停留在安抚语气。"
+        "可参考 style_card.compose_control_contract_hint_weight 与 compose_evidence_hint_weight 调整强调强度。"
+        f"{storylet_prompt_section}"
+        "不得新增角色、事件或改写既定状态结果。"
+        f"{memory_context_prompt_section}"
+        "叙事中必须自然融入 style_card.shell_tokens 中的至少一个场域关键词，场域特征要渗透到动作和对白里，不能只是装饰。"
+        "输出 JSON: {\"narration\":\"...\",\"coverage_marks\":{\"target\":true,\"move\":true,\"consequence\":true,\"relationship\":true},\"length_profile\":\"short|normal|burst\"}。"
+    )
+    compose_input_payload = compose_input.model_dump(mode="json")
+
+    def _attempt(attempt: int, *, candidate_index: int = 0) -> _ComposeAttempt:
+        return _run_compose_attempt(
+            gateway=gateway,
+            system_prompt=system_prompt,
+            compose_input_payload=compose_input_payload,
+            attempt=attempt,
+            candidate_index=candidate_index,
+            turn_complexity=turn_complexity,
+            max_output_tokens=max_output_tokens,
+            # Retries relax the shell-token check; hedged candidates are all
+            # first attempts and keep it.
+            shell_tokens=shell_tokens if attempt < 1 else (),
+        )
+
+    def _commit(result: _ComposeAttempt, *, retry_count: int, source: str) -> tuple[str, str, dict[str, int | float | str | bool]]:
+        record_compose_latency(result.latency_ms)
+        length_profile = result.output.length_profile if result.output is not None else "normal"
+        diagnostics["compose_retry_count"] = retry_count
+        diagnostics["blocked_stems_hit"] = False
+        diagnostics["compose_invalid_reason"] = ""
+        diagnostics["fallback_reason"] = "none"
+        diagnostics["length_profile"] = f"{length_profile}:{_sentence_count(result.rendered)}"
+        diagnostics["compose_input_tokens"] = _usage_token_count(result.usage, "input_tokens")
+        diagnostics["compose_output_tokens"] = _usage_token_count(result.usage, "output_tokens")
+        diagnostics["compose_total_tokens"] = _usage_token_count(result.usage, "total_tokens")
+        diagnostics["compose_latency_ms"] = round((time.perf_counter() - compose_started) * 1000, 4)
+        diagnostics["narration_compose_source"] = source
+        return result.rendered, source, diagnostics
+
+    max_attempts = 3
+    first_sequential_attempt = 0
     last_invalid_label = ""
-    for attempt in range(3):
-        try:
-            storylet_prompt_section = _storylet_hint_prompt_section(compose_input.storylet_hints)
-            response = gateway._invoke_json(
-                system_prompt=(
-                    "你是中文都市关系戏文案作者。请基于给定事实包、style_cases 和 style_card 写一段自然叙事。"
-                    "重点是口吻自然、节奏有变化、角色感清晰、现场动作细节可感。"
-                    "请优先体现角色差异化表达，尽量避免重复沿用 soft_avoid_stems 里的句干。"
-                    "soft_deweight_stems 是近期高频判词降权清单，请尽量换成具体动作和对话。"
-                    "可参考 style_card.narrative_technique_card 选择叙述手法，避免每句都写成结论。"
-                    "可参考 style_card.move_expression_hints 为同一动作切换表达路径。"
-                    "可参考 style_card.voice_phrase_hints 与 voice_hints 写出口吻差异，不要原样复读 line_stub。"
-                    "可参考 style_card.control_contract 体现换手感：谁先让步、代价如何落地、拒绝后如何升级、旁观者看到了什么。"
-                    "即便是 comfort/flirt/ally_with 这类软动作，也要写出可观测换手，不要只停留在安抚语气。"
-                    "可参考 style_card.compose_control_contract_hint_weight 与 compose_evidence_hint_weight 调整强调强度。"
-                    f"{storylet_prompt_section}"
-                    "不得新增角色、事件或改写既定状态结果。"
-                    f"{memory_context_prompt_section}"
-                    "叙事中必须自然融入 style_card.shell_tokens 中的至少一个场域关键词，场域特征要渗透到动作和对白里，不能只是装饰。"
-                    "输出 JSON: {\"narration\":\"...\",\"coverage_marks\":{\"target\":true,\"move\":true,\"consequence\":true,\"relationship\":true},\"length_profile\":\"short|normal|burst\"}。"
-                ),
-                user_payload={
-                    "compose_input": compose_input.model_dump(mode="json"),
-                    "retry_mode": attempt > 0,
-                    "turn_complexity": turn_complexity,
-                },
-                max_output_tokens=max_output_tokens,
-                operation_name="play_v2.narration_compose",
-                plaintext_fallback_key="narration",
-            )
-            payload = response.payload if isinstance(response.payload, dict) else {}
-            if "narration" not in payload and payload.get("rewritten_narration"):
-                payload = {
-                    "narration": payload.get("rewritten_narration"),
-                    "coverage_marks": payload.get("coverage_marks") or {},
-                    "length_profile": payload.get("length_profile") or "normal",
-                }
-            output = NarrationComposeOutput.model_validate(payload)
-            invalid_reasons, rendered = _compose_invalid_reasons(
-                output=output,
-                shell_tokens=shell_tokens if attempt < 1 else (),
-            )
-            if "shell_miss" in invalid_reasons:
-                diagnostics["shell_miss_on_first"] = True
-        except ValidationError:
-            invalid_reasons = ["schema_invalid"]
-            rendered = ""
-        except Exception:
-            invalid_reasons = ["llm_provider_failed"]
-            rendered = ""
-        if not invalid_reasons and rendered:
-            diagnostics["compose_retry_count"] = attempt
-            diagnostics["blocked_stems_hit"] = False
-            diagnostics["compose_invalid_reason"] = ""
-            diagnostics["fallback_reason"] = "none"
-            diagnostics["length_profile"] = f"{output.length_profile}:{_sentence_count(rendered)}"
-            diagnostics["compose_input_tokens"] = _usage_token_count(response.usage, "input_tokens")
-            diagnostics["compose_output_tokens"] = _usage_token_count(response.usage, "output_tokens")
-            diagnostics["compose_total_tokens"] = _usage_token_count(response.usage, "total_tokens")
-            diagnostics["compose_latency_ms"] = round((time.perf_counter() - compose_started) * 1000, 4)
-            diagnostics["narration_compose_source"] = "llm_retry" if attempt > 0 else "llm"
-            return rendered, str(diagnostics["narration_compose_source"]), diagnostics
-        last_invalid_label = ",".join(invalid_reasons[:4])
+    hedge_mode = str(getattr(settings, "play_v2_compose_hedge_mode", "off") or "off")
+    hedge_candidates = min(int(getattr(settings, "play_v2_compose_hedge_candidates", 2) or 1), max_attempts)
+    diagnostics["compose_hedge_mode"] = hedge_mode if hedge_mode in {"parallel", "delayed"} and hedge_candidates > 1 else "off"
+    diagnostics["compose_hedge_launched"] = 0
+    diagnostics["compose_hedge_winner_index"] = -1
+    diagnostics["compose_hedge_cancelled"] = 0
+    diagnostics["compose_hedge_abandoned"] = 0
+    diagnostics["compose_hedge_delay_ms"] = 0.0
+    diagnostics["compose_hedge_extra_total_tokens"] = 0
+    diagnostics["compose_hedge_abandoned_token_budget"] = 0
+    if diagnostics["compose_hedge_mode"] != "off":
+        hedge = run_hedged(
+            lambda index: _attempt(0, candidate_index=index),
+            is_valid=lambda result: result.valid,
+            mode=diagnostics["compose_hedge_mode"],  # type: ignore[arg-type]
+            candidates=hedge_candidates,
+            delay_ms=hedge_delay_ms(
+                percentile=float(getattr(settings, "play_v2_compose_hedge_delay_percentile", 90.0) or 90.0),
+                fallback_ms=float(getattr(settings, "play_v2_compose_hedge_delay_ms", 1500) or 0),
+            ),
+        )
+        diagnostics["compose_hedge_launched"] = hedge.launched
+        diagnostics["compose_hedge_winner_index"] = hedge.winner_index
+        diagnostics["compose_hedge_cancelled"] = hedge.cancelled
+        diagnostics["compose_hedge_abandoned"] = hedge.abandoned
+        diagnostics["compose_hedge_delay_ms"] = round(hedge.delay_ms, 4)
+        # Losing candidates that finished still spent tokens; in-flight ones
+        # are bounded by their output budget since they cannot be cancelled.
+        diagnostics["compose_hedge_extra_total_tokens"] = sum(
+            _usage_token_count(result.usage, "total_tokens") for result in hedge.rejected
+        )
+        diagnostics["compose_hedge_abandoned_token_budget"] = hedge.abandoned * max_output_tokens
+        if any("shell_miss" in result.invalid_reasons for result in hedge.rejected):
+            diagnostics["shell_miss_on_first"] = True
+        if hedge.winner is not None:
+            return _commit(hedge.winner, retry_count=0, source="llm")
+        if hedge.rejected:
+            last_invalid_label = ",".join(hedge.rejected[-1].invalid_reasons[:4])
+        first_sequential_attempt = max(hedge.launched, 1)
+    for attempt in range(first_sequential_attempt, max_attempts):
+        result = _attempt(attempt)
+        if attempt == 0 and "shell_miss" in result.invalid_reasons:
+            diagnostics["shell_miss_on_first"] = True
+        if result.valid:
+            return _commit(result, retry_count=attempt, source="llm_retry" if attempt > 0 else "llm")
+        last_invalid_label = ",".join(result.invalid_reasons[:4])
     diagnostics["compose_retry_count"] = 2
     diagnostics["diversity_guard_hits"] = 0
     diagnostics["compose_invalid_reason"] = last_invalid_label
@@ -6595,6 +7003,76 @@ def _compose_narration_once_with_regen(
     return fallback_text, "fallback", diagnostics
 
 
+@dataclass(frozen=True)
+class _ComposeAttempt:
+    output: NarrationComposeOutput | None
+    rendered: str
+    invalid_reasons: list[str]
+    usage: Any
+    latency_ms: float
+
+    @property
+    def valid(self) -> bool:
+        return self.output is not None and not self.invalid_reasons and bool(self.rendered)
+
+
+def _run_compose_attempt(
+    *,
+    gateway: PlayLLMGateway,
+    system_prompt: str,
+    compose_input_payload: dict[str, Any],
+    attempt: int,
+    candidate_index: int,
+    turn_complexity: Literal["normal", "key_burst"],
+    max_output_tokens: int,
+    shell_tokens: tuple[str, ...],
+) -> _ComposeAttempt:
+    started = time.perf_counter()
+    usage: Any = None
+    output: NarrationComposeOutput | None = None
+    user_payload: dict[str, Any] = {
+        "compose_input": compose_input_payload,
+        "retry_mode": attempt > 0,
+        "turn_complexity": turn_complexity,
+    }
+    if candidate_index > 0:
+        user_payload["candidate_index"] = candidate_index
+    try:
+        response = gateway._invoke_json(
+            system_prompt=system_prompt,
+            user_payload=user_payload,
+            max_output_tokens=max_output_tokens,
+            operation_name="play_v2.narration_compose",
+            plaintext_fallback_key="narration",
+        )
+        usage = response.usage
+        payload = response.payload if isinstance(response.payload, dict) else {}
+        if "narration" not in payload and payload.get("rewritten_narration"):
+            payload = {
+                "narration": payload.get("rewritten_narration"),
+                "coverage_marks": payload.get("coverage_marks") or {},
+                "length_profile": payload.get("length_profile") or "normal",
+            }
+        output = NarrationComposeOutput.model_validate(payload)
+        invalid_reasons, rendered = _compose_invalid_reasons(
+            output=output,
+            shell_tokens=shell_tokens,
+        )
+    except ValidationError:
+        invalid_reasons = ["schema_invalid"]
+        rendered = ""
+    except Exception:
+        invalid_reasons = ["llm_provider_failed"]
+        rendered = ""
+    return _ComposeAttempt(
+        output=output,
+        rendered=rendered,
+        invalid_reasons=invalid_reasons,
+        usage=usage,
+        latency_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
 def _compose_burst_enhance_with_regen(
     *,
     plan: CompiledPlayPlan,
@@ -6887,7 +7365,11 @@ def _render_narration_npc_texture_v2(
         primary_name=beat.target_name,
         turn_index=state.turn_index,
     )
-    style_hints = build_tone_example_style_hints(current_segment, state)
+    style_hints = build_tone_example_style_hints(
+        current_segment,
+        state,
+        pools=_segment_artefacts(plan, current_segment).tone_pools,
+    )
     style_hints = replace(
         style_hints,
         counter_function_role=str(role_lexicon.get("counter_function_role") or "wait_flip"),
@@ -7151,6 +7633,14 @@ def _render_narration_npc_texture_v2(
         "memory_context_revealed_secrets": int(compose_diagnostics.get("memory_context_revealed_secrets") or 0),
         "memory_context_npc_pressure_count": int(compose_diagnostics.get("memory_context_npc_pressure_count") or 0),
         "memory_context_total_chars_sent": int(compose_diagnostics.get("memory_context_total_chars_sent") or 0),
+        "compose_hedge_mode": str(compose_diagnostics.get("compose_hedge_mode") or "off"),
+        "compose_hedge_launched": int(compose_diagnostics.get("compose_hedge_launched") or 0),
+        "compose_hedge_winner_index": int(compose_diagnostics.get("compose_hedge_winner_index", -1)),
+        "compose_hedge_cancelled": int(compose_diagnostics.get("compose_hedge_cancelled") or 0),
+        "compose_hedge_abandoned": int(compose_diagnostics.get("compose_hedge_abandoned") or 0),
+        "compose_hedge_delay_ms": float(compose_diagnostics.get("compose_hedge_delay_ms") or 0.0),
+        "compose_hedge_extra_total_tokens": int(compose_diagnostics.get("compose_hedge_extra_total_tokens") or 0),
+        "compose_hedge_abandoned_token_budget": int(compose_diagnostics.get("compose_hedge_abandoned_token_budget") or 0),
     }
     merged_diagnostics["storylet_matches_ids"] = list(storylet_match_ids)
     return composed_text, merged_diagnostics
@@ -7242,6 +7732,50 @@ def _post_submit_llm_call_count(diagnostics: dict[str, int | float | str | bool]
     return count
 
 
+def resolve_turn_state(
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    intent: UrbanTurnIntent,
+    *,
+    micro_sim: _NpcMicroSimResult | None = None,
+    player_chosen_storylet_id: str | None = None,
+) -> tuple[UrbanWorldState, list[str]]:
+    """Deterministic resolution stage of a turn: move deltas, latent events and storylets.
+
+    Needs no gateway, so ``resolve_turn_state_in_worker`` can run it in a worker
+    process when ``play_v2_turn_worker_processes`` is set.
+    """
+    state, consequence_tags = apply_turn_resolution(
+        plan,
+        state,
+        intent,
+        micro_sim=micro_sim,
+    )
+    # Storylet engine — let author's storylet pool actually affect state.
+    # Two paths:
+    #   - Player picked a storylet card → fire that exact one, bypass preconditions
+    #     (we offered the option, they chose it; cooldown still enforced).
+    #   - Otherwise → auto-fire the highest-scoring matcher hit whose preconditions
+    #     strictly pass (capped at MAX_AUTO_FIRES_PER_TURN).
+    # Reset the per-turn buffer first so a fresh turn always starts clean.
+    reset_turn_storylet_state(state)
+    if player_chosen_storylet_id:
+        player_fire = fire_player_chosen_storylet(plan, state, player_chosen_storylet_id)
+        storylet_fire_results = [player_fire] if player_fire and player_fire.fired else []
+    else:
+        storylet_fire_results = _auto_fire_storylets(plan, state)
+    if storylet_fire_results:
+        # Mirror revealed secrets onto consequence_tags so downstream tag-based
+        # surfaces (narration, ending judge) treat them like any other reveal.
+        consequence_tags = list(consequence_tags)
+        for fire in storylet_fire_results:
+            for sid in [*fire.revealed_secret_ids, *fire.chained_secret_ids]:
+                tag = f"storylet_revealed:{sid}"
+                if tag not in consequence_tags:
+                    consequence_tags.append(tag)
+    return state, consequence_tags
+
+
 def run_turn(
     plan: CompiledPlayPlan,
     state: UrbanWorldState,
@@ -7260,6 +7794,8 @@ def run_turn(
     precomputed_compose: dict[str, Any] | None = None,
     prefetched_suggestions: tuple[UrbanSuggestedAction, ...] | None = None,
     prefetched_control_actions: tuple[UrbanControlAction, ...] | None = None,
+    prefetched_legalization: IntentLegalizationPrecompute | None = None,
+    prefetch_source: str = "not_requested",
     draft_usage: dict[str, int] | None = None,
     draft_call_count: int = 0,
     draft_intent_status: str = "not_requested",
@@ -7277,286 +7813,285 @@ def run_turn(
     submitted_with_selected_ids = bool(
         (selected_story_action_id or "").strip() or (selected_suggestion_id or "").strip()
     )
-    delta_pack_diagnostics = poll_and_apply_pending_delta_pack(plan=plan, state=state)
-    gateway: PlayLLMGateway | None = None
-    gateway_acquire_wait_ms = 0.0
-    needs_live_gateway = (
-        _live_llm_calls_enabled(settings=settings, flag_attr="play_v2_intent_compiler_use_llm")
-        or _live_llm_calls_enabled(settings=settings, flag_attr="play_v2_micro_sim_use_llm")
-        or _live_llm_calls_enabled(settings=settings, flag_attr="play_v2_dramatic_rewrite_use_llm")
-    )
-    if needs_live_gateway:
-        gateway_started = time.perf_counter()
-        try:
-            gateway = get_play_llm_gateway(settings)
-        except PlayGatewayError:
-            gateway = None
-        gateway_acquire_wait_ms = round((time.perf_counter() - gateway_started) * 1000, 4)
-    intent, micro_sim, _intent_diagnostics = run_intent_stage(
-        plan,
-        state,
-        input_text,
-        gateway=gateway,
-        selected_suggestion_id=selected_suggestion_id,
-        selected_story_action_id=selected_story_action_id,
-        selected_control_action_id=selected_control_action_id,
-        control_action=control_action,
-        control_target_kind=control_target_kind,
-        control_target_id=control_target_id,
-        control_target_mode=control_target_mode,
-        precomputed_intent=precomputed_intent,
-        precomputed_micro_sim=precomputed_micro_sim,
-        precomputed_diagnostics=precomputed_intent_diagnostics,
-        prefetched_suggestions=prefetched_suggestions,
-        prefetched_control_actions=prefetched_control_actions,
-    )
-    _intent_diagnostics["gateway_acquire_wait_ms"] = gateway_acquire_wait_ms
-    state, consequence_tags = apply_turn_resolution(
-        plan,
-        state,
-        intent,
-        micro_sim=micro_sim,
-    )
-    # Storylet engine — let author's storylet pool actually affect state.
-    # Two paths:
-    #   - Player picked a storylet card → fire that exact one, bypass preconditions
-    #     (we offered the option, they chose it; cooldown still enforced).
-    #   - Otherwise → auto-fire the highest-scoring matcher hit whose preconditions
-    #     strictly pass (capped at MAX_AUTO_FIRES_PER_TURN).
-    # Reset the per-turn buffer first so a fresh turn always starts clean.
-    reset_turn_storylet_state(state)
-    player_chosen_storylet_id = extract_storylet_id_from_suggestion(
-        selected_story_action_id or selected_suggestion_id
-    )
-    if player_chosen_storylet_id:
-        player_fire = fire_player_chosen_storylet(plan, state, player_chosen_storylet_id)
-        storylet_fire_results = [player_fire] if player_fire and player_fire.fired else []
-    else:
-        storylet_fire_results = _auto_fire_storylets(plan, state)
-    if storylet_fire_results:
-        # Mirror revealed secrets onto consequence_tags so downstream tag-based
-        # surfaces (narration, ending judge) treat them like any other reveal.
-        consequence_tags = list(consequence_tags)
-        for fire in storylet_fire_results:
-            for sid in [*fire.revealed_secret_ids, *fire.chained_secret_ids]:
-                tag = f"storylet_revealed:{sid}"
-                if tag not in consequence_tags:
-                    consequence_tags.append(tag)
-    resolved_segment = _resolved_segment(plan, state)
-    render_state = state.model_copy(deep=True)
-    narration, narration_diagnostics = _render_narration(
-        plan,
-        render_state,
-        intent,
-        intent_diagnostics=_intent_diagnostics,
-        submitted_with_selected_ids=submitted_with_selected_ids,
-        precomputed_compose=precomputed_compose,
-        gateway=gateway,
-    )
-    if state.last_turn_semantic_plan is not None and render_state.last_turn_semantic_plan is not None:
-        state.last_turn_semantic_plan = state.last_turn_semantic_plan.model_copy(
-            update={
-                "style_plan": render_state.last_turn_semantic_plan.style_plan.model_copy(deep=True),
-            }
+    with record_turn_changes(state) as change_log:
+        delta_pack_diagnostics = poll_and_apply_pending_delta_pack(plan=plan, state=state)
+        gateway: PlayLLMGateway | None = None
+        gateway_acquire_wait_ms = 0.0
+        needs_live_gateway = (
+            _live_llm_calls_enabled(settings=settings, flag_attr="play_v2_intent_compiler_use_llm")
+            or _live_llm_calls_enabled(settings=settings, flag_attr="play_v2_micro_sim_use_llm")
+            or _live_llm_calls_enabled(settings=settings, flag_attr="play_v2_dramatic_rewrite_use_llm")
         )
-    state.recent_example_bucket_ids = list(render_state.recent_example_bucket_ids[:6])
-    state.recent_clause_family_ids = list(render_state.recent_clause_family_ids[:6])
-    render_semantic_tag = next((tag for tag in render_state.last_turn_tags if isinstance(tag, str) and tag.startswith("render:")), None)
-    if render_semantic_tag:
-        state.last_turn_tags = _finalize_last_turn_tags(
-            latent_ops=[],
-            consequence_tags=list(state.last_turn_tags),
-            required_tags=[render_semantic_tag],
+        if needs_live_gateway:
+            gateway_started = time.perf_counter()
+            try:
+                gateway = get_play_llm_gateway(settings)
+            except PlayGatewayError:
+                gateway = None
+            gateway_acquire_wait_ms = round((time.perf_counter() - gateway_started) * 1000, 4)
+        intent, micro_sim, _intent_diagnostics = run_intent_stage(
+            plan,
+            state,
+            input_text,
+            gateway=gateway,
+            selected_suggestion_id=selected_suggestion_id,
+            selected_story_action_id=selected_story_action_id,
+            selected_control_action_id=selected_control_action_id,
+            control_action=control_action,
+            control_target_kind=control_target_kind,
+            control_target_id=control_target_id,
+            control_target_mode=control_target_mode,
+            precomputed_intent=precomputed_intent,
+            precomputed_micro_sim=precomputed_micro_sim,
+            precomputed_diagnostics=precomputed_intent_diagnostics,
+            prefetched_suggestions=prefetched_suggestions,
+            prefetched_control_actions=prefetched_control_actions,
+            prefetched_legalization=prefetched_legalization,
         )
-    narration = _commit_semantic_style_after_render(
-        plan=plan,
-        state=state,
-        narration=narration,
-    )
-    narration, invariant_tags = InvariantValidator.validate_and_patch(
-        plan=plan,
-        segment=resolved_segment,
-        state=state,
-        narration=narration,
-    )
-    if invariant_tags:
-        state.last_turn_tags = unique_preserve([*state.last_turn_tags, *invariant_tags])[:8]
-    if state.last_turn_public_event_text:
-        state.last_turn_consequences = unique_preserve(
-            [state.last_turn_public_event_text, *state.last_turn_consequences]
-        )[:8]
-    if state.last_turn_semantic_plan is not None and state.last_turn_semantic_plan.style_plan.key_segment:
-        style_tag = (
-            "style:key_segment_shell_anchor_hit"
-            if state.last_turn_semantic_plan.style_plan.shell_anchor_hit
-            else "style:key_segment_shell_anchor_miss"
+        _intent_diagnostics["gateway_acquire_wait_ms"] = gateway_acquire_wait_ms
+        player_chosen_storylet_id = extract_storylet_id_from_suggestion(
+            selected_story_action_id or selected_suggestion_id
         )
-        state.last_turn_tags = unique_preserve([*state.last_turn_tags, style_tag])[:8]
-    state.last_turn_story_debug_summary = _story_debug_summary(state)
-    segment_advanced = advance_segment_if_ready(plan, state)
-    ending_triggered, _, _ = judge_ending(plan, state)
-    if ending_triggered:
-        clear_delta_pack_future(state.session_id)
-    if segment_advanced and not ending_triggered:
-        scheduled_delta_diagnostics = schedule_next_beat_delta_pack(plan=plan, state=state)
-        for key, value in scheduled_delta_diagnostics.items():
-            delta_pack_diagnostics[key] = value
-    story_actions = [] if ending_triggered else build_suggested_actions(plan, state)
-    control_actions = [] if ending_triggered else build_control_actions(plan, state)
-    suggested_actions = story_actions
-    pattern_redact_terms = tuple(
-        unique_preserve(
-            [
-                *(member.display_name for member in plan.cast),
-                plan.social_arena,
-                "镜头",
-                "热搜",
-                "公屏",
-                "台下",
-                "评审",
-                "名额",
-                "主桌",
-                "会议室",
-            ]
+        resolution_started = time.perf_counter()
+        worker_processes = int(getattr(settings, "play_v2_turn_worker_processes", 0) or 0)
+        if worker_processes > 0:
+            state, intent, consequence_tags, resolution_mode = resolve_turn_state_in_worker(
+                plan,
+                state,
+                intent,
+                micro_sim=micro_sim,
+                player_chosen_storylet_id=player_chosen_storylet_id,
+                max_workers=worker_processes,
+                state_codec_name=str(getattr(settings, "play_session_state_codec", "json")),
+            )
+        else:
+            state, consequence_tags = resolve_turn_state(
+                plan,
+                state,
+                intent,
+                micro_sim=micro_sim,
+                player_chosen_storylet_id=player_chosen_storylet_id,
+            )
+            resolution_mode = "inline"
+        _intent_diagnostics["resolution_stage_mode"] = resolution_mode
+        _intent_diagnostics["resolution_stage_latency_ms"] = round((time.perf_counter() - resolution_started) * 1000, 4)
+        resolved_segment = _resolved_segment(plan, state)
+        render_state = state.model_copy(deep=True)
+        narration, narration_diagnostics = _render_narration(
+            plan,
+            render_state,
+            intent,
+            intent_diagnostics=_intent_diagnostics,
+            submitted_with_selected_ids=submitted_with_selected_ids,
+            precomputed_compose=precomputed_compose,
+            gateway=gateway,
         )
-    )
-    next_fingerprints, next_phrases, next_pattern_fingerprints = append_narration_history(
-        recent_fingerprints=tuple(state.recent_narration_fingerprints),
-        recent_phrases=tuple(state.recent_narration_phrases),
-        recent_pattern_fingerprints=tuple(state.recent_narration_pattern_fingerprints),
-        narration=narration,
-        max_recent=_NARRATION_HISTORY_WINDOW,
-        pattern_redact_terms=pattern_redact_terms,
-    )
-    state.narration = narration
-    state.story_actions = story_actions
-    state.control_actions = control_actions
-    state.suggested_actions = suggested_actions
-    state.recent_narration_fingerprints = next_fingerprints
-    state.recent_narration_phrases = next_phrases
-    state.recent_narration_pattern_fingerprints = next_pattern_fingerprints
-    expected_event_phrase = canonicalize_phrase(narration)[:320]
-    append_narration_event(
-        state,
-        turn_index=state.turn_index,
-        narration=narration,
-        move_family=intent.move_family,
-        target_id=intent.target_id or "",
-    )
-    relationship_deltas_payload: dict[str, dict[str, float]] = {}
-    raw_relationship_deltas = getattr(state, "last_turn_relationship_deltas", {}) or {}
-    if isinstance(raw_relationship_deltas, dict):
-        for character_id, raw_deltas in raw_relationship_deltas.items():
-            if not isinstance(raw_deltas, dict):
-                continue
-            normalized_deltas: dict[str, float] = {}
-            for dimension, raw_value in raw_deltas.items():
-                if dimension not in _MEMORY_CONTEXT_RELATION_DIMENSIONS:
-                    continue
-                try:
-                    normalized_deltas[str(dimension)] = float(raw_value)
-                except Exception:
-                    continue
-            if normalized_deltas:
-                relationship_deltas_payload[str(character_id)] = normalized_deltas
-    if state.narration_event_log:
-        last_event = state.narration_event_log[-1]
-        if last_event.turn_index == state.turn_index and last_event.phrase == expected_event_phrase:
-            state.narration_event_log[-1] = last_event.model_copy(
-                update={"relationship_deltas": relationship_deltas_payload}
+        if state.last_turn_semantic_plan is not None and render_state.last_turn_semantic_plan is not None:
+            state.last_turn_semantic_plan = state.last_turn_semantic_plan.model_copy(
+                update={
+                    "style_plan": render_state.last_turn_semantic_plan.style_plan.model_copy(deep=True),
+                }
             )
-    progress_summary = _build_progress_summary(plan, state)
-    intent_stage_diagnostics: dict[str, int | float | str | bool] = {}
-    for key, value in dict(_intent_diagnostics or {}).items():
-        if isinstance(value, bool):
-            intent_stage_diagnostics[key] = value
-        elif isinstance(value, (int, float, str)) and not isinstance(value, bool):
-            intent_stage_diagnostics[key] = value
-    for key, value in dict(narration_diagnostics or {}).items():
-        if isinstance(value, bool):
-            intent_stage_diagnostics[key] = value
-        elif isinstance(value, (int, float, str)) and not isinstance(value, bool):
-            intent_stage_diagnostics[key] = value
-    for key, value in dict(delta_pack_diagnostics or {}).items():
-        if isinstance(value, bool):
-            intent_stage_diagnostics[key] = value
-        elif isinstance(value, (int, float, str)) and not isinstance(value, bool):
-            intent_stage_diagnostics[key] = value
-    storylet_matches_ids = narration_diagnostics.get("storylet_matches_ids")
-    if isinstance(storylet_matches_ids, list):
-        intent_stage_diagnostics["storylet_matches_ids"] = [
-            str(item).strip()
-            for item in storylet_matches_ids
-            if str(item).strip()
-        ][:3]
-    intent_stage_diagnostics["storylet_matches_count"] = int(
-        narration_diagnostics.get("storylet_matches_count") or 0
-    )
-    hook_callback_tags = [
-        tag
-        for tag in state.last_turn_tags
-        if isinstance(tag, str) and tag.startswith("callback_fired:hook_")
-    ]
-    if hook_callback_tags:
-        intent_stage_diagnostics["hook_callbacks_fired"] = json.dumps(hook_callback_tags, ensure_ascii=False)
-        intent_stage_diagnostics["hook_callbacks_fired_count"] = len(hook_callback_tags)
-    draft_payload = dict(draft_usage or {})
-    draft_input_tokens = int(draft_payload.get("input_tokens", 0) or 0)
-    draft_output_tokens = int(draft_payload.get("output_tokens", 0) or 0)
-    draft_total_tokens = int(draft_payload.get("total_tokens", 0) or 0)
-    if draft_total_tokens <= 0:
-        draft_total_tokens = max(draft_input_tokens + draft_output_tokens, 0)
-    resolved_compose_prewarm_total_tokens = max(int(compose_prewarm_total_tokens or 0), 0)
-    resolved_typing_phase_prewarm_tokens = max(int(typing_phase_prewarm_tokens or 0), 0)
-    resolved_read_phase_prewarm_tokens = max(int(read_phase_prewarm_tokens or 0), 0)
-    intent_stage_diagnostics["draft_intent_status"] = str(draft_intent_status or "not_requested")
-    intent_stage_diagnostics["draft_call_count"] = max(int(draft_call_count or 0), 0)
-    intent_stage_diagnostics["draft_input_tokens"] = max(draft_input_tokens, 0)
-    intent_stage_diagnostics["draft_output_tokens"] = max(draft_output_tokens, 0)
-    intent_stage_diagnostics["draft_total_tokens"] = max(draft_total_tokens, 0)
-    intent_stage_diagnostics["compose_prewarm_status"] = str(compose_prewarm_status or "not_requested")
-    intent_stage_diagnostics["compose_prewarm_hit"] = str(compose_prewarm_status or "").strip().lower() == "ready"
-    intent_stage_diagnostics["compose_prewarm_wait_ms"] = round(max(float(compose_prewarm_wait_ms or 0.0), 0.0), 4)
-    intent_stage_diagnostics["compose_prewarm_source"] = str(compose_prewarm_source or "")
-    intent_stage_diagnostics["compose_prewarm_total_tokens"] = resolved_compose_prewarm_total_tokens
-    intent_stage_diagnostics["typing_final_draft_seen"] = bool(typing_final_draft_seen)
-    intent_stage_diagnostics["typing_scope_cleared_count"] = max(int(typing_scope_cleared_count or 0), 0)
-    intent_stage_diagnostics["compose_prewarm_stale_fragment_count"] = max(
-        int(compose_prewarm_stale_fragment_count or 0), 0
-    )
-    intent_stage_total_tokens = int(intent_stage_diagnostics.get("intent_stage_total_tokens") or 0)
-    compose_total_tokens = int(intent_stage_diagnostics.get("compose_total_tokens") or 0)
-    pre_submit_total_tokens = max(
-        draft_total_tokens + resolved_typing_phase_prewarm_tokens + resolved_read_phase_prewarm_tokens,
-        0,
-    )
-    post_submit_total_tokens = max(intent_stage_total_tokens + compose_total_tokens, 0)
-    intent_stage_diagnostics["read_phase_prewarm_tokens"] = resolved_read_phase_prewarm_tokens
-    intent_stage_diagnostics["typing_phase_prewarm_tokens"] = resolved_typing_phase_prewarm_tokens
-    intent_stage_diagnostics["submit_phase_tokens"] = post_submit_total_tokens
-    intent_stage_diagnostics["pre_submit_total_tokens"] = pre_submit_total_tokens
-    intent_stage_diagnostics["post_submit_total_tokens"] = post_submit_total_tokens
-    intent_stage_diagnostics["play_turn_total_tokens"] = pre_submit_total_tokens + post_submit_total_tokens
-    post_submit_llm_calls = _post_submit_llm_call_count(intent_stage_diagnostics)
-    intent_stage_diagnostics["post_submit_llm_calls"] = post_submit_llm_calls
-    intent_stage_diagnostics["single_llm_call_after_submit"] = post_submit_llm_calls <= 1
-    return UrbanTurnResult(
-        plan=plan,
-        state=state,
-        narration=narration,
-        story_actions=story_actions,
-        control_actions=control_actions,
-        suggested_actions=suggested_actions,
-        triggered_latent_event=(state.last_turn_escalations[0] if state.last_turn_escalations else None),
-        latent_radar=list(state.latent_radar[:4]),
-        control_resolution=state.last_turn_control_resolution,
-        segment_advanced=segment_advanced,
-        ending_triggered=ending_triggered,
-        consequence_tags=consequence_tags[:8],
-        progress_summary=progress_summary,
-        intent=intent,
-        intent_stage_diagnostics=intent_stage_diagnostics,
-    )
+        state.recent_example_bucket_ids = list(render_state.recent_example_bucket_ids[:6])
+        state.recent_clause_family_ids = list(render_state.recent_clause_family_ids[:6])
+        render_semantic_tag = next((tag for tag in render_state.last_turn_tags if isinstance(tag, str) and tag.startswith("render:")), None)
+        if render_semantic_tag:
+            state.last_turn_tags = _finalize_last_turn_tags(
+                latent_ops=[],
+                consequence_tags=list(state.last_turn_tags),
+                required_tags=[render_semantic_tag],
+            )
+        narration = _commit_semantic_style_after_render(
+            plan=plan,
+            state=state,
+            narration=narration,
+        )
+        narration, invariant_tags = InvariantValidator.validate_and_patch(
+            plan=plan,
+            segment=resolved_segment,
+            state=state,
+            narration=narration,
+        )
+        if invariant_tags:
+            state.last_turn_tags = unique_preserve([*state.last_turn_tags, *invariant_tags])[:8]
+        if state.last_turn_public_event_text:
+            state.last_turn_consequences = unique_preserve(
+                [state.last_turn_public_event_text, *state.last_turn_consequences]
+            )[:8]
+        if state.last_turn_semantic_plan is not None and state.last_turn_semantic_plan.style_plan.key_segment:
+            style_tag = (
+                "style:key_segment_shell_anchor_hit"
+                if state.last_turn_semantic_plan.style_plan.shell_anchor_hit
+                else "style:key_segment_shell_anchor_miss"
+            )
+            state.last_turn_tags = unique_preserve([*state.last_turn_tags, style_tag])[:8]
+        state.last_turn_story_debug_summary = _story_debug_summary(state)
+        segment_advanced = advance_segment_if_ready(plan, state)
+        ending_triggered, _, _ = judge_ending(plan, state)
+        if ending_triggered:
+            clear_delta_pack_future(state.session_id)
+        if segment_advanced and not ending_triggered:
+            scheduled_delta_diagnostics = schedule_next_beat_delta_pack(plan=plan, state=state)
+            for key, value in scheduled_delta_diagnostics.items():
+                delta_pack_diagnostics[key] = value
+        story_actions = [] if ending_triggered else build_suggested_actions(plan, state)
+        control_actions = [] if ending_triggered else build_control_actions(plan, state)
+        suggested_actions = story_actions
+        pattern_redact_terms = tuple(
+            unique_preserve(
+                [
+                    *(member.display_name for member in plan.cast),
+                    plan.social_arena,
+                    "镜头",
+                    "热搜",
+                    "公屏",
+                    "台下",
+                    "评审",
+                    "名额",
+                    "主桌",
+                    "会议室",
+                ]
+            )
+        )
+        next_fingerprints, next_phrases, next_pattern_fingerprints = append_narration_history(
+            recent_fingerprints=tuple(state.recent_narration_fingerprints),
+            recent_phrases=tuple(state.recent_narration_phrases),
+            recent_pattern_fingerprints=tuple(state.recent_narration_pattern_fingerprints),
+            narration=narration,
+            max_recent=_NARRATION_HISTORY_WINDOW,
+            pattern_redact_terms=pattern_redact_terms,
+        )
+        state.narration = narration
+        state.story_actions = story_actions
+        state.control_actions = control_actions
+        state.suggested_actions = suggested_actions
+        state.recent_narration_fingerprints = next_fingerprints
+        state.recent_narration_phrases = next_phrases
+        state.recent_narration_pattern_fingerprints = next_pattern_fingerprints
+        expected_event_phrase = canonicalize_phrase(narration)[:320]
+        append_narration_event(
+            state,
+            turn_index=state.turn_index,
+            narration=narration,
+            move_family=intent.move_family,
+            target_id=intent.target_id or "",
+        )
+        relationship_deltas_payload: dict[str, dict[str, float]] = {}
+        raw_relationship_deltas = getattr(state, "last_turn_relationship_deltas", {}) or {}
+        if isinstance(raw_relationship_deltas, dict):
+            for character_id, raw_deltas in raw_relationship_deltas.items():
+                if not isinstance(raw_deltas, dict):
+                    continue
+                normalized_deltas: dict[str, float] = {}
+                for dimension, raw_value in raw_deltas.items():
+                    if dimension not in _MEMORY_CONTEXT_RELATION_DIMENSIONS:
+                        continue
+                    try:
+                        normalized_deltas[str(dimension)] = float(raw_value)
+                    except Exception:
+                        continue
+                if normalized_deltas:
+                    relationship_deltas_payload[str(character_id)] = normalized_deltas
+        attach_narration_event_deltas(
+            state,
+            turn_index=state.turn_index,
+            phrase=expected_event_phrase,
+            relationship_deltas=relationship_deltas_payload,
+        )
+        progress_summary = _build_progress_summary(plan, state)
+        intent_stage_diagnostics: dict[str, int | float | str | bool] = {}
+        for key, value in dict(_intent_diagnostics or {}).items():
+            if isinstance(value, bool):
+                intent_stage_diagnostics[key] = value
+            elif isinstance(value, (int, float, str)) and not isinstance(value, bool):
+                intent_stage_diagnostics[key] = value
+        for key, value in dict(narration_diagnostics or {}).items():
+            if isinstance(value, bool):
+                intent_stage_diagnostics[key] = value
+            elif isinstance(value, (int, float, str)) and not isinstance(value, bool):
+                intent_stage_diagnostics[key] = value
+        for key, value in dict(delta_pack_diagnostics or {}).items():
+            if isinstance(value, bool):
+                intent_stage_diagnostics[key] = value
+            elif isinstance(value, (int, float, str)) and not isinstance(value, bool):
+                intent_stage_diagnostics[key] = value
+        storylet_matches_ids = narration_diagnostics.get("storylet_matches_ids")
+        if isinstance(storylet_matches_ids, list):
+            intent_stage_diagnostics["storylet_matches_ids"] = [
+                str(item).strip()
+                for item in storylet_matches_ids
+                if str(item).strip()
+            ][:3]
+        intent_stage_diagnostics["storylet_matches_count"] = int(
+            narration_diagnostics.get("storylet_matches_count") or 0
+        )
+        hook_callback_tags = [
+            tag
+            for tag in state.last_turn_tags
+            if isinstance(tag, str) and tag.startswith("callback_fired:hook_")
+        ]
+        if hook_callback_tags:
+            intent_stage_diagnostics["hook_callbacks_fired"] = json.dumps(hook_callback_tags, ensure_ascii=False)
+            intent_stage_diagnostics["hook_callbacks_fired_count"] = len(hook_callback_tags)
+        draft_payload = dict(draft_usage or {})
+        draft_input_tokens = int(draft_payload.get("input_tokens", 0) or 0)
+        draft_output_tokens = int(draft_payload.get("output_tokens", 0) or 0)
+        draft_total_tokens = int(draft_payload.get("total_tokens", 0) or 0)
+        if draft_total_tokens <= 0:
+            draft_total_tokens = max(draft_input_tokens + draft_output_tokens, 0)
+        resolved_compose_prewarm_total_tokens = max(int(compose_prewarm_total_tokens or 0), 0)
+        resolved_typing_phase_prewarm_tokens = max(int(typing_phase_prewarm_tokens or 0), 0)
+        resolved_read_phase_prewarm_tokens = max(int(read_phase_prewarm_tokens or 0), 0)
+        intent_stage_diagnostics["draft_intent_status"] = str(draft_intent_status or "not_requested")
+        intent_stage_diagnostics["prefetch_source"] = str(prefetch_source or "not_requested")
+        intent_stage_diagnostics["draft_call_count"] = max(int(draft_call_count or 0), 0)
+        intent_stage_diagnostics["draft_input_tokens"] = max(draft_input_tokens, 0)
+        intent_stage_diagnostics["draft_output_tokens"] = max(draft_output_tokens, 0)
+        intent_stage_diagnostics["draft_total_tokens"] = max(draft_total_tokens, 0)
+        intent_stage_diagnostics["compose_prewarm_status"] = str(compose_prewarm_status or "not_requested")
+        intent_stage_diagnostics["compose_prewarm_hit"] = str(compose_prewarm_status or "").strip().lower() == "ready"
+        intent_stage_diagnostics["compose_prewarm_wait_ms"] = round(max(float(compose_prewarm_wait_ms or 0.0), 0.0), 4)
+        intent_stage_diagnostics["compose_prewarm_source"] = str(compose_prewarm_source or "")
+        intent_stage_diagnostics["compose_prewarm_total_tokens"] = resolved_compose_prewarm_total_tokens
+        intent_stage_diagnostics["typing_final_draft_seen"] = bool(typing_final_draft_seen)
+        intent_stage_diagnostics["typing_scope_cleared_count"] = max(int(typing_scope_cleared_count or 0), 0)
+        intent_stage_diagnostics["compose_prewarm_stale_fragment_count"] = max(
+            int(compose_prewarm_stale_fragment_count or 0), 0
+        )
+        intent_stage_total_tokens = int(intent_stage_diagnostics.get("intent_stage_total_tokens") or 0)
+        compose_total_tokens = int(intent_stage_diagnostics.get("compose_total_tokens") or 0)
+        pre_submit_total_tokens = max(
+            draft_total_tokens + resolved_typing_phase_prewarm_tokens + resolved_read_phase_prewarm_tokens,
+            0,
+        )
+        post_submit_total_tokens = max(intent_stage_total_tokens + compose_total_tokens, 0)
+        intent_stage_diagnostics["read_phase_prewarm_tokens"] = resolved_read_phase_prewarm_tokens
+        intent_stage_diagnostics["typing_phase_prewarm_tokens"] = resolved_typing_phase_prewarm_tokens
+        intent_stage_diagnostics["submit_phase_tokens"] = post_submit_total_tokens
+        intent_stage_diagnostics["pre_submit_total_tokens"] = pre_submit_total_tokens
+        intent_stage_diagnostics["post_submit_total_tokens"] = post_submit_total_tokens
+        intent_stage_diagnostics["play_turn_total_tokens"] = pre_submit_total_tokens + post_submit_total_tokens
+        post_submit_llm_calls = _post_submit_llm_call_count(intent_stage_diagnostics)
+        intent_stage_diagnostics["post_submit_llm_calls"] = post_submit_llm_calls
+        intent_stage_diagnostics["single_llm_call_after_submit"] = post_submit_llm_calls <= 1
+        return UrbanTurnResult(
+            plan=plan,
+            state=state,
+            narration=narration,
+            story_actions=story_actions,
+            control_actions=control_actions,
+            suggested_actions=suggested_actions,
+            triggered_latent_event=(state.last_turn_escalations[0] if state.last_turn_escalations else None),
+            latent_radar=list(state.latent_radar[:4]),
+            control_resolution=state.last_turn_control_resolution,
+            segment_advanced=segment_advanced,
+            ending_triggered=ending_triggered,
+            consequence_tags=consequence_tags[:8],
+            progress_summary=progress_summary,
+            intent=intent,
+            intent_stage_diagnostics=intent_stage_diagnostics,
+            change_set=build_turn_change_set(change_log, state),
+        )
 
 
 def run_smoke_playthrough(
@@ -18,13 +18,14 @@ Two firing paths:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Mapping
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from rpg_backend.author_v3.storylet_compiler import Storylet
-from rpg_backend.author_v3.tension_weaver import SecretChain
 from rpg_backend.play_v2.contracts import CompiledPlayPlan, UrbanWorldState
+from rpg_backend.play_v2.storylet_pool import storylet_pool_index
+from rpg_backend.play_v2.turn_changes import record_global_change, record_relationship_change, relationship_values
 
 
 # How many storylets we'll fire automatically per turn (matcher-driven path).
@@ -163,7 +164,7 @@ def fire_storylet(
 
     # 2. Cascade SecretChain unlocks.
     if result.revealed_secret_ids and plan.secret_chains:
-        chained = _cascade_chains(plan.secret_chains, result.revealed_secret_ids)
+        chained = _cascade_chains(storylet_pool_index(plan).chain_adjacency, result.revealed_secret_ids)
         for sid in chained:
             if sid in state.known_secret_ids:
                 continue
@@ -182,7 +183,9 @@ def fire_storylet(
             continue
         new_affection = max(-3, min(6, rel.affection + affection_delta))
         applied_delta = new_affection - rel.affection
+        before = relationship_values(rel)
         rel.affection = new_affection
+        record_relationship_change(char_id, before, rel)
         result.relationship_changes[char_id] = applied_delta
 
     # 4. Tension delta → scene_heat. Positive = ramp up, negative = cool down.
@@ -190,6 +193,7 @@ def fire_storylet(
     if scene_heat_delta != 0:
         new_heat = max(0, min(6, state.scene_heat + scene_heat_delta))
         result.scene_heat_delta = new_heat - state.scene_heat
+        record_global_change("scene_heat", state.scene_heat, new_heat)
         state.scene_heat = new_heat
 
     # 5. Cooldown bookkeeping + per-turn surface.
@@ -212,22 +216,14 @@ def fire_storylet(
     return result
 
 
-def _cascade_chains(chain_dicts: list[dict[str, Any]], trigger_secret_ids: list[str]) -> list[str]:
+def _cascade_chains(chain_adjacency: Mapping[str, tuple[str, ...]], trigger_secret_ids: list[str]) -> list[str]:
     """BFS through SecretChain edges. Trigger A → unlocks B → may itself trigger C..."""
-    chains_by_trigger: dict[str, list[str]] = {}
-    for chain_dict in chain_dicts:
-        try:
-            chain = SecretChain.model_validate(chain_dict)
-        except Exception:  # noqa: BLE001 — bad data shouldn't crash the turn
-            continue
-        chains_by_trigger.setdefault(chain.trigger_secret_id, []).append(chain.unlocks_secret_id)
-
     unlocked: list[str] = []
     queue = list(trigger_secret_ids)
     seen = set(queue)
     while queue:
         current = queue.pop(0)
-        for next_id in chains_by_trigger.get(current, []):
+        for next_id in chain_adjacency.get(current, ()):
             if next_id in seen:
                 continue
             seen.add(next_id)
@@ -248,13 +244,8 @@ def deserialize_storylet(raw: dict[str, Any]) -> Storylet | None:
 
 
 def storylet_pool_iter(plan: CompiledPlayPlan):
-    """Iterate hydrated storylets from plan.storylet_pool, skipping malformed ones."""
-    if not plan.storylet_pool:
-        return
-    for raw in plan.storylet_pool:
-        storylet = deserialize_storylet(raw)
-        if storylet is not None:
-            yield storylet
+    """Iterate the plan's compiled storylets; malformed entries never reach the pool."""
+    yield from storylet_pool_index(plan).storylets
 
 
 def reset_turn_storylet_state(state: UrbanWorldState) -> None:
@@ -4,6 +4,7 @@ from pydantic import BaseModel, ConfigDict
 
 from rpg_backend.author_v3.storylet_compiler import Storylet
 from rpg_backend.play_v2.contracts import CompiledPlayPlan, UrbanWorldState
+from rpg_backend.play_v2.storylet_pool import storylet_pool_index
 
 
 _REQUIRED_SECRETS_WEIGHT = 0.35
@@ -114,12 +115,9 @@ def find_matching_storylets(
     if max_count <= 0 or not plan.storylet_pool:
         return []
 
+    pool = storylet_pool_index(plan)
     matches: list[StoryletMatch] = []
-    for raw_storylet in plan.storylet_pool:
-        try:
-            storylet = Storylet.model_validate(raw_storylet)
-        except Exception:  # noqa: BLE001 — malformed pool entries skipped silently
-            continue
+    for storylet in pool.storylets:
         match_score, matched_conditions = _score_storylet(storylet, state, plan)
         if match_score < min_score:
             continue
@@ -133,8 +131,8 @@ def find_matching_storylets(
                 matched_conditions=matched_conditions,
                 dramatic_weight=float(getattr(storylet, "dramatic_weight", 0.0) or 0.0),
                 cooldown_turns=int(getattr(storylet, "cooldown_turns", 0) or 0),
-                preconditions=storylet.preconditions.model_dump(mode="json"),
-                effects=storylet.effects.model_dump(mode="json"),
+                preconditions=dict(pool.preconditions_by_id[storylet.storylet_id]),
+                effects=dict(pool.effects_by_id[storylet.storylet_id]),
             )
         )
 
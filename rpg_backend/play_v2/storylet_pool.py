@@ -0,0 +1,213 @@
+"""Compiled storylet pools: validated once at publish time, hydrated once per pool.
+
+`plan.storylet_pool` holds raw storylet dicts straight from author_v3. Publishing
+runs them through `compile_plan_storylet_pool`, which rejects malformed entries,
+and stamps the plan with `storylet_pool_digest`, a digest of the pool and secret
+chains it validated. At play time `storylet_pool_index` compiles the pool into
+model objects plus the lookup tables the engine needs (chain adjacency,
+cooldowns, which storylets reveal which secret) and caches the result by pool
+digest. A plan whose pool no longer matches its stamp, or that was published
+before the stamp existed, is recompiled leniently instead.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+from threading import Lock
+from typing import Any
+import weakref
+
+from pydantic import ValidationError
+
+from rpg_backend.author_v2.contracts import CompiledPlayPlan
+from rpg_backend.author_v3.storylet_compiler import Storylet, StoryletCondition, StoryletEffect
+from rpg_backend.author_v3.tension_weaver import SecretChain
+from rpg_backend.play_v2.plan_artefacts import content_artefact
+
+COMPILED_STORYLET_POOL_VERSION = 1
+
+_pool_memo_lock = Lock()
+# id(plan) -> (pool source objects the index was built from, index)
+_pool_memo: dict[int, tuple[tuple[Any, Any], "StoryletPoolIndex"]] = {}
+
+
+class StoryletPoolValidationError(ValueError):
+    def __init__(self, problems: list[str]) -> None:
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+@dataclass(frozen=True)
+class StoryletPoolIndex:
+    storylets: tuple[Storylet, ...] = ()
+    by_id: dict[str, Storylet] = field(default_factory=dict)
+    # Normalised JSON form of each storylet's preconditions/effects, reused by matches.
+    preconditions_by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    effects_by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    chain_adjacency: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    cooldown_turns_by_id: dict[str, int] = field(default_factory=dict)
+    storylet_ids_by_revealed_secret: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+
+def _chain_adjacency(chains: list[SecretChain]) -> dict[str, list[str]]:
+    adjacency: dict[str, list[str]] = {}
+    for chain in chains:
+        targets = adjacency.setdefault(chain.trigger_secret_id, [])
+        if chain.unlocks_secret_id not in targets:
+            targets.append(chain.unlocks_secret_id)
+    return adjacency
+
+
+def _compiled_payload(storylets: list[Storylet], chains: list[SecretChain]) -> dict[str, Any]:
+    revealers: dict[str, list[str]] = {}
+    for storylet in storylets:
+        for secret_id in storylet.effects.secrets_revealed:
+            if secret_id:
+                revealers.setdefault(secret_id, []).append(storylet.storylet_id)
+    return {
+        "version": COMPILED_STORYLET_POOL_VERSION,
+        "storylets": [storylet.model_dump(mode="json") for storylet in storylets],
+        "chain_adjacency": _chain_adjacency(chains),
+        "cooldown_turns": {storylet.storylet_id: storylet.cooldown_turns for storylet in storylets},
+        "storylet_ids_by_revealed_secret": revealers,
+    }
+
+
+def compile_plan_storylet_pool(plan: CompiledPlayPlan) -> dict[str, Any] | None:
+    """Strictly validate the plan's storylet pool and secret chains.
+
+    Raises `StoryletPoolValidationError` listing every malformed storylet, duplicate
+    id or malformed chain, so a bad pool is refused at publish time.
+    """
+    if not plan.storylet_pool and not plan.secret_chains:
+        return None
+    problems: list[str] = []
+    storylets: list[Storylet] = []
+    seen_ids: set[str] = set()
+    for index, raw in enumerate(plan.storylet_pool):
+        try:
+            storylet = Storylet.model_validate(raw)
+        except ValidationError as exc:
+            problems.append(f"storylet_pool[{index}]: {exc.errors()[0].get('msg', 'invalid')}")
+            continue
+        if storylet.storylet_id in seen_ids:
+            problems.append(f"storylet_pool[{index}]: duplicate storylet_id {storylet.storylet_id!r}")
+            continue
+        seen_ids.add(storylet.storylet_id)
+        storylets.append(storylet)
+    chains: list[SecretChain] = []
+    for index, raw in enumerate(plan.secret_chains or []):
+        try:
+            chains.append(SecretChain.model_validate(raw))
+        except ValidationError as exc:
+            problems.append(f"secret_chains[{index}]: {exc.errors()[0].get('msg', 'invalid')}")
+    if problems:
+        raise StoryletPoolValidationError(problems)
+    return _compiled_payload(storylets, chains)
+
+
+def _lenient_payload(plan: CompiledPlayPlan) -> dict[str, Any]:
+    # Plans published before the compiled form existed: keep the old behaviour of
+    # skipping malformed entries, but pay for it once per plan instead of per call.
+    storylets: list[Storylet] = []
+    seen_ids: set[str] = set()
+    for raw in plan.storylet_pool or []:
+        try:
+            storylet = Storylet.model_validate(raw)
+        except Exception:  # noqa: BLE001 — malformed legacy pool entries are skipped
+            continue
+        if storylet.storylet_id in seen_ids:
+            continue
+        seen_ids.add(storylet.storylet_id)
+        storylets.append(storylet)
+    chains: list[SecretChain] = []
+    for raw in plan.secret_chains or []:
+        try:
+            chains.append(SecretChain.model_validate(raw))
+        except Exception:  # noqa: BLE001
+            continue
+    return _compiled_payload(storylets, chains)
+
+
+def _hydrate_storylet(raw: dict[str, Any]) -> Storylet:
+    # The compiled form was validated and fully dumped at publish time, so every
+    # field is present and model_construct can skip validation.
+    return Storylet.model_construct(
+        **{
+            **raw,
+            "preconditions": StoryletCondition.model_construct(**raw["preconditions"]),
+            "effects": StoryletEffect.model_construct(**raw["effects"]),
+        }
+    )
+
+
+def _build_index(plan: CompiledPlayPlan, *, validated: bool) -> StoryletPoolIndex:
+    if not plan.storylet_pool and not plan.secret_chains:
+        return StoryletPoolIndex()
+    compiled = compile_plan_storylet_pool(plan) if validated else _lenient_payload(plan)
+    if compiled is None:
+        return StoryletPoolIndex()
+    raw_storylets = list(compiled.get("storylets") or [])
+    storylets = tuple(_hydrate_storylet(raw) for raw in raw_storylets)
+    return StoryletPoolIndex(
+        storylets=storylets,
+        by_id={storylet.storylet_id: storylet for storylet in storylets},
+        preconditions_by_id={raw["storylet_id"]: raw["preconditions"] for raw in raw_storylets},
+        effects_by_id={raw["storylet_id"]: raw["effects"] for raw in raw_storylets},
+        chain_adjacency={key: tuple(value) for key, value in dict(compiled.get("chain_adjacency") or {}).items()},
+        cooldown_turns_by_id={key: int(value) for key, value in dict(compiled.get("cooldown_turns") or {}).items()},
+        storylet_ids_by_revealed_secret={
+            key: tuple(value) for key, value in dict(compiled.get("storylet_ids_by_revealed_secret") or {}).items()
+        },
+    )
+
+
+def _pool_sources(plan: CompiledPlayPlan) -> tuple[Any, Any]:
+    return (plan.storylet_pool, plan.secret_chains)
+
+
+def storylet_pool_digest(plan: CompiledPlayPlan) -> str:
+    """Digest of the plan's storylet pool and secret chains, as stamped at publish time."""
+    payload = json.dumps(
+        [COMPILED_STORYLET_POOL_VERSION, plan.storylet_pool, plan.secret_chains],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _forget_plan(plan_id: int) -> None:
+    with _pool_memo_lock:
+        _pool_memo.pop(plan_id, None)
+
+
+def storylet_pool_index(plan: CompiledPlayPlan) -> StoryletPoolIndex:
+    """Hydrated storylet pool for ``plan``, shared by every plan with the same pool.
+
+    Keyed by the pool's own digest rather than the whole-plan fingerprint, so plan
+    copies that only differ elsewhere share one index. When the digest matches the
+    plan's publish stamp the pool is known to be valid and compiles strictly;
+    otherwise it is recompiled leniently, skipping malformed entries. A per-object
+    memo skips re-hashing while those fields still hold the same objects.
+    """
+    sources = _pool_sources(plan)
+    plan_id = id(plan)
+    with _pool_memo_lock:
+        memo = _pool_memo.get(plan_id)
+    if memo is not None and all(left is right for left, right in zip(memo[0], sources)):
+        return memo[1]
+    digest = storylet_pool_digest(plan)
+    validated = plan.storylet_pool_digest == digest
+    index = content_artefact(
+        digest,
+        f"storylet_pool:{'validated' if validated else 'lenient'}",
+        lambda: _build_index(plan, validated=validated),
+    )
+    with _pool_memo_lock:
+        if plan_id not in _pool_memo:
+            weakref.finalize(plan, _forget_plan, plan_id)
+        _pool_memo[plan_id] = (sources, index)
+    return index
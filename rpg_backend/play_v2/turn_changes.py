@@ -0,0 +1,235 @@
+"""Per-turn change recording for v2 turns.
+
+The reducers, storylet firing and cost bookkeeping call the ``record_*``
+helpers where they mutate state. While ``record_turn_changes`` is open those
+calls land in a ``TurnChangeLog``; outside a turn they are no-ops. The log is
+turned into the turn's ``UrbanTurnChangeSet`` without re-reading the state it
+describes.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from rpg_backend.play_v2.contracts import (
+    CostUpdateRecord,
+    HookTransitionRecord,
+    SnapshotSection,
+    UrbanTurnChangeSet,
+    UrbanWorldState,
+)
+
+# Globals that also appear on the relationship snapshot, not just the state bars.
+_RELATIONSHIP_SNAPSHOT_GLOBALS = frozenset({"scene_heat", "public_image", "route_lock", "secret_exposure"})
+_RELATIONSHIP_DIMENSIONS = ("affection", "trust", "tension", "suspicion", "dependency")
+_MIND_BAR_DIMENSIONS = ("mask_integrity", "pressure_load", "humiliation_risk")
+# Every committed turn rewrites narration, feedback ledgers and the action cards.
+_PER_TURN_SECTIONS: tuple[SnapshotSection, ...] = ("narration", "feedback", "progress", "actions")
+
+
+@dataclass(slots=True)
+class TurnChangeLog:
+    """What the turn's mutation sites recorded while ``record_turn_changes`` was open.
+
+    Deltas accumulate per key, so a value moved twice reports its net change;
+    hook and cost transitions keep the first before-status and the latest
+    after-status. The header fields are the pre-turn scalars the change set
+    reports alongside the recorded changes.
+    """
+
+    turn_index_before: int
+    segment_index_before: int
+    segment_progress_before: int
+    status_before: str
+    route_target_before: str | None
+    ending_id_before: str | None
+    global_deltas: dict[str, int] = field(default_factory=dict)
+    relationship_deltas: dict[str, dict[str, int]] = field(default_factory=dict)
+    npc_mind_changed_ids: dict[str, None] = field(default_factory=dict)
+    hook_transitions: dict[str, tuple[str | None, str | None]] = field(default_factory=dict)
+    cost_updates: dict[str, tuple[str | None, str | None]] = field(default_factory=dict)
+    latent_radar_changed: bool = False
+
+    def add_global(self, name: str, delta: int) -> None:
+        self.global_deltas[name] = self.global_deltas.get(name, 0) + int(delta)
+
+    def add_relationship(self, character_id: str, name: str, delta: int) -> None:
+        deltas = self.relationship_deltas.setdefault(character_id, {})
+        deltas[name] = deltas.get(name, 0) + int(delta)
+
+    def add_hook_transition(self, hook_id: str, before: str | None, after: str | None) -> None:
+        first_before = self.hook_transitions.get(hook_id, (before, after))[0]
+        self.hook_transitions[hook_id] = (first_before, after)
+
+    def add_cost_update(self, cost_id: str, before: str | None, after: str | None) -> None:
+        first_before = self.cost_updates.get(cost_id, (before, after))[0]
+        self.cost_updates[cost_id] = (first_before, after)
+
+    def merge(self, other: TurnChangeLog) -> None:
+        """Fold in changes recorded elsewhere, e.g. by a turn worker process."""
+        for name, delta in other.global_deltas.items():
+            self.add_global(name, delta)
+        for character_id, deltas in other.relationship_deltas.items():
+            for name, delta in deltas.items():
+                self.add_relationship(character_id, name, delta)
+        self.npc_mind_changed_ids.update(other.npc_mind_changed_ids)
+        for hook_id, (before, after) in other.hook_transitions.items():
+            self.add_hook_transition(hook_id, before, after)
+        for cost_id, (before, after) in other.cost_updates.items():
+            self.add_cost_update(cost_id, before, after)
+        self.latent_radar_changed = self.latent_radar_changed or other.latent_radar_changed
+
+
+_ACTIVE_CHANGE_LOG: ContextVar[TurnChangeLog | None] = ContextVar(
+    "_ACTIVE_CHANGE_LOG",
+    default=None,
+)
+
+
+@contextmanager
+def record_turn_changes(state: UrbanWorldState) -> Iterator[TurnChangeLog]:
+    """Collect the changes recorded for ``state``'s next turn on this context."""
+    log = TurnChangeLog(
+        turn_index_before=state.turn_index,
+        segment_index_before=state.segment_index,
+        segment_progress_before=state.segment_progress,
+        status_before=state.status,
+        route_target_before=state.current_route_target_id,
+        ending_id_before=state.ending_id,
+    )
+    token = _ACTIVE_CHANGE_LOG.set(log)
+    try:
+        yield log
+    finally:
+        _ACTIVE_CHANGE_LOG.reset(token)
+
+
+def merge_turn_changes(log: TurnChangeLog) -> None:
+    active = _ACTIVE_CHANGE_LOG.get()
+    if active is not None:
+        active.merge(log)
+
+
+def record_global_change(name: str, before: int, after: int) -> None:
+    log = _ACTIVE_CHANGE_LOG.get()
+    if log is not None and after != before:
+        log.add_global(name, int(after) - int(before))
+
+
+def relationship_values(relationship: Any) -> tuple[int, ...]:
+    return tuple(int(getattr(relationship, name)) for name in _RELATIONSHIP_DIMENSIONS)
+
+
+def record_relationship_change(character_id: str, before: tuple[int, ...], relationship: Any) -> None:
+    """Record how ``relationship`` moved from the ``relationship_values`` taken before the write."""
+    log = _ACTIVE_CHANGE_LOG.get()
+    if log is None:
+        return
+    for name, before_value, after_value in zip(_RELATIONSHIP_DIMENSIONS, before, relationship_values(relationship)):
+        if after_value != before_value:
+            log.add_relationship(character_id, name, after_value - before_value)
+
+
+def mind_bar_values(mind: Any) -> tuple[int, ...]:
+    return tuple(int(getattr(mind, name)) for name in _MIND_BAR_DIMENSIONS)
+
+
+def record_mind_change(character_id: str, before: tuple[int, ...], mind: Any) -> None:
+    """Record ``character_id`` when a write moved one of the mind values the state bars show."""
+    log = _ACTIVE_CHANGE_LOG.get()
+    if log is not None and mind_bar_values(mind) != before:
+        log.npc_mind_changed_ids[character_id] = None
+
+
+def record_hook_transition(hook_id: str, before: str | None, after: str | None) -> None:
+    log = _ACTIVE_CHANGE_LOG.get()
+    if log is not None and before != after:
+        log.add_hook_transition(hook_id, before, after)
+
+
+def record_cost_status(cost_id: str, before: str | None, after: str | None) -> None:
+    log = _ACTIVE_CHANGE_LOG.get()
+    if log is not None and before != after:
+        log.add_cost_update(cost_id, before, after)
+
+
+def record_latent_radar_change() -> None:
+    log = _ACTIVE_CHANGE_LOG.get()
+    if log is not None:
+        log.latent_radar_changed = True
+
+
+def build_turn_change_set(log: TurnChangeLog, state: UrbanWorldState) -> UrbanTurnChangeSet:
+    """Change set for the committed turn ``log`` recorded.
+
+    Only the header scalars are read from the post-turn ``state``; everything
+    else comes from what the mutation sites recorded.
+    """
+    global_deltas = {name: delta for name, delta in log.global_deltas.items() if delta}
+    relationship_deltas = {
+        character_id: {name: delta for name, delta in deltas.items() if delta}
+        for character_id, deltas in log.relationship_deltas.items()
+    }
+    relationship_deltas = {character_id: deltas for character_id, deltas in relationship_deltas.items() if deltas}
+    mind_changed_ids = list(log.npc_mind_changed_ids)
+    hook_transitions = [
+        HookTransitionRecord(hook_id=hook_id, before_status=before, after_status=after)
+        for hook_id, (before, after) in log.hook_transitions.items()
+        if before != after
+    ]
+    cost_updates = [
+        CostUpdateRecord(cost_id=cost_id, before_status=before, after_status=after)
+        for cost_id, (before, after) in log.cost_updates.items()
+        if before != after
+    ]
+
+    sections: list[SnapshotSection] = []
+    if state.turn_index != log.turn_index_before:
+        sections.extend(_PER_TURN_SECTIONS)
+    elif state.segment_progress != log.segment_progress_before or state.segment_index != log.segment_index_before:
+        sections.append("progress")
+    if state.status != log.status_before:
+        sections.append("status")
+    if state.segment_index != log.segment_index_before:
+        sections.append("beat")
+    if global_deltas or relationship_deltas or mind_changed_ids:
+        sections.append("state_bars")
+    route_target_changed = state.current_route_target_id != log.route_target_before
+    if route_target_changed:
+        sections.append("route_target")
+    if relationship_deltas or route_target_changed or _RELATIONSHIP_SNAPSHOT_GLOBALS.intersection(global_deltas):
+        sections.append("relationship_state")
+    if log.latent_radar_changed or (not state.latent_radar and global_deltas):
+        # Without explicit radar items the snapshot derives the radar from the pressure globals.
+        sections.append("latent_radar")
+    if state.ending_id != log.ending_id_before:
+        sections.append("ending")
+    return UrbanTurnChangeSet(
+        turn_index_before=log.turn_index_before,
+        turn_index_after=state.turn_index,
+        segment_index_before=log.segment_index_before,
+        segment_index_after=state.segment_index,
+        status_before=log.status_before,
+        status_after=state.status,
+        global_deltas=global_deltas,
+        relationship_deltas=relationship_deltas,
+        npc_mind_changed_ids=mind_changed_ids,
+        hook_transitions=hook_transitions,
+        latent_ops=list(state.last_turn_latent_ops[:6]),
+        cost_updates=cost_updates,
+        revealed_secret_ids=list(state.last_turn_revealed_secret_ids[:4]),
+        route_target_before=log.route_target_before,
+        route_target_after=state.current_route_target_id,
+        ending_id_after=state.ending_id,
+        changed_sections=sections,
+    )
+
+
+def merge_changed_sections(change_sets: list[UrbanTurnChangeSet]) -> list[SnapshotSection]:
+    merged: dict[SnapshotSection, None] = {}
+    for change_set in change_sets:
+        merged.update(dict.fromkeys(change_set.changed_sections))
+    return list(merged)
@@ -6,6 +6,7 @@ from typing import Any
 from rpg_backend.author.normalize import unique_preserve
 from rpg_backend.play_v2.contracts import HookState, UrbanTurnIntent, UrbanWorldState
 from rpg_backend.play_v2.hook_engine import register_hook_callbacks
+from rpg_backend.play_v2.turn_changes import record_hook_transition
 
 _HOOK_STATUS_ORDER: dict[str, int] = {
     "dormant": 0,
@@ -109,6 +110,7 @@ class HookLifecycleReducer:
                     "leverage_value": leverage_value,
                 }
             )
+            record_hook_transition(hook.hook_id, current_status, next_status)
             changed_hook_ids.append(hook.hook_id)
 
         for hook in original_hook_states.values():
@@ -0,0 +1,174 @@
+"""Worker-process execution for the deterministic resolution stage of a v2 turn.
+
+`resolve_turn_state` is pure-Python CPU work, so on the FastAPI threadpool
+concurrent sessions queue behind the GIL. With `play_v2_turn_worker_processes`
+set, `run_turn` ships that stage to a process pool while intent compilation
+and narration (the LLM I/O) stay on the calling thread.
+
+Plans are large and immutable, so each worker keeps the plans it has seen by
+fingerprint. `CompiledPlayPlan` is frozen, so a fingerprint always describes
+the plan's current content. A task names its plan, and the full plan is only
+sent when a worker reports that it does not have it yet. The state goes both
+ways in the configured session-state codec, and the changes the stage
+recorded travel back with it so the caller's turn change log stays complete.
+The app's shutdown hook calls `shutdown_turn_worker_pool`.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+from threading import Lock
+from typing import Any
+
+from rpg_backend.author_v2.contracts import CompiledPlayPlan
+from rpg_backend.play.state_codec import PlayStateCodec, build_state_codec
+from rpg_backend.play_v2.contracts import UrbanTurnIntent, UrbanWorldState
+from rpg_backend.play_v2.plan_artefacts import plan_fingerprint
+from rpg_backend.play_v2.turn_changes import TurnChangeLog, merge_turn_changes, record_turn_changes
+
+_WORKER_PLAN_CACHE_MAX_ENTRIES = 32
+_PLAN_MISSING = "plan_missing"
+# Compression only pays for storage; across a local pipe it is pure overhead.
+_TRANSPORT_CODEC_NAMES = {"json+zlib": "json", "msgpack+zstd": "msgpack"}
+
+_pool_lock = Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_max_workers = 0
+
+# Worker-side state: plans by fingerprint and codecs by name.
+_worker_plans: dict[str, CompiledPlayPlan] = {}
+_codecs: dict[str, PlayStateCodec] = {}
+
+
+def _codec(name: str) -> PlayStateCodec:
+    transport_name = _TRANSPORT_CODEC_NAMES.get(name, name)
+    codec = _codecs.get(transport_name)
+    if codec is None:
+        codec = _codecs[transport_name] = build_state_codec(transport_name)
+    return codec
+
+
+def _resolve_in_worker(
+    plan_key: str,
+    plan_payload: bytes | None,
+    state_payload: bytes,
+    state_codec_name: str,
+    intent: UrbanTurnIntent,
+    micro_sim: Any | None,
+    player_chosen_storylet_id: str | None,
+) -> tuple[str, bytes | None, UrbanTurnIntent | None, list[str] | None, TurnChangeLog | None]:
+    from rpg_backend.play_v2.runtime import resolve_turn_state
+
+    plan = _worker_plans.get(plan_key)
+    if plan is None:
+        if plan_payload is None:
+            return _PLAN_MISSING, None, None, None, None
+        plan = CompiledPlayPlan.model_validate_json(plan_payload)
+        while len(_worker_plans) >= _WORKER_PLAN_CACHE_MAX_ENTRIES:
+            _worker_plans.pop(next(iter(_worker_plans)))
+        _worker_plans[plan_key] = plan
+    codec = _codec(state_codec_name)
+    state = UrbanWorldState.model_validate(codec.decode(state_payload))
+    with record_turn_changes(state) as change_log:
+        state, consequence_tags = resolve_turn_state(
+            plan,
+            state,
+            intent,
+            micro_sim=micro_sim,
+            player_chosen_storylet_id=player_chosen_storylet_id,
+        )
+    return "ok", codec.encode(state.model_dump(mode="json")), intent, consequence_tags, change_log
+
+
+def _turn_worker_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_max_workers
+    with _pool_lock:
+        if _pool is None or _pool_max_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            # spawn, not fork: the parent runs request and prewarm threads that may hold locks.
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_max_workers = max_workers
+        return _pool
+
+
+def shutdown_turn_worker_pool() -> None:
+    global _pool, _pool_max_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+        _pool_max_workers = 0
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool, _pool_max_workers
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _pool_max_workers = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def resolve_turn_state_in_worker(
+    plan: CompiledPlayPlan,
+    state: UrbanWorldState,
+    intent: UrbanTurnIntent,
+    *,
+    micro_sim: Any | None,
+    player_chosen_storylet_id: str | None,
+    max_workers: int,
+    state_codec_name: str = "json",
+) -> tuple[UrbanWorldState, UrbanTurnIntent, list[str], str]:
+    """Run `resolve_turn_state` in the worker pool.
+
+    Returns the resolved state, the intent (resolution fills in its lane), the
+    consequence tags and the mode that ran. If the pool breaks, the stage runs
+    inline on the untouched caller state. Errors raised by the stage itself
+    propagate exactly as they would inline.
+    """
+    from rpg_backend.play_v2.runtime import resolve_turn_state
+
+    plan_key = plan_fingerprint(plan)
+    state_payload = _codec(state_codec_name).encode(state.model_dump(mode="json"))
+    pool = _turn_worker_pool(max_workers)
+    try:
+        status, resolved_payload, resolved_intent, consequence_tags, change_log = pool.submit(
+            _resolve_in_worker,
+            plan_key,
+            None,
+            state_payload,
+            state_codec_name,
+            intent,
+            micro_sim,
+            player_chosen_storylet_id,
+        ).result()
+        if status == _PLAN_MISSING:
+            status, resolved_payload, resolved_intent, consequence_tags, change_log = pool.submit(
+                _resolve_in_worker,
+                plan_key,
+                plan.model_dump_json().encode("utf-8"),
+                state_payload,
+                state_codec_name,
+                intent,
+                micro_sim,
+                player_chosen_storylet_id,
+            ).result()
+    except BrokenProcessPool:
+        _discard_broken_pool(pool)
+        resolved_state, inline_tags = resolve_turn_state(
+            plan,
+            state,
+            intent,
+            micro_sim=micro_sim,
+            player_chosen_storylet_id=player_chosen_storylet_id,
+        )
+        return resolved_state, intent, inline_tags, "inline_fallback"
+    if status != "ok" or resolved_payload is None or resolved_intent is None or consequence_tags is None:
+        raise RuntimeError(f"turn worker returned no resolved state ({status})")
+    if change_log is not None:
+        merge_turn_changes(change_log)
+    resolved_state = UrbanWorldState.model_validate(_codec(state_codec_name).decode(resolved_payload))
+    return resolved_state, resolved_intent, consequence_tags, "process"
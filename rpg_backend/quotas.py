@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import sqlite3
 from threading import Lock
+from typing import TYPE_CHECKING, Protocol
+
+from rpg_backend.sqlite_utils import connect_sqlite
+
+if TYPE_CHECKING:
+    from rpg_backend.config import Settings
 
 
 class QuotaExceededError(RuntimeError):
@@ -12,17 +19,205 @@ class QuotaExceededError(RuntimeError):
         super().__init__(f"{scope} daily LLM quota exceeded ({limit})")
 
 
+@dataclass(frozen=True)
+class QuotaCounter:
+    scope: str
+    subject_key: str
+    limit: int
+
+
+class DailyQuotaBackend(Protocol):
+    def consume(self, *, day: str, counters: tuple[QuotaCounter, ...], amount: int) -> None:
+        """Debit ``amount`` from every counter or from none of them.
+
+        Raises ``QuotaExceededError`` for the first counter (in order) whose
+        limit would be exceeded.
+        """
+
+    def reset(self) -> None: ...
+
+
+class _QuotaShard:
+    __slots__ = ("lock", "day", "counts")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.day = ""
+        self.counts: dict[tuple[str, str], int] = {}
+
+    def roll_to(self, day: str) -> None:
+        # Counters only ever live for one UTC day, so rollover swaps the whole
+        # dict instead of scanning keys for stale days.
+        if self.day != day:
+            self.day = day
+            self.counts = {}
+
+
+class ShardedMemoryQuotaBackend:
+    """In-process counters split across independently locked shards.
+
+    Only valid for a single worker process; use ``SQLiteQuotaBackend`` when
+    more than one uvicorn worker shares the same quota.
+    """
+
+    def __init__(self, *, shard_count: int = 16) -> None:
+        self._shards = tuple(_QuotaShard() for _ in range(max(1, int(shard_count))))
+
+    def _shard_index(self, counter: QuotaCounter) -> int:
+        return hash((counter.scope, counter.subject_key)) % len(self._shards)
+
+    def consume(self, *, day: str, counters: tuple[QuotaCounter, ...], amount: int) -> None:
+        shard_indexes = [self._shard_index(counter) for counter in counters]
+        # Lock in index order so two requests touching the same pair of shards
+        # can never deadlock.
+        locked = sorted(set(shard_indexes))
+        for index in locked:
+            self._shards[index].lock.acquire()
+        try:
+            for index in locked:
+                self._shards[index].roll_to(day)
+            for counter, index in zip(counters, shard_indexes):
+                used = self._shards[index].counts.get((counter.scope, counter.subject_key), 0)
+                if used + amount > counter.limit:
+                    raise QuotaExceededError(scope=counter.scope, limit=counter.limit)
+            for counter, index in zip(counters, shard_indexes):
+                counts = self._shards[index].counts
+                key = (counter.scope, counter.subject_key)
+                counts[key] = counts.get(key, 0) + amount
+        finally:
+            for index in reversed(locked):
+                self._shards[index].lock.release()
+
+    def usage(self, *, day: str, scope: str, subject_key: str) -> int:
+        shard = self._shards[self._shard_index(QuotaCounter(scope=scope, subject_key=subject_key, limit=0))]
+        with shard.lock:
+            if shard.day != day:
+                return 0
+            return shard.counts.get((scope, subject_key), 0)
+
+    def resident_days(self) -> set[str]:
+        return {shard.day for shard in self._shards if shard.counts}
+
+    def reset(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.day = ""
+                shard.counts = {}
+
+
+class SQLiteQuotaBackend:
+    """Daily counters shared by every process that opens the same database.
+
+    Each debit is a conditional ``UPSERT ... RETURNING`` inside one
+    ``BEGIN IMMEDIATE`` transaction, so concurrent workers serialise on the
+    SQLite write lock and a rejected counter rolls back the others.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._schema_ready = False
+        self._pruned_day = ""
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = connect_sqlite(self._db_path)
+        connection.isolation_level = None
+        if not self._schema_ready:
+            self._ensure_schema(connection)
+            self._schema_ready = True
+        return connection
+
+    @staticmethod
+    def _ensure_schema(connection: sqlite3.Connection) -> None:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_daily_quota_counters (
+                scope TEXT NOT NULL,
+                subject_key TEXT NOT NULL,
+                day TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                PRIMARY KEY (scope, subject_key, day)
+            )
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_daily_quota_counters_day ON llm_daily_quota_counters (day)"
+        )
+
+    def consume(self, *, day: str, counters: tuple[QuotaCounter, ...], amount: int) -> None:
+        for counter in counters:
+            if amount > counter.limit:
+                raise QuotaExceededError(scope=counter.scope, limit=counter.limit)
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self._pruned_day != day:
+                    connection.execute("DELETE FROM llm_daily_quota_counters WHERE day < ?", (day,))
+                for counter in counters:
+                    row = connection.execute(
+                        """
+                        INSERT INTO llm_daily_quota_counters (scope, subject_key, day, used)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT(scope, subject_key, day) DO UPDATE SET
+                            used = used + excluded.used
+                        WHERE used + excluded.used <= ?
+                        RETURNING used
+                        """,
+                        (counter.scope, counter.subject_key, day, amount, counter.limit),
+                    ).fetchone()
+                    if row is None:
+                        raise QuotaExceededError(scope=counter.scope, limit=counter.limit)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            self._pruned_day = day
+        finally:
+            connection.close()
+
+    def usage(self, *, day: str, scope: str, subject_key: str) -> int:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                """
+                SELECT used FROM llm_daily_quota_counters
+                WHERE scope = ? AND subject_key = ? AND day = ?
+                """,
+                (scope, subject_key, day),
+            ).fetchone()
+        finally:
+            connection.close()
+        return int(row["used"]) if row is not None else 0
+
+    def reset(self) -> None:
+        connection = self._connect()
+        try:
+            connection.execute("DELETE FROM llm_daily_quota_counters")
+        finally:
+            connection.close()
+        self._pruned_day = ""
+
+
+def build_quota_backend(settings: Settings) -> DailyQuotaBackend:
+    if settings.llm_quota_backend == "sqlite":
+        return SQLiteQuotaBackend(settings.llm_quota_db_path or settings.runtime_state_db_path)
+    return ShardedMemoryQuotaBackend()
+
+
 @dataclass
 class DailyQuotaLimiter:
-    """Small in-process daily limiter for public demo LLM calls.
+    """Daily limiter for public demo LLM calls.
 
-    The demo uses one uvicorn process in production, so an in-memory guard is
-    enough to stop accidental public burn. A multi-instance deployment should
-    replace this with Redis or database-backed counters.
+    Counting is delegated to a ``DailyQuotaBackend``. The in-memory default is
+    fine for one uvicorn worker; multi-worker deployments should configure
+    ``APP_LLM_QUOTA_BACKEND=sqlite`` so every worker debits the same counters.
     """
 
-    _counts: dict[tuple[str, str, str], int] = field(default_factory=dict)
-    _lock: Lock = field(default_factory=Lock)
+    backend: DailyQuotaBackend = field(default_factory=ShardedMemoryQuotaBackend)
 
     @staticmethod
     def _day_key(now: datetime | None = None) -> str:
@@ -40,26 +235,14 @@ class DailyQuotaLimiter:
         now: datetime | None = None,
     ) -> None:
         debit = max(1, int(amount))
-        day = self._day_key(now)
-        ip_counter = ("ip", day, ip_key)
-        user_counter = ("user", day, user_key) if user_key else None
-        with self._lock:
-            stale_keys = [key for key in self._counts if key[1] != day]
-            for key in stale_keys:
-                del self._counts[key]
-            if ip_limit is not None and self._counts.get(ip_counter, 0) + debit > ip_limit:
-                raise QuotaExceededError(scope="ip", limit=ip_limit)
-            if (
-                user_limit is not None
-                and user_counter is not None
-                and self._counts.get(user_counter, 0) + debit > user_limit
-            ):
-                raise QuotaExceededError(scope="user", limit=user_limit)
-            if ip_limit is not None:
-                self._counts[ip_counter] = self._counts.get(ip_counter, 0) + debit
-            if user_limit is not None and user_counter is not None:
-                self._counts[user_counter] = self._counts.get(user_counter, 0) + debit
+        counters: list[QuotaCounter] = []
+        if ip_limit is not None:
+            counters.append(QuotaCounter(scope="ip", subject_key=ip_key, limit=ip_limit))
+        if user_limit is not None and user_key:
+            counters.append(QuotaCounter(scope="user", subject_key=user_key, limit=user_limit))
+        if not counters:
+            return
+        self.backend.consume(day=self._day_key(now), counters=tuple(counters), amount=debit)
 
     def reset(self) -> None:
-        with self._lock:
-            self._counts.clear()
+        self.backend.reset()
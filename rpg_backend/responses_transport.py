@@ -6,9 +6,11 @@ import re
 import threading
 import time
 from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from types import SimpleNamespace
-from typing import Any, Callable, Generic, Literal, TypeVar
+from typing import Any, Callable, Generic, Iterator, Literal, TypeVar
 from urllib.parse import urlparse
 
 import httpx
@@ -55,25 +57,134 @@ def _try_parse_json(text: str) -> tuple[Any, bool, str | None]:
     return None, False, first_error
 
 
+LLMRequestPriority = Literal["interactive", "speculative", "background", "batch"]
+
+_DEFAULT_INTERACTIVE_RESERVE_FRACTION = 0.2
+
+
+@dataclass
+class LLMPriorityScope:
+    priority: LLMRequestPriority
+    rejected: int = 0
+
+
+_REQUEST_PRIORITY_SCOPE: ContextVar[LLMPriorityScope | None] = ContextVar("llm_request_priority_scope", default=None)
+
+
+@contextmanager
+def llm_request_priority(priority: LLMRequestPriority) -> Iterator[LLMPriorityScope]:
+    """Tag every transport call made inside the block with ``priority``.
+
+    The tag only reaches executor threads through ``copy_context()``. The
+    yielded scope counts calls the admission policy dropped, so callers can
+    discard results that quietly fell back to heuristics.
+    """
+    scope = LLMPriorityScope(priority=priority)
+    token = _REQUEST_PRIORITY_SCOPE.set(scope)
+    try:
+        yield scope
+    finally:
+        _REQUEST_PRIORITY_SCOPE.reset(token)
+
+
+def current_llm_request_priority(default: LLMRequestPriority = "interactive") -> LLMRequestPriority:
+    scope = _REQUEST_PRIORITY_SCOPE.get()
+    return scope.priority if scope is not None else default
+
+
+def _interactive_reserve_fraction() -> float:
+    raw = str(os.environ.get("APP_RESPONSES_INTERACTIVE_RESERVE_FRACTION") or "").strip()
+    if not raw:
+        return _DEFAULT_INTERACTIVE_RESERVE_FRACTION
+    try:
+        return min(max(float(raw), 0.0), 0.5)
+    except ValueError:
+        return _DEFAULT_INTERACTIVE_RESERVE_FRACTION
+
+
 class _RequestsPerMinuteLimiter:
-    def __init__(self, requests_per_minute: int) -> None:
+    """Sliding-window RPM limiter with per-priority admission.
+
+    Interactive calls may use the whole window. Speculative and background
+    calls leave ``reserve`` of it to interactive calls, and batch calls leave
+    twice that so they yield to background work too. The reserve is only held
+    while interactive calls use it: a lower class may borrow reserved slots
+    beyond the interactive calls in the current window plus one for the next
+    arrival. Background and batch calls wait for capacity; speculative calls
+    are dropped instead, since a late prewarm is useless.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        *,
+        interactive_reserve_fraction: float | None = None,
+        window_seconds: float = 60.0,
+    ) -> None:
         self.requests_per_minute = max(1, int(requests_per_minute))
+        self.window_seconds = float(window_seconds)
+        self.interactive_reserve_fraction = (
+            _interactive_reserve_fraction() if interactive_reserve_fraction is None else interactive_reserve_fraction
+        )
         self._lock = threading.Lock()
-        self._recent_requests: deque[float] = deque()
-
-    def acquire(self) -> None:
-        window_seconds = 60.0
+        self._recent_requests: deque[tuple[float, bool]] = deque()
+        self._recent_interactive = 0
+        self.admitted: dict[str, int] = {}
+        self.rejected: dict[str, int] = {}
+
+    def capacity_for(self, priority: LLMRequestPriority) -> int:
+        with self._lock:
+            self._prune(time.monotonic(), self.window_seconds)
+            return self._capacity_locked(priority)
+
+    def _capacity_locked(self, priority: LLMRequestPriority) -> int:
+        if priority == "interactive":
+            return self.requests_per_minute
+        reserve_slots = self.requests_per_minute * self.interactive_reserve_fraction
+        held = min(reserve_slots, self._recent_interactive + 1) if reserve_slots > 0 else 0.0
+        if priority == "batch":
+            held *= 2
+        return max(1, int(self.requests_per_minute - held))
+
+    def _prune(self, now: float, window_seconds: float) -> None:
+        cutoff = now - window_seconds
+        while self._recent_requests and self._recent_requests[0][0] <= cutoff:
+            _, interactive = self._recent_requests.popleft()
+            if interactive:
+                self._recent_interactive -= 1
+
+    def has_headroom(self, priority: LLMRequestPriority) -> bool:
+        with self._lock:
+            self._prune(time.monotonic(), self.window_seconds)
+            return len(self._recent_requests) < self._capacity_locked(priority)
+
+    def acquire(self, priority: LLMRequestPriority = "interactive") -> None:
+        window_seconds = self.window_seconds
         while True:
             now = time.monotonic()
             sleep_for = 0.0
             with self._lock:
-                cutoff = now - window_seconds
-                while self._recent_requests and self._recent_requests[0] <= cutoff:
-                    self._recent_requests.popleft()
-                if len(self._recent_requests) < self.requests_per_minute:
-                    self._recent_requests.append(now)
+                self._prune(now, window_seconds)
+                used = len(self._recent_requests)
+                # Borrowed headroom shrinks as interactive calls arrive, so
+                # capacity is re-read on every attempt.
+                capacity = self._capacity_locked(priority)
+                if used < capacity:
+                    interactive = priority == "interactive"
+                    self._recent_requests.append((now, interactive))
+                    if interactive:
+                        self._recent_interactive += 1
+                    self.admitted[priority] = self.admitted.get(priority, 0) + 1
                     return
-                sleep_for = max(0.0, self._recent_requests[0] + window_seconds - now)
+                if priority == "speculative":
+                    self.rejected[priority] = self.rejected.get(priority, 0) + 1
+                    raise LLMAdmissionRejectedError(
+                        "rate limit headroom reserved for interactive calls; speculative request dropped",
+                        status_code=429,
+                    )
+                # The window drops below ``capacity`` once the oldest
+                # ``used - capacity + 1`` requests have aged out.
+                sleep_for = max(0.0, self._recent_requests[used - capacity][0] + window_seconds - now)
             if sleep_for > 0:
                 time.sleep(sleep_for)
 
@@ -96,14 +207,52 @@ _DEFAULT_PERMISSIVE_OBJECT_SCHEMA: dict[str, Any] = {
 }
 
 
-def _acquire_rpm_slot(*, scope: str, requests_per_minute: int) -> None:
+def _acquire_rpm_slot(
+    *,
+    scope: str,
+    requests_per_minute: int,
+    priority: LLMRequestPriority = "interactive",
+) -> None:
     normalized_scope = str(scope or "").strip() or "default"
     with _RPM_LIMITERS_LOCK:
         limiter = _RPM_LIMITERS.get(normalized_scope)
         if limiter is None or limiter.requests_per_minute != int(requests_per_minute):
             limiter = _RequestsPerMinuteLimiter(int(requests_per_minute))
             _RPM_LIMITERS[normalized_scope] = limiter
-    limiter.acquire()
+    try:
+        limiter.acquire(priority)
+    except LLMAdmissionRejectedError:
+        scope_state = _REQUEST_PRIORITY_SCOPE.get()
+        if scope_state is not None:
+            scope_state.rejected += 1
+        raise
+
+
+def llm_admission_open(priority: LLMRequestPriority, *, scope: str | None) -> bool:
+    """False when the rate-limited ``scope`` is out of headroom for ``priority``.
+
+    ``scope`` is the limiter the caller's requests will be admitted under (see
+    ``resolve_rate_limit``); ``None`` means they are not rate limited.
+    """
+    if scope is None:
+        return True
+    normalized_scope = str(scope).strip() or "default"
+    with _RPM_LIMITERS_LOCK:
+        limiter = _RPM_LIMITERS.get(normalized_scope)
+    return limiter is None or limiter.has_headroom(priority)
+
+
+def rpm_limiter_stats() -> dict[str, dict[str, Any]]:
+    with _RPM_LIMITERS_LOCK:
+        limiters = dict(_RPM_LIMITERS)
+    return {
+        scope: {
+            "requests_per_minute": limiter.requests_per_minute,
+            "admitted": dict(limiter.admitted),
+            "rejected": dict(limiter.rejected),
+        }
+        for scope, limiter in limiters.items()
+    }
 
 
 class ResponsesProviderError(RuntimeError):
@@ -114,6 +263,10 @@ class ResponsesProviderError(RuntimeError):
         self.status_code = status_code
 
 
+class LLMAdmissionRejectedError(ResponsesProviderError):
+    """A low-priority request was dropped to keep headroom for interactive calls."""
+
+
 @dataclass(frozen=True)
 class ResponsesJSONResponse:
     payload: dict[str, Any]
@@ -379,8 +532,10 @@ class _RawResponsesResource:
         rate_limit_scope: str | None = None,
         chat_json_stream_mode: Literal["auto", "force", "off"] = "auto",
         chat_json_stream_hosts: tuple[str, ...] | None = None,
+        default_priority: LLMRequestPriority = "interactive",
     ) -> None:
         self._base_url = base_url.rstrip("/")
+        self._default_priority = default_priority
         self._use_chat_completions = True
         explicit_pool = tuple(key for key in (api_keys or ()) if str(key).strip())
         fallback = str(api_key).strip()
@@ -562,6 +717,7 @@ class _RawResponsesResource:
             _acquire_rpm_slot(
                 scope=self._rate_limit_scope,
                 requests_per_minute=self._requests_per_minute,
+                priority=current_llm_request_priority(self._default_priority),
             )
         endpoint_url, request_payload = self._prepare_request_payload(payload)
         use_stream_chat = self._should_use_stream_chat(endpoint_url)
@@ -645,12 +801,19 @@ class _RawResponsesResource:
     def _prepare_request_payload(self, payload: dict[str, Any]) -> tuple[str, dict[str, Any]]:
         instructions = str(payload.get("instructions") or "").strip()
         input_text = payload.get("input")
-        if not isinstance(input_text, str):
-            input_text = json.dumps(input_text, ensure_ascii=False, sort_keys=True)
         messages: list[dict[str, str]] = []
         if instructions:
             messages.append({"role": "system", "content": instructions})
-        messages.append({"role": "user", "content": input_text})
+        if isinstance(input_text, list) and all(isinstance(item, dict) for item in input_text):
+            # Responses-style input items: already split into role-tagged messages.
+            messages.extend(
+                {"role": str(item.get("role") or "user"), "content": str(item.get("content") or "")}
+                for item in input_text
+            )
+        else:
+            if not isinstance(input_text, str):
+                input_text = json.dumps(input_text, ensure_ascii=False, sort_keys=True)
+            messages.append({"role": "user", "content": input_text})
 
         chat_payload: dict[str, Any] = {
             "model": payload.get("model"),
@@ -691,6 +854,7 @@ class RawResponsesClient:
         rate_limit_scope: str | None = None,
         chat_json_stream_mode: Literal["auto", "force", "off"] = "auto",
         chat_json_stream_hosts: tuple[str, ...] | None = None,
+        default_priority: LLMRequestPriority = "interactive",
     ) -> None:
         self.responses = _RawResponsesResource(
             base_url=base_url,
@@ -701,9 +865,26 @@ class RawResponsesClient:
             rate_limit_scope=rate_limit_scope,
             chat_json_stream_mode=chat_json_stream_mode,
             chat_json_stream_hosts=chat_json_stream_hosts,
+            default_priority=default_priority,
         )
 
 
+def resolve_rate_limit(
+    *,
+    requests_per_minute: int | None,
+    rate_limit_scope: str | None,
+) -> tuple[int | None, str | None]:
+    """Apply the process-wide APP_RESPONSES_GLOBAL_* override to a client's rate limit."""
+    global_rpm_raw = str(os.environ.get("APP_RESPONSES_GLOBAL_REQUESTS_PER_MINUTE") or "").strip()
+    if global_rpm_raw:
+        try:
+            requests_per_minute = max(1, int(global_rpm_raw))
+            rate_limit_scope = str(os.environ.get("APP_RESPONSES_GLOBAL_RATE_LIMIT_SCOPE") or "").strip() or "responses:global"
+        except ValueError:
+            pass
+    return requests_per_minute, rate_limit_scope
+
+
 def build_openai_client(
     *,
     base_url: str,
@@ -716,14 +897,12 @@ def build_openai_client(
     rate_limit_scope: str | None = None,
     chat_json_stream_mode: Literal["auto", "force", "off"] = "auto",
     chat_json_stream_hosts: tuple[str, ...] | None = None,
+    default_priority: LLMRequestPriority = "interactive",
 ) -> RawResponsesClient:
-    global_rpm_raw = str(os.environ.get("APP_RESPONSES_GLOBAL_REQUESTS_PER_MINUTE") or "").strip()
-    if global_rpm_raw:
-        try:
-            requests_per_minute = max(1, int(global_rpm_raw))
-            rate_limit_scope = str(os.environ.get("APP_RESPONSES_GLOBAL_RATE_LIMIT_SCOPE") or "").strip() or "responses:global"
-        except ValueError:
-            pass
+    requests_per_minute, rate_limit_scope = resolve_rate_limit(
+        requests_per_minute=requests_per_minute,
+        rate_limit_scope=rate_limit_scope,
+    )
     default_headers: dict[str, str] = {}
     if use_session_cache:
         default_headers = {
@@ -738,6 +917,7 @@ def build_openai_client(
         rate_limit_scope=rate_limit_scope,
         chat_json_stream_mode=chat_json_stream_mode,
         chat_json_stream_hosts=chat_json_stream_hosts,
+        default_priority=default_priority,
     )
 
 
@@ -811,7 +991,16 @@ class ResponsesJSONTransport:
         response_format_schema: dict[str, Any] | None = None,
         response_format_name: str | None = None,
         response_format_strict: bool = True,
+        context_prefix: str | None = None,
+        stage_instructions: str | None = None,
     ) -> ResponsesJSONResponse:
+        """Send one JSON request and parse the reply.
+
+        With ``context_prefix`` the request is laid out as the system prompt, then
+        the prefix as the first user message, then ``stage_instructions`` and the
+        payload as the second. Callers keep the system prompt fixed so requests
+        sharing a prefix open with the same bytes.
+        """
         xcode_mode = self._is_xcode_mode()
         resolved_response_format = response_format_type
         if resolved_response_format is None:
@@ -822,10 +1011,18 @@ class ResponsesJSONTransport:
         instructions = system_prompt
         if resolved_response_format == "json_object" and self.json_object_prompt_only:
             instructions = f"{self._JSON_OBJECT_PROMPT_PREFIX}\n\n{system_prompt}"
+        request_input: str | list[dict[str, str]] = user_text
+        if context_prefix:
+            stage_text = f"{stage_instructions}\n\n{user_text}" if stage_instructions else user_text
+            request_input = [
+                {"role": "user", "content": context_prefix},
+                {"role": "user", "content": stage_text},
+            ]
+            input_characters = len(context_prefix) + len(stage_text)
         request_kwargs: dict[str, Any] = {
             "model": self.model,
             "instructions": instructions,
-            "input": user_text,
+            "input": request_input,
             "max_output_tokens": max_output_tokens,
             "timeout": self.timeout_seconds,
             "temperature": self.temperature,
@@ -860,7 +1057,11 @@ class ResponsesJSONTransport:
         if self.use_session_cache and previous_response_id:
             request_kwargs["previous_response_id"] = previous_response_id
         operation = operation_name or "unknown"
+        request_priority = current_llm_request_priority(
+            getattr(getattr(self.client, "responses", None), "_default_priority", "interactive")
+        )
         attempt_index = sum(1 for entry in self.call_trace if entry.get("operation") == operation) + 1
+        started_at = time.perf_counter()
         try:
             response = self.client.responses.create(**request_kwargs)
         except Exception as exc:  # noqa: BLE001
@@ -878,13 +1079,16 @@ class ResponsesJSONTransport:
                     "json_content_type_hint": bool(self.json_content_type_hint),
                     "usage": {},
                     "attempt_index": attempt_index,
+                    "request_priority": request_priority,
                     "response_received": False,
                     "failure_code": self.provider_failed_code,
                     "failure_message_bucket": _failure_message_bucket(str(exc)),
                     "failure_status_code": status_code,
+                    "elapsed_ms": max(int((time.perf_counter() - started_at) * 1000), 0),
                 }
             )
             raise self.error_factory(self.provider_failed_code, str(exc), status_code) from exc
+        elapsed_ms = max(int((time.perf_counter() - started_at) * 1000), 0)
         try:
             content = response.output_text
         except Exception as exc:  # noqa: BLE001
@@ -934,9 +1138,11 @@ class ResponsesJSONTransport:
                 "json_content_type_hint": bool(self.json_content_type_hint),
                 "usage": usage,
                 "attempt_index": attempt_index,
+                "request_priority": request_priority,
                 "response_received": True,
                 "failure_code": None,
                 "failure_message_bucket": None,
+                "elapsed_ms": elapsed_ms,
             }
         )
         return ResponsesJSONResponse(
@@ -134,7 +134,7 @@ def test_whitespace_template_seed_rejected_before_quota_debit() -> None:
         main_module.llm_quota_limiter = original_limiter
 
     assert response.status_code == 422
-    assert test_limiter._counts == {}
+    assert test_limiter.backend.resident_days() == set()
 
 
 def test_whitespace_advisor_question_rejected_before_quota_debit() -> None:
@@ -152,7 +152,7 @@ def test_whitespace_advisor_question_rejected_before_quota_debit() -> None:
         main_module.llm_quota_limiter = original_limiter
 
     assert response.status_code == 422
-    assert test_limiter._counts == {}
+    assert test_limiter.backend.resident_days() == set()
 
 
 def test_invalid_turn_validation_runs_before_quota_debit(monkeypatch) -> None:
@@ -200,13 +200,16 @@ def test_invalid_turn_validation_runs_before_quota_debit(monkeypatch) -> None:
     assert response.json()["error"]["code"] == "option_out_of_range"
     assert fake_service.estimated is False
     assert fake_service.advanced is False
-    assert test_limiter._counts == {}
+    assert test_limiter.backend.resident_days() == set()
 
 
 def test_author_job_reserves_full_pipeline_quota(monkeypatch) -> None:
     class FakeAuthorService:
         called = False
 
+        def ensure_job_capacity(self) -> None:
+            return None
+
         def create_job(self, *_args, **_kwargs):  # noqa: ANN202
             self.called = True
             raise AssertionError("author job should not start when full quota is unavailable")
@@ -232,7 +235,7 @@ def test_author_job_reserves_full_pipeline_quota(monkeypatch) -> None:
     assert response.status_code == 429
     assert response.json()["error"]["code"] == "ip_llm_quota_exceeded"
     assert fake_service.called is False
-    assert test_limiter._counts == {}
+    assert test_limiter.backend.resident_days() == set()
 
 
 def test_author_preview_reserves_retry_quota(monkeypatch) -> None:
@@ -264,13 +267,16 @@ def test_author_preview_reserves_retry_quota(monkeypatch) -> None:
     assert response.status_code == 429
     assert response.json()["error"]["code"] == "ip_llm_quota_exceeded"
     assert fake_service.called is False
-    assert test_limiter._counts == {}
+    assert test_limiter.backend.resident_days() == set()
 
 
 def test_author_job_without_preview_reserves_preview_and_pipeline_quota(monkeypatch) -> None:
     class FakeAuthorService:
         called = False
 
+        def ensure_job_capacity(self) -> None:
+            return None
+
         def create_job(self, *_args, **_kwargs):  # noqa: ANN202
             self.called = True
             raise AssertionError("direct job should not start when preview plus pipeline quota is unavailable")
@@ -296,13 +302,16 @@ def test_author_job_without_preview_reserves_preview_and_pipeline_quota(monkeypa
     assert response.status_code == 429
     assert response.json()["error"]["code"] == "ip_llm_quota_exceeded"
     assert fake_service.called is False
-    assert test_limiter._counts == {}
+    assert test_limiter.backend.resident_days() == set()
 
 
 def test_author_job_with_client_preview_id_still_reserves_full_pipeline_quota(monkeypatch) -> None:
     class FakeAuthorService:
         called = False
 
+        def ensure_job_capacity(self) -> None:
+            return None
+
         def create_job(self, *_args, **_kwargs):  # noqa: ANN202
             self.called = True
             raise AssertionError("author job should validate quota before trusting preview_id")
@@ -331,7 +340,7 @@ def test_author_job_with_client_preview_id_still_reserves_full_pipeline_quota(mo
     assert response.status_code == 429
     assert response.json()["error"]["code"] == "ip_llm_quota_exceeded"
     assert fake_service.called is False
-    assert test_limiter._counts == {}
+    assert test_limiter.backend.resident_days() == set()
 
 
 def test_logged_out_cannot_mutate_story_visibility(tmp_path) -> None:
@@ -14,12 +14,19 @@ from rpg_backend.author.generation import cast as cast_generation
 from rpg_backend.author.generation import endings as ending_generation
 from rpg_backend.author.generation import routes as route_generation
 from rpg_backend.author.generation import story_frame as story_generation
-from rpg_backend.play.gateway import PlayLLMGateway
+from rpg_backend.config import Settings
+from rpg_backend.play.gateway import PlayLLMGateway, play_rate_limit_scope
 from rpg_backend.responses_transport import (
+    LLMAdmissionRejectedError,
     RawResponsesClient,
     ResponsesJSONTransport,
     ResponsesProviderError,
+    _RequestsPerMinuteLimiter,
+    _acquire_rpm_slot,
     _failure_message_bucket,
+    llm_admission_open,
+    llm_request_priority,
+    rpm_limiter_stats,
     usage_to_dict,
 )
 from tests.author_fixtures import (
@@ -581,6 +588,101 @@ def test_failure_message_bucket_classifies_pending_queue_messages_as_rate_limit(
     assert _failure_message_bucket("Too many pending requests, please retry later") == "rate_limit"
 
 
+def test_rpm_limiter_keeps_interactive_headroom_and_drops_speculative_overflow(monkeypatch) -> None:
+    monkeypatch.setattr("rpg_backend.responses_transport._RPM_LIMITERS", {})
+    monkeypatch.setenv("APP_RESPONSES_INTERACTIVE_RESERVE_FRACTION", "0.2")
+
+    # With no interactive traffic the background class borrows all but one
+    # reserved slot.
+    for _ in range(9):
+        _acquire_rpm_slot(scope="shared", requests_per_minute=10, priority="background")
+
+    assert llm_admission_open("speculative", scope="shared") is False
+    assert llm_admission_open("interactive", scope="shared") is True
+    assert llm_admission_open("speculative", scope="other") is True
+    assert llm_admission_open("speculative", scope=None) is True
+    with llm_request_priority("speculative") as admission:
+        try:
+            _acquire_rpm_slot(scope="shared", requests_per_minute=10, priority="speculative")
+        except LLMAdmissionRejectedError as exc:
+            assert exc.status_code == 429
+            assert _failure_message_bucket(str(exc)) == "rate_limit"
+        else:  # pragma: no cover
+            raise AssertionError("expected speculative request to be dropped")
+    assert admission.rejected == 1
+    _acquire_rpm_slot(scope="shared", requests_per_minute=10, priority="interactive")
+
+    stats = rpm_limiter_stats()["shared"]
+    assert stats["admitted"] == {"background": 9, "interactive": 1}
+    assert stats["rejected"] == {"speculative": 1}
+
+
+def test_rpm_limiter_lends_reserve_only_while_interactive_load_is_low() -> None:
+    limiter = _RequestsPerMinuteLimiter(20, interactive_reserve_fraction=0.2)
+
+    assert limiter.capacity_for("background") == 19
+    assert limiter.capacity_for("batch") == 18
+    for _ in range(2):
+        limiter.acquire("interactive")
+    assert limiter.capacity_for("background") == 17
+    for _ in range(3):
+        limiter.acquire("interactive")
+    assert limiter.capacity_for("background") == 16
+    assert limiter.capacity_for("batch") == 12
+    assert limiter.capacity_for("interactive") == 20
+
+
+def test_play_rate_limit_scope_follows_the_play_gateway_limiter(monkeypatch) -> None:
+    monkeypatch.delenv("APP_RESPONSES_GLOBAL_REQUESTS_PER_MINUTE", raising=False)
+
+    assert play_rate_limit_scope(Settings(responses_play_requests_per_minute=120)) == "play"
+    assert play_rate_limit_scope(Settings(responses_play_requests_per_minute=None)) is None
+    monkeypatch.setenv("APP_RESPONSES_GLOBAL_REQUESTS_PER_MINUTE", "60")
+    monkeypatch.setenv("APP_RESPONSES_GLOBAL_RATE_LIMIT_SCOPE", "shared-provider")
+    assert play_rate_limit_scope(Settings(responses_play_requests_per_minute=None)) == "shared-provider"
+
+
+def test_shared_transport_records_request_priority_in_call_trace() -> None:
+    class _RejectingClient:
+        _default_priority = "background"
+
+        def __init__(self) -> None:
+            self.responses = self
+
+        def create(self, **kwargs):  # noqa: ANN201, ARG002
+            raise LLMAdmissionRejectedError("rate limit headroom reserved", status_code=429)
+
+    trace: list[dict[str, object]] = []
+    transport = ResponsesJSONTransport(
+        client=_RejectingClient(),  # type: ignore[arg-type]
+        model="demo-model",
+        timeout_seconds=20.0,
+        use_session_cache=False,
+        temperature=0.2,
+        enable_thinking=False,
+        provider_failed_code="provider_failed",
+        invalid_response_code="invalid_response",
+        invalid_json_code="invalid_json",
+        error_factory=lambda code, message, status_code: RuntimeError(f"{code}:{message}:{status_code}"),
+        call_trace=trace,
+    )
+
+    for priority in (None, "speculative"):
+        try:
+            if priority is None:
+                transport.invoke_json(system_prompt="Return JSON only.", user_payload={}, max_output_tokens=32)
+            else:
+                with llm_request_priority(priority):
+                    transport.invoke_json(system_prompt="Return JSON only.", user_payload={}, max_output_tokens=32)
+        except RuntimeError as exc:
+            assert "provider_failed" in str(exc)
+        else:  # pragma: no cover
+            raise AssertionError("expected provider failure")
+
+    assert [entry["request_priority"] for entry in trace] == ["background", "speculative"]
+    assert {entry["failure_message_bucket"] for entry in trace} == {"rate_limit"}
+
+
 def test_raw_responses_client_parses_output_blocks(monkeypatch) -> None:
     recorded: dict[str, object] = {}
 
@@ -1738,3 +1840,70 @@ def test_gateway_retries_route_affordance_generation_after_invalid_json() -> Non
     assert pack.value.affordance_effect_profiles
     assert client.calls[0]["previous_response_id"] == "resp-route"
     assert client.calls[1]["previous_response_id"] == "resp-route"
+
+
+def test_raw_responses_client_sends_role_tagged_input_as_separate_messages(monkeypatch) -> None:
+    recorded: dict[str, object] = {}
+
+    class _FakeHTTPResponse:
+        status_code = 200
+
+        def json(self):  # noqa: ANN201
+            return {"id": "resp-demo", "output_text": "{\"pong\": true}", "usage": {}}
+
+    class _FakeHTTPClient:
+        def __init__(self, *, timeout: float, limits=None) -> None:  # noqa: ANN001
+            pass
+
+        def close(self) -> None:
+            pass
+
+        def post(self, url: str, *, headers: dict[str, str], json: dict[str, object], timeout: float):  # noqa: ANN201
+            recorded["json"] = json
+            return _FakeHTTPResponse()
+
+    monkeypatch.setattr("rpg_backend.responses_transport.httpx.Client", _FakeHTTPClient)
+    client = RawResponsesClient(base_url="https://example.test/v1", api_key="secret-key")
+
+    client.responses.create(
+        model="demo-model",
+        instructions="Fixed preamble.",
+        input=[
+            {"role": "user", "content": "shared world"},
+            {"role": "user", "content": "stage prompt\n\n{\"stage\":1}"},
+        ],
+    )
+
+    assert recorded["json"]["messages"] == [
+        {"role": "system", "content": "Fixed preamble."},
+        {"role": "user", "content": "shared world"},
+        {"role": "user", "content": "stage prompt\n\n{\"stage\":1}"},
+    ]
+
+
+def test_shared_transport_counts_the_context_prefix_in_input_characters() -> None:
+    client = FakeClient([{"pong": True}])
+    transport = ResponsesJSONTransport(
+        client=client,  # type: ignore[arg-type]
+        model="demo-model",
+        timeout_seconds=20.0,
+        use_session_cache=False,
+        temperature=0.2,
+        enable_thinking=False,
+        provider_failed_code="provider_failed",
+        invalid_response_code="invalid_response",
+        invalid_json_code="invalid_json",
+        error_factory=lambda code, message, status_code: RuntimeError(f"{code}:{message}:{status_code}"),
+    )
+
+    response = transport.invoke_json(
+        system_prompt="Fixed preamble.",
+        user_payload={"ping": True},
+        max_output_tokens=32,
+        context_prefix="shared world",
+        stage_instructions="stage prompt",
+    )
+
+    sent = client.calls[0]["input"]
+    assert [item["content"] for item in sent] == ["shared world", "stage prompt\n\n{\"ping\": true}"]
+    assert response.input_characters == sum(len(item["content"]) for item in sent)
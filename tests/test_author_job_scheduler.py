@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from fastapi.testclient import TestClient
+import pytest
+
+from rpg_backend.author.job_scheduler import AuthorJobQueueFullError, AuthorJobScheduler
+from rpg_backend.author_v2.product_jobs import ProductAuthorJobService
+from rpg_backend.config import get_settings
+from rpg_backend.main import app
+from tests.auth_helpers import ensure_authenticated_client
+
+
+def test_scheduler_caps_concurrency_serves_users_round_robin_and_rejects_past_depth() -> None:
+    release = threading.Event()
+    counter_lock = threading.Lock()
+    started: list[str] = []
+    running = {"now": 0, "max": 0}
+    reported: list[dict[str, int]] = []
+
+    def _job(name: str):  # noqa: ANN202
+        def _run() -> None:
+            with counter_lock:
+                started.append(name)
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            release.wait(5)
+            with counter_lock:
+                running["now"] -= 1
+
+        return _run
+
+    scheduler = AuthorJobScheduler(max_concurrent=1, max_queue_depth=4, on_queue_changed=lambda positions: reported.append(dict(positions)))
+
+    assert scheduler.submit("a1", "alice", _job("a1")) is None
+    assert scheduler.submit("a2", "alice", _job("a2")) == 1
+    assert scheduler.submit("a3", "alice", _job("a3")) == 2
+    # A second user's first job goes ahead of alice's backlog.
+    assert scheduler.submit("b1", "bob", _job("b1")) == 2
+    assert scheduler.submit("c1", "carol", _job("c1")) == 3
+    assert reported[-1] == {"a2": 1, "b1": 2, "c1": 3, "a3": 4}
+    assert scheduler.position("a3") == 4
+
+    with pytest.raises(AuthorJobQueueFullError) as excinfo:
+        with scheduler.admission():
+            pass
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.retry_after_seconds >= 1
+
+    release.set()
+    for _ in range(200):
+        if len(started) == 5 and scheduler.running_count() == 0:
+            break
+        time.sleep(0.01)
+
+    assert started == ["a1", "a2", "b1", "c1", "a3"]
+    assert running["max"] == 1
+    assert scheduler.queued_count() == 0
+    with scheduler.admission():
+        pass
+
+
+def test_product_author_jobs_queue_behind_the_cap_and_reject_with_retry_after(tmp_path, monkeypatch) -> None:
+    import rpg_backend.main as main_module
+
+    service = ProductAuthorJobService(
+        settings=get_settings().model_copy(
+            update={
+                "runtime_state_db_path": str(tmp_path / "runtime.sqlite3"),
+                "author_product_run_mode": "deterministic",
+                "author_job_max_concurrent": 1,
+                "author_job_max_queue_depth": 1,
+            }
+        )
+    )
+    release = threading.Event()
+    original_run_job = service._run_job
+
+    def _held_run_job(job_id: str) -> None:
+        release.wait(10)
+        original_run_job(job_id)
+
+    monkeypatch.setattr(service, "_run_job", _held_run_job)
+    seed = "董事会前夜，项目负责人被上司、对手和法务一起拖进并购黑账与暧昧站队里"
+    request = type("JobRequest", (), {"prompt_seed": seed, "random_seed": None, "preview_id": None})()
+
+    first = service.create_job(request, actor_user_id="usr_first")
+    second = service.create_job(request, actor_user_id="usr_second")
+
+    assert first.queue_position is None
+    assert (second.status, second.queue_position) == ("queued", 1)
+    with pytest.raises(AuthorJobQueueFullError):
+        service.create_job(request, actor_user_id="usr_third")
+
+    original_service = main_module.author_job_service
+    main_module.author_job_service = service
+    client = TestClient(app)
+    try:
+        ensure_authenticated_client(client, email="author-queue-full@example.com", display_name="Queue Full")
+        rejected = client.post("/author/jobs", json={"prompt_seed": seed})
+    finally:
+        main_module.author_job_service = original_service
+        release.set()
+
+    assert rejected.status_code == 429
+    assert rejected.json()["error"]["code"] == "author_job_queue_full"
+    assert int(rejected.headers["Retry-After"]) == rejected.json()["error"]["retry_after_seconds"]
+
+    for _ in range(400):
+        statuses = [service.get_job(job.job_id, actor_user_id=owner).status for job, owner in ((first, "usr_first"), (second, "usr_second"))]
+        if all(status in {"completed", "failed"} for status in statuses):
+            break
+        time.sleep(0.01)
+
+    assert statuses == ["completed", "completed"]
+    second_events = [event["event"] for event in service._get_record(second.job_id).events]
+    assert second_events[:3] == ["job_created", "queue_position", "job_started"]
+    assert service._get_record(second.job_id).events[1]["data"]["queue_position"] == 1
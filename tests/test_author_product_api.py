@@ -28,6 +28,9 @@ class _FakeAuthorJobService:
         del actor_user_id
         return _preview_response(payload.prompt_seed)
 
+    def ensure_job_capacity(self) -> None:
+        return None
+
     def create_job(self, payload, *, actor_user_id=None):  # noqa: ANN001
         del actor_user_id
         return AuthorJobStatusResponse(
@@ -430,6 +433,71 @@ def _progress_snapshot(stage: str, stage_index: int, total_tokens: int) -> Autho
     )
 
 
+def test_product_author_service_coalesces_duplicate_preview_seeds(tmp_path, monkeypatch) -> None:
+    import threading
+    import time
+
+    import rpg_backend.author_v2.product_jobs as product_jobs_module
+
+    original_run_preview = product_jobs_module.run_preview_blueprint_graph
+    calls: list[str] = []
+
+    def _slow_run_preview(prompt_seed, **kwargs):  # noqa: ANN001, ANN202
+        calls.append(prompt_seed)
+        time.sleep(0.05)
+        return original_run_preview(prompt_seed, **kwargs)
+
+    monkeypatch.setattr(product_jobs_module, "run_preview_blueprint_graph", _slow_run_preview)
+    service = ProductAuthorJobService(
+        settings=get_settings().model_copy(
+            update={
+                "runtime_state_db_path": str(tmp_path / "runtime.sqlite3"),
+                "author_product_run_mode": "deterministic",
+            }
+        )
+    )
+    seed = "董事会前夜，项目负责人被上司、对手和法务一起拖进并购黑账与暧昧站队里"
+    seeds = [seed, f"{seed}。", f"  {seed}  ", seed] * 2
+    previews: list[AuthorPreviewResponse] = []
+
+    def _create(prompt_seed: str) -> None:
+        request = type("PreviewRequest", (), {"prompt_seed": prompt_seed, "random_seed": None})()
+        previews.append(service.create_preview(request, actor_user_id="usr_v2"))
+
+    threads = [threading.Thread(target=_create, args=(prompt_seed,)) for prompt_seed in seeds]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _create(f"{seed}！")
+
+    assert len(calls) == 1
+    assert len({preview.preview_id for preview in previews}) == len(seeds) + 1
+    assert {preview.relationship_hook for preview in previews} == {previews[0].relationship_hook}
+    assert service._preview_cache.stats().hits >= 1
+
+
+def test_preview_blueprint_cache_expires_entries_and_never_caches_failures() -> None:
+    from rpg_backend.author_v2.preview_cache import PreviewBlueprintCache
+
+    now = [0.0]
+    cache = PreviewBlueprintCache(ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+
+    def _failing_build():  # noqa: ANN202
+        raise RuntimeError("provider down")
+
+    try:
+        cache.get_or_build("seed-a", _failing_build)
+    except RuntimeError:
+        pass
+    assert cache.get_or_build("seed-a", lambda: ("a1", True)) == ("a1", "miss")
+    assert cache.get_or_build("seed-a", lambda: ("a2", True)) == ("a1", "hit")
+    assert cache.get_or_build("seed-b", lambda: ("fallback", False)) == ("fallback", "miss")
+    assert cache.get_or_build("seed-b", lambda: ("b", True)) == ("b", "miss")
+    now[0] = 61.0
+    assert cache.get_or_build("seed-a", lambda: ("a3", True)) == ("a3", "miss")
+
+
 def test_story_preview_api_returns_preview_payload() -> None:
     import rpg_backend.main as main_module
 
@@ -485,7 +553,7 @@ def test_author_job_service_reuses_registered_preview(monkeypatch) -> None:
     assert response.preview.preview_id == preview.preview_id
     assert response.preview.prompt_seed == preview.prompt_seed
     assert response.progress.stage == "cast_planned"
-    assert response.status == "running"
+    assert response.status == "queued"
 
 
 def test_author_job_routes_are_scoped_to_actor(monkeypatch) -> None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import os
 import time
 from types import SimpleNamespace
 
@@ -11,7 +13,15 @@ from rpg_backend.author_v2.gateway import (
     get_author_v2_llm_gateway,
     resolve_author_v2_live_mode_chain,
 )
-from rpg_backend.author_v2.ip_library import URBAN_IP_LIBRARY, bind_slots_to_ip_cast, build_slot_candidate_pool
+from rpg_backend.author_v2.ip_library import (
+    URBAN_IP_LIBRARY,
+    bind_slots_to_ip_cast,
+    build_ip_library_index,
+    build_slot_candidate_pool,
+    ip_library_index,
+    profile_by_id,
+)
+from rpg_backend.author_v2.keyword_matcher import KeywordMatcher
 from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
 from rpg_backend.author_v2.product_package import RelationshipDramaV2Package
 from rpg_backend.author_v2.quality_gates import (
@@ -19,13 +29,20 @@ from rpg_backend.author_v2.quality_gates import (
     evaluate_sibling_divergence_gate,
     evaluate_surface_signal_readability,
 )
-from rpg_backend.author_v2.template_library import TEMPLATE_LIBRARY, build_seed_fingerprint, get_template_spec, match_story_template
+from rpg_backend.author_v2.template_library import (
+    TEMPLATE_LIBRARY,
+    build_seed_fingerprint,
+    get_template_spec,
+    match_story_template,
+    match_story_template_with_trace,
+)
 from rpg_backend.author_v2.workflow import (
     _compile_segment_with_mode,
     _compile_single_segment,
     _sanitize_voice_atoms_delta_payload,
     allocate_segment_contracts,
     bind_ip_cast,
+    clear_policy_caches,
     compile_voice_atoms,
     compile_segment_playbooks,
     plan_cast_slots,
@@ -397,6 +414,29 @@ def test_urban_ip_library_expands_to_sixty_profiles_with_gender_balance() -> Non
     assert sum(1 for profile in URBAN_IP_LIBRARY if profile.gender == "male") == 30
 
 
+def test_ip_library_index_limits_slot_ranking_to_compatible_profiles() -> None:
+    library = ip_library_index()
+    blueprint = _accepted_blueprint()
+    cast_slots = plan_cast_slots({"accepted_blueprint": blueprint, "quality_trace": []})["cast_slots"]
+
+    assert profile_by_id() is library.by_id
+    with pytest.raises(TypeError):
+        library.by_id["intruder"] = URBAN_IP_LIBRARY[0]  # type: ignore[index]
+    assert set(library.by_id) == {profile.ip_character_id for profile in URBAN_IP_LIBRARY}
+    for tag, profile_ids in library.profile_ids_by_secret_affinity.items():
+        assert all(tag in library.by_id[profile_id].secret_affinity_tags for profile_id in profile_ids)
+
+    # Profiles that are not registered for the slot's function are never scored.
+    lead_slot = cast_slots[0]
+    subset = build_ip_library_index(
+        [profile for profile in URBAN_IP_LIBRARY if lead_slot.slot_function not in profile.compatible_slot_functions]
+    )
+    assert build_slot_candidate_pool([lead_slot], blueprint, library=subset) == {lead_slot.slot_id: []}
+    pool = build_slot_candidate_pool([lead_slot], blueprint, library=library)[lead_slot.slot_id]
+    assert pool
+    assert {row["ip_character_id"] for row in pool} <= set(library.profile_ids_by_slot_function[lead_slot.slot_function])
+
+
 def test_preview_gender_pref_propagates_to_binding() -> None:
     preview, _ = run_preview_blueprint_graph("豪门订婚宴上，旧录音和家族站队同时逼近。")
     accepted = apply_blueprint_edits(
@@ -529,6 +569,62 @@ def test_compile_voice_atoms_live_calls_gateway_on_first_attempt(monkeypatch) ->
     assert gateway.voice_calls == int(gateway.last_payload.get("batch_count") or 1)
 
 
+def test_compile_voice_atoms_retries_only_failing_batches(monkeypatch) -> None:
+    blueprint = _accepted_blueprint()
+    cast_slots = plan_cast_slots({"accepted_blueprint": blueprint, "quality_trace": []})["cast_slots"]
+    bound_cast = bind_slots_to_ip_cast(cast_slots, blueprint)
+
+    class _FlakyBatchGateway(_DynamicFakeGateway):
+        def __init__(self) -> None:
+            super().__init__()
+            self.voice_payloads: list[dict] = []
+
+        def invoke_json(self, **kwargs):  # noqa: ANN003, ANN201
+            response = super().invoke_json(**kwargs)
+            if kwargs.get("operation_name") != "author_v2.voice_atoms":
+                return response
+            payload = kwargs["user_payload"]
+            self.voice_payloads.append(payload)
+            if payload["batch_index"] == 1 and payload["regeneration_index"] == 1:
+                return SimpleNamespace(payload={"unexpected": True})
+            return response
+
+    gateway = _FlakyBatchGateway()
+    monkeypatch.setattr(
+        "rpg_backend.author_v2.workflow._resolve_live_gateway",
+        lambda live_mode, gateway_override: [("live_gpt_5_4_mini", gateway)],
+    )
+
+    result_state = compile_voice_atoms(
+        {
+            "accepted_blueprint": blueprint,
+            "arc_template_id": "standard_4",
+            "bound_cast": bound_cast,
+            "quality_trace": [],
+            "llm_call_trace": [],
+            "live_mode": "live_gpt_5_4_mini",
+        }
+    )
+    quality_record = next(record for record in result_state["quality_trace"] if record["stage"] == "compile_voice_atoms")
+    batch_count = int(gateway.voice_payloads[0]["batch_count"])
+    retried = [payload for payload in gateway.voice_payloads if payload["regeneration_index"] == 2]
+
+    assert batch_count > 1
+    assert len(gateway.voice_payloads) == batch_count + 1
+    assert [payload["batch_index"] for payload in retried] == [1]
+    assert retried[0]["validation_feedback"].startswith("live_gpt_5_4_mini:batch_1:")
+    assert quality_record["outcome"] == "accepted"
+    assert quality_record["live_attempt_count"] == 2
+    assert quality_record["voice_batch_count"] == batch_count
+    assert quality_record["voice_batch_retry_count"] == 1
+    breakdown = {row["batch_index"]: row for row in quality_record["voice_batch_breakdown"]}
+    assert breakdown[1]["attempts"] == 2 and len(breakdown[1]["latency_ms"]) == 2
+    assert len(breakdown[1]["failures"]) == 1
+    assert all(row["attempts"] == 1 and row["accepted"] for index, row in breakdown.items() if index != 1)
+    voice_trace = [entry for entry in result_state["llm_call_trace"] if entry.get("stage") == "compile_voice_atoms"]
+    assert [entry["batch_index"] for entry in voice_trace] == [*range(1, batch_count + 1), 1]
+
+
 def test_sanitize_voice_atoms_delta_payload_coerces_weight_string() -> None:
     payload = {
         "voice_atom_deltas_by_character": {
@@ -1065,6 +1161,31 @@ def test_preview_normalization_validates_without_post_patch_repair(monkeypatch)
     assert normalize_record["outcome"] == "accepted"
 
 
+def test_keyword_matcher_reports_every_overlapping_keyword() -> None:
+    matcher = KeywordMatcher(["豪门", "豪门恩怨", "门恩", "私生", "私生子", "生子", "录音", "放录音"])
+
+    assert matcher.find("豪门恩怨里私生子当众放录音") == {"豪门", "豪门恩怨", "门恩", "私生", "私生子", "生子", "录音", "放录音"}
+    assert matcher.find("私生活") == {"私生"}
+    assert matcher.find("") == frozenset()
+
+
+def test_seed_fingerprint_reads_keyword_families_from_one_scan() -> None:
+    fingerprint = build_seed_fingerprint("董事会前夜，上司、对手和法务都盯着那本黑账，谁先站队谁背锅。", "15_20")
+    template, trace = match_story_template_with_trace(fingerprint)
+
+    assert fingerprint.public_shell_id == "office_power"
+    assert fingerprint.arena_type == "board_vote"
+    assert fingerprint.secret_class == "black_ledger"
+    assert fingerprint.relationship_geometry == "boss_rival_legal"
+    assert fingerprint.route_preference_bias == "side"
+    assert fingerprint.source_markers[:2] == ["董事会", "黑账"]
+    assert template.template_id == "office_board_vote_blackledger"
+    assert trace["decision_hint_hits"] == ["董事会", "法务", "黑账"]
+    assert {item["template_id"] for item in trace["candidate_scores"]} <= {
+        item.template_id for item in TEMPLATE_LIBRARY if item.shell_id == "office_power"
+    }
+
+
 def test_every_modern_template_has_tone_example_pack() -> None:
     modern_templates = [template for template in TEMPLATE_LIBRARY if template.shell_id != "urban_supernatural"]
 
@@ -1336,6 +1457,38 @@ def test_compile_play_plan_applies_semantic_autotune_patch(monkeypatch) -> None:
     )
 
 
+def test_compile_play_plan_reuses_policies_and_reloads_changed_patch_file(monkeypatch, tmp_path) -> None:
+    patch_path = tmp_path / "semantic_patch.json"
+    patch_path.write_text(json.dumps({"recommended_overrides": {"utility_weight_profile": {"intent_hit_weight_delta": 1}}}))
+    monkeypatch.setenv("APP_SEMANTIC_AUTOTUNE_PATCH_PATH", str(patch_path))
+    get_settings.cache_clear()
+    clear_policy_caches()
+    try:
+        first = run_author_play_graph(_accepted_blueprint())
+        second = run_author_play_graph(_accepted_blueprint())
+        first_record = next(record for record in first.state["quality_trace"] if record["stage"] == "compile_play_plan")
+        second_record = next(record for record in second.state["quality_trace"] if record["stage"] == "compile_play_plan")
+
+        assert first_record["policy_cache"] == "miss"
+        assert second_record["policy_cache"] == "hit"
+        assert second_record["policy_compile_ms"] >= 0
+        assert second.play_plan.semantic_strategy_pack is first.play_plan.semantic_strategy_pack
+
+        patch_path.write_text(json.dumps({"recommended_overrides": {"utility_weight_profile": {"intent_hit_weight_delta": 2}}}))
+        os.utime(patch_path, ns=(patch_path.stat().st_mtime_ns + 1_000_000_000,) * 2)
+        third = run_author_play_graph(_accepted_blueprint())
+        third_record = next(record for record in third.state["quality_trace"] if record["stage"] == "compile_play_plan")
+
+        assert third_record["policy_cache"] == "miss"
+        assert (
+            third.play_plan.semantic_strategy_pack.utility_weight_profile.intent_hit_weight
+            == first.play_plan.semantic_strategy_pack.utility_weight_profile.intent_hit_weight + 1
+        )
+    finally:
+        get_settings.cache_clear()
+        clear_policy_caches()
+
+
 def test_segment_playbook_payload_uses_delta_contract_and_base_excerpt(monkeypatch) -> None:
     blueprint = _accepted_blueprint()
     cast_slots = plan_cast_slots({"accepted_blueprint": blueprint, "quality_trace": []})["cast_slots"]
@@ -16,3 +16,56 @@ def test_compiled_plan_roundtrip() -> None:
     assert reloaded.delta_pack_contract_version == 5
     assert reloaded.semantic_strategy_pack.role_divergence_matrix.default_crowd_reason_priority
     assert reloaded.semantic_strategy_pack.supporting_divergence_policy.key_segment_required_pairs
+
+
+def test_plan_bridge_reprojects_only_the_edited_slice(monkeypatch) -> None:
+    import rpg_backend.author_v3.plan_bridge as plan_bridge
+
+    result = run_author_v3_pipeline("董事会前夜，上司和法务把她拖进并购黑账", run_mode="deterministic")
+    args = [
+        result["world_config"],
+        result["relationship_matrix"],
+        result["tension_web"],
+        result["storylet_pool"],
+        result["mapped_segments"],
+        result["quality_report"],
+    ]
+    plan_bridge.clear_projection_caches()
+    plan_bridge.bridge_to_plan(*args)
+
+    calls: dict[str, int] = {}
+    for name in ("_resolve_shell_defaults", "_build_cast_member", "_build_compiled_segment", "_build_semantic_strategy_pack"):
+        original = getattr(plan_bridge, name)
+
+        def _counted(*call_args, _name=name, _original=original, **call_kwargs):  # noqa: ANN002, ANN003, ANN202
+            calls[_name] = calls.get(_name, 0) + 1
+            return _original(*call_args, **call_kwargs)
+
+        monkeypatch.setattr(plan_bridge, name, _counted)
+
+    pool = args[3]
+    mapped_storylet_id = args[4][0].source_storylet_id
+    edited_storylets = [
+        storylet.model_copy(update={"scene_text": "改写后的场景：她在董事会前夜拿到了黑账原件。"})
+        if storylet.storylet_id == mapped_storylet_id
+        else storylet
+        for storylet in pool.storylets
+    ]
+    args[3] = pool.model_copy(update={"storylets": edited_storylets})
+    incremental = plan_bridge.bridge_to_plan(*args)
+
+    assert calls == {}
+    assert incremental.segments[0].source_storylet["scene_text"] == "改写后的场景：她在董事会前夜拿到了黑账原件。"
+    assert any(item["scene_text"] == "改写后的场景：她在董事会前夜拿到了黑账原件。" for item in incremental.storylet_pool)
+
+    plan_bridge.clear_projection_caches()
+    full = plan_bridge.bridge_to_plan(*args)
+    assert calls["_build_compiled_segment"] == len(args[4])
+
+    def _comparable(plan: CompiledPlayPlan) -> dict:
+        payload = plan.model_dump(mode="json", exclude={"story_id"})
+        payload["delta_kernel"].pop("kernel_id")
+        payload["initial_beat_delta_pack"].pop("snapshot_id")
+        return payload
+
+    assert _comparable(incremental) == _comparable(full)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import os
+from types import SimpleNamespace
+
+from rpg_backend.author_v3.gateway import AuthorV3LLMGateway
+from rpg_backend.author_v3.relationship_matrix import build_relationship_matrix
+from rpg_backend.author_v3.stage_context import summarize_stage_usage, world_context_prefix
+from rpg_backend.author_v3.storylet_compiler import compile_storylet_pool
+from rpg_backend.author_v3.tension_weaver import weave_secrets
+from rpg_backend.author_v3.world_forge import forge_world
+
+
+def _prompt_text(request: dict[str, object]) -> str:
+    messages = request["input"]
+    contents = [str(item["content"]) for item in messages] if isinstance(messages, list) else [str(messages)]
+    return "\n\n".join([str(request["instructions"]), *contents])
+
+
+class _PrefixCachingClient:
+    """Answers every call with a fixed payload and reports the shared leading prefix as cached tokens."""
+
+    def __init__(self, payloads: dict[str, dict[str, object]]) -> None:
+        self.responses = self
+        self.requests: list[dict[str, object]] = []
+        self._payloads = payloads
+
+    def create(self, **kwargs):  # noqa: ANN201
+        prompt = _prompt_text(kwargs)
+        cached = max((len(os.path.commonprefix([prompt, _prompt_text(seen)])) for seen in self.requests), default=0)
+        self.requests.append(kwargs)
+        payload = self._payloads["storylets" if "叙事片段编译器" in prompt else "web"]
+        return SimpleNamespace(
+            id=f"resp_{len(self.requests)}",
+            output_text=json.dumps(payload, ensure_ascii=False),
+            usage={
+                "input_tokens": len(prompt),
+                "output_tokens": 10,
+                "input_tokens_details": {"cached_tokens": cached},
+            },
+        )
+
+
+def test_live_stages_share_a_byte_stable_world_prefix_and_report_stage_usage() -> None:
+    config = forge_world("董事会权力斗争")
+    matrix = build_relationship_matrix(config)
+    deterministic_web = weave_secrets(config, matrix)
+    client = _PrefixCachingClient(
+        {
+            "web": deterministic_web.model_dump(mode="json"),
+            "storylets": compile_storylet_pool(config, deterministic_web, matrix).model_dump(mode="json"),
+        }
+    )
+    gateway = AuthorV3LLMGateway(client=client, model="test-model", profile_id="pure_gpt", timeout_seconds=1.0)
+
+    web = weave_secrets(config, matrix, gateway=gateway, max_rounds=1, threshold=1.1)
+    compile_storylet_pool(config, web, matrix, gateway=gateway)
+
+    prefix = world_context_prefix(config, matrix)
+    # Reordering the cast or the edges renders the same bytes.
+    shuffled = config.model_copy(update={"characters": list(reversed(config.characters))})
+    assert world_context_prefix(shuffled, matrix.model_copy(update={"edges": list(reversed(matrix.edges))})) == prefix
+
+    operations = [entry["operation"] for entry in gateway.call_trace]
+    assert operations == ["author_v3_weave_secrets", "author_v3_strengthen_tension", "author_v3_compile_storylets"]
+    # One fixed system prompt, then the world as user content, then the stage's own prompt and data.
+    assert len({str(request["instructions"]) for request in client.requests}) == 1
+    assert all(prefix not in str(request["instructions"]) for request in client.requests)
+    assert all(request["input"][0] == {"role": "user", "content": prefix} for request in client.requests)
+    stage_messages = [str(request["input"][1]["content"]) for request in client.requests]
+    assert all("characters" not in json.loads(message.rsplit("\n\n", 1)[-1]) for message in stage_messages)
+    assert {entry["context_prefix_characters"] for entry in gateway.call_trace} == {len(prefix)}
+    assert all(entry["usage"]["cached_input_tokens"] >= len(prefix) for entry in gateway.call_trace[1:])
+    assert all(isinstance(entry["elapsed_ms"], int) for entry in gateway.call_trace)
+
+    usage = summarize_stage_usage(gateway.call_trace)
+    assert list(usage) == operations
+    assert usage["author_v3_compile_storylets"]["calls"] == 1
+    assert usage["author_v3_compile_storylets"]["cached_input_tokens"] >= len(prefix)
+    assert usage["author_v3_weave_secrets"]["cached_input_tokens"] == 0
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from threading import Event
+import time
+
+import pytest
+
+from rpg_backend.author_v2.contracts import CompiledPlayPlan
+from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+from rpg_backend.author_v2.workflow import run_author_play_graph
+import rpg_backend.play_v2.runtime as runtime_module
+from rpg_backend.play_v2.compose_hedge import (
+    hedge_delay_ms,
+    record_compose_latency,
+    reset_compose_latency_window,
+    run_hedged,
+)
+from rpg_backend.play_v2.runtime import build_initial_world_state, build_suggested_actions, run_turn
+
+
+def test_parallel_hedge_commits_first_valid_arrival_and_reports_stragglers() -> None:
+    release_slow = Event()
+
+    def _candidate(index: int) -> tuple[int, bool]:
+        if index == 0:
+            release_slow.wait(2)
+            return index, True
+        if index == 1:
+            return index, False
+        time.sleep(0.02)
+        return index, True
+
+    outcome = run_hedged(_candidate, is_valid=lambda result: result[1], mode="parallel", candidates=3)
+    release_slow.set()
+
+    assert outcome.winner == (2, True)
+    assert outcome.winner_index == 2
+    assert outcome.rejected == [(1, False)]
+    assert outcome.launched == 3
+    assert outcome.cancelled + outcome.abandoned == 1
+
+
+def test_delayed_hedge_launches_backup_only_after_delay_or_failure() -> None:
+    launched_at: list[float] = []
+    release_first = Event()
+
+    def _slow_first(index: int) -> int:
+        launched_at.append(time.perf_counter())
+        if index == 0:
+            release_first.wait(2)
+        return index
+
+    started = time.perf_counter()
+    outcome = run_hedged(_slow_first, is_valid=lambda _: True, mode="delayed", candidates=2, delay_ms=50)
+    release_first.set()
+
+    assert outcome.winner == 1
+    assert outcome.launched == 2
+    assert outcome.abandoned == 1
+    assert launched_at[1] - started >= 0.045
+
+    fast = run_hedged(lambda index: index, is_valid=lambda _: True, mode="delayed", candidates=3, delay_ms=1000)
+    assert (fast.winner, fast.launched) == (0, 1)
+
+    failing = run_hedged(lambda index: index, is_valid=lambda index: index == 2, mode="delayed", candidates=3, delay_ms=1000)
+    assert (failing.winner, failing.launched, failing.rejected) == (2, 3, [0, 1])
+
+
+def test_hedge_delay_uses_latency_percentile_once_window_is_warm() -> None:
+    reset_compose_latency_window()
+    try:
+        assert hedge_delay_ms(percentile=90, fallback_ms=1500) == 1500
+        for latency in range(10, 110, 10):
+            record_compose_latency(latency)
+        assert hedge_delay_ms(percentile=90, fallback_ms=1500) == pytest.approx(91.0)
+    finally:
+        reset_compose_latency_window()
+
+
+@pytest.fixture(scope="module")
+def v2_plan() -> CompiledPlayPlan:
+    preview, _ = run_preview_blueprint_graph("校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。")
+    accepted = apply_blueprint_edits(preview)
+    return run_author_play_graph(accepted).play_plan
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict[str, object], usage: dict[str, int]) -> None:
+        self.payload = payload
+        self.usage = usage
+
+
+class _ShellMissOnFirstCandidateClient:
+    """The first compose candidate is slow and misses the shell token."""
+
+    def __init__(self) -> None:
+        self.compose_payloads: list[dict[str, object]] = []
+
+    def _invoke_json(self, **kwargs):  # noqa: ANN003, ANN204
+        user_payload = dict(kwargs.get("user_payload") or {})
+        self.compose_payloads.append(user_payload)
+        compose_input = dict(user_payload.get("compose_input") or {})
+        target_name = dict(compose_input.get("fact_pack") or {}).get("target_name", "对方")
+        shell_tokens = list(dict(compose_input.get("style_card") or {}).get("shell_tokens") or [])
+        if "candidate_index" not in user_payload:
+            time.sleep(0.05)
+            narration = f"{target_name}把话说死，周围人都听见了代价。"
+        else:
+            narration = f"{target_name}把话压进{shell_tokens[0] if shell_tokens else '场上'}里，周围人都听见了代价。"
+        return _FakeResponse(
+            {
+                "narration": narration,
+                "coverage_marks": {"target": True, "move": True, "consequence": True, "relationship": True},
+                "length_profile": "normal",
+            },
+            {"input_tokens": 100, "output_tokens": 40, "total_tokens": 140},
+        )
+
+
+def test_run_turn_hedged_compose_commits_valid_backup_candidate(monkeypatch: pytest.MonkeyPatch, v2_plan: CompiledPlayPlan) -> None:
+    settings = type(
+        "_SettingsStub",
+        (),
+        {
+            "play_v2_dramatic_rewrite_max_output_tokens": 320,
+            "play_v2_dramatic_rewrite_use_llm": True,
+            "play_v2_intent_compiler_use_llm": False,
+            "play_v2_micro_sim_use_llm": False,
+            "internal_test_strict_no_repair_fallback": False,
+            "play_v2_compose_hedge_mode": "parallel",
+            "play_v2_compose_hedge_candidates": 2,
+        },
+    )()
+    gateway = _ShellMissOnFirstCandidateClient()
+    monkeypatch.setattr(runtime_module, "get_play_llm_gateway", lambda _settings: gateway)
+    monkeypatch.setenv("APP_PLAY_V2_ALLOW_LIVE_LLM_IN_TESTS", "true")
+    monkeypatch.setattr(runtime_module, "get_settings", lambda: settings)
+
+    state = build_initial_world_state(v2_plan, session_id="hedged-compose")
+    action = build_suggested_actions(v2_plan, state)[0]
+    result = run_turn(v2_plan, state, action.prompt, selected_suggestion_id=action.suggestion_id)
+
+    diagnostics = result.intent_stage_diagnostics
+    assert diagnostics["compose_hedge_mode"] == "parallel"
+    assert diagnostics["compose_hedge_launched"] == 2
+    assert diagnostics["compose_hedge_winner_index"] == 1
+    assert diagnostics["compose_retry_count"] == 0
+    assert diagnostics["narration_compose_source"] == "llm"
+    assert diagnostics["compose_total_tokens"] >= 140
+    assert diagnostics["compose_hedge_extra_total_tokens"] + diagnostics["compose_hedge_abandoned_token_budget"] > 0
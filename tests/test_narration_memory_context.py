@@ -2,9 +2,20 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import pytest
+
 from rpg_backend.author_v2.contracts import CompiledPlayPlan
 from rpg_backend.play_v2.contracts import HookState, NarrationEventEntry, NarrationSegmentSummary, UrbanWorldState
-from rpg_backend.play_v2.narration_memory import build_narration_memory_context
+from rpg_backend.play_v2.narration_memory import (
+    append_narration_event,
+    attach_narration_event_deltas,
+    build_narration_memory_context,
+    clear_narration_memory_cache,
+    consolidate_segment_memory,
+    narration_memory_cache_stats,
+    narration_memory_key,
+)
+import rpg_backend.play_v2.narration_memory as narration_memory_module
 
 
 def _make_hook_state(
@@ -283,3 +294,63 @@ def test_backward_compat_existing_fields_remain_present_and_correct() -> None:
     assert context["event_phrases"] == ["first phrase", "second phrase"]
     assert context["summary_texts"] == ["summary one", "summary two"]
     assert context["summary_key_events"] == ["event_a", "event_b", "event_c"]
+
+
+def test_memory_context_is_memoised_by_content_and_tracks_new_events() -> None:
+    clear_narration_memory_cache()
+    state = UrbanWorldState.model_construct(
+        narration_event_log=[],
+        narration_segment_summaries=[],
+        hook_states={
+            "hook_1": _make_hook_state(
+                status="active", leverage_value=0.7, holder_id="npc_a", target_id="npc_b", source_secret_id="s1"
+            )
+        },
+    )
+    append_narration_event(state, turn_index=1, narration="她把旧录音放在桌上，所有人都安静了。", move_family="expose")
+    speculative = state.model_copy(deep=True)
+
+    first = build_narration_memory_context(speculative, current_turn_npc_ids=[])
+    second = build_narration_memory_context(state, current_turn_npc_ids=[])
+
+    assert second == first
+    assert second is not first
+    assert narration_memory_cache_stats()["hits"] == 1
+
+    append_narration_event(state, turn_index=2, narration="他当众否认，声音却在发抖。", move_family="deny")
+    after_event = build_narration_memory_context(state, current_turn_npc_ids=[])
+    assert len(after_event["event_phrases"]) == 2
+    assert after_event["active_hook_summary"] == first["active_hook_summary"]
+
+    consolidate_segment_memory(state, segment_id="seg_1", segment_role="opening")
+    after_segment = build_narration_memory_context(state, current_turn_npc_ids=[])
+    assert after_segment["event_phrases"] == []
+    assert len(after_segment["summary_texts"]) == 1
+
+
+def test_memory_key_reuses_layer_keys_built_when_the_log_changed(monkeypatch: pytest.MonkeyPatch) -> None:
+    clear_narration_memory_cache()
+    state = UrbanWorldState.model_construct(narration_event_log=[], narration_segment_summaries=[], hook_states={})
+    append_narration_event(state, turn_index=1, narration="她把旧录音放在桌上，所有人都安静了。", move_family="expose")
+    phrase = state.narration_event_log[-1].phrase
+    attach_narration_event_deltas(state, turn_index=1, phrase=phrase, relationship_deltas={"npc_a": {"trust": -1.0}})
+    key = narration_memory_key(state, current_turn_npc_ids=[])
+
+    calls: list[int] = []
+    original = narration_memory_module._event_layer_key
+    monkeypatch.setattr(
+        narration_memory_module,
+        "_event_layer_key",
+        lambda event_log: calls.append(len(event_log)) or original(event_log),
+    )
+
+    assert narration_memory_key(state, current_turn_npc_ids=[]) == key
+    assert build_narration_memory_context(state, current_turn_npc_ids=[])["relationship_trajectory"] == {
+        "npc_a": {"trust": "falling"}
+    }
+    assert calls == []
+
+    append_narration_event(state, turn_index=2, narration="他当众否认，声音却在发抖。", move_family="deny")
+    assert calls == [2]
+    assert narration_memory_key(state, current_turn_npc_ids=[]) != key
+    assert calls == [2]
@@ -230,3 +230,19 @@ def test_username_case_insensitive_resolves_same_account() -> None:
     assert mixed.status_code == 200
     assert lower.json()["user"]["user_id"] == same_id
     assert mixed.json()["user"]["user_id"] == same_id
+
+
+def test_app_shutdown_closes_play_service_and_turn_worker_pool(monkeypatch) -> None:
+    calls: list[str] = []
+
+    class _ClosingPlayService:
+        def close(self) -> None:
+            calls.append("play_service")
+
+    monkeypatch.setattr(main_module, "play_session_service", _ClosingPlayService())
+    monkeypatch.setattr(main_module, "shutdown_turn_worker_pool", lambda: calls.append("turn_workers"))
+
+    with TestClient(app):
+        assert calls == []
+
+    assert calls == ["play_service", "turn_workers"]
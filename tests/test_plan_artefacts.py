@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from rpg_backend.author_v2.contracts import CompiledPlayPlan
+from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+from rpg_backend.author_v2.workflow import run_author_play_graph
+from rpg_backend.play_v2.narration_frames import build_tone_example_pools, build_tone_example_style_hints
+from rpg_backend.play_v2.plan_artefacts import clear_plan_artefacts, plan_artefact_cache_stats, plan_fingerprint
+from rpg_backend.play_v2.runtime import (
+    _build_default_suggestion_lanes,
+    _segment_artefacts,
+    _segment_suggestion_lanes,
+    build_initial_world_state,
+)
+
+
+@pytest.fixture(scope="module")
+def v2_plan() -> CompiledPlayPlan:
+    preview, _ = run_preview_blueprint_graph("校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。")
+    accepted = apply_blueprint_edits(preview)
+    return run_author_play_graph(accepted).play_plan
+
+
+def test_pooled_style_hints_match_per_turn_rebuild(v2_plan: CompiledPlayPlan) -> None:
+    state = build_initial_world_state(v2_plan, session_id="pooled-hints")
+    for segment in v2_plan.segments:
+        pools = build_tone_example_pools(segment)
+        for turn_index in range(6):
+            state.turn_index = turn_index
+            state.scene_heat = turn_index
+            state.recent_example_bucket_ids = list(
+                build_tone_example_style_hints(segment, state).used_bucket_ids
+            )[: turn_index % 3]
+            assert build_tone_example_style_hints(segment, state, pools=pools) == build_tone_example_style_hints(
+                segment, state
+            )
+
+
+def test_segment_artefacts_are_shared_by_plan_content(v2_plan: CompiledPlayPlan) -> None:
+    clear_plan_artefacts()
+    copy = CompiledPlayPlan.model_validate(v2_plan.model_dump(mode="json"))
+    segment = v2_plan.segments[0]
+
+    first = _segment_artefacts(v2_plan, segment)
+    second = _segment_artefacts(copy, copy.segments[0])
+
+    assert plan_fingerprint(copy) == plan_fingerprint(v2_plan)
+    assert second is first
+    assert plan_artefact_cache_stats()["hits"] == 1
+    lane_segment = segment.model_copy(update={"suggestion_lanes": []})
+    assert _segment_suggestion_lanes(lane_segment, v2_plan) == _build_default_suggestion_lanes(segment, v2_plan)
+    edited = v2_plan.model_copy(update={"title": f"{v2_plan.title} (edited)"})
+    assert _segment_artefacts(edited, edited.segments[0]) is not first
+    with pytest.raises(ValidationError):
+        v2_plan.title = f"{v2_plan.title} (edited in place)"  # type: ignore[misc]
+    assert _segment_artefacts(v2_plan, segment) is first
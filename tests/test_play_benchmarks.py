@@ -5,6 +5,7 @@ from pathlib import Path
 
 from tools.play_benchmarks import runner
 from tools.play_benchmarks import fullstack_runner
+from tools.play_benchmarks import turn_engine_benchmark
 
 
 def test_parse_play_benchmark_args_defaults(tmp_path: Path) -> None:
@@ -100,3 +101,29 @@ def test_fullstack_runner_parse_args_defaults(tmp_path: Path) -> None:
     assert config.suite == "stability_smoke"
     assert config.output_dir == tmp_path.resolve()
     assert config.play_ttl_seconds == 3600
+
+
+def test_turn_engine_benchmark_runs_stubbed_turns_and_flags_regressions() -> None:
+    import rpg_backend.play_v2.runtime as runtime_module
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import run_author_play_graph
+
+    preview, _ = run_preview_blueprint_graph(turn_engine_benchmark._SEED)
+    base_plan = run_author_play_graph(apply_blueprint_edits(preview)).play_plan
+    tier = turn_engine_benchmark.BenchmarkTier(name="tiny", extra_cast=1, storylets=4, latent_events=2)
+    plan = turn_engine_benchmark.build_synthetic_plan(base_plan, tier, seed=3)
+    original_settings = runtime_module.get_settings
+
+    report = turn_engine_benchmark.run_tier(plan, tier, turns=3, warmup_turns=1, seed=3, allocations=True)
+
+    assert runtime_module.get_settings is original_settings
+    assert report["plan"] == {"cast": len(base_plan.cast) + 1, "storylets": 4, "latent_events": 2}
+    assert report["turns"] == 3
+    assert report["llm_operations"]["play_v2.narration_compose"] == 3
+    assert {"run_intent_stage", "apply_turn_resolution", "_render_narration", "other"} <= set(report["stages_ms"])
+    assert report["allocations"]["peak_kib"]["p50"] > 0
+
+    baseline = {"tiers": {"tiny": {"run_turn_ms": {"p50": 10.0, "p95": 12.0, "p99": 12.0}}}}
+    current = {"tiers": {"tiny": {"run_turn_ms": {"p50": 10.5, "p95": 20.0, "p99": 12.0}}}}
+    regressions = turn_engine_benchmark.compare_to_baseline(current, baseline, tolerance=0.25, slack_ms=1.0)
+    assert regressions == ["tiny run_turn p95: 12.000ms -> 20.000ms"]
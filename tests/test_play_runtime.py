@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
+import threading
 
 import pytest
 
@@ -25,6 +26,7 @@ import rpg_backend.play.service as play_service_module
 from rpg_backend.play.service import PlayServiceError, PlaySessionService
 from rpg_backend.play.session_handlers import LegacyPlaySessionHandler, V2PlaySessionHandler
 from rpg_backend.play_v2.contracts import UrbanWorldState
+from rpg_backend.play_v2.runtime import parse_turn_intent
 from rpg_backend.config import Settings
 from tests.author_fixtures import author_fixture_bundle
 
@@ -210,6 +212,38 @@ def test_play_service_draft_intent_reuse_on_submit_turn(tmp_path) -> None:
     assert int(usage.get("draft_call_count") or 0) >= 1
 
 
+def test_play_service_prewarms_next_turn_in_background(tmp_path) -> None:
+    library_service, story = _publish_v2_story(tmp_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+    )
+    snapshot = service.create_session(story.story_id)
+    service.submit_turn(snapshot.session_id, PlayTurnRequest(input_text="我先稳住她，再慢慢追问。"))
+    pending = service._prewarm_futures[snapshot.session_id]
+    bundle = pending.future.result(timeout=5)
+    record = service._get_record(snapshot.session_id)
+    assert isinstance(record.state, UrbanWorldState)
+    assert pending.state_snapshot_id == service._state_snapshot_id(record.state)
+    assert [item.suggestion_id for item in bundle.suggested_actions] == [
+        item.suggestion_id for item in record.state.story_actions
+    ]
+
+    for input_text in ("我当众追问她旧录音的事。", bundle.suggested_actions[0].prompt, "嗯"):
+        baseline = parse_turn_intent(record.plan, record.state, input_text)
+        prefetched = parse_turn_intent(
+            record.plan,
+            record.state,
+            input_text,
+            prefetched_legalization=bundle.legalization,
+        )
+        assert prefetched == baseline
+
+    service.submit_turn(snapshot.session_id, PlayTurnRequest(input_text="我转头去问另一个人。"))
+    usages = [dict(trace.interpret_usage or {}) for trace in service.get_turn_traces(snapshot.session_id)]
+    assert [usage.get("prefetch_source") for usage in usages] == ["background", "background"]
+
+
 def test_play_service_draft_intent_uses_gateway_only_for_final_fragment(tmp_path, monkeypatch) -> None:
     library_service, story = _publish_v2_story(tmp_path)
     service = PlaySessionService(
@@ -243,6 +277,43 @@ def test_play_service_draft_intent_uses_gateway_only_for_final_fragment(tmp_path
     assert observed_gateways[1] is sentinel_gateway
 
 
+def test_play_service_read_phase_spec_compose_starts_from_the_background_prewarm(tmp_path, monkeypatch) -> None:
+    library_service, story = _publish_v2_story(tmp_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=Settings(play_v2_spec_compose_prewarm_enabled=True),
+    )
+    monkeypatch.setattr(play_service_module, "_SPEC_COMPOSE_PREWARM_ENABLED", True)
+    monkeypatch.setattr(service, "_should_schedule_read_phase_prewarm", lambda **kwargs: True)  # noqa: ARG005
+    scheduled: list[dict[str, object]] = []
+    monkeypatch.setattr(service, "_schedule_spec_compose_job", lambda **kwargs: scheduled.append(dict(kwargs)))
+    build_threads: list[str] = []
+    build_bundle = service._build_prewarm_bundle
+
+    def _recording_build(**kwargs):  # noqa: ANN003, ANN202
+        build_threads.append(threading.current_thread().name)
+        return build_bundle(**kwargs)
+
+    monkeypatch.setattr(service, "_build_prewarm_bundle", _recording_build)
+    snapshot = service.create_session(story.story_id)
+    first_action = snapshot.story_actions[0]
+    service.submit_turn(
+        snapshot.session_id,
+        PlayTurnRequest(
+            input_text=first_action.prompt,
+            selected_suggestion_id=first_action.suggestion_id,
+            selected_story_action_id=first_action.suggestion_id,
+        ),
+    )
+
+    bundle = service._prewarm_futures[snapshot.session_id].future.result(timeout=5)
+    assert build_threads and all(name.startswith("turn-prewarm") for name in build_threads)
+    read_phase_calls = [item for item in scheduled if str(item.get("source", "")).startswith("read_phase:")]
+    assert read_phase_calls
+    assert all(item["prefetched_suggestions"] is bundle.suggested_actions for item in read_phase_calls)
+
+
 def test_play_service_draft_intent_compose_prewarm_forced_disabled_even_if_setting_enabled(tmp_path, monkeypatch) -> None:
     library_service, story = _publish_v2_story(tmp_path)
     service = PlaySessionService(
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from rpg_backend.config import Settings
+from rpg_backend.play.contracts import PlayTurnRequest
+from rpg_backend.play.service import PlaySessionService
+from rpg_backend.play.session_cache import PlaySessionCache
+from rpg_backend.play.storage import SQLitePlaySessionStorage
+from tests.test_play_runtime import _no_gateway, _publish_story
+
+
+def _cache(*, clock: dict[str, float], evicted: list[str], **overrides) -> PlaySessionCache:  # noqa: ANN003
+    options = {"max_entries": 2, "max_bytes": 10_000, "max_idle_seconds": 60.0}
+    options.update(overrides)
+    return PlaySessionCache(
+        on_evict=lambda session_id, _record: evicted.append(session_id),
+        clock=lambda: clock["now"],
+        **options,
+    )
+
+
+def test_session_cache_evicts_least_recently_used_and_drops_its_lock() -> None:
+    clock = {"now": 0.0}
+    evicted: list[str] = []
+    cache = _cache(clock=clock, evicted=evicted)
+
+    cache.put("a", "record-a", size_bytes=10)
+    cache.put("b", "record-b", size_bytes=10)
+    assert cache.get("a") == "record-a"
+    cache.put("c", "record-c", size_bytes=10)
+
+    assert evicted == ["b"]
+    assert cache.get("b") is None
+    assert "b" not in cache._slots
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.capacity_evictions) == (1, 1, 1)
+    assert (stats.resident_entries, stats.resident_bytes) == (2, 20)
+
+
+def test_session_cache_respects_byte_budget_and_pinned_slots() -> None:
+    clock = {"now": 0.0}
+    evicted: list[str] = []
+    cache = _cache(clock=clock, evicted=evicted, max_entries=10, max_bytes=100)
+
+    cache.put("a", "record-a", size_bytes=60)
+    with cache.lock("a"):
+        cache.put("b", "record-b", size_bytes=60)
+        assert evicted == []
+        assert cache.peek("a") == "record-a"
+    cache.put("c", "record-c", size_bytes=30)
+
+    assert evicted == ["a"]
+    assert cache.stats().resident_bytes == 90
+
+
+def test_session_cache_sweeps_idle_records() -> None:
+    clock = {"now": 0.0}
+    evicted: list[str] = []
+    cache = _cache(clock=clock, evicted=evicted)
+
+    cache.put("a", "record-a", size_bytes=10)
+    clock["now"] = 30.0
+    cache.put("b", "record-b", size_bytes=10)
+    clock["now"] = 75.0
+
+    assert cache.sweep_idle() == 1
+    assert evicted == ["a"]
+    assert cache.stats().idle_evictions == 1
+    assert cache.peek("b") == "record-b"
+
+
+def test_session_cache_keeps_record_when_write_through_fails() -> None:
+    def _failing_evict(_session_id: str, _record: object) -> None:
+        raise RuntimeError("disk full")
+
+    cache = PlaySessionCache(max_entries=1, max_bytes=1_000, max_idle_seconds=60.0, on_evict=_failing_evict)
+    cache.put("a", "record-a", size_bytes=10)
+    cache.put("b", "record-b", size_bytes=10)
+
+    assert cache.peek("a") == "record-a"
+    assert cache.stats().resident_entries == 2
+
+
+def test_play_service_writes_through_evicted_sessions_and_reloads_them(tmp_path) -> None:
+    library_service, story = _publish_story(tmp_path)
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_cache_max_entries=1,
+        play_session_cache_sweep_interval_seconds=0,
+    )
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=SQLitePlaySessionStorage(settings.runtime_state_db_path),
+    )
+    first = service.create_session(story.story_id)
+    played = service.submit_turn(
+        first.session_id,
+        PlayTurnRequest(input_text="I verify the first blackout ledger before anyone can revise it."),
+    )
+    second = service.create_session(story.story_id)
+
+    assert service._session_cache.peek(first.session_id) is None
+    restored = service.get_session(first.session_id)
+    diagnostics = service.get_session_diagnostics(second.session_id)
+
+    assert restored.turn_index == played.turn_index
+    assert restored.narration == played.narration
+    assert service._session_cache.peek(first.session_id) is None
+    assert service._session_cache.peek(second.session_id) is not None
+    assert diagnostics.session_cache is not None
+    assert diagnostics.session_cache.capacity_evictions >= 2
+    assert diagnostics.session_cache.resident_entries == 1
+    assert diagnostics.session_cache.resident_bytes > 0
+    assert 0.0 < diagnostics.session_cache.hit_rate < 1.0
+
+
+def test_play_service_sweeper_expires_resident_sessions_without_a_request(tmp_path) -> None:
+    library_service, story = _publish_story(tmp_path)
+    clock = {"now": datetime(2026, 4, 7, 10, 0, tzinfo=timezone.utc)}
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_ttl_seconds=60,
+        play_session_cache_sweep_interval_seconds=0,
+    )
+    storage = SQLitePlaySessionStorage(settings.runtime_state_db_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+        now_provider=lambda: clock["now"],
+    )
+    created = service.create_session(story.story_id)
+    clock["now"] = clock["now"] + timedelta(seconds=61)
+
+    service.sweep_session_cache()
+
+    payload = storage.get_session(created.session_id)
+    assert payload is not None
+    assert payload["state"]["payload"]["status"] == "expired"
+    assert payload["finished_at"] is not None
+
+
+def test_play_service_sweeps_lazily_on_access_and_skips_clean_evictions(tmp_path, monkeypatch) -> None:
+    import rpg_backend.play.service as play_service_module
+
+    library_service, story = _publish_story(tmp_path)
+    clock = {"now": datetime(2026, 4, 7, 10, 0, tzinfo=timezone.utc), "monotonic": 0.0}
+    monkeypatch.setattr(play_service_module, "monotonic", lambda: clock["monotonic"])
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_ttl_seconds=60,
+        play_session_cache_sweep_interval_seconds=30,
+    )
+    storage = SQLitePlaySessionStorage(settings.runtime_state_db_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+        now_provider=lambda: clock["now"],
+    )
+    stale = service.create_session(story.story_id)
+    fresh = service.create_session(story.story_id)
+    full_writes: list[str] = []
+    original_save_session = storage.save_session
+    storage.save_session = lambda payload: full_writes.append(payload["session_id"]) or original_save_session(payload)  # type: ignore[method-assign]
+
+    service._write_through_evicted_record(fresh.session_id, service._session_cache.peek(fresh.session_id))
+    assert full_writes == []
+
+    clock["now"] = clock["now"] + timedelta(seconds=61)
+
+    clock["monotonic"] = 31.0
+    service.get_session(fresh.session_id)
+
+    payload = storage.get_session(stale.session_id)
+    assert payload is not None
+    assert payload["state"]["payload"]["status"] == "expired"
+    assert service._next_session_cache_sweep_at == 61.0
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from rpg_backend.config import Settings
+from rpg_backend.play.contracts import PlayTurnRequest
+from rpg_backend.play.service import PlaySessionService
+from rpg_backend.play.state_codec import (
+    JsonStateCodec,
+    PlayStateCodecError,
+    PlayStateCodecRegistry,
+    ZstdMsgpackStateCodec,
+    build_state_codec,
+    train_zstd_dictionary,
+)
+from rpg_backend.play.storage import SQLitePlaySessionStorage
+from tests.test_play_runtime import _no_gateway, _publish_story
+
+_CODEC_NAMES = ("json", "json+zlib", "orjson", "msgpack", "msgpack+zstd")
+# Packages from the `state-codecs` extra; json and json+zlib need none.
+_CODEC_PACKAGES = {
+    "orjson": ("orjson",),
+    "msgpack": ("ormsgpack",),
+    "msgpack+zstd": ("ormsgpack", "zstandard"),
+}
+
+
+def _require_codec_packages(*codec_names: str) -> None:
+    for codec_name in codec_names:
+        for package in _CODEC_PACKAGES.get(codec_name, ()):
+            pytest.importorskip(package)
+
+
+def _random_json_value(rng: random.Random, depth: int = 0):  # noqa: ANN202
+    kinds = ["str", "int", "float", "bool", "none"]
+    if depth < 4:
+        kinds += ["list", "dict", "dict"]
+    kind = rng.choice(kinds)
+    if kind == "str":
+        return "".join(rng.choice("abc xyz_-档案议会🙂") for _ in range(rng.randint(0, 12)))
+    if kind == "int":
+        return rng.randint(-(2**40), 2**40)
+    if kind == "float":
+        return rng.uniform(-1000, 1000)
+    if kind == "bool":
+        return rng.random() < 0.5
+    if kind == "none":
+        return None
+    if kind == "list":
+        return [_random_json_value(rng, depth + 1) for _ in range(rng.randint(0, 5))]
+    return {f"k{rng.randint(0, 50)}": _random_json_value(rng, depth + 1) for _ in range(rng.randint(0, 6))}
+
+
+@pytest.mark.parametrize("codec_name", _CODEC_NAMES)
+def test_state_codecs_round_trip_random_json_documents(codec_name: str) -> None:
+    _require_codec_packages(codec_name)
+    codec = build_state_codec(codec_name)
+    registry = PlayStateCodecRegistry(JsonStateCodec())
+    rng = random.Random(f"codec:{codec_name}")
+
+    for _ in range(200):
+        document = {"state_kind": "urban_v2", "payload": _random_json_value(rng)}
+        encoded = codec.encode(document)
+        assert codec.decode(encoded) == document
+        assert registry.decoder_for(codec.encoding).decode(encoded) == document
+
+
+def test_zstd_dictionary_codec_tags_rows_with_its_dictionary(tmp_path) -> None:
+    _require_codec_packages("msgpack+zstd")
+    rng = random.Random("dictionary")
+    states = [
+        {"state_kind": "urban_v2", "payload": {"npc_mind_states": _random_json_value(rng), "turn_index": index}}
+        for index in range(64)
+    ]
+    dictionary_path = tmp_path / "states.zdict"
+    dictionary_path.write_bytes(train_zstd_dictionary(states, dict_size=4096))
+    codec = build_state_codec("msgpack+zstd", zstd_dict_path=str(dictionary_path))
+
+    encoded = codec.encode(states[3])
+
+    assert codec.encoding.startswith("msgpack.v1+zstd.d")
+    assert codec.decode(encoded) == states[3]
+    assert PlayStateCodecRegistry(codec).decoder_for(codec.encoding) is codec
+    with pytest.raises(PlayStateCodecError):
+        PlayStateCodecRegistry(ZstdMsgpackStateCodec()).decoder_for(codec.encoding)
+
+
+def test_play_sessions_stay_readable_after_switching_state_codec(tmp_path) -> None:
+    _require_codec_packages("msgpack", "orjson", "msgpack+zstd")
+    library_service, story = _publish_story(tmp_path)
+    settings = Settings(runtime_state_db_path=str(tmp_path / "runtime.sqlite3"))
+
+    def _service(codec_name: str) -> PlaySessionService:
+        return PlaySessionService(
+            story_library_service=library_service,
+            gateway_factory=_no_gateway,
+            settings=settings,
+            storage=SQLitePlaySessionStorage(
+                settings.runtime_state_db_path,
+                state_codec=build_state_codec(codec_name),
+            ),
+        )
+
+    created = _service("json").create_session(story.story_id)
+    snapshot = created
+    for codec_name in ("msgpack", "orjson", "msgpack+zstd", "json"):
+        service = _service(codec_name)
+        restored = service.get_session(created.session_id)
+        assert restored.model_dump(mode="json") == snapshot.model_dump(mode="json")
+        snapshot = service.submit_turn(
+            created.session_id,
+            PlayTurnRequest(input_text="I verify the first blackout ledger before anyone can revise it."),
+        )
+
+    with SQLitePlaySessionStorage(settings.runtime_state_db_path)._connect() as connection:
+        encoding = connection.execute(
+            "SELECT state_encoding FROM play_sessions WHERE session_id = ?",
+            (created.session_id,),
+        ).fetchone()["state_encoding"]
+    assert encoding == "json"
+    assert snapshot.turn_index == 4
@@ -14,7 +14,7 @@ from rpg_backend.play_v2.narration_frames import NpcReactionBeat, NarrationRende
 from rpg_backend.play_v2.narration_variants import phrase_fingerprint
 from rpg_backend.play_v2.contracts import LatentEvent, UnresolvedCostRecord, UrbanTurnIntent
 from rpg_backend.play_v2.narration_surface import _support_line, render_npc_texture_v2
-from rpg_backend.play_v2.product_api import build_v2_snapshot, build_v2_state_bars, build_v2_turn_trace
+from rpg_backend.play_v2.product_api import apply_v2_turn_changes, build_v2_snapshot, build_v2_state_bars, build_v2_turn_trace
 from rpg_backend.play_v2.semantic_planners import PayoffPlanner
 import rpg_backend.play_v2.delta_pack_runtime as delta_pack_runtime
 import rpg_backend.play_v2.runtime as runtime_module
@@ -1362,7 +1362,7 @@ def test_deflect_presses_but_ages_public_wave_or_secret_pressure() -> None:
 def test_patient_burn_preferences_make_delayed_regression_mature_faster() -> None:
     plan = _play_plan()
     target_id = plan.route_target_ids[0]
-    plan.cast = [
+    cast = [
         member.model_copy(
             update={
                 "strategic_intent": member.strategic_intent.model_copy(
@@ -1376,6 +1376,7 @@ def test_patient_burn_preferences_make_delayed_regression_mature_faster() -> Non
         )
         for member in plan.cast
     ]
+    plan = plan.model_copy(update={"cast": cast})
     state = build_initial_world_state(plan, session_id="patient_burn_case")
     _move_state_to_segment(plan, state, "misread")
     stake_ids = [item for item in state.active_character_ids if item != target_id][:2]
@@ -1411,7 +1412,7 @@ def test_public_reveal_detonates_secret_pressure_early() -> None:
 def test_regression_payoff_preferences_bias_delayed_event_damage() -> None:
     plan = _play_plan()
     target_id = plan.route_target_ids[0]
-    plan.cast = [
+    cast = [
         member.model_copy(
             update={
                 "strategic_intent": member.strategic_intent.model_copy(
@@ -1424,6 +1425,7 @@ def test_regression_payoff_preferences_bias_delayed_event_damage() -> None:
         )
         for member in plan.cast
     ]
+    plan = plan.model_copy(update={"cast": cast})
     state = build_initial_world_state(plan, session_id="payoff_preference_case")
     _move_state_to_segment(plan, state, "reveal")
     stake_ids = [item for item in state.active_character_ids if item != target_id][:2]
@@ -1625,6 +1627,96 @@ def test_turn_trace_contains_latent_operation_tags() -> None:
     assert trace.control_source in {"explicit", "free_text", "none"}
 
 
+def test_run_turn_change_set_drives_trace_without_pre_turn_copy() -> None:
+    plan = _play_plan()
+    state = build_initial_world_state(plan, session_id="change_set_case")
+    _move_state_to_segment(plan, state, "reveal")
+    segment_index_before = state.segment_index
+    turn_index_before = state.turn_index
+    globals_before = {name: getattr(state, name) for name in ("scene_heat", "public_image", "route_lock", "secret_pressure")}
+    burst = next(item for item in build_suggested_actions(plan, state) if item.lane_id == "burst")
+
+    result = run_turn(plan, state, burst.prompt, selected_suggestion_id=burst.suggestion_id)
+    change_set = result.change_set
+    trace, _ = build_v2_turn_trace(
+        plan=plan,
+        result=result,
+        player_input=burst.prompt,
+        selected_suggestion_id=burst.suggestion_id,
+        turn_elapsed_ms=10,
+    )
+
+    assert change_set is not None
+    assert (change_set.turn_index_before, change_set.turn_index_after) == (turn_index_before, result.state.turn_index)
+    assert change_set.segment_index_before == segment_index_before
+    assert {"narration", "feedback", "progress", "actions"} <= set(change_set.changed_sections)
+    for name, before_value in globals_before.items():
+        moved = getattr(result.state, name) - before_value
+        if moved:
+            assert change_set.global_deltas[name] == moved
+    assert ("state_bars" in change_set.changed_sections) == bool(
+        change_set.global_deltas or change_set.relationship_deltas or change_set.npc_mind_changed_ids
+    )
+    assert change_set.latent_ops == list(result.state.last_turn_latent_ops)
+    assert trace.beat_index_before == segment_index_before + 1
+    assert trace.global_state_changes == change_set.global_deltas
+
+
+def test_run_turn_change_set_records_every_change_the_turn_made() -> None:
+    plan = _play_plan()
+    state = build_initial_world_state(plan, session_id="change_set_record_case")
+    global_names = (
+        "scene_heat",
+        "public_image",
+        "route_lock",
+        "relationship_debt_pressure",
+        "public_wave_pressure",
+        "secret_pressure",
+        "npc_action_pressure",
+        "secret_exposure",
+    )
+    relationship_names = ("affection", "trust", "tension", "suspicion", "dependency")
+    for turn in range(6):
+        if state.status != "active":
+            break
+        before = state.model_copy(deep=True)
+        suggestions = build_suggested_actions(plan, state)
+        suggestion = suggestions[turn % len(suggestions)]
+        result = run_turn(plan, state, suggestion.prompt, selected_suggestion_id=suggestion.suggestion_id)
+        state = result.state
+        change_set = result.change_set
+
+        assert change_set is not None
+        assert change_set.global_deltas == {
+            name: getattr(state, name) - getattr(before, name)
+            for name in global_names
+            if getattr(state, name) != getattr(before, name)
+        }
+        moved_relationships = {
+            character_id: {
+                name: getattr(target, name) - getattr(before.relationships[character_id], name)
+                for name in relationship_names
+                if getattr(target, name) != getattr(before.relationships[character_id], name)
+            }
+            for character_id, target in state.relationships.items()
+        }
+        assert change_set.relationship_deltas == {key: value for key, value in moved_relationships.items() if value}
+        hooks_before = {hook_id: hook.status for hook_id, hook in before.hook_states.items()}
+        assert {(item.hook_id, item.before_status, item.after_status) for item in change_set.hook_transitions} == {
+            (hook_id, hooks_before.get(hook_id), hook.status)
+            for hook_id, hook in state.hook_states.items()
+            if hooks_before.get(hook_id) != hook.status
+        }
+        costs_before = {item.cost_id: item.status for item in before.unresolved_costs}
+        costs_after = {item.cost_id: item.status for item in state.unresolved_costs}
+        assert {(item.cost_id, item.before_status, item.after_status) for item in change_set.cost_updates} == {
+            (cost_id, costs_before.get(cost_id), costs_after.get(cost_id))
+            for cost_id in {*costs_before, *costs_after}
+            if costs_before.get(cost_id) != costs_after.get(cost_id)
+        }
+        assert apply_v2_turn_changes(plan, state, build_v2_snapshot(plan, before), change_set) == build_v2_snapshot(plan, state)
+
+
 def test_story_debug_contains_structured_payload() -> None:
     plan = _play_plan()
     state = build_initial_world_state(plan, session_id="story_debug_case")
@@ -3498,6 +3590,126 @@ def test_run_intent_stage_pressure_turn_prefers_llm_micro_sim_by_default(monkeyp
     assert "play_v2.npc_micro_sim" in gateway.operations
 
 
+class _SpeculationResponse:
+    def __init__(self, payload: dict[str, object], usage: dict[str, int]) -> None:
+        self.payload = payload
+        self.usage = usage
+        self.response_id = None
+
+
+class _SpeculationClient:
+    """Intent compile returns a fixed move; micro-sim calls are counted."""
+
+    def __init__(self, intent_payload: dict[str, object], *, intent_delay_s: float = 0.05) -> None:
+        self.intent_payload = intent_payload
+        self.intent_delay_s = intent_delay_s
+        self.micro_sim_intents: list[dict[str, object]] = []
+
+    def _invoke_json(self, **kwargs):  # noqa: ANN003, ANN204
+        operation_name = str(kwargs.get("operation_name") or "")
+        user_payload = dict(kwargs.get("user_payload") or {})
+        if operation_name.startswith("play_v2.intent_compile"):
+            time.sleep(self.intent_delay_s)
+            return _SpeculationResponse(dict(self.intent_payload), {"input_tokens": 90, "output_tokens": 30, "total_tokens": 120})
+        if operation_name != "play_v2.npc_micro_sim":
+            raise AssertionError(f"unexpected operation in speculation test: {operation_name}")
+        self.micro_sim_intents.append(dict(user_payload.get("intent") or {}))
+        time.sleep(0.03)
+        shortlist = list(user_payload.get("shortlist") or [])
+        actor = shortlist[0]["character_id"] if shortlist else ""
+        return _SpeculationResponse(
+            {
+                "recommended_actor_id": actor,
+                "summary": "micro sim llm",
+                "candidates": [
+                    {
+                        "character_id": actor,
+                        "action_family": "test_water",
+                        "reason_family": "mixed",
+                        "signal_family": "mixed",
+                        "cost_family": "mixed",
+                        "confidence": 0.71,
+                        "rationale": "ok",
+                    }
+                ],
+            },
+            {"input_tokens": 60, "output_tokens": 20, "total_tokens": 80},
+        )
+
+
+def _speculation_setup(monkeypatch: pytest.MonkeyPatch):  # noqa: ANN202
+    plan = _play_plan()
+    state = build_initial_world_state(plan)
+    _move_state_to_segment(plan, state, "reveal")
+    state.turn_index = 3
+    settings = type(
+        "_SettingsStub",
+        (),
+        {
+            "play_v2_intent_compiler_use_llm": True,
+            "play_v2_micro_sim_use_llm": True,
+            "play_v2_micro_sim_speculative_enabled": True,
+        },
+    )()
+    monkeypatch.setenv("APP_PLAY_V2_ALLOW_LIVE_LLM_IN_TESTS", "true")
+    monkeypatch.setattr(runtime_module, "get_settings", lambda: settings)
+    input_text = "我当着大家的面把旧录音的事情说清楚，看谁先慌。"
+    heuristic_intent = parse_turn_intent(plan, state, input_text, diagnostics={})
+    return plan, state, input_text, heuristic_intent
+
+
+def test_run_intent_stage_keeps_speculative_micro_sim_when_compiled_intent_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    plan, state, input_text, heuristic_intent = _speculation_setup(monkeypatch)
+    gateway = _SpeculationClient(
+        {
+            "move_family": heuristic_intent.move_family,
+            "target_id": heuristic_intent.target_id,
+            "scene_frame": heuristic_intent.scene_frame,
+            "intent_confidence": 0.8,
+            "control_action": heuristic_intent.control_action,
+        }
+    )
+
+    intent, micro_sim, diagnostics = run_intent_stage(plan, state, input_text, gateway=gateway)
+
+    assert intent.intent_compile_source == "llm"
+    assert micro_sim is not None and micro_sim.source == "llm"
+    assert len(gateway.micro_sim_intents) == 1
+    assert diagnostics["micro_sim_speculative_status"] == "hit"
+    assert diagnostics["micro_sim_speculative_hit"] is True
+    assert diagnostics["micro_sim_speculative_saved_ms"] > 0
+    assert diagnostics["intent_micro_sim_stage_latency_ms"] < diagnostics["micro_sim_speculative_latency_ms"]
+    assert diagnostics["micro_sim_total_tokens"] == 80
+    assert diagnostics["intent_stage_total_tokens"] == 200
+
+
+def test_run_intent_stage_reruns_micro_sim_when_compiled_intent_differs(monkeypatch: pytest.MonkeyPatch) -> None:
+    plan, state, input_text, heuristic_intent = _speculation_setup(monkeypatch)
+    segment = plan.segments[state.segment_index]
+    other_move = next(
+        move for move in segment.allowed_move_families if move != heuristic_intent.move_family
+    )
+    gateway = _SpeculationClient(
+        {
+            "move_family": other_move,
+            "target_id": heuristic_intent.target_id,
+            "scene_frame": heuristic_intent.scene_frame,
+            "intent_confidence": 0.8,
+            "control_action": heuristic_intent.control_action,
+        }
+    )
+
+    intent, micro_sim, diagnostics = run_intent_stage(plan, state, input_text, gateway=gateway)
+
+    assert intent.move_family == other_move
+    assert micro_sim is not None
+    assert diagnostics["micro_sim_speculative_status"] == "miss"
+    assert diagnostics["micro_sim_speculative_hit"] is False
+    assert [item["move_family"] for item in gateway.micro_sim_intents] == [heuristic_intent.move_family, other_move]
+    assert diagnostics["micro_sim_speculative_wasted_total_tokens"] == 80
+    assert diagnostics["micro_sim_total_tokens"] == 160
+
+
 def test_run_turn_reuses_single_gateway_for_intent_micro_and_compose(monkeypatch: pytest.MonkeyPatch) -> None:
     plan = _play_plan()
     state = build_initial_world_state(plan)
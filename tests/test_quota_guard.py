@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import multiprocessing
 
 import pytest
 from starlette.requests import Request
 
 import rpg_backend.main as main_module
 from rpg_backend.config import get_settings
-from rpg_backend.quotas import DailyQuotaLimiter, QuotaExceededError
+from rpg_backend.quotas import (
+    DailyQuotaLimiter,
+    QuotaExceededError,
+    ShardedMemoryQuotaBackend,
+    SQLiteQuotaBackend,
+)
 
 
 def test_daily_quota_limiter_rejects_after_daily_limit() -> None:
@@ -112,7 +118,116 @@ def test_daily_quota_limiter_prunes_stale_day_counters() -> None:
         now=datetime(2026, 1, 2, tzinfo=timezone.utc),
     )
 
-    assert all(key[1] == "2026-01-02" for key in limiter._counts)
+    assert limiter.backend.resident_days() == {"2026-01-02"}
+    assert limiter.backend.usage(day="2026-01-01", scope="ip", subject_key="203.0.113.7") == 0
+    assert limiter.backend.usage(day="2026-01-02", scope="ip", subject_key="203.0.113.7") == 1
+
+
+def test_sharded_memory_backend_keeps_counters_consistent_across_shards() -> None:
+    limiter = DailyQuotaLimiter(backend=ShardedMemoryQuotaBackend(shard_count=4))
+
+    for index in range(3):
+        limiter.check_and_increment(
+            ip_key=f"203.0.113.{index}",
+            user_key="usr_demo",
+            ip_limit=10,
+            user_limit=3,
+        )
+
+    with pytest.raises(QuotaExceededError) as excinfo:
+        limiter.check_and_increment(
+            ip_key="203.0.113.99",
+            user_key="usr_demo",
+            ip_limit=10,
+            user_limit=3,
+        )
+
+    assert excinfo.value.scope == "user"
+    day = DailyQuotaLimiter._day_key()
+    assert limiter.backend.usage(day=day, scope="ip", subject_key="203.0.113.99") == 0
+
+
+def test_sqlite_quota_backend_rejects_without_partial_debit(tmp_path) -> None:
+    limiter = DailyQuotaLimiter(backend=SQLiteQuotaBackend(str(tmp_path / "quota.sqlite3")))
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    limiter.check_and_increment(
+        ip_key="203.0.113.7",
+        user_key="usr_demo",
+        ip_limit=10,
+        user_limit=2,
+        amount=2,
+        now=now,
+    )
+
+    with pytest.raises(QuotaExceededError) as excinfo:
+        limiter.check_and_increment(
+            ip_key="203.0.113.7",
+            user_key="usr_demo",
+            ip_limit=10,
+            user_limit=2,
+            now=now,
+        )
+
+    assert excinfo.value.scope == "user"
+    assert limiter.backend.usage(day="2026-01-01", scope="ip", subject_key="203.0.113.7") == 2
+
+
+def test_sqlite_quota_backend_drops_previous_day_rows(tmp_path) -> None:
+    backend = SQLiteQuotaBackend(str(tmp_path / "quota.sqlite3"))
+    limiter = DailyQuotaLimiter(backend=backend)
+
+    for day in (1, 2):
+        limiter.check_and_increment(
+            ip_key="203.0.113.7",
+            user_key=None,
+            ip_limit=1,
+            user_limit=None,
+            now=datetime(2026, 1, day, tzinfo=timezone.utc),
+        )
+
+    assert backend.usage(day="2026-01-01", scope="ip", subject_key="203.0.113.7") == 0
+    assert backend.usage(day="2026-01-02", scope="ip", subject_key="203.0.113.7") == 1
+
+
+def _consume_quota_in_worker(db_path: str, attempts: int, results) -> None:
+    limiter = DailyQuotaLimiter(backend=SQLiteQuotaBackend(db_path))
+    accepted = 0
+    for _ in range(attempts):
+        try:
+            limiter.check_and_increment(
+                ip_key="203.0.113.7",
+                user_key="usr_demo",
+                ip_limit=1000,
+                user_limit=37,
+            )
+        except QuotaExceededError:
+            continue
+        accepted += 1
+    results.put(accepted)
+
+
+def test_sqlite_quota_backend_enforces_exact_limit_across_processes(tmp_path) -> None:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method unavailable")
+    context = multiprocessing.get_context("fork")
+    db_path = str(tmp_path / "quota.sqlite3")
+    results = context.Queue()
+    workers = [
+        context.Process(target=_consume_quota_in_worker, args=(db_path, 20, results))
+        for _ in range(6)
+    ]
+    for worker in workers:
+        worker.start()
+    accepted = [results.get(timeout=60) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=60)
+
+    assert sum(accepted) == 37
+    day = DailyQuotaLimiter._day_key()
+    backend = SQLiteQuotaBackend(db_path)
+    assert backend.usage(day=day, scope="user", subject_key="usr_demo") == 37
+    assert backend.usage(day=day, scope="ip", subject_key="203.0.113.7") == 37
 
 
 def test_default_actor_is_not_used_as_shared_user_quota_key(monkeypatch) -> None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import threading
 import time
 
 import pytest
@@ -10,10 +12,16 @@ from rpg_backend.author.contracts import AuthorJobProgress
 from rpg_backend.author.jobs import AuthorJobService, _AuthorJobRecord
 from rpg_backend.author.storage import SQLiteAuthorJobStorage
 from rpg_backend.author.workflow import build_author_graph
+import rpg_backend.author_v2.workflow as author_v2_workflow_module
+from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+from rpg_backend.author_v2.product_adapters import author_preview_from_blueprint
+from rpg_backend.author_v2.product_jobs import ProductAuthorJobService, _ProductAuthorJobRecord
 from rpg_backend.config import Settings
 from rpg_backend.play.contracts import PlayTurnRequest
 from rpg_backend.play.service import PlayServiceError, PlaySessionService
+from rpg_backend.play.state_codec import build_state_codec
 from rpg_backend.play.storage import SQLitePlaySessionStorage
+from rpg_backend.sqlite_utils import connect_sqlite
 from tests.author_fixtures import FakeGateway
 from tests.test_author_product_api import _preview_response
 from tests.test_play_runtime import _no_gateway, _publish_story
@@ -93,6 +101,254 @@ def test_play_session_service_restores_session_state_after_restart(tmp_path) ->
     assert continued.turn_index == updated.turn_index + 1
 
 
+def test_play_session_turns_append_rows_without_rewriting_plan(tmp_path) -> None:
+    library_service, story = _publish_story(tmp_path)
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_ttl_seconds=900,
+    )
+    storage = SQLitePlaySessionStorage(
+        settings.runtime_state_db_path,
+        state_codec=build_state_codec("json+zlib"),
+    )
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    created = service.create_session(story.story_id)
+    delta_bytes: list[int] = []
+    original_save_session = storage.save_session
+    original_save_delta = storage.save_session_delta
+
+    def _forbid_full_save(payload):  # noqa: ANN001, ANN202
+        raise AssertionError("turns must not rewrite the whole session document")
+
+    def _record_delta(**kwargs):  # noqa: ANN003, ANN202
+        stats = original_save_delta(**kwargs)
+        delta_bytes.append(stats.total_bytes)
+        return stats
+
+    storage.save_session = _forbid_full_save  # type: ignore[method-assign]
+    storage.save_session_delta = _record_delta  # type: ignore[method-assign]
+    try:
+        for input_text in (
+            "I verify the first blackout ledger before anyone can revise it.",
+            "I press the council clerk about who edited the record.",
+            "I confront the rival in public with what I know.",
+        ):
+            service.submit_turn(created.session_id, PlayTurnRequest(input_text=input_text))
+    finally:
+        storage.save_session = original_save_session  # type: ignore[method-assign]
+        storage.save_session_delta = original_save_delta  # type: ignore[method-assign]
+
+    assert len(delta_bytes) == 3
+    assert delta_bytes[-1] < delta_bytes[0] * 2
+    payload = storage.get_session(created.session_id)
+    assert payload is not None
+    assert len(payload["history"]) == 7
+    assert [trace["turn_index"] for trace in payload["turn_traces"]] == [1, 2, 3]
+    assert payload["state"]["payload"]["turn_index"] == 3
+
+
+def test_play_session_turn_reports_not_found_when_session_row_was_deleted(tmp_path) -> None:
+    library_service, story = _publish_story(tmp_path)
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_ttl_seconds=900,
+    )
+    storage = SQLitePlaySessionStorage(settings.runtime_state_db_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    created = service.create_session(story.story_id)
+    with storage._connect() as connection:
+        connection.execute("DELETE FROM play_sessions WHERE session_id = ?", (created.session_id,))
+        connection.commit()
+
+    with pytest.raises(PlayServiceError) as exc_info:
+        service.submit_turn(
+            created.session_id,
+            PlayTurnRequest(input_text="I verify the first blackout ledger before anyone can revise it."),
+        )
+
+    assert exc_info.value.code == "play_session_not_found"
+    assert exc_info.value.status_code == 404
+    assert storage.get_session(created.session_id) is None
+    assert (
+        storage.save_session_delta(
+            session_id=created.session_id,
+            expires_at="2026-01-01T00:00:00+00:00",
+            finished_at=None,
+            state={},
+            history_start=0,
+            new_history=[],
+            traces_start=0,
+            new_turn_traces=[],
+        )
+        is None
+    )
+
+
+def test_play_session_storage_reads_legacy_inline_history(tmp_path) -> None:
+    library_service, story = _publish_story(tmp_path)
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_ttl_seconds=900,
+    )
+    storage = SQLitePlaySessionStorage(settings.runtime_state_db_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    created = service.create_session(story.story_id)
+    payload = storage.get_session(created.session_id)
+    assert payload is not None
+    with storage._connect() as connection:
+        connection.execute("DELETE FROM play_session_history WHERE session_id = ?", (created.session_id,))
+        connection.execute(
+            "UPDATE play_sessions SET history_json = ? WHERE session_id = ?",
+            (json.dumps(payload["history"]), created.session_id),
+        )
+        connection.commit()
+
+    restarted = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    restarted.submit_turn(
+        created.session_id,
+        PlayTurnRequest(input_text="I verify the first blackout ledger before anyone can revise it."),
+    )
+
+    history = storage.get_session(created.session_id)["history"]  # type: ignore[index]
+    assert [entry["speaker"] for entry in history] == ["gm", "player", "gm"]
+
+    cold = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    first_page = cold.get_session_history(created.session_id, limit=1)
+    second_page = cold.get_session_history(created.session_id, after_turn=0, limit=1)
+    assert [entry.speaker for entry in first_page.entries] == ["gm"]
+    assert first_page.has_more is True
+    assert [entry.speaker for entry in second_page.entries] == ["player", "gm"]
+    assert second_page.has_more is False
+
+
+def test_play_session_cold_load_pages_history_and_traces_from_storage(tmp_path) -> None:
+    library_service, story = _publish_story(tmp_path)
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_ttl_seconds=900,
+    )
+    storage = SQLitePlaySessionStorage(settings.runtime_state_db_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    created = service.create_session(story.story_id)
+    for input_text in (
+        "I verify the first blackout ledger before anyone can revise it.",
+        "I press the council clerk about who edited the record.",
+        "I confront the rival in public with what I know.",
+    ):
+        service.submit_turn(created.session_id, PlayTurnRequest(input_text=input_text))
+
+    restarted = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    restarted.get_session(created.session_id)
+    record = restarted._session_cache.peek(created.session_id)
+    assert record.history == []
+    assert record.turn_traces == []
+    assert (record.history_offset, record.trace_offset) == (7, 3)
+
+    page = restarted.get_session_history(created.session_id, after_turn=1, limit=1)
+    assert [(entry.turn_index, entry.speaker) for entry in page.entries] == [(2, "player"), (2, "gm")]
+    assert page.has_more is True
+    assert [trace.turn_index for trace in restarted.get_turn_traces(created.session_id, after_turn=2)] == [3]
+    diagnostics = restarted.get_session_diagnostics(created.session_id, limit=2)
+    assert [trace["turn_index"] for trace in diagnostics.turn_traces] == [1, 2]
+    assert diagnostics.turn_traces_has_more is True
+    assert diagnostics.summary.turn_count == 3
+
+    restarted.submit_turn(
+        created.session_id,
+        PlayTurnRequest(input_text="I use the verified record to force a public answer from the council floor."),
+    )
+
+    payload = storage.get_session(created.session_id)
+    assert payload is not None
+    assert len(payload["history"]) == 9
+    assert [trace["turn_index"] for trace in payload["turn_traces"]] == [1, 2, 3, 4]
+    assert len(restarted.get_session_history(created.session_id).entries) == 9
+
+
+def test_play_session_delta_returns_changed_sections_until_change_sets_run_out(tmp_path) -> None:
+    library_service, story = _publish_story(tmp_path)
+    settings = Settings(
+        runtime_state_db_path=str(tmp_path / "runtime.sqlite3"),
+        play_session_ttl_seconds=900,
+    )
+    storage = SQLitePlaySessionStorage(settings.runtime_state_db_path)
+    service = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    created = service.create_session(story.story_id)
+    for input_text in (
+        "I verify the first blackout ledger before anyone can revise it.",
+        "I press the council clerk about who edited the record.",
+    ):
+        turn_snapshot = service.submit_turn(created.session_id, PlayTurnRequest(input_text=input_text))
+    full = service.get_session(created.session_id)
+    assert turn_snapshot == full
+
+    delta = service.get_session_delta(created.session_id, since_turn=0)
+    assert delta.snapshot is None
+    assert delta.turn_index == full.turn_index == 2
+    assert {"narration", "feedback", "progress", "actions"} <= set(delta.changed_sections)
+    assert delta.narration == full.narration
+    assert delta.story_actions == full.story_actions
+    assert delta.progress == full.progress
+    for section, field_name in (("state_bars", "state_bars"), ("latent_radar", "latent_radar"), ("beat", "beat_index")):
+        if section in delta.changed_sections:
+            assert getattr(delta, field_name) == getattr(full, field_name)
+        else:
+            assert getattr(delta, field_name) is None
+
+    unchanged = service.get_session_delta(created.session_id, since_turn=2)
+    assert (unchanged.changed_sections, unchanged.snapshot, unchanged.narration) == ([], None, None)
+
+    restarted = PlaySessionService(
+        story_library_service=library_service,
+        gateway_factory=_no_gateway,
+        settings=settings,
+        storage=storage,
+    )
+    fallback = restarted.get_session_delta(created.session_id, since_turn=1)
+    assert fallback.snapshot == full
+    assert fallback.changed_sections == []
+
+
 def test_play_session_service_rejects_legacy_v2_state_schema(tmp_path) -> None:
     library_service, story = _publish_story(tmp_path)
     settings = Settings(
@@ -185,6 +441,103 @@ def test_sqlite_checkpoint_saver_restores_author_graph_snapshot(tmp_path) -> Non
     assert snapshot.values["route_affordance_pack_draft"].affordance_effect_profiles
 
 
+def test_sqlite_checkpoint_saver_stores_channel_values_once_and_releases_them(tmp_path) -> None:
+    db_path = str(tmp_path / "runtime.sqlite3")
+    # A database created before the blob store existed is migrated in place.
+    with connect_sqlite(db_path) as connection:
+        connection.execute(
+            """
+            CREATE TABLE author_checkpoint_blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL,
+                channel TEXT NOT NULL,
+                version_key TEXT NOT NULL,
+                value_type TEXT NOT NULL,
+                value_blob BLOB NOT NULL,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version_key)
+            )
+            """
+        )
+    saver = SQLiteCheckpointSaver(db_path).with_allowlist(AUTHOR_CHECKPOINT_ALLOWLIST)
+    brief = "A civic archivist must hold the city together while a blackout referendum turns the public record into a weapon."
+    for run_id in ("dedup-run-a", "dedup-run-b"):
+        graph = build_author_graph(gateway=FakeGateway(), checkpointer=saver)
+        graph.invoke({"run_id": run_id, "raw_brief": brief}, config=graph_config(run_id=run_id))
+
+    def _store_counts() -> tuple[int, int, int]:
+        with connect_sqlite(db_path) as connection:
+            references = sum(
+                connection.execute(f"SELECT COUNT(*) FROM {table} WHERE content_hash IS NOT NULL").fetchone()[0]
+                for table in ("author_checkpoint_blobs", "author_checkpoint_writes")
+            )
+            stored, ref_total = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(ref_count), 0) FROM author_checkpoint_blob_store"
+            ).fetchone()
+        return references, stored, ref_total
+
+    references, stored, ref_total = _store_counts()
+    assert ref_total == references
+    assert stored < references
+
+    saver.prune(["dedup-run-a"])
+    pruned_references, pruned_stored, pruned_ref_total = _store_counts()
+    assert pruned_ref_total == pruned_references < references
+    assert pruned_stored <= stored
+    restored = build_author_graph(gateway=FakeGateway(), checkpointer=saver).get_state(graph_config(run_id="dedup-run-a"))
+    assert restored.values["design_bundle"].story_bible.title
+
+    saver.delete_thread("dedup-run-a")
+    saver.delete_thread("dedup-run-b")
+    assert _store_counts() == (0, 0, 0)
+
+
+def test_sqlite_checkpoint_saver_keeps_shared_values_under_concurrent_put_and_prune(tmp_path) -> None:
+    from langgraph.checkpoint.base import empty_checkpoint
+
+    db_path = str(tmp_path / "runtime.sqlite3")
+    saver = SQLiteCheckpointSaver(db_path)
+    shared_value = {"brief": "a value every thread stores " * 40}
+
+    def _churn(thread_id: str) -> None:
+        for step in range(1, 122):
+            checkpoint = empty_checkpoint()
+            checkpoint["channel_values"] = {"shared": shared_value}
+            checkpoint["channel_versions"] = {"shared": step}
+            saver.put(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}},
+                checkpoint,
+                {},
+                {"shared": step},
+            )
+            if step % 2 == 0:
+                saver.delete_thread(thread_id)
+            else:
+                saver.prune([thread_id])
+
+    threads = [threading.Thread(target=_churn, args=(f"thread-{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with connect_sqlite(db_path) as connection:
+        references = {
+            str(row["content_hash"]): int(row["reference_count"])
+            for row in connection.execute(
+                "SELECT content_hash, COUNT(*) AS reference_count FROM author_checkpoint_blobs "
+                "WHERE content_hash IS NOT NULL GROUP BY content_hash"
+            ).fetchall()
+        }
+        stored = {
+            str(row["content_hash"]): int(row["ref_count"])
+            for row in connection.execute("SELECT content_hash, ref_count FROM author_checkpoint_blob_store").fetchall()
+        }
+    assert references and stored == references
+    for index in range(4):
+        restored = saver.get_tuple({"configurable": {"thread_id": f"thread-{index}", "checkpoint_ns": ""}})
+        assert restored is not None and restored.checkpoint["channel_values"]["shared"] == shared_value
+
+
 def test_author_job_service_resumes_from_existing_checkpoint_after_restart(tmp_path) -> None:
     settings = Settings(runtime_state_db_path=str(tmp_path / "runtime.sqlite3"))
     storage = SQLiteAuthorJobStorage(settings.runtime_state_db_path)
@@ -242,3 +595,58 @@ def test_author_job_service_resumes_from_existing_checkpoint_after_restart(tmp_p
         assert restarted.get_job_result("checkpoint-job").bundle is not None
     finally:
         author_jobs_module.get_author_llm_gateway = original_gateway_factory
+
+
+def test_product_author_job_resumes_after_last_checkpointed_stage(tmp_path, monkeypatch) -> None:
+    settings = Settings(runtime_state_db_path=str(tmp_path / "runtime.sqlite3"), author_product_run_mode="deterministic")
+    seed = "董事会前夜，项目负责人被上司、对手和法务一起拖进并购黑账与暧昧站队里。"
+    preview_blueprint, _ = run_preview_blueprint_graph(seed)
+    service = ProductAuthorJobService(settings=settings)
+    service._save_record(
+        _ProductAuthorJobRecord(
+            job_id="v2-checkpoint-job",
+            owner_user_id="local-dev",
+            prompt_seed=seed,
+            preview=author_preview_from_blueprint(preview_blueprint),
+            preview_blueprint=preview_blueprint,
+            status="running",
+            progress=AuthorJobProgress(stage="cast_planned", stage_index=2, stage_total=5),
+        )
+    )
+
+    # The first process got through voice atoms before it died.
+    graph = author_v2_workflow_module.build_author_play_graph(checkpointer=SQLiteCheckpointSaver(settings.runtime_state_db_path))
+    list(
+        graph.stream(
+            {
+                "accepted_blueprint": apply_blueprint_edits(preview_blueprint),
+                "llm_call_trace": [],
+                "quality_trace": [],
+                "live_mode": "deterministic",
+            },
+            config=graph_config(run_id="v2-checkpoint-job"),
+            stream_mode="updates",
+            interrupt_after=["compile_voice_atoms"],
+        )
+    )
+
+    def _already_checkpointed(state):  # noqa: ANN001, ANN202
+        raise AssertionError("a checkpointed stage ran again after restart")
+
+    for stage in ("plan_cast_slots", "bind_ip_cast", "compile_voice_atoms"):
+        monkeypatch.setattr(author_v2_workflow_module, stage, _already_checkpointed)
+
+    restarted = ProductAuthorJobService(settings=settings)
+    for _ in range(200):
+        status = restarted.get_job("v2-checkpoint-job")
+        if status.status in {"completed", "failed"}:
+            break
+        time.sleep(0.01)
+
+    assert status.status == "completed"
+    diagnostics = restarted.get_job_diagnostics("v2-checkpoint-job")
+    assert "job_resumed" in [event.event for event in diagnostics.events]
+    stages = [entry["stage"] for entry in diagnostics.quality_trace]
+    assert stages.count("plan_cast_slots") == 1
+    assert stages.count("compile_voice_atoms") == 1
+    assert "compile_play_plan" in stages
@@ -41,8 +41,8 @@ def _shared_v3_plan() -> CompiledPlayPlan:
 
 @pytest.fixture()
 def fresh_plan(_shared_v3_plan: CompiledPlayPlan) -> CompiledPlayPlan:
-    """Function-scoped deep copy — mutations to storylet_pool / secret_chains
-    in one test don't leak to others."""
+    """Function-scoped deep copy so state built from one test's plan never
+    leaks into another."""
     return _shared_v3_plan.model_copy(deep=True)
 
 
@@ -88,12 +88,12 @@ def _make_storylet(
     )
 
 
-def _inject_storylet_pool(plan: CompiledPlayPlan, storylets: list[Storylet]) -> None:
-    plan.storylet_pool = [s.model_dump(mode="json") for s in storylets]
+def _inject_storylet_pool(plan: CompiledPlayPlan, storylets: list[Storylet]) -> CompiledPlayPlan:
+    return plan.model_copy(update={"storylet_pool": [s.model_dump(mode="json") for s in storylets]})
 
 
-def _inject_chains(plan: CompiledPlayPlan, chains: list[SecretChain]) -> None:
-    plan.secret_chains = [c.model_dump() for c in chains]
+def _inject_chains(plan: CompiledPlayPlan, chains: list[SecretChain]) -> CompiledPlayPlan:
+    return plan.model_copy(update={"secret_chains": [c.model_dump() for c in chains]})
 
 
 # ---------------- core fire behaviour ----------------
@@ -103,7 +103,7 @@ def test_fire_storylet_reveals_secrets_into_state(
     fresh_plan: CompiledPlayPlan, fresh_state: UrbanWorldState
 ) -> None:
     storylet = _make_storylet("st_reveal_a", secrets_revealed=["secret_alpha", "secret_beta"])
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
@@ -127,7 +127,7 @@ def test_fire_storylet_relationship_shifts_quantize_to_affection_delta(
         "st_shift",
         relationship_shifts={target_char: 1.0},  # +1.0 → +3 affection delta
     )
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
@@ -143,7 +143,7 @@ def test_fire_storylet_tension_delta_moves_scene_heat(
 ) -> None:
     fresh_state.scene_heat = 2
     storylet = _make_storylet("st_tension", tension_delta=0.5)
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
@@ -157,7 +157,7 @@ def test_fire_storylet_clamps_scene_heat_to_max(
 ) -> None:
     fresh_state.scene_heat = 6  # already at cap
     storylet = _make_storylet("st_overheat", tension_delta=1.0)
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
@@ -173,7 +173,7 @@ def test_storylet_cooldown_blocks_consecutive_fire(
     fresh_plan: CompiledPlayPlan, fresh_state: UrbanWorldState
 ) -> None:
     storylet = _make_storylet("st_cd", cooldown_turns=3, secrets_revealed=["x"])
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     fresh_state.turn_index = 5
     first = fire_storylet(storylet, fresh_state, fresh_plan)
@@ -200,7 +200,7 @@ def test_zero_cooldown_storylet_can_refire_same_turn(
     fresh_plan: CompiledPlayPlan, fresh_state: UrbanWorldState
 ) -> None:
     storylet = _make_storylet("st_no_cd", cooldown_turns=0, secrets_revealed=["y"])
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     first = fire_storylet(storylet, fresh_state, fresh_plan)
     second = fire_storylet(storylet, fresh_state, fresh_plan)
@@ -220,7 +220,7 @@ def test_storylet_with_unmet_required_secrets_does_not_fire(
         required_secrets_known=["unobtainable_secret"],
         secrets_revealed=["payoff"],
     )
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
@@ -239,7 +239,7 @@ def test_bypass_preconditions_lets_player_pick_fire(
         required_secrets_known=["nonexistent"],
         secrets_revealed=["picked_payoff"],
     )
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan, bypass_preconditions=True)
 
@@ -256,7 +256,7 @@ def test_min_tension_threshold_gates_fire(
     storylet = _make_storylet(
         "st_high_tension", min_tension_score=0.7, secrets_revealed=["explosion"]
     )
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
     assert preconditions_satisfied(storylet, fresh_state, fresh_plan) is False
 
     # Crank tension up to 1.0 (heat 6 / 6 + exposure 6 / 6 + witness 3 / 3 → ~1.0).
@@ -285,10 +285,10 @@ def test_chain_cascades_unlock_secrets_after_fire(
             narrative_logic="The branch reveal trips the leaf.",
         ),
     ]
-    _inject_chains(fresh_plan, chains)
+    fresh_plan = _inject_chains(fresh_plan, chains)
 
     storylet = _make_storylet("st_root", secrets_revealed=["secret_root"])
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
@@ -317,10 +317,10 @@ def test_chain_cycle_does_not_loop_forever(
             narrative_logic="loop-2",
         ),
     ]
-    _inject_chains(fresh_plan, chains)
+    fresh_plan = _inject_chains(fresh_plan, chains)
 
     storylet = _make_storylet("st_cycle", secrets_revealed=["cycle_a"])
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
@@ -337,7 +337,7 @@ def test_reset_turn_storylet_state_clears_per_turn_buffer(
     fresh_plan: CompiledPlayPlan, fresh_state: UrbanWorldState
 ) -> None:
     storylet = _make_storylet("st_reset", secrets_revealed=["s"])
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     fire_storylet(storylet, fresh_state, fresh_plan)
     assert "st_reset" in fresh_state.last_turn_fired_storylet_ids
@@ -351,10 +351,14 @@ def test_reset_turn_storylet_state_clears_per_turn_buffer(
 def test_storylet_pool_iter_skips_malformed_records(
     fresh_plan: CompiledPlayPlan,
 ) -> None:
-    fresh_plan.storylet_pool = [
-        {"this": "is", "not": "a valid storylet"},
-        _make_storylet("st_valid").model_dump(mode="json"),
-    ]
+    fresh_plan = fresh_plan.model_copy(
+        update={
+            "storylet_pool": [
+                {"this": "is", "not": "a valid storylet"},
+                _make_storylet("st_valid").model_dump(mode="json"),
+            ]
+        }
+    )
     storylets = list(storylet_pool_iter(fresh_plan))
     assert len(storylets) == 1
     assert storylets[0].storylet_id == "st_valid"
@@ -365,7 +369,7 @@ def test_known_secrets_cap_prevents_overflow(
 ) -> None:
     fresh_state.known_secret_ids = [f"existing_{i}" for i in range(8)]  # already at cap=8
     storylet = _make_storylet("st_overflow", secrets_revealed=["new_secret"])
-    _inject_storylet_pool(fresh_plan, [storylet])
+    fresh_plan = _inject_storylet_pool(fresh_plan, [storylet])
 
     result = fire_storylet(storylet, fresh_state, fresh_plan)
 
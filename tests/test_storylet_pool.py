@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+from rpg_backend.author_v2.contracts import CompiledPlayPlan
+from rpg_backend.author_v3.storylet_compiler import Storylet
+from rpg_backend.author_v3.workflow import run_author_v3_pipeline
+from rpg_backend.library.service import LibraryServiceError, StoryLibraryService
+from rpg_backend.library.storage import SQLiteStoryLibraryStorage
+from rpg_backend.play_v2.runtime import build_initial_world_state
+from rpg_backend.play_v2.storylet_matcher import find_matching_storylets
+from rpg_backend.play_v2.storylet_pool import (
+    COMPILED_STORYLET_POOL_VERSION,
+    StoryletPoolValidationError,
+    compile_plan_storylet_pool,
+    storylet_pool_digest,
+    storylet_pool_index,
+)
+from tests.test_story_library_api import _publish_source
+
+
+@pytest.fixture(scope="module")
+def v3_plan() -> CompiledPlayPlan:
+    return run_author_v3_pipeline("董事会权力斗争", run_mode="deterministic")["plan"]
+
+
+def test_compiled_pool_hydrates_to_the_validated_storylets(v3_plan: CompiledPlayPlan) -> None:
+    assert v3_plan.storylet_pool
+    compiled = compile_plan_storylet_pool(v3_plan)
+    assert compiled is not None and compiled["version"] == COMPILED_STORYLET_POOL_VERSION
+    published = v3_plan.model_copy(update={"storylet_pool_digest": storylet_pool_digest(v3_plan)})
+
+    index = storylet_pool_index(published)
+
+    expected = [Storylet.model_validate(raw) for raw in v3_plan.storylet_pool]
+    assert [storylet.model_dump(mode="json") for storylet in index.storylets] == [
+        storylet.model_dump(mode="json") for storylet in expected
+    ]
+    assert index.cooldown_turns_by_id == {storylet.storylet_id: storylet.cooldown_turns for storylet in expected}
+    for chain in v3_plan.secret_chains or []:
+        assert chain["unlocks_secret_id"] in index.chain_adjacency[chain["trigger_secret_id"]]
+    assert storylet_pool_index(published) is index
+
+    state = build_initial_world_state(v3_plan, session_id="storylet-pool")
+    legacy = find_matching_storylets(state, v3_plan, max_count=5, min_score=0.0)
+    assert find_matching_storylets(state, published, max_count=5, min_score=0.0) == legacy
+
+
+def test_pool_edited_after_publish_is_recompiled_from_the_current_pool(v3_plan: CompiledPlayPlan) -> None:
+    published = v3_plan.model_copy(update={"storylet_pool_digest": storylet_pool_digest(v3_plan)})
+    pool = list(v3_plan.storylet_pool or [])
+    edited = published.model_copy(update={"storylet_pool": [*pool[1:], {"storylet_id": "broken"}]})
+
+    assert edited.storylet_pool_digest != storylet_pool_digest(edited)
+    assert [storylet.storylet_id for storylet in storylet_pool_index(edited).storylets] == [
+        raw["storylet_id"] for raw in pool[1:]
+    ]
+    assert len(storylet_pool_index(published).storylets) == len(pool)
+
+
+def test_publish_rejects_malformed_storylets_and_persists_compiled_pool(tmp_path, v3_plan: CompiledPlayPlan) -> None:
+    service = StoryLibraryService(SQLiteStoryLibraryStorage(str(tmp_path / "stories.sqlite3")))
+    source = _publish_source("job-storylet-pool")
+    pool = list(v3_plan.storylet_pool or [])
+    bad_plan = source.bundle.compiled_play_plan.model_copy(
+        update={"storylet_pool": [*pool, {"storylet_id": "broken"}, pool[0]]}
+    )
+    with pytest.raises(StoryletPoolValidationError) as excinfo:
+        compile_plan_storylet_pool(bad_plan)
+    assert len(excinfo.value.problems) == 2
+
+    publish_kwargs = {
+        "owner_user_id": "usr_owner_1",
+        "source_job_id": source.source_job_id,
+        "prompt_seed": source.prompt_seed,
+        "summary": source.summary,
+        "preview": source.preview,
+    }
+    with pytest.raises(LibraryServiceError) as rejected:
+        service.publish_story(**publish_kwargs, bundle=source.bundle.model_copy(update={"compiled_play_plan": bad_plan}))
+    assert rejected.value.code == "story_storylet_pool_invalid"
+
+    good_plan = source.bundle.compiled_play_plan.model_copy(
+        update={"storylet_pool": pool, "secret_chains": v3_plan.secret_chains}
+    )
+    card = service.publish_story(**publish_kwargs, bundle=source.bundle.model_copy(update={"compiled_play_plan": good_plan}))
+    stored_plan = service.get_story_record(card.story_id, actor_user_id="usr_owner_1").bundle.compiled_play_plan
+
+    assert stored_plan.storylet_pool_digest == storylet_pool_digest(good_plan)
+    assert "compiled_storylet_pool" not in stored_plan.model_dump(mode="json")
+    assert [storylet.storylet_id for storylet in storylet_pool_index(stored_plan).storylets] == [
+        raw["storylet_id"] for raw in pool
+    ]
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+from rpg_backend.author_v2.workflow import run_author_play_graph
+from rpg_backend.config import get_settings
+import rpg_backend.play_v2.runtime as runtime_module
+from rpg_backend.play_v2.runtime import build_initial_world_state, run_turn
+from rpg_backend.play_v2.turn_workers import shutdown_turn_worker_pool
+
+
+def test_worker_process_resolution_matches_inline(monkeypatch) -> None:
+    preview, _ = run_preview_blueprint_graph("校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。")
+    plan = run_author_play_graph(apply_blueprint_edits(preview)).play_plan
+    inputs = ["我当众追问她旧录音的事。", "我私下拉住他，把旧账摊开。"]
+
+    def _play() -> tuple[list[str], dict, list[str]]:
+        state = build_initial_world_state(plan, session_id="turn-workers")
+        narrations: list[str] = []
+        modes: list[str] = []
+        for input_text in inputs:
+            result = run_turn(plan, state, input_text)
+            state = result.state
+            narrations.append(result.narration)
+            modes.append(str(result.intent_stage_diagnostics.get("resolution_stage_mode")))
+        return narrations, state.model_dump(mode="json"), modes
+
+    inline_narrations, inline_state, inline_modes = _play()
+    worker_settings = get_settings().model_copy(update={"play_v2_turn_worker_processes": 1})
+    monkeypatch.setattr(runtime_module, "get_settings", lambda: worker_settings)
+    try:
+        worker_narrations, worker_state, worker_modes = _play()
+    finally:
+        shutdown_turn_worker_pool()
+
+    assert inline_modes == ["inline", "inline"]
+    assert worker_modes == ["process", "process"]
+    assert worker_narrations == inline_narrations
+    assert worker_state == inline_state
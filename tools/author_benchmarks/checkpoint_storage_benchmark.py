@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from statistics import median
+from typing import Any
+
+from rpg_backend.author.checkpointer import SQLiteCheckpointSaver
+from rpg_backend.sqlite_utils import connect_sqlite
+
+_SEED = "校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Run the deterministic author_v2 play graph against the SQLite checkpointer and report "
+            "checkpoint DB growth and put/put_writes latency per author run."
+        )
+    )
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", default=_SEED)
+    parser.add_argument("--prune", action="store_true", help="prune every run to its latest checkpoint and time it")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+class _TimedSaver(SQLiteCheckpointSaver):
+    put_ms: list[float] = []
+    put_writes_ms: list[float] = []
+
+    def put(self, config, checkpoint, metadata, new_versions):  # noqa: ANN001, ANN201
+        started = time.perf_counter()
+        try:
+            return super().put(config, checkpoint, metadata, new_versions)
+        finally:
+            self.put_ms.append((time.perf_counter() - started) * 1000)
+
+    def put_writes(self, config, writes, task_id, task_path=""):  # noqa: ANN001, ANN201
+        started = time.perf_counter()
+        try:
+            return super().put_writes(config, writes, task_id, task_path)
+        finally:
+            self.put_writes_ms.append((time.perf_counter() - started) * 1000)
+
+
+def _db_bytes(db_path: str) -> int:
+    connection = connect_sqlite(db_path)
+    try:
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        connection.close()
+    return sum(os.path.getsize(path) for path in (db_path, f"{db_path}-wal") if os.path.exists(path))
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {"count": 0, "total_ms": 0.0, "p50_ms": 0.0, "max_ms": 0.0}
+    return {
+        "count": len(samples),
+        "total_ms": round(sum(samples), 3),
+        "p50_ms": round(median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import run_author_play_graph
+
+    preview, _ = run_preview_blueprint_graph(args.seed)
+    blueprint = apply_blueprint_edits(preview)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "checkpoints.sqlite3")
+        saver = _TimedSaver(db_path)
+        empty_bytes = _db_bytes(db_path)
+        run_ms: list[float] = []
+        for index in range(max(args.runs, 1)):
+            started = time.perf_counter()
+            run_author_play_graph(blueprint, checkpointer=saver, run_id=f"benchmark-run-{index}")
+            run_ms.append((time.perf_counter() - started) * 1000)
+        runs = len(run_ms)
+        total_bytes = _db_bytes(db_path) - empty_bytes
+        report: dict[str, Any] = {
+            "config": {"runs": runs},
+            "db_bytes": total_bytes,
+            "db_bytes_per_run": round(total_bytes / runs),
+            "run_ms": _summary(run_ms),
+            "put": _summary(_TimedSaver.put_ms),
+            "put_writes": _summary(_TimedSaver.put_writes_ms),
+            "checkpoint_write_ms_per_run": round((sum(_TimedSaver.put_ms) + sum(_TimedSaver.put_writes_ms)) / runs, 3),
+        }
+        if args.prune:
+            started = time.perf_counter()
+            saver.prune([f"benchmark-run-{index}" for index in range(runs)])
+            report["prune_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            # Pruned pages return to the freelist; VACUUM shows the live size.
+            connection = connect_sqlite(db_path)
+            try:
+                connection.execute("VACUUM")
+            finally:
+                connection.close()
+            report["db_bytes_after_prune"] = _db_bytes(db_path) - empty_bytes
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
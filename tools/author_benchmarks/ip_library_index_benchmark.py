@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from statistics import median
+from typing import Any, get_args
+
+from rpg_backend.author_v2.contracts import AcceptedBlueprint, CastSlotPlan, IPCharacterProfile, SlotFunctionId
+
+_SEED = "校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。"
+_SLOT_FUNCTIONS = get_args(SlotFunctionId)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure author_v2 cast slot ranking against synthetic IP libraries of growing size, "
+            "comparing the library index with a full linear scan."
+        )
+    )
+    parser.add_argument("--sizes", default="60,1000,10000", help="comma-separated library sizes")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", default=_SEED)
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+def synthetic_library(size: int, *, seed: int = 7) -> list[IPCharacterProfile]:
+    """Clone the shipped library into ``size`` profiles with shuffled slot functions and tags."""
+    from rpg_backend.author_v2.ip_library import URBAN_IP_LIBRARY
+
+    rng = random.Random(seed)
+    secret_tags = sorted({tag for profile in URBAN_IP_LIBRARY for tag in profile.secret_affinity_tags})
+    voice_tags = sorted({tag for profile in URBAN_IP_LIBRARY for tag in profile.voice_register_tags})
+    output: list[IPCharacterProfile] = []
+    for index in range(size):
+        base = URBAN_IP_LIBRARY[index % len(URBAN_IP_LIBRARY)]
+        if index < len(URBAN_IP_LIBRARY):
+            output.append(base)
+            continue
+        output.append(
+            base.model_copy(
+                update={
+                    "ip_character_id": f"{base.ip_character_id}_{index}",
+                    "compatible_slot_functions": rng.sample(_SLOT_FUNCTIONS, k=rng.randint(1, 2)),
+                    "secret_affinity_tags": rng.sample(secret_tags, k=min(2, len(secret_tags))),
+                    "voice_register_tags": rng.sample(voice_tags, k=min(2, len(voice_tags))),
+                    "disallowed_with": [],
+                }
+            )
+        )
+    return output
+
+
+def _linear_rank(
+    profiles: list[IPCharacterProfile],
+    slot: CastSlotPlan,
+    blueprint: AcceptedBlueprint,
+    selected: list[IPCharacterProfile],
+    limit: int,
+) -> list[tuple[float, IPCharacterProfile]]:
+    # The pre-index ranker: hard filter and four scoring passes over every profile.
+    from rpg_backend.author_v2.ip_library import (
+        _SECRET_AFFINITY_KEYWORDS,
+        _TARGET_GENDER_VALUES,
+        _VOICE_REGISTER_KEYWORDS,
+        _disallowed_hit,
+    )
+
+    selected_ids = {picked.ip_character_id for picked in selected}
+    secret_text = f"{blueprint.taboo_secret} {blueprint.relationship_setup} {slot.secret_pressure}"
+    voice_text = f"{blueprint.social_arena} {blueprint.share_hook} {blueprint.hook}"
+    ranked: list[tuple[float, IPCharacterProfile]] = []
+    for profile in profiles:
+        if profile.ip_character_id in selected_ids or slot.slot_function not in set(profile.compatible_slot_functions):
+            continue
+        if blueprint.target_gender_pref in _TARGET_GENDER_VALUES and profile.gender != blueprint.target_gender_pref:
+            continue
+        if not profile.is_adult or _disallowed_hit(profile, selected):
+            continue
+        role = max(0.0, 3.4 - list(profile.compatible_slot_functions).index(slot.slot_function) * 0.9)
+        secret = sum(
+            1.0
+            for tag in profile.secret_affinity_tags
+            if any(keyword in secret_text for keyword in _SECRET_AFFINITY_KEYWORDS.get(tag, ()))
+        )
+        if secret <= 0.0:
+            secret = sum(0.4 for trigger in profile.taboo_triggers if trigger in secret_text)
+        voice = sum(
+            0.8
+            for tag in profile.voice_register_tags
+            if any(keyword in voice_text for keyword in _VOICE_REGISTER_KEYWORDS.get(tag, ()))
+        )
+        penalty = 0.0
+        for picked in selected:
+            penalty += len(set(profile.persona_traits) & set(picked.persona_traits)) * 0.55
+            penalty += 0.4 if profile.worldly_desire_type == picked.worldly_desire_type else 0.0
+            penalty += len(set(profile.voice_register_tags) & set(picked.voice_register_tags)) * 0.2
+        ranked.append((role + min(secret, 3.0) + min(voice, 2.4) - min(penalty, 2.4), profile))
+    ranked.sort(key=lambda item: (-item[0], item[1].ip_character_id))
+    return ranked[:limit]
+
+
+def _linear_pool(profiles: list[IPCharacterProfile], slots: list[CastSlotPlan], blueprint: AcceptedBlueprint) -> None:
+    selected: list[IPCharacterProfile] = []
+    for slot in slots:
+        ranked = _linear_rank(profiles, slot, blueprint, selected, 8)
+        if ranked:
+            selected.append(ranked[0][1])
+
+
+def _median_ms(run: Any, repeats: int) -> float:
+    samples: list[float] = []
+    for _ in range(max(repeats, 1)):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(median(samples), 3)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.ip_library import build_ip_library_index, build_slot_candidate_pool, profile_by_id
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import plan_cast_slots
+
+    preview, _ = run_preview_blueprint_graph(args.seed)
+    blueprint = apply_blueprint_edits(preview)
+    slots = plan_cast_slots({"accepted_blueprint": blueprint, "quality_trace": []})["cast_slots"]
+    report: dict[str, Any] = {
+        "config": {"slot_count": len(slots), "repeats": args.repeats},
+        "profile_by_id_us": round(_median_ms(lambda: [profile_by_id() for _ in range(1000)], args.repeats), 3),
+        "sizes": {},
+    }
+    for size in [int(token) for token in args.sizes.split(",") if token.strip()]:
+        profiles = synthetic_library(size)
+        started = time.perf_counter()
+        library = build_ip_library_index(profiles)
+        build_ms = round((time.perf_counter() - started) * 1000, 3)
+        indexed_ms = _median_ms(lambda: build_slot_candidate_pool(slots, blueprint, library=library), args.repeats)
+        linear_ms = _median_ms(lambda: _linear_pool(profiles, slots, blueprint), args.repeats)
+        report["sizes"][str(size)] = {
+            "index_build_ms": build_ms,
+            "candidate_pool_indexed_ms": indexed_ms,
+            "candidate_pool_linear_scan_ms": linear_ms,
+            "speedup": round(linear_ms / indexed_ms, 2) if indexed_ms else None,
+        }
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+import json
+import tempfile
+import threading
+import time
+from typing import Any, Iterator
+
+from tools.author_benchmarks.preview_burst_benchmark import _SEEDS, stub_preview_gateway
+from tools.play_benchmarks.turn_engine_benchmark import _summary
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Submit a burst of author jobs at once through stub LLM latency and report admission, "
+            "queue wait, peak pipeline concurrency and per-user fairness, unbounded versus the job scheduler."
+        )
+    )
+    parser.add_argument("--submissions", type=int, default=200)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--max-concurrent", type=int, default=4)
+    parser.add_argument("--max-queue-depth", type=int, default=100)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0, help="sleep per stub preview synthesis call")
+    parser.add_argument("--job-latency-ms", type=float, default=100.0, help="stub LLM time added to every author pipeline")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+@contextmanager
+def stub_author_pipeline(job_latency_ms: float) -> Iterator[dict[str, int]]:
+    """Run the deterministic author_v2 graph after a fixed stub LLM delay; yields live/peak pipeline counts."""
+    import rpg_backend.author_v2.product_jobs as product_jobs_module
+
+    original = product_jobs_module.run_author_play_graph
+    lock = threading.Lock()
+    pipelines = {"running": 0, "peak": 0}
+
+    def _run(accepted_blueprint, **kwargs):  # noqa: ANN001, ANN202
+        with lock:
+            pipelines["running"] += 1
+            pipelines["peak"] = max(pipelines["peak"], pipelines["running"])
+        try:
+            time.sleep(max(job_latency_ms, 0.0) / 1000)
+            return original(accepted_blueprint, **{**kwargs, "live_mode": "deterministic"})
+        finally:
+            with lock:
+                pipelines["running"] -= 1
+
+    product_jobs_module.run_author_play_graph = _run
+    try:
+        yield pipelines
+    finally:
+        product_jobs_module.run_author_play_graph = original
+
+
+def _event_at(events: list[dict[str, Any]], *names: str) -> Any:
+    return next((event["emitted_at"] for event in events if event["event"] in names), None)
+
+
+def _burst(service: Any, args: argparse.Namespace) -> dict[str, Any]:
+    from rpg_backend.author.job_scheduler import AuthorJobQueueFullError
+
+    submissions = max(args.submissions, 1)
+    users = max(args.users, 1)
+    barrier = threading.Barrier(submissions)
+    lock = threading.Lock()
+    accepted: list[tuple[str, str]] = []
+    retry_after: list[int] = []
+    submit_ms: list[float] = []
+    request_type = type("JobRequest", (), {"random_seed": None, "preview_id": None})
+
+    def _submit(index: int) -> None:
+        request = request_type()
+        request.prompt_seed = _SEEDS[index % len(_SEEDS)]
+        owner_user_id = f"user-{index % users:03d}"
+        barrier.wait()
+        started = time.perf_counter()
+        try:
+            response = service.create_job(request, actor_user_id=owner_user_id)
+        except AuthorJobQueueFullError as exc:
+            with lock:
+                retry_after.append(exc.retry_after_seconds)
+            return
+        finally:
+            with lock:
+                submit_ms.append((time.perf_counter() - started) * 1000)
+        with lock:
+            accepted.append((response.job_id, owner_user_id))
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=_submit, args=(index,)) for index in range(submissions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    admitted_ms = (time.perf_counter() - started) * 1000
+    pending = {job_id for job_id, _owner in accepted}
+    deadline = time.monotonic() + 600
+    while pending and time.monotonic() < deadline:
+        pending = {job_id for job_id in pending if service._get_record(job_id).status not in {"completed", "failed"}}
+        time.sleep(0.05)
+
+    queue_wait_ms: list[float] = []
+    starts: list[tuple[Any, str]] = []
+    position_events = 0
+    statuses: dict[str, int] = {}
+    for job_id, owner_user_id in accepted:
+        record = service._get_record(job_id)
+        statuses[record.status] = statuses.get(record.status, 0) + 1
+        created_at = _event_at(record.events, "job_created")
+        started_at = _event_at(record.events, "job_started", "job_resumed")
+        position_events += sum(1 for event in record.events if event["event"] == "queue_position")
+        if created_at is not None and started_at is not None:
+            queue_wait_ms.append((started_at - created_at).total_seconds() * 1000)
+            starts.append((started_at, owner_user_id))
+    starts.sort(key=lambda item: item[0])
+    first_round = starts[: min(users, len(starts))]
+    return {
+        "accepted": len(accepted),
+        "rejected": len(retry_after),
+        "retry_after_seconds": {"min": min(retry_after), "max": max(retry_after)} if retry_after else None,
+        "admission_wall_ms": round(admitted_ms, 3),
+        "drain_wall_ms": round((time.perf_counter() - started) * 1000, 3),
+        "submit_latency_ms": _summary(submit_ms),
+        "queue_wait_ms": _summary(queue_wait_ms),
+        "job_statuses": statuses,
+        "queue_position_events": position_events,
+        # How many distinct users got a job started among the first `users` starts.
+        "users_served_in_first_round": len({owner for _started_at, owner in first_round}),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.product_jobs import ProductAuthorJobService
+    from rpg_backend.config import get_settings
+
+    report: dict[str, Any] = {
+        "config": {
+            "submissions": args.submissions,
+            "users": args.users,
+            "max_concurrent": args.max_concurrent,
+            "max_queue_depth": args.max_queue_depth,
+            "llm_latency_ms": args.llm_latency_ms,
+            "job_latency_ms": args.job_latency_ms,
+        },
+        "modes": {},
+    }
+    modes = {
+        # A cap as large as the burst admits everything at once, like the old thread-per-job start.
+        "unbounded": {"author_job_max_concurrent": max(args.submissions, 1), "author_job_max_queue_depth": 0},
+        "scheduled": {"author_job_max_concurrent": args.max_concurrent, "author_job_max_queue_depth": args.max_queue_depth},
+    }
+    with stub_preview_gateway(args.llm_latency_ms), tempfile.TemporaryDirectory() as tmp_dir:
+        for mode, limits in modes.items():
+            with stub_author_pipeline(args.job_latency_ms) as pipelines:
+                service = ProductAuthorJobService(
+                    settings=get_settings().model_copy(
+                        update={
+                            "runtime_state_db_path": f"{tmp_dir}/{mode}.sqlite3",
+                            "author_product_run_mode": "pure_gpt",
+                            **limits,
+                        }
+                    )
+                )
+                report["modes"][mode] = _burst(service, args)
+                report["modes"][mode]["peak_concurrent_pipelines"] = pipelines["peak"]
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
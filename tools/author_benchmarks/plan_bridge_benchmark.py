@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import time
+from statistics import median
+from typing import Any, Callable
+
+_SEED = "董事会前夜，项目负责人被上司、对手和法务一起拖进并购黑账与暧昧站队里。"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time author_v3 plan_bridge on a recorded v3 bundle: a full bridge with cold projection "
+            "caches versus incremental re-bridges after editing one part of the bundle."
+        )
+    )
+    parser.add_argument("--bundle", help="recorded v3 bundle JSON (see --record); defaults to a fresh deterministic run")
+    parser.add_argument("--record", help="write the v3 bundle used for timing to this path")
+    parser.add_argument("--seed", default=_SEED)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+def _bundle_from_run(seed: str) -> dict[str, Any]:
+    from rpg_backend.author_v3.workflow import run_author_v3_pipeline
+
+    result = run_author_v3_pipeline(seed, run_mode="deterministic")
+    return {
+        "world_config": result["world_config"],
+        "relationship_matrix": result["relationship_matrix"],
+        "tension_web": result["tension_web"],
+        "storylet_pool": result["storylet_pool"],
+        "mapped_segments": result["mapped_segments"],
+        "quality_report": result["quality_report"],
+    }
+
+
+def _dump_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: [item.model_dump(mode="json") for item in value] if isinstance(value, list) else value.model_dump(mode="json")
+        for key, value in bundle.items()
+    }
+
+
+def _load_bundle(payload: dict[str, Any]) -> dict[str, Any]:
+    from rpg_backend.author_v3.contracts import RelationshipMatrix, WorldConfiguration
+    from rpg_backend.author_v3.quality_evaluator import QualityReport
+    from rpg_backend.author_v3.storylet_compiler import MappedSegment, StoryletPool
+    from rpg_backend.author_v3.tension_weaver import TensionWeb
+
+    return {
+        "world_config": WorldConfiguration.model_validate(payload["world_config"]),
+        "relationship_matrix": RelationshipMatrix.model_validate(payload["relationship_matrix"]),
+        "tension_web": TensionWeb.model_validate(payload["tension_web"]),
+        "storylet_pool": StoryletPool.model_validate(payload["storylet_pool"]),
+        "mapped_segments": [MappedSegment.model_validate(item) for item in payload["mapped_segments"]],
+        "quality_report": QualityReport.model_validate(payload["quality_report"]),
+    }
+
+
+def _edit_storylets(bundle: dict[str, Any], revision: int) -> dict[str, Any]:
+    pool = bundle["storylet_pool"]
+    last = pool.storylets[-1]
+    edited = last.model_copy(update={"scene_text": f"{last.scene_text[:480]}#{revision}"})
+    return {**bundle, "storylet_pool": pool.model_copy(update={"storylets": [*pool.storylets[:-1], edited]})}
+
+
+def _edit_segments(bundle: dict[str, Any], revision: int) -> dict[str, Any]:
+    first, *rest = bundle["mapped_segments"]
+    return {**bundle, "mapped_segments": [first.model_copy(update={"scene_goal": f"{first.scene_goal[:200]}#{revision}"}), *rest]}
+
+
+def _edit_cast(bundle: dict[str, Any], revision: int) -> dict[str, Any]:
+    config = bundle["world_config"]
+    characters = [
+        character.model_copy(update={"speech_pattern": f"{character.speech_pattern[:100]}#{revision}"})
+        if character.character_id != config.protagonist_id and index == len(config.characters) - 1
+        else character
+        for index, character in enumerate(config.characters)
+    ]
+    return {**bundle, "world_config": config.model_copy(update={"characters": characters})}
+
+
+def _bridge(bundle: dict[str, Any]) -> Any:
+    from rpg_backend.author_v3.plan_bridge import bridge_to_plan
+
+    return bridge_to_plan(
+        bundle["world_config"],
+        bundle["relationship_matrix"],
+        bundle["tension_web"],
+        bundle["storylet_pool"],
+        bundle["mapped_segments"],
+        bundle["quality_report"],
+    )
+
+
+def _median_ms(run: Callable[[int], None], repeats: int) -> float:
+    samples: list[float] = []
+    for revision in range(max(repeats, 1)):
+        started = time.perf_counter()
+        run(revision)
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(median(samples), 4)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v3.plan_bridge import clear_projection_caches
+
+    if args.bundle:
+        bundle = _load_bundle(json.loads(Path(args.bundle).read_text(encoding="utf-8")))
+    else:
+        bundle = _bundle_from_run(args.seed)
+    if args.record:
+        Path(args.record).write_text(json.dumps(_dump_bundle(bundle), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def _full(_revision: int) -> None:
+        clear_projection_caches()
+        _bridge(bundle)
+
+    def _incremental(edit: Callable[[dict[str, Any], int], dict[str, Any]]) -> Callable[[int], None]:
+        # Edits are prepared outside the timed call; each revision is new content, so the edited projection misses.
+        edited = [edit(bundle, revision) for revision in range(max(args.repeats, 1))]
+        clear_projection_caches()
+        _bridge(bundle)
+        return lambda revision: _bridge(edited[revision])
+
+    report: dict[str, Any] = {
+        "config": {
+            "repeats": args.repeats,
+            "bundle": args.bundle or "deterministic_run",
+            "storylets": len(bundle["storylet_pool"].storylets),
+            "segments": len(bundle["mapped_segments"]),
+            "characters": len(bundle["world_config"].characters),
+        },
+        "full_bridge_ms": _median_ms(_full, args.repeats),
+    }
+    clear_projection_caches()
+    _bridge(bundle)
+    report["unchanged_rebridge_ms"] = _median_ms(lambda _revision: _bridge(bundle), args.repeats)
+    report["incremental_rebridge_ms"] = {
+        "storylet_edit": _median_ms(_incremental(_edit_storylets), args.repeats),
+        "segment_edit": _median_ms(_incremental(_edit_segments), args.repeats),
+        "cast_edit": _median_ms(_incremental(_edit_cast), args.repeats),
+    }
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import json
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any, Iterator
+
+from tools.play_benchmarks.turn_engine_benchmark import _summary
+
+_SEEDS = (
+    "校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。",
+    "董事会前夜，项目负责人被上司、对手和法务一起拖进并购黑账与暧昧站队里。",
+    "豪门订婚宴上，未婚夫、旧爱和律师一起逼她在众目睽睽下选边。",
+    "闺蜜结婚前一周突然把我前任拉进伴娘群，婚礼彩排变成公开审判。",
+)
+_PREVIEW_DELTA_KEYS = (
+    "hook",
+    "bomb_moment",
+    "cost_of_truth",
+    "protagonist_public_identity",
+    "protagonist_hidden_need",
+    "social_arena",
+    "relationship_setup",
+    "taboo_secret",
+    "share_hook",
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Fire a burst of author preview requests with duplicate seeds through a stub LLM gateway and "
+            "report latency with per-request generation versus the service's shared preview cache."
+        )
+    )
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--distinct-seeds", type=int, default=4, choices=range(1, len(_SEEDS) + 1))
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0, help="sleep per stub preview synthesis call")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+class StubPreviewGateway:
+    """Answers preview synthesis with the deterministic draft after a fixed delay."""
+
+    def __init__(self, latency_ms: float, profile_id: str = "live_gpt_5_4_mini") -> None:
+        self.profile_id = profile_id
+        self.model = "stub"
+        self.call_trace: list[dict[str, Any]] = []
+        self.max_output_tokens_preview = 1200
+        self._latency_seconds = max(latency_ms, 0.0) / 1000
+
+    def invoke_json(self, *, system_prompt, user_payload, max_output_tokens, operation_name, response_format_type=None):  # noqa: ANN001, ANN201
+        del system_prompt, max_output_tokens, response_format_type
+        time.sleep(self._latency_seconds)
+        self.call_trace.append({"operation": operation_name, "usage": {"input_tokens": 0, "output_tokens": 0}})
+        draft = user_payload["deterministic_draft"]
+        return SimpleNamespace(payload={key: draft[key] for key in _PREVIEW_DELTA_KEYS if key in draft})
+
+
+@contextmanager
+def stub_preview_gateway(latency_ms: float) -> Iterator[list[int]]:
+    """Route author_v2 preview synthesis to a fresh stub gateway per request; yields a call counter."""
+    import rpg_backend.author_v2.preview as preview_module
+
+    calls = [0]
+    original = preview_module.get_author_v2_llm_gateway
+
+    def _gateway(mode: str) -> StubPreviewGateway:
+        calls[0] += 1
+        return StubPreviewGateway(latency_ms, profile_id=mode)
+
+    preview_module.get_author_v2_llm_gateway = _gateway
+    try:
+        yield calls
+    finally:
+        preview_module.get_author_v2_llm_gateway = original
+
+
+class _UncachedPreviews:
+    """Stands in for the service's preview cache to reproduce one generation per request."""
+
+    def get_or_build(self, key: str, build: Any) -> tuple[Any, str]:
+        del key
+        return build()[0], "miss"
+
+
+def _burst(create: Any, seeds: list[str], concurrency: int) -> dict[str, Any]:
+    def _timed(seed: str) -> float:
+        started = time.perf_counter()
+        create(seed)
+        return (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="preview-burst") as executor:
+        latencies = list(executor.map(_timed, seeds))
+    return {
+        "wall_ms": round((time.perf_counter() - started) * 1000, 3),
+        "latency_ms": _summary(latencies),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.product_jobs import ProductAuthorJobService
+    from rpg_backend.config import get_settings
+
+    # Duplicates arrive interleaved and with the small variations real users type.
+    variants = ("{seed}", "{seed}。", " {seed} ", "{seed}！")
+    seeds = [
+        variants[(index // args.distinct_seeds) % len(variants)].format(seed=_SEEDS[index % args.distinct_seeds].rstrip("。"))
+        for index in range(max(args.requests, 1))
+    ]
+    report: dict[str, Any] = {
+        "config": {
+            "requests": len(seeds),
+            "distinct_seeds": args.distinct_seeds,
+            "concurrency": args.concurrency,
+            "llm_latency_ms": args.llm_latency_ms,
+        },
+        "modes": {},
+    }
+    with stub_preview_gateway(args.llm_latency_ms) as calls, tempfile.TemporaryDirectory() as tmp_dir:
+        for mode in ("per_request_generation", "shared_preview_cache"):
+            calls[0] = 0
+            service = ProductAuthorJobService(
+                settings=get_settings().model_copy(
+                    update={
+                        "runtime_state_db_path": f"{tmp_dir}/{mode}.sqlite3",
+                        "author_product_run_mode": "pure_gpt",
+                    }
+                )
+            )
+            if mode == "per_request_generation":
+                service._preview_cache = _UncachedPreviews()  # type: ignore[assignment]
+            request_type = type("PreviewRequest", (), {"random_seed": None})
+
+            def _create(seed: str, service: ProductAuthorJobService = service) -> None:
+                request = request_type()
+                request.prompt_seed = seed
+                service.create_preview(request, actor_user_id="benchmark")
+
+            report["modes"][mode] = _burst(_create, seeds, args.concurrency)
+            report["modes"][mode]["llm_calls"] = calls[0]
+            if mode == "shared_preview_cache":
+                stats = service._preview_cache.stats()
+                report["modes"][mode]["cache"] = {"hits": stats.hits, "coalesced": stats.coalesced, "misses": stats.misses}
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
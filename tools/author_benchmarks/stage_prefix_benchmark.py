@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from types import SimpleNamespace
+from typing import Any
+
+_SEED = "董事会权力斗争"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Run the author_v3 weave, strengthen and compile stages over a deterministic world through a stub "
+            "provider that caches prompt prefixes, and report per-stage prompt size and how much of it a "
+            "provider prefix cache could serve."
+        )
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="repeat the stages over the same world, like quality-loop rounds")
+    parser.add_argument("--strengthen-rounds", type=int, default=1)
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="sleep per stub provider call")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+class PrefixCachingStubClient:
+    """Replays canned stage payloads; counts each request's longest prompt prefix shared with an earlier one as cached."""
+
+    def __init__(self, payloads: dict[str, Any], latency_ms: float) -> None:
+        self.responses = self
+        self.requests: list[dict[str, Any]] = []
+        self._payloads = payloads
+        self._latency_seconds = max(latency_ms, 0.0) / 1000
+        self._seen: list[str] = []
+
+    def create(self, **kwargs):  # noqa: ANN201
+        messages = kwargs["input"]
+        contents = [str(item["content"]) for item in messages] if isinstance(messages, list) else [str(messages)]
+        prompt = "\n\n".join([str(kwargs["instructions"]), *contents])
+        cached = max((len(os.path.commonprefix([prompt, seen])) for seen in self._seen), default=0)
+        self._seen.append(prompt)
+        self.requests.append({"prompt_characters": len(prompt), "cached_characters": cached})
+        time.sleep(self._latency_seconds)
+        payload = self._payloads["storylets" if "叙事片段编译器" in prompt else "web"]
+        return SimpleNamespace(
+            id=f"resp_{len(self.requests)}",
+            output_text=json.dumps(payload, ensure_ascii=False),
+            usage={"input_tokens": len(prompt), "output_tokens": 0, "input_tokens_details": {"cached_tokens": cached}},
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v3.gateway import AuthorV3LLMGateway
+    from rpg_backend.author_v3.relationship_matrix import build_relationship_matrix
+    from rpg_backend.author_v3.storylet_compiler import compile_storylet_pool
+    from rpg_backend.author_v3.tension_weaver import weave_secrets
+    from rpg_backend.author_v3.world_forge import forge_world
+
+    config = forge_world(_SEED)
+    matrix = build_relationship_matrix(config)
+    web = weave_secrets(config, matrix)
+    client = PrefixCachingStubClient(
+        {
+            "web": web.model_dump(mode="json"),
+            "storylets": compile_storylet_pool(config, web, matrix).model_dump(mode="json"),
+        },
+        args.llm_latency_ms,
+    )
+    gateway = AuthorV3LLMGateway(client=client, model="stub", profile_id="pure_gpt", timeout_seconds=1.0)
+    for _round in range(max(args.rounds, 1)):
+        # A threshold above 1.0 always runs the configured strengthen rounds.
+        live_web = weave_secrets(config, matrix, gateway=gateway, max_rounds=args.strengthen_rounds, threshold=1.1)
+        compile_storylet_pool(config, live_web, matrix, gateway=gateway)
+
+    stages: dict[str, dict[str, Any]] = {}
+    for index, entry in enumerate(gateway.call_trace):
+        usage = entry.get("usage") or {}
+        stage = stages.setdefault(
+            entry["operation"],
+            {"calls": 0, "input_characters": 0, "cached_characters": 0, "first_call_cached_characters": None, "elapsed_ms": 0},
+        )
+        stage["calls"] += 1
+        stage["input_characters"] += int(usage.get("input_tokens") or 0)
+        stage["cached_characters"] += int(usage.get("cached_input_tokens") or 0)
+        stage["elapsed_ms"] += int(entry.get("elapsed_ms") or 0)
+        if stage["first_call_cached_characters"] is None:
+            stage["first_call_cached_characters"] = client.requests[index]["cached_characters"]
+    for stage in stages.values():
+        stage["cached_share"] = round(stage["cached_characters"] / max(stage["input_characters"], 1), 4)
+    total_input = sum(stage["input_characters"] for stage in stages.values())
+    total_cached = sum(stage["cached_characters"] for stage in stages.values())
+    report = {
+        "config": {"rounds": args.rounds, "strengthen_rounds": args.strengthen_rounds, "llm_latency_ms": args.llm_latency_ms},
+        "stages": stages,
+        "total": {
+            "calls": len(gateway.call_trace),
+            "input_characters": total_input,
+            "cached_characters": total_cached,
+            "cached_share": round(total_cached / max(total_input, 1), 4),
+        },
+    }
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
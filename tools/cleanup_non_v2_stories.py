@@ -45,6 +45,14 @@ def _delete_play_rows(play_db: str, story_ids: list[str]) -> int:
     if not story_ids:
         return 0
     with sqlite3.connect(play_db) as connection:
+        for child_table in ("play_session_history", "play_session_turn_traces"):
+            try:
+                connection.executemany(
+                    f"DELETE FROM {child_table} WHERE session_id IN (SELECT session_id FROM play_sessions WHERE story_id = ?)",
+                    [(story_id,) for story_id in story_ids],
+                )
+            except sqlite3.OperationalError:
+                pass
         cursor = connection.executemany(
             "DELETE FROM play_sessions WHERE story_id = ?",
             [(story_id,) for story_id in story_ids],
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+from threading import Lock
+import time
+from typing import Any
+
+from tools.play_benchmarks.turn_engine_benchmark import (
+    DEFAULT_TIERS,
+    DeterministicPlayClient,
+    _SEED,
+    _summary,
+    _turn_inputs,
+    build_synthetic_plan,
+    stub_llm_runtime,
+)
+
+_HEDGE_MODES = ("off", "parallel", "delayed")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare play_v2 run_turn latency with narration compose hedging off, parallel and delayed, "
+            "using a stub gateway whose compose latency has a lognormal tail."
+        )
+    )
+    parser.add_argument("--modes", default=",".join(_HEDGE_MODES), help="comma-separated hedge modes to run")
+    parser.add_argument("--turns", type=int, default=400)
+    parser.add_argument("--warmup-turns", type=int, default=10)
+    parser.add_argument("--compose-median-ms", type=float, default=60.0)
+    parser.add_argument("--compose-sigma", type=float, default=0.6, help="lognormal sigma of compose latency")
+    parser.add_argument("--shell-miss-rate", type=float, default=0.3, help="share of drafts missing every shell token")
+    parser.add_argument("--candidates", type=int, default=2)
+    parser.add_argument("--delay-ms", type=int, default=150, help="delayed-mode fallback before the window warms up")
+    parser.add_argument("--delay-percentile", type=float, default=90.0)
+    parser.add_argument("--tier", default="small", choices=[tier.name for tier in DEFAULT_TIERS])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--plan-seed", default=_SEED, help="author_v2 seed used for the base plan")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+class TailLatencyPlayClient(DeterministicPlayClient):
+    """Stub gateway whose compose calls sleep a seeded lognormal latency and sometimes miss the shell."""
+
+    def __init__(self, *, median_ms: float, sigma: float, shell_miss_rate: float, seed: int) -> None:
+        super().__init__()
+        self._median_ms = max(median_ms, 0.0)
+        self._sigma = max(sigma, 0.0)
+        self._shell_miss_rate = min(max(shell_miss_rate, 0.0), 1.0)
+        self._rng = random.Random(f"compose-hedge:{seed}")
+        self._lock = Lock()
+        self.compose_total_tokens = 0
+
+    def _invoke_json(self, **kwargs: Any):
+        operation = str(kwargs.get("operation_name") or "")
+        if operation != "play_v2.narration_compose":
+            with self._lock:
+                return super()._invoke_json(**kwargs)
+        with self._lock:
+            latency_ms = self._median_ms * math.exp(self._rng.gauss(0.0, self._sigma)) if self._median_ms else 0.0
+            shell_miss = self._rng.random() < self._shell_miss_rate
+        time.sleep(latency_ms / 1000)
+        with self._lock:
+            response = super()._invoke_json(**kwargs)
+            self.compose_total_tokens += int(response.usage.get("total_tokens") or 0)
+        if shell_miss:
+            response.payload["narration"] = "对方把话压了下去，周围人都听见了这一步的代价。"
+        return response
+
+
+def run_mode(plan: Any, mode: str, *, args: argparse.Namespace) -> dict[str, Any]:
+    from rpg_backend.play_v2.compose_hedge import reset_compose_latency_window
+    from rpg_backend.play_v2.runtime import build_initial_world_state, run_turn
+
+    client = TailLatencyPlayClient(
+        median_ms=args.compose_median_ms,
+        sigma=args.compose_sigma,
+        shell_miss_rate=args.shell_miss_rate,
+        seed=args.seed,
+    )
+    rng = random.Random(f"{args.seed}:turns")
+    sessions = 0
+    state = build_initial_world_state(plan, session_id=f"compose-hedge-{mode}-{sessions}")
+    latencies: list[float] = []
+    winner_indexes: dict[str, int] = {}
+    reset_compose_latency_window()
+    with stub_llm_runtime(
+        client,
+        play_v2_compose_hedge_mode=mode,
+        play_v2_compose_hedge_candidates=max(args.candidates, 1),
+        play_v2_compose_hedge_delay_ms=max(args.delay_ms, 0),
+        play_v2_compose_hedge_delay_percentile=args.delay_percentile,
+    ):
+        for turn in range(max(args.warmup_turns, 0) + max(args.turns, 1)):
+            if turn == args.warmup_turns:
+                client.compose_total_tokens = 0
+                client.operation_counts.clear()
+            if state.status != "active":
+                sessions += 1
+                state = build_initial_world_state(plan, session_id=f"compose-hedge-{mode}-{sessions}")
+            input_text, suggestion_id = _turn_inputs(plan, state, rng, turn)
+            started = time.perf_counter()
+            result = run_turn(plan, state, input_text, selected_suggestion_id=suggestion_id)
+            elapsed = (time.perf_counter() - started) * 1000
+            state = result.state
+            if turn < args.warmup_turns:
+                continue
+            latencies.append(elapsed)
+            winner = str(result.intent_stage_diagnostics.get("compose_hedge_winner_index", -1))
+            winner_indexes[winner] = winner_indexes.get(winner, 0) + 1
+    reset_compose_latency_window()
+    return {
+        "turns": len(latencies),
+        "run_turn_ms": _summary(latencies),
+        "compose_calls": int(client.operation_counts.get("play_v2.narration_compose", 0)),
+        "compose_tokens_per_turn": round(client.compose_total_tokens / len(latencies), 1) if latencies else 0.0,
+        "hedge_winner_index": dict(sorted(winner_indexes.items())),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import run_author_play_graph
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip() in _HEDGE_MODES]
+    if not modes:
+        raise SystemExit(f"no known modes in {args.modes!r}; choose from {', '.join(_HEDGE_MODES)}")
+    preview, _ = run_preview_blueprint_graph(args.plan_seed)
+    tier = next(item for item in DEFAULT_TIERS if item.name == args.tier)
+    plan = build_synthetic_plan(run_author_play_graph(apply_blueprint_edits(preview)).play_plan, tier, seed=args.seed)
+    report: dict[str, Any] = {
+        "config": {
+            "tier": tier.name,
+            "turns": args.turns,
+            "compose_median_ms": args.compose_median_ms,
+            "compose_sigma": args.compose_sigma,
+            "shell_miss_rate": args.shell_miss_rate,
+            "candidates": args.candidates,
+            "delay_ms": args.delay_ms,
+            "delay_percentile": args.delay_percentile,
+        },
+        "modes": {mode: run_mode(plan, mode, args=args) for mode in modes},
+    }
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from typing import Any
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure interactive LLM latency under mixed load against a local stub provider, "
+            "with and without priority-aware rate limit admission."
+        )
+    )
+    parser.add_argument("--seconds", type=float, default=6.0)
+    parser.add_argument("--requests-per-window", type=int, default=30)
+    parser.add_argument("--window-seconds", type=float, default=1.0, help="shrunk stand-in for the 60s RPM window")
+    parser.add_argument("--provider-latency-ms", type=float, default=40.0)
+    parser.add_argument("--interactive-interval-ms", type=float, default=150.0)
+    parser.add_argument("--background-workers", type=int, default=6)
+    parser.add_argument("--speculative-workers", type=int, default=3)
+    parser.add_argument("--reserve-fraction", type=float, default=0.2)
+    return parser.parse_args(argv)
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 2)
+
+
+def _run_mixed_load(args: argparse.Namespace, *, prioritized: bool) -> dict[str, Any]:
+    from rpg_backend.responses_transport import LLMAdmissionRejectedError, _RequestsPerMinuteLimiter
+
+    limiter = _RequestsPerMinuteLimiter(
+        args.requests_per_window,
+        interactive_reserve_fraction=args.reserve_fraction if prioritized else 0.0,
+        window_seconds=args.window_seconds,
+    )
+    provider_latency = args.provider_latency_ms / 1000
+    stop = threading.Event()
+    interactive_ms: list[float] = []
+    completed = {"background": 0, "speculative": 0}
+    counter_lock = threading.Lock()
+
+    def _call(priority: str) -> None:
+        # The legacy limiter had a single class; model it by admitting everything as interactive.
+        limiter.acquire(priority if prioritized else "interactive")  # type: ignore[arg-type]
+        time.sleep(provider_latency)
+
+    def _background() -> None:
+        while not stop.is_set():
+            _call("background")
+            with counter_lock:
+                completed["background"] += 1
+
+    def _speculative() -> None:
+        while not stop.is_set():
+            try:
+                _call("speculative")
+            except LLMAdmissionRejectedError:
+                time.sleep(provider_latency)
+                continue
+            with counter_lock:
+                completed["speculative"] += 1
+
+    workers = [threading.Thread(target=_background, daemon=True) for _ in range(args.background_workers)]
+    workers += [threading.Thread(target=_speculative, daemon=True) for _ in range(args.speculative_workers)]
+    for worker in workers:
+        worker.start()
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        _call("interactive")
+        interactive_ms.append((time.perf_counter() - started) * 1000)
+        time.sleep(max(0.0, args.interactive_interval_ms / 1000 - (time.perf_counter() - started)))
+    stop.set()
+    return {
+        "interactive_calls": len(interactive_ms),
+        "interactive_p50_ms": _percentile(interactive_ms, 50),
+        "interactive_p95_ms": _percentile(interactive_ms, 95),
+        "background_completed": completed["background"],
+        "speculative_completed": completed["speculative"],
+        "speculative_dropped": int(limiter.rejected.get("speculative", 0)),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = {
+        "config": {
+            "requests_per_window": args.requests_per_window,
+            "window_seconds": args.window_seconds,
+            "provider_latency_ms": args.provider_latency_ms,
+            "reserve_fraction": args.reserve_fraction,
+        },
+        "single_class": _run_mixed_load(args, prioritized=False),
+        "priority_admission": _run_mixed_load(args, prioritized=True),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
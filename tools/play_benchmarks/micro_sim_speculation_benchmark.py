@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+import json
+import math
+import random
+from threading import Lock
+import time
+from typing import Any
+
+from tools.play_benchmarks.turn_engine_benchmark import (
+    DEFAULT_TIERS,
+    DeterministicPlayClient,
+    _FREE_TEXT_TEMPLATES,
+    _SEED,
+    _summary,
+    _turn_inputs,
+    build_synthetic_plan,
+    stub_llm_runtime,
+)
+
+_SPECULATIVE_SEGMENT_ROLES = frozenset({"misread", "pressure", "reveal", "terminal"})
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare play_v2 run_intent_stage latency with and without speculative NPC micro-sim, "
+            "using a stub gateway with a lognormal intent compile and a fixed micro-sim latency."
+        )
+    )
+    parser.add_argument("--samples", type=int, default=60, help="intent stage calls per arm")
+    parser.add_argument("--intent-median-ms", type=float, default=50.0)
+    parser.add_argument("--intent-sigma", type=float, default=0.4, help="lognormal sigma of intent compile latency")
+    parser.add_argument("--micro-sim-ms", type=float, default=30.0)
+    parser.add_argument("--match-rate", type=float, default=0.7, help="share of compiled intents matching the heuristic one")
+    parser.add_argument("--state-turns", type=int, default=40, help="turns played to collect mid-story states")
+    parser.add_argument("--tier", default="small", choices=[tier.name for tier in DEFAULT_TIERS])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--plan-seed", default=_SEED, help="author_v2 seed used for the base plan")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+class SpeculationPlayClient(DeterministicPlayClient):
+    """Stub gateway whose intent compile answers ``next_intent`` after a seeded lognormal delay."""
+
+    def __init__(self, *, intent_median_ms: float, intent_sigma: float, micro_sim_ms: float, seed: int) -> None:
+        super().__init__()
+        self._intent_median_ms = max(intent_median_ms, 0.0)
+        self._intent_sigma = max(intent_sigma, 0.0)
+        self._micro_sim_seconds = max(micro_sim_ms, 0.0) / 1000
+        self._rng = random.Random(f"micro-sim-speculation:{seed}")
+        self._lock = Lock()
+        self.next_intent: dict[str, Any] = {}
+
+    def _invoke_json(self, **kwargs: Any):
+        operation = str(kwargs.get("operation_name") or "")
+        if operation.startswith("play_v2.intent_compile"):
+            with self._lock:
+                latency_ms = self._intent_median_ms * math.exp(self._rng.gauss(0.0, self._intent_sigma))
+                response = super()._invoke_json(**kwargs)
+            time.sleep(latency_ms / 1000)
+            response.payload.update(self.next_intent)
+            return response
+        if operation == "play_v2.npc_micro_sim":
+            time.sleep(self._micro_sim_seconds)
+        with self._lock:
+            return super()._invoke_json(**kwargs)
+
+
+def collect_states(plan: Any, *, turns: int, seed: int) -> list[Any]:
+    """Play ``turns`` stubbed turns and keep deep copies of states in micro-sim segments."""
+    from rpg_backend.play_v2.runtime import build_initial_world_state, run_turn
+
+    rng = random.Random(f"{seed}:states")
+    client = DeterministicPlayClient()
+    states: list[Any] = []
+    sessions = 0
+    state = build_initial_world_state(plan, session_id=f"speculation-states-{sessions}")
+    with stub_llm_runtime(client):
+        for turn in range(max(turns, 1)):
+            if state.status != "active":
+                sessions += 1
+                state = build_initial_world_state(plan, session_id=f"speculation-states-{sessions}")
+            if plan.segments[state.segment_index].segment_role in _SPECULATIVE_SEGMENT_ROLES:
+                states.append(state.model_copy(deep=True))
+            input_text, suggestion_id = _turn_inputs(plan, state, rng, turn)
+            state = run_turn(plan, state, input_text, selected_suggestion_id=suggestion_id).state
+    return states
+
+
+def _compiled_intent(plan: Any, state: Any, input_text: str, *, match: bool) -> dict[str, Any]:
+    from rpg_backend.play_v2.runtime import parse_turn_intent
+
+    heuristic = parse_turn_intent(plan, state, input_text, diagnostics={})
+    move_family = heuristic.move_family
+    if not match:
+        allowed = list(plan.segments[state.segment_index].allowed_move_families)
+        move_family = next((move for move in allowed if move != heuristic.move_family), move_family)
+    return {
+        "move_family": move_family,
+        "target_id": heuristic.target_id,
+        "scene_frame": heuristic.scene_frame,
+        "control_action": heuristic.control_action,
+        "intent_confidence": 0.8,
+    }
+
+
+def run_arm(plan: Any, states: list[Any], *, speculative: bool, args: argparse.Namespace) -> dict[str, Any]:
+    from rpg_backend.play_v2.micro_sim_speculation import reset_speculation_outcomes
+    from rpg_backend.play_v2.runtime import run_intent_stage
+
+    client = SpeculationPlayClient(
+        intent_median_ms=args.intent_median_ms,
+        intent_sigma=args.intent_sigma,
+        micro_sim_ms=args.micro_sim_ms,
+        seed=args.seed,
+    )
+    rng = random.Random(f"{args.seed}:samples")
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    saved_ms: list[float] = []
+    wasted_tokens = 0
+    reset_speculation_outcomes()
+    with stub_llm_runtime(client, play_v2_micro_sim_speculative_enabled=speculative):
+        for sample in range(max(args.samples, 1)):
+            state = states[sample % len(states)].model_copy(deep=True)
+            member = rng.choice(plan.cast)
+            input_text = rng.choice(_FREE_TEXT_TEMPLATES).format(name=member.display_name)
+            client.next_intent = _compiled_intent(plan, state, input_text, match=rng.random() < args.match_rate)
+            started = time.perf_counter()
+            _, _, diagnostics = run_intent_stage(plan, state, input_text, gateway=client)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[str(diagnostics.get("micro_sim_speculative_status") or "off")] += 1
+            saved_ms.append(float(diagnostics.get("micro_sim_speculative_saved_ms") or 0.0))
+            wasted_tokens += int(diagnostics.get("micro_sim_speculative_wasted_total_tokens") or 0)
+    reset_speculation_outcomes()
+    speculated = statuses["hit"] + statuses["miss"] + statuses["error"]
+    return {
+        "samples": len(latencies),
+        "intent_stage_ms": _summary(latencies),
+        "speculative_status": dict(sorted(statuses.items())),
+        "hit_rate": round(statuses["hit"] / speculated, 4) if speculated else 0.0,
+        "saved_ms": _summary(saved_ms),
+        "wasted_micro_sim_tokens": wasted_tokens,
+        "llm_operations": dict(client.operation_counts),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import run_author_play_graph
+
+    preview, _ = run_preview_blueprint_graph(args.plan_seed)
+    tier = next(item for item in DEFAULT_TIERS if item.name == args.tier)
+    plan = build_synthetic_plan(run_author_play_graph(apply_blueprint_edits(preview)).play_plan, tier, seed=args.seed)
+    states = collect_states(plan, turns=args.state_turns, seed=args.seed)
+    if not states:
+        raise SystemExit("no states reached a micro-sim segment; raise --state-turns")
+    report: dict[str, Any] = {
+        "config": {
+            "tier": tier.name,
+            "samples": args.samples,
+            "states": len(states),
+            "intent_median_ms": args.intent_median_ms,
+            "intent_sigma": args.intent_sigma,
+            "micro_sim_ms": args.micro_sim_ms,
+            "match_rate": args.match_rate,
+        },
+        "arms": {
+            "off": run_arm(plan, states, speculative=False, args=args),
+            "speculative": run_arm(plan, states, speculative=True, args=args),
+        },
+    }
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
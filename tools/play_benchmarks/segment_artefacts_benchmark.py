@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from statistics import median
+from typing import Any, Callable
+
+_SEED = "校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure per-plan segment artefact reuse on the deterministic play_v2 run_turn path."
+    )
+    parser.add_argument("--turns", type=int, default=120)
+    parser.add_argument("--calls", type=int, default=2000, help="iterations for the isolated helper timings")
+    parser.add_argument("--seed", default=_SEED)
+    return parser.parse_args(argv)
+
+
+def _disable_live_llm() -> None:
+    # The deterministic path never needs a gateway; keep every LLM stage off so
+    # timings measure runtime work only.
+    for name in (
+        "APP_PLAY_V2_INTENT_COMPILER_USE_LLM",
+        "APP_PLAY_V2_MICRO_SIM_USE_LLM",
+        "APP_PLAY_V2_DRAMATIC_REWRITE_USE_LLM",
+    ):
+        os.environ[name] = "false"
+
+
+def _per_call_us(run: Callable[[], Any], calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        run()
+    return round((time.perf_counter() - started) * 1_000_000 / calls, 2)
+
+
+def _run_turns(plan: Any, *, turns: int, cold: bool) -> list[float]:
+    from rpg_backend.play_v2.plan_artefacts import clear_plan_artefacts
+    from rpg_backend.play_v2.runtime import build_initial_world_state, build_suggested_actions, run_turn
+
+    latencies: list[float] = []
+    state = build_initial_world_state(plan, session_id="segment-artefacts-bench")
+    for turn in range(turns):
+        if state.status != "active":
+            state = build_initial_world_state(plan, session_id="segment-artefacts-bench")
+        actions = build_suggested_actions(plan, state)
+        action = actions[turn % len(actions)]
+        if cold:
+            clear_plan_artefacts()
+        started = time.perf_counter()
+        result = run_turn(plan, state, action.prompt, selected_suggestion_id=action.suggestion_id)
+        latencies.append((time.perf_counter() - started) * 1000)
+        state = result.state
+    return latencies
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    _disable_live_llm()
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import run_author_play_graph
+    from rpg_backend.play_v2.narration_frames import build_tone_example_pools, build_tone_example_style_hints
+    from rpg_backend.play_v2.plan_artefacts import clear_plan_artefacts, plan_artefact_cache_stats
+    from rpg_backend.play_v2.runtime import _segment_suggestion_lanes, build_initial_world_state
+
+    preview, _ = run_preview_blueprint_graph(args.seed)
+    plan = run_author_play_graph(apply_blueprint_edits(preview)).play_plan
+    state = build_initial_world_state(plan, session_id="segment-artefacts-bench")
+    segment = plan.segments[state.segment_index]
+    pools = build_tone_example_pools(segment)
+    calls = max(args.calls, 1)
+    helpers = {
+        "tone_style_hints_rebuild_us": _per_call_us(lambda: build_tone_example_style_hints(segment, state), calls),
+        "tone_style_hints_pooled_us": _per_call_us(
+            lambda: build_tone_example_style_hints(segment, state, pools=pools), calls
+        ),
+    }
+    lane_segment = segment.model_copy(update={"suggestion_lanes": []})
+    helpers["default_lanes_cached_us"] = _per_call_us(lambda: _segment_suggestion_lanes(lane_segment, plan), calls)
+
+    _run_turns(plan, turns=10, cold=False)
+    cold = _run_turns(plan, turns=max(args.turns, 1), cold=True)
+    clear_plan_artefacts()
+    warm = _run_turns(plan, turns=max(args.turns, 1), cold=False)
+    report = {
+        "turns": len(warm),
+        "helpers": helpers,
+        "run_turn_ms": {
+            "rebuild_every_turn": {"p50": round(median(cold), 3), "mean": round(sum(cold) / len(cold), 3)},
+            "plan_artefacts": {"p50": round(median(warm), 3), "mean": round(sum(warm) / len(warm), 3)},
+        },
+        "cache": plan_artefact_cache_stats(),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
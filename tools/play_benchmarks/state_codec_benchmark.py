@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from statistics import mean
+from typing import Any
+
+from rpg_backend.play.state_codec import (
+    JsonStateCodec,
+    JsonZlibStateCodec,
+    MsgpackStateCodec,
+    OrjsonStateCodec,
+    PlayStateCodec,
+    PlayStateCodecRegistry,
+    ZstdMsgpackStateCodec,
+    train_zstd_dictionary,
+)
+from rpg_backend.play_v2.contracts import UrbanWorldState
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare play session state codecs on size and throughput using states from a runtime DB."
+    )
+    parser.add_argument("--db", required=True, help="runtime_state sqlite file holding play_sessions rows")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--dict-size", type=int, default=16 * 1024)
+    parser.add_argument("--write-dict", help="write a zstd dictionary trained on every loaded state to this path")
+    return parser.parse_args(argv)
+
+
+def load_states(db_path: str) -> list[Any]:
+    registry = PlayStateCodecRegistry(JsonStateCodec())
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    try:
+        rows = connection.execute("SELECT state_encoding, state_json, state_blob FROM play_sessions").fetchall()
+    finally:
+        connection.close()
+    states: list[Any] = []
+    for row in rows:
+        codec = registry.decoder_for(str(row["state_encoding"] or "json"))
+        data = str(row["state_json"]).encode("utf-8") if codec.is_text else bytes(row["state_blob"])
+        states.append(codec.decode(data))
+    return states
+
+
+def _validate(state: Any) -> None:
+    if isinstance(state, dict) and state.get("state_kind") == "urban_v2":
+        UrbanWorldState.model_validate(state.get("payload") or {})
+
+
+def measure_codec(codec: PlayStateCodec, states: list[Any], *, iterations: int) -> dict[str, Any]:
+    encoded = [codec.encode(state) for state in states]
+    for state, data in zip(states, encoded):
+        if codec.decode(data) != state:
+            raise AssertionError(f"{codec.encoding} did not round-trip a state")
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for state in states:
+            codec.encode(state)
+    encode_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for data in encoded:
+            codec.decode(data)
+    decode_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for data in encoded:
+        _validate(codec.decode(data))
+    load_seconds = time.perf_counter() - started
+    operations = iterations * len(states)
+    return {
+        "encoding": codec.encoding,
+        "mean_bytes": int(mean(len(data) for data in encoded)),
+        "max_bytes": max(len(data) for data in encoded),
+        "encode_per_s": int(operations / encode_seconds) if encode_seconds else None,
+        "decode_per_s": int(operations / decode_seconds) if decode_seconds else None,
+        "decode_and_validate_ms": round(load_seconds * 1000 / len(states), 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    states = load_states(args.db)
+    if len(states) < 2:
+        raise SystemExit("need at least two play_sessions rows to benchmark")
+    # Train on even rows and measure on odd rows so the dictionary result is
+    # not scored on its own training data.
+    training, holdout = states[::2], states[1::2]
+    _validate(holdout[0])  # warm pydantic so the first codec is not charged for it
+    dictionary = train_zstd_dictionary(training, dict_size=args.dict_size)
+    codecs: list[PlayStateCodec] = [
+        JsonStateCodec(),
+        JsonZlibStateCodec(),
+        OrjsonStateCodec(),
+        MsgpackStateCodec(),
+        ZstdMsgpackStateCodec(),
+        ZstdMsgpackStateCodec(dictionary=dictionary),
+    ]
+    report = {
+        "db": args.db,
+        "states": len(states),
+        "holdout_states": len(holdout),
+        "codecs": [measure_codec(codec, holdout, iterations=max(args.iterations, 1)) for codec in codecs],
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.write_dict:
+        Path(args.write_dict).write_bytes(train_zstd_dictionary(states, dict_size=args.dict_size))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
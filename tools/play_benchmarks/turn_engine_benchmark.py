@@ -0,0 +1,501 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+_SEED = "校庆晚会前，旧录音和前任回归把她逼进公开站队。做成标准都市关系戏。"
+# Top-level run_turn stages, timed by wrapping the runtime module globals run_turn
+# calls through. Timings are inclusive of anything the stage calls.
+_STAGE_FUNCTIONS = (
+    "poll_and_apply_pending_delta_pack",
+    "run_intent_stage",
+    "apply_turn_resolution",
+    "_auto_fire_storylets",
+    "fire_player_chosen_storylet",
+    "resolve_turn_state_in_worker",
+    "_render_narration",
+    "advance_segment_if_ready",
+    "judge_ending",
+    "schedule_next_beat_delta_pack",
+    "append_narration_event",
+)
+_LATENT_KINDS = ("relationship_debt", "public_wave", "secret_pressure", "npc_action")
+_STORYLET_FUNCTIONS = ("hook", "escalation", "reversal", "revelation", "cost", "resolution")
+_SEGMENT_ROLES = ("opening", "misread", "pressure", "reversal", "reveal", "terminal")
+_FREE_TEXT_TEMPLATES = (
+    "我当众逼问{name}，让所有人都听见",
+    "我私下拉住{name}，把旧账摊开",
+    "我先稳住场面，再试探{name}的底线",
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkTier:
+    name: str
+    extra_cast: int
+    storylets: int
+    latent_events: int
+
+
+DEFAULT_TIERS = (
+    BenchmarkTier(name="small", extra_cast=0, storylets=8, latent_events=0),
+    BenchmarkTier(name="medium", extra_cast=1, storylets=32, latent_events=3),
+    BenchmarkTier(name="large", extra_cast=2, storylets=96, latent_events=6),
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Drive play_v2 run_turn offline over seeded synthetic plans with a deterministic stub "
+            "LLM gateway, reporting per-stage wall time, allocations and latency percentiles."
+        )
+    )
+    parser.add_argument("--tiers", default=",".join(tier.name for tier in DEFAULT_TIERS))
+    parser.add_argument("--turns", type=int, default=60)
+    parser.add_argument("--warmup-turns", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--plan-seed", default=_SEED, help="author_v2 seed used for the base plan")
+    parser.add_argument("--allocations", action="store_true", help="also run a tracemalloc pass per tier")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    parser.add_argument("--baseline", help="fail when run_turn percentiles regress against this report")
+    parser.add_argument("--write-baseline", help="write the report to this path as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--slack-ms", type=float, default=1.0, help="absolute slack added to every latency check")
+    return parser.parse_args(argv)
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 4)
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    return {
+        "p50": _percentile(values, 50),
+        "p95": _percentile(values, 95),
+        "p99": _percentile(values, 99),
+        "mean": round(sum(values) / len(values), 4) if values else 0.0,
+        "max": round(max(values), 4) if values else 0.0,
+    }
+
+
+class DeterministicPlayClient:
+    """Stand-in for PlayLLMGateway that answers every play_v2 operation from its payload.
+
+    Responses are pure functions of the request, so two runs over the same plan
+    and inputs exercise identical code paths.
+    """
+
+    max_output_tokens_interpret = 320
+    max_output_tokens_interpret_repair = 320
+
+    def __init__(self) -> None:
+        self.operation_counts: Counter[str] = Counter()
+
+    def _invoke_json(
+        self,
+        *,
+        system_prompt: str,
+        user_payload: dict[str, Any],
+        max_output_tokens: int | None,
+        previous_response_id: str | None = None,
+        operation_name: str | None = None,
+        plaintext_fallback_key: str | None = None,
+    ):
+        from rpg_backend.play.gateway import PlayGatewayJSONResponse
+
+        operation = str(operation_name or "")
+        self.operation_counts[operation] += 1
+        if operation.startswith("play_v2.intent_compile"):
+            payload = self._intent_payload(user_payload)
+        elif operation == "play_v2.npc_micro_sim":
+            payload = self._micro_sim_payload(user_payload)
+        elif operation == "play_v2.narration_compose":
+            payload = self._compose_payload(user_payload)
+        elif operation == "play_v2.narration_compose_pass2":
+            payload = {"narration": str(user_payload.get("base_narration") or "")}
+        else:
+            payload = {}
+        input_characters = len(system_prompt) + len(json.dumps(user_payload, ensure_ascii=False, default=str))
+        output_tokens = len(json.dumps(payload, ensure_ascii=False)) // 2
+        return PlayGatewayJSONResponse(
+            payload=payload,
+            response_id=f"stub-{operation}-{self.operation_counts[operation]}",
+            usage={
+                "input_tokens": input_characters // 2,
+                "output_tokens": output_tokens,
+                "total_tokens": input_characters // 2 + output_tokens,
+            },
+            input_characters=input_characters,
+        )
+
+    @staticmethod
+    def _intent_payload(user_payload: dict[str, Any]) -> dict[str, Any]:
+        suggestions = list(user_payload.get("suggestions") or [])
+        cast = list(user_payload.get("cast") or [])
+        allowed = list(user_payload.get("allowed_move_families") or [])
+        chosen = suggestions[0] if suggestions else {}
+        move_family = chosen.get("move_family") if chosen.get("move_family") in allowed else (allowed[0] if allowed else "")
+        return {
+            "move_family": move_family,
+            "target_id": chosen.get("target_id") or (cast[0]["character_id"] if cast else None),
+            "scene_frame": chosen.get("scene_frame") or user_payload.get("default_scene_frame"),
+            "lane_id": chosen.get("lane_id"),
+            "intent_confidence": 0.82,
+            "alternatives": [item.get("label") for item in suggestions[1:3] if item.get("label")],
+        }
+
+    @staticmethod
+    def _micro_sim_payload(user_payload: dict[str, Any]) -> dict[str, Any]:
+        shortlist = list(user_payload.get("shortlist") or [])
+        return {
+            "recommended_actor_id": shortlist[0]["character_id"] if shortlist else None,
+            "summary": "stub micro-sim",
+            "candidates": [
+                {
+                    "character_id": item.get("character_id"),
+                    "action_family": item.get("heuristic_action_family"),
+                    "reason_family": item.get("heuristic_reason_family"),
+                    "confidence": item.get("heuristic_confidence", 0.5),
+                    "rationale": "stub",
+                }
+                for item in shortlist
+            ],
+        }
+
+    @staticmethod
+    def _compose_payload(user_payload: dict[str, Any]) -> dict[str, Any]:
+        compose_input = user_payload.get("compose_input") or {}
+        target_name = (compose_input.get("fact_pack") or {}).get("target_name") or "对方"
+        shell_tokens = (compose_input.get("style_card") or {}).get("shell_tokens") or []
+        shell_token = shell_tokens[0] if shell_tokens else "场上"
+        return {
+            "narration": f"{target_name}把话压进{shell_token}里，周围人都听见了这一步的代价。",
+            "coverage_marks": {"target": True, "move": True, "consequence": True, "relationship": True},
+            "length_profile": "normal",
+        }
+
+
+@contextmanager
+def stub_llm_runtime(client: DeterministicPlayClient, **settings_overrides: Any) -> Iterator[None]:
+    """Route run_turn's LLM stages to ``client`` and restore the runtime afterwards."""
+    import rpg_backend.play_v2.runtime as runtime_module
+    from rpg_backend.config import get_settings
+
+    settings = get_settings().model_copy(
+        update={
+            "play_v2_intent_compiler_use_llm": True,
+            "play_v2_micro_sim_use_llm": True,
+            "play_v2_dramatic_rewrite_use_llm": True,
+            **settings_overrides,
+        }
+    )
+    original_settings = runtime_module.get_settings
+    original_gateway = runtime_module.get_play_llm_gateway
+    original_allow = os.environ.get("APP_PLAY_V2_ALLOW_LIVE_LLM_IN_TESTS")
+    runtime_module.get_settings = lambda: settings
+    runtime_module.get_play_llm_gateway = lambda _settings: client
+    os.environ["APP_PLAY_V2_ALLOW_LIVE_LLM_IN_TESTS"] = "true"
+    try:
+        yield
+    finally:
+        runtime_module.get_settings = original_settings
+        runtime_module.get_play_llm_gateway = original_gateway
+        if original_allow is None:
+            os.environ.pop("APP_PLAY_V2_ALLOW_LIVE_LLM_IN_TESTS", None)
+        else:
+            os.environ["APP_PLAY_V2_ALLOW_LIVE_LLM_IN_TESTS"] = original_allow
+
+
+@contextmanager
+def stage_timers(sink: dict[str, float]) -> Iterator[None]:
+    """Accumulate wall time per top-level run_turn stage into ``sink`` (milliseconds)."""
+    import rpg_backend.play_v2.runtime as runtime_module
+
+    originals: dict[str, Callable[..., Any]] = {}
+
+    def _timed(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                sink[name] = sink.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+        return _wrapper
+
+    for name in _STAGE_FUNCTIONS:
+        function = getattr(runtime_module, name, None)
+        if callable(function):
+            originals[name] = function
+            setattr(runtime_module, name, _timed(name, function))
+    try:
+        yield
+    finally:
+        for name, function in originals.items():
+            setattr(runtime_module, name, function)
+
+
+def build_synthetic_plan(base_plan: Any, tier: BenchmarkTier, *, seed: int) -> Any:
+    """Grow ``base_plan`` to the tier's size with seeded cast clones and storylets."""
+    from rpg_backend.author_v2.contracts import CompiledPlayPlan
+    from rpg_backend.author_v3.storylet_compiler import Storylet, StoryletCondition, StoryletEffect
+    from rpg_backend.play_v2.storylet_pool import compile_plan_storylet_pool, storylet_pool_digest
+
+    rng = random.Random(f"{seed}:{tier.name}")
+    cast = list(base_plan.cast)
+    voice_atoms = dict(base_plan.voice_atoms_by_character)
+    templates = [member for member in cast if member.character_id not in base_plan.route_target_ids] or cast
+    for index in range(min(tier.extra_cast, 7 - len(cast))):
+        template = templates[index % len(templates)]
+        clone_id = f"{template.character_id}_bench{index + 1}"
+        cast.append(
+            template.model_copy(
+                update={"character_id": clone_id, "display_name": f"{template.display_name}{index + 1}"[:40]}
+            )
+        )
+        if template.character_id in voice_atoms:
+            voice_atoms[clone_id] = list(voice_atoms[template.character_id])
+    cast_ids = [member.character_id for member in cast]
+    secret_ids = [str(item.get("secret_id")) for item in base_plan.organic_secrets or [] if item.get("secret_id")]
+    storylets = []
+    for index in range(tier.storylets):
+        characters = rng.sample(cast_ids, k=min(2, len(cast_ids)))
+        storylets.append(
+            Storylet(
+                storylet_id=f"st_bench_{index:03d}",
+                narrative_function=rng.choice(_STORYLET_FUNCTIONS),  # type: ignore[arg-type]
+                title=f"基准情境 {index}",
+                scene_text=f"{characters[0]}在众人面前停了一下，旧账又被翻到桌面上。",
+                characters_involved=characters,
+                venue_hint=base_plan.social_arena[:60],
+                dramatic_weight=round(rng.uniform(0.2, 0.9), 2),
+                cooldown_turns=rng.randint(0, 4),
+                preconditions=StoryletCondition(
+                    required_secrets_known=rng.sample(secret_ids, k=1) if secret_ids and rng.random() < 0.3 else [],
+                    min_tension_score=round(rng.uniform(0.0, 0.4), 2),
+                    required_segment_roles=rng.sample(_SEGMENT_ROLES, k=2),  # type: ignore[arg-type]
+                ),
+                effects=StoryletEffect(
+                    secrets_revealed=rng.sample(secret_ids, k=1) if secret_ids and rng.random() < 0.2 else [],
+                    relationship_shifts={characters[-1]: round(rng.uniform(-0.2, 0.2), 2)},
+                    tension_delta=round(rng.uniform(0.0, 0.2), 2),
+                ),
+            ).model_dump(mode="json")
+        )
+    plan = CompiledPlayPlan.model_validate(
+        {
+            **base_plan.model_dump(mode="json"),
+            "story_id": f"{base_plan.story_id}-bench-{tier.name}",
+            "cast": [member.model_dump(mode="json") for member in cast],
+            "voice_atoms_by_character": {
+                key: [atom.model_dump(mode="json") for atom in atoms] for key, atoms in voice_atoms.items()
+            },
+            "storylet_pool": [*(base_plan.storylet_pool or []), *storylets],
+        }
+    )
+    compile_plan_storylet_pool(plan)
+    return plan.model_copy(update={"storylet_pool_digest": storylet_pool_digest(plan)})
+
+
+def seed_latent_events(plan: Any, state: Any, tier: BenchmarkTier, *, seed: int) -> None:
+    from rpg_backend.play_v2.contracts import LatentEvent
+
+    rng = random.Random(f"{seed}:{tier.name}:latent")
+    cast_ids = [member.character_id for member in plan.cast]
+    state.latent_events = [
+        LatentEvent(
+            event_id=f"latent_bench_{index}",
+            kind=_LATENT_KINDS[index % len(_LATENT_KINDS)],  # type: ignore[arg-type]
+            shell_id=plan.story_shell_id,
+            source_turn_index=0,
+            source_segment_id=plan.segments[0].segment_id,
+            stake_character_ids=rng.sample(cast_ids, k=1),
+            target_character_ids=rng.sample(cast_ids, k=1),
+            pressure=rng.randint(0, 3),
+            trigger_threshold=rng.randint(3, 6),
+            foreshadow_text="有人把旧账压在了桌角，迟早要被翻出来。",
+            detonation_text="旧账在众人面前被当场翻开。",
+        )
+        for index in range(min(tier.latent_events, 6))
+    ]
+
+
+def _turn_inputs(plan: Any, state: Any, rng: random.Random, turn: int) -> tuple[str, str | None]:
+    from rpg_backend.play_v2.runtime import build_suggested_actions
+
+    actions = build_suggested_actions(plan, state)
+    if turn % 3 == 2 or not actions:
+        member = rng.choice(plan.cast)
+        return rng.choice(_FREE_TEXT_TEMPLATES).format(name=member.display_name), None
+    action = rng.choice(actions)
+    return action.prompt, action.suggestion_id
+
+
+def run_tier(plan: Any, tier: BenchmarkTier, *, turns: int, warmup_turns: int, seed: int, allocations: bool) -> dict[str, Any]:
+    from rpg_backend.play_v2.runtime import build_initial_world_state, run_turn
+
+    def _fresh_state(session_index: int) -> Any:
+        state = build_initial_world_state(plan, session_id=f"turn-bench-{tier.name}-{session_index}")
+        seed_latent_events(plan, state, tier, seed=seed)
+        return state
+
+    def _drive(turn_count: int, *, on_turn: Callable[[Callable[[], Any]], Any]) -> None:
+        rng = random.Random(f"{seed}:{tier.name}:turns")
+        sessions = 0
+        state = _fresh_state(sessions)
+        for turn in range(turn_count):
+            if state.status != "active":
+                sessions += 1
+                state = _fresh_state(sessions)
+            input_text, suggestion_id = _turn_inputs(plan, state, rng, turn)
+            current = state
+            result = on_turn(lambda: run_turn(plan, current, input_text, selected_suggestion_id=suggestion_id))
+            state = result.state
+
+    client = DeterministicPlayClient()
+    total_ms: list[float] = []
+    stage_ms: dict[str, list[float]] = {}
+    with stub_llm_runtime(client):
+        _drive(warmup_turns, on_turn=lambda call: call())
+        client.operation_counts.clear()
+
+        def _timed_turn(call: Callable[[], Any]) -> Any:
+            sink: dict[str, float] = {}
+            with stage_timers(sink):
+                started = time.perf_counter()
+                result = call()
+                elapsed = (time.perf_counter() - started) * 1000
+            total_ms.append(elapsed)
+            sink["other"] = max(elapsed - sum(sink.values()), 0.0)
+            for name, value in sink.items():
+                stage_ms.setdefault(name, []).append(value)
+            return result
+
+        _drive(turns, on_turn=_timed_turn)
+        operation_counts = dict(client.operation_counts)
+
+        allocation_report: dict[str, Any] | None = None
+        if allocations:
+            peaks_kib: list[float] = []
+            blocks: list[float] = []
+
+            def _traced_turn(call: Callable[[], Any]) -> Any:
+                tracemalloc.start()
+                try:
+                    result = call()
+                    _, peak = tracemalloc.get_traced_memory()
+                    blocks.append(float(sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))))
+                finally:
+                    tracemalloc.stop()
+                peaks_kib.append(peak / 1024)
+                return result
+
+            _drive(turns, on_turn=_traced_turn)
+            allocation_report = {"peak_kib": _summary(peaks_kib), "live_blocks": _summary(blocks)}
+
+    return {
+        "plan": {
+            "cast": len(plan.cast),
+            "storylets": len(plan.storylet_pool or []),
+            "latent_events": min(tier.latent_events, 6),
+        },
+        "turns": len(total_ms),
+        "run_turn_ms": _summary(total_ms),
+        "stages_ms": {name: _summary(values) for name, values in sorted(stage_ms.items())},
+        "llm_operations": operation_counts,
+        "allocations": allocation_report,
+    }
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float,
+    slack_ms: float,
+) -> list[str]:
+    """Return a human-readable line for every tier metric that regressed past tolerance."""
+    regressions: list[str] = []
+    for tier_name, current in dict(report.get("tiers") or {}).items():
+        previous = dict(baseline.get("tiers") or {}).get(tier_name)
+        if not previous:
+            continue
+        for metric in ("p50", "p95", "p99"):
+            before = float(previous["run_turn_ms"].get(metric, 0.0))
+            after = float(current["run_turn_ms"].get(metric, 0.0))
+            if after > before * (1 + tolerance) + slack_ms:
+                regressions.append(f"{tier_name} run_turn {metric}: {before:.3f}ms -> {after:.3f}ms")
+        before_alloc = (previous.get("allocations") or {}).get("peak_kib") or {}
+        after_alloc = (current.get("allocations") or {}).get("peak_kib") or {}
+        if before_alloc and after_alloc and after_alloc["p95"] > before_alloc["p95"] * (1 + tolerance):
+            regressions.append(
+                f"{tier_name} peak alloc p95: {before_alloc['p95']:.1f}KiB -> {after_alloc['p95']:.1f}KiB"
+            )
+    return regressions
+
+
+def _select_tiers(names: str) -> list[BenchmarkTier]:
+    by_name = {tier.name: tier for tier in DEFAULT_TIERS}
+    selected = [by_name[name.strip()] for name in names.split(",") if name.strip() in by_name]
+    if not selected:
+        raise SystemExit(f"no known tiers in {names!r}; choose from {', '.join(by_name)}")
+    return selected
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import run_author_play_graph
+
+    preview, _ = run_preview_blueprint_graph(args.plan_seed)
+    base_plan = run_author_play_graph(apply_blueprint_edits(preview)).play_plan
+    tiers: dict[str, Any] = {}
+    for tier in _select_tiers(args.tiers):
+        plan = build_synthetic_plan(base_plan, tier, seed=args.seed)
+        tiers[tier.name] = run_tier(
+            plan,
+            tier,
+            turns=max(args.turns, 1),
+            warmup_turns=max(args.warmup_turns, 0),
+            seed=args.seed,
+            allocations=args.allocations,
+        )
+    report: dict[str, Any] = {
+        "config": {"seed": args.seed, "plan_seed": args.plan_seed, "turns": args.turns, "warmup_turns": args.warmup_turns},
+        "tiers": tiers,
+    }
+    exit_code = 0
+    if args.baseline:
+        regressions = compare_to_baseline(
+            report,
+            json.loads(Path(args.baseline).read_text(encoding="utf-8")),
+            tolerance=args.tolerance,
+            slack_ms=args.slack_ms,
+        )
+        report["regressions"] = regressions
+        exit_code = 1 if regressions else 0
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(rendered, encoding="utf-8")
+    if args.write_baseline:
+        Path(args.write_baseline).write_text(rendered, encoding="utf-8")
+    print(rendered)
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
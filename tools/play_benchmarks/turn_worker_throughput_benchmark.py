@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import random
+import time
+from typing import Any
+
+from tools.play_benchmarks.turn_engine_benchmark import (
+    DEFAULT_TIERS,
+    DeterministicPlayClient,
+    _FREE_TEXT_TEMPLATES,
+    _SEED,
+    _summary,
+    build_synthetic_plan,
+    stub_llm_runtime,
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure play_v2 turn throughput at several session concurrencies with a stub LLM gateway, "
+            "running the deterministic resolution stage inline and in worker processes."
+        )
+    )
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrent session counts")
+    parser.add_argument("--turns-per-session", type=int, default=6)
+    parser.add_argument("--worker-processes", type=int, default=max(os.cpu_count() or 1, 1))
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="sleep per stub LLM call to model provider I/O")
+    parser.add_argument("--tier", default="medium", choices=[tier.name for tier in DEFAULT_TIERS])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--plan-seed", default=_SEED, help="author_v2 seed used for the base plan")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args(argv)
+
+
+class LatencyPlayClient(DeterministicPlayClient):
+    def __init__(self, latency_ms: float) -> None:
+        super().__init__()
+        self._latency_seconds = max(latency_ms, 0.0) / 1000
+
+    def _invoke_json(self, **kwargs: Any):
+        if self._latency_seconds:
+            time.sleep(self._latency_seconds)
+        return super()._invoke_json(**kwargs)
+
+
+def _drive_session(plan: Any, session_index: int, *, turns: int, seed: int) -> list[float]:
+    from rpg_backend.play_v2.runtime import build_initial_world_state, run_turn
+
+    rng = random.Random(f"{seed}:{session_index}")
+    state = build_initial_world_state(plan, session_id=f"throughput-{session_index}")
+    latencies: list[float] = []
+    for _ in range(turns):
+        if state.status != "active":
+            break
+        member = rng.choice(plan.cast)
+        input_text = rng.choice(_FREE_TEXT_TEMPLATES).format(name=member.display_name)
+        started = time.perf_counter()
+        state = run_turn(plan, state, input_text).state
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def run_concurrency(plan: Any, concurrency: int, *, turns: int, seed: int) -> dict[str, Any]:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="throughput-session") as executor:
+        results = list(
+            executor.map(lambda index: _drive_session(plan, index, turns=turns, seed=seed), range(concurrency))
+        )
+    elapsed = time.perf_counter() - started
+    latencies = [value for session in results for value in session]
+    return {
+        "turns": len(latencies),
+        "turns_per_second": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        "turn_latency_ms": _summary(latencies),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from rpg_backend.author_v2.preview import apply_blueprint_edits, run_preview_blueprint_graph
+    from rpg_backend.author_v2.workflow import run_author_play_graph
+    from rpg_backend.play_v2.turn_workers import shutdown_turn_worker_pool
+
+    preview, _ = run_preview_blueprint_graph(args.plan_seed)
+    tier = next(item for item in DEFAULT_TIERS if item.name == args.tier)
+    plan = build_synthetic_plan(run_author_play_graph(apply_blueprint_edits(preview)).play_plan, tier, seed=args.seed)
+    concurrencies = [max(int(token), 1) for token in args.concurrency.split(",") if token.strip()]
+    modes = {"inline": 0, "process": max(args.worker_processes, 1)}
+    report: dict[str, Any] = {
+        "config": {
+            "tier": tier.name,
+            "turns_per_session": args.turns_per_session,
+            "worker_processes": modes["process"],
+            "llm_latency_ms": args.llm_latency_ms,
+        },
+        "modes": {},
+    }
+    client = LatencyPlayClient(args.llm_latency_ms)
+    try:
+        for mode, worker_processes in modes.items():
+            with stub_llm_runtime(client, play_v2_turn_worker_processes=worker_processes):
+                # Warm plan caches (and, in process mode, ship the plan to every worker).
+                run_concurrency(plan, modes["process"], turns=1, seed=args.seed)
+                report["modes"][mode] = {
+                    str(concurrency): run_concurrency(plan, concurrency, turns=args.turns_per_session, seed=args.seed)
+                    for concurrency in concurrencies
+                }
+    finally:
+        shutdown_turn_worker_pool()
+    rendered = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
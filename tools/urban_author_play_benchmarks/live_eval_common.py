@@ -101,6 +101,7 @@ def helper_probe() -> dict[str, Any]:
             session_cache_value=settings.responses_session_cache_value,
             requests_per_minute=settings.helper_responses_requests_per_minute,
             rate_limit_scope="helper:probe",
+            default_priority="batch",
         )
         summary_rows: list[dict[str, Any]] = []
         for probe_name, payload, runs in probes:
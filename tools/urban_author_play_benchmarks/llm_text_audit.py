@@ -253,6 +253,7 @@ def _invoke_endpoint_json(
         session_cache_value=settings.responses_session_cache_value,
         requests_per_minute=settings.helper_responses_requests_per_minute,
         rate_limit_scope="helper:llm_text_audit",
+        default_priority="batch",
     )
     request_kwargs = {
         "model": endpoint.model,
@@ -346,6 +346,7 @@ def run_case(
                 preview_blueprint=preview,
                 accepted_blueprint=accepted,
                 plan=v3_result["plan"],
+                llm_call_trace=v3_result["llm_call_trace"],
             )
             quality_trace_v3 = list(package.quality_trace)
             quality_trace_v3.append({
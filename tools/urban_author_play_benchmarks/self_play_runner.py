@@ -700,6 +700,7 @@ class ResponsesPlayBackend(PersistentPlayerBackend):
             session_cache_value=self._settings.responses_session_cache_value,
             requests_per_minute=self._settings.responses_play_requests_per_minute,
             rate_limit_scope="play_eval:llm_player",
+            default_priority="batch",
         )
 
     def open_session(self, *, persona: PersonaConfig, system_prompt: str) -> dict[str, Any]: